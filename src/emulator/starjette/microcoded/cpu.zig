@@ -574,7 +574,7 @@ pub const MICROCODE_ROM_SIZE = 66;
 
 pub fn generateMicrocodeRom() [MICROCODE_ROM_SIZE]MicroOp {
     var rom: [MICROCODE_ROM_SIZE]MicroOp = undefined;
-    for (0..63) |i| {
+    for (0..64) |i| {
         const opcode: Opcode = @enumFromInt(i);
         rom[i] = generateMicrocode(opcode);
     }
@@ -585,6 +585,17 @@ pub fn generateMicrocodeRom() [MICROCODE_ROM_SIZE]MicroOp {
 
 pub const microcode_rom = generateMicrocodeRom();
 
+/// Write the microcode ROM to a file, one little-endian u64 per entry, for
+/// starjette/tests/microcode_report.py.
+pub fn dumpMicrocodeRom(path: []const u8) !void {
+    var buf: [MICROCODE_ROM_SIZE * 8]u8 = undefined;
+    for (microcode_rom, 0..) |uop, i| {
+        const bits: u42 = @bitCast(uop);
+        std.mem.writeInt(u64, buf[i * 8 ..][0..8], bits, .little);
+    }
+    try std.fs.cwd().writeFile(.{ .sub_path = path, .data = &buf });
+}
+
 pub inline fn executeMicroOp(cpu: *CpuState, uop: MicroOp, instr: u8, trap: bool, trap_cause: u8) void {
     const r = cpu.reg;
 
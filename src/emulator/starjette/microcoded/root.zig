@@ -5,6 +5,7 @@ const cpu = @import("cpu.zig");
 pub const Word = cpu.Word;
 
 pub const run = cpu.run;
+pub const dumpMicrocodeRom = cpu.dumpMicrocodeRom;
 
 pub fn main(rom_file: []const u8, max_cycles: usize, quiet: bool, gpa: std.mem.Allocator) !void {
     const errorLevel = try cpu.run(rom_file, max_cycles, quiet, gpa);
@@ -64,6 +64,7 @@ pub fn main() !void {
         \\-l, --llemu            Use low-level emulator (default is high-level).
         \\-5, --riscv            Use RISC-V CPU core.
         \\-q, --quiet            Suppress non-error output.
+        \\--dump-microcode <str> Write the low-level emulator's microcode ROM to a file.
         \\
     );
 
@@ -87,6 +88,11 @@ pub fn main() !void {
         log_level = .err;
     }
 
+    if (res.args.@"dump-microcode") |path| {
+        try ll_emu.dumpMicrocodeRom(path);
+        return;
+    }
+
     if (res.args.debugger != 0) {
         std.debug.print("Debugger is currently broken, sorry.\n", .{});
         // try debugger.main(gpa, res.args.vdp != 0);
@@ -0,0 +1,32 @@
+; Kernel mode test shim for 32-bit word builds (tests/w32/)
+;
+; Same as test_shim.asm, with the frame pointers placed so that the frames
+; below them sit at the same addresses as on a 16-bit machine, where fp 0
+; wraps around to 0xffff. cpudef.asm reads immediates with bit 15 set as
+; negative, so 0xe000 is spelled out as push/shi.
+
+#bank vector
+
+; Reset vector at 0x0000
+_reset_handler:
+  li fp, 0x10000       ; initialize kernel frame pointer
+  push 3               ; initialize alternate (user) frame pointer to 0xe000
+  shi 0x40
+  shi 0x00
+  pop afp
+
+  ; Set up exception vector to point to our handler
+  li evec, _exception_handler
+
+  jump _start
+
+_exception_handler:
+  push ecause
+
+  ; negate ecause for error code, avoiding `sub` because it's an extended instruction
+  xor -1
+  add 1
+
+  halt
+
+_start:
@@ -0,0 +1,112 @@
+"""
+Replay every built test and benchmark ROM against the branch predictors in
+starjette_branch.py and report misprediction rates per benchmark, plus the
+worst branch sites with --sites, symbolized from the ROM's .sjidx index when
+one has been built (`make symbols`).
+
+Arguments may be .bin files or suite manifest.json files, as for
+pipeline_report.py.
+
+Usage (from starjette/): python tests/branch_report.py [--sites N] [ROM or manifest ...]
+Build the ROMs first with `make tests` and the suite targets.
+"""
+
+import argparse
+import os
+import sys
+
+from pipeline_report import collect_roms
+from starjette_branch import PREDICTORS, RETURN_STACK_DEPTHS, ReturnStack, trace_branches
+from starjette_symbols import open_for_rom
+from starjette_system import System
+
+
+def simulate(cpu, max_cycles):
+    """Run cpu, returning (predictors, return stacks, per site stats)."""
+    predictors = [make() for make in PREDICTORS.values()]
+    stacks = [ReturnStack(depth) for depth in RETURN_STACK_DEPTHS]
+    # pc -> [executions, taken, misses per predictor...]
+    sites = {}
+    for event in trace_branches(cpu, max_cycles):
+        kind, pc = event[0], event[1]
+        if kind == "branch":
+            backward, taken = event[2], event[3]
+            site = sites.get(pc)
+            if site is None:
+                site = sites[pc] = [0, 0] + [0] * len(predictors)
+            site[0] += 1
+            site[1] += taken
+            for i, predictor in enumerate(predictors):
+                site[2 + i] += predictor.branch(pc, backward, taken)
+        elif kind == "call":
+            for stack in stacks:
+                stack.call(event[2])
+        else:
+            for stack in stacks:
+                stack.ret(event[2])
+    return predictors, stacks, sites
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    parser.add_argument("--sites", type=int, default=0, metavar="N",
+                        help="print the N branch sites with the most gshare mispredictions per ROM")
+    args = parser.parse_args()
+
+    roms = collect_roms(args.paths)
+    names = list(PREDICTORS) + [f"ras{depth}" for depth in RETURN_STACK_DEPTHS]
+    width = max([len(label) for label, *_ in roms] + [8])
+    print("misprediction rate, conditional branches then `pop pc` returns")
+    print(f"{'rom':<{width}} {'instrs':>9} {'branches':>9} {'taken':>6} {'returns':>8} "
+          + " ".join(f"{name:>14}" for name in names))
+
+    totals = [0, 0, 0, 0]
+    total_misses = [0] * len(names)
+    skipped = 0
+    for label, path, max_cycles, wordsize in roms:
+        if not os.path.exists(path):
+            skipped += 1
+            continue
+        cpu = System(wordsize=wordsize)
+        cpu.load_rom(path)
+        predictors, stacks, sites = simulate(cpu, max_cycles)
+
+        branches = predictors[0].predictions
+        taken = sum(site[1] for site in sites.values())
+        returns = stacks[0].predictions
+        models = predictors + stacks
+        print(f"{label:<{width}} {cpu.cycles:>9} {branches:>9} {taken / max(branches, 1):>6.1%} {returns:>8} "
+              + " ".join(f"{m.miss_rate:>14.2%}" for m in models))
+
+        for i, value in enumerate([cpu.cycles, branches, taken, returns]):
+            totals[i] += value
+        for i, model in enumerate(models):
+            total_misses[i] += model.misses
+
+        if args.sites and sites:
+            column = 2 + list(PREDICTORS).index("gshare256")
+            worst = sorted(sites.items(), key=lambda item: -item[1][column])[:args.sites]
+            symbols = open_for_rom(path)
+            for pc, site in worst:
+                rates = " ".join(f"{name} {site[2 + i] / site[0]:.0%}" for i, name in enumerate(PREDICTORS))
+                where = f"  {symbols.symbolize(pc)}" if symbols else ""
+                print(f"    {pc:#06x} {site[0]:>7}x taken {site[1] / site[0]:>4.0%}  {rates}{where}")
+            if symbols:
+                symbols.close()
+
+    instructions, branches, taken, returns = totals
+    rates = [misses / max(branches if i < len(PREDICTORS) else returns, 1) for i, misses in enumerate(total_misses)]
+    print(f"{'total':<{width}} {instructions:>9} {branches:>9} {taken / max(branches, 1):>6.1%} {returns:>8} "
+          + " ".join(f"{rate:>14.2%}" for rate in rates))
+    if skipped:
+        print(f"({skipped} ROMs not built, skipped)")
+
+    print("\nmispredictions per 1000 instructions:")
+    for name, misses in zip(names, total_misses):
+        print(f"    {name:<16} {1000 * misses / max(instructions, 1):7.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
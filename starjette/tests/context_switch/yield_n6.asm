@@ -0,0 +1,588 @@
+; Context switch kernel: 6 tasks, cooperative yield
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _trap
+    li udmask, 0xf
+    push 6
+    push 0x7b04
+    sw
+    push 5
+    push 0x7b00
+    sw
+
+    ; Task 0: depth 0
+    li rx, 0x7c00
+    li ry, _task_0
+    push ry
+    push rx
+    sw
+    push 0
+    push 2
+    rel rx
+    sw
+    push 0x0f00
+    push 8
+    rel rx
+    sw
+    push 0x4000
+    push 14
+    rel rx
+    sw
+
+    ; Task 1: depth 8
+    li rx, 0x7c10
+    li ry, _task_1
+    push ry
+    push rx
+    sw
+    push 0
+    push 2
+    rel rx
+    sw
+    push 0x0f00
+    push 8
+    rel rx
+    sw
+    push 0x4400
+    push 14
+    rel rx
+    sw
+
+    ; Task 2: depth 32
+    li rx, 0x7c20
+    li ry, _task_2
+    push ry
+    push rx
+    sw
+    push 0
+    push 2
+    rel rx
+    sw
+    push 0x0f00
+    push 8
+    rel rx
+    sw
+    push 0x4800
+    push 14
+    rel rx
+    sw
+
+    ; Task 3: depth 128
+    li rx, 0x7c30
+    li ry, _task_3
+    push ry
+    push rx
+    sw
+    push 0
+    push 2
+    rel rx
+    sw
+    push 0x0f00
+    push 8
+    rel rx
+    sw
+    push 0x4c00
+    push 14
+    rel rx
+    sw
+
+    ; Task 4: depth 256
+    li rx, 0x7c40
+    li ry, _task_4
+    push ry
+    push rx
+    sw
+    push 0
+    push 2
+    rel rx
+    sw
+    push 0x0f00
+    push 8
+    rel rx
+    sw
+    push 0x5000
+    push 14
+    rel rx
+    sw
+
+    ; Task 5: depth 480
+    li rx, 0x7c50
+    li ry, _task_5
+    push ry
+    push rx
+    sw
+    push 0
+    push 2
+    rel rx
+    sw
+    push 0x0f00
+    push 8
+    rel rx
+    sw
+    push 0x5400
+    push 14
+    rel rx
+    sw
+    li rx, 0
+    li ry, 0
+    jump _pick
+
+_trap:
+    push ecause
+    beqz _syscall
+    push ecause
+    push 0x50
+    xor
+    bnez _fatal
+    jump _switch
+
+_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
+
+; Syscall number on the user's tos: 0 yield, 1 exit
+_syscall:
+    beqz _switch
+    push 1
+    push 0x7b02
+    lw
+    add 12
+    sw
+    push 0x7b04
+    lw
+    add -1
+    dup
+    push 0x7b04
+    sw
+    beqz _all_done
+
+_switch:
+    push ry
+    push 0x7b08
+    sw
+    push rx
+    push 0x7b06
+    sw
+    push 0x7b02
+    lw
+    pop rx
+
+    push epc
+    push rx
+    sw
+    push estatus
+    push 2
+    rel rx
+    sw
+    push 0x7b06
+    lw
+    push 4
+    rel rx
+    sw
+    push 0x7b08
+    lw
+    push 6
+    rel rx
+    sw
+    push afp
+    push 8
+    rel rx
+    sw
+
+    ; Flush the data stack: count from depth, copy with snw
+    push depth
+    add -1
+    push 10
+    rel rx
+    sw
+    push 14
+    rel rx
+    lw
+    pop ry
+_flush:
+    push depth
+    add -1
+    beqz _pick
+    snw
+    jump _flush
+
+; Round robin to the next task that has not exited
+_pick:
+    push 0x7b00
+    lw
+    add 1
+    dup
+    push 6
+    xor
+    bnez _pick_wrap
+    drop
+    push 0
+_pick_wrap:
+    dup
+    push 0x7b00
+    sw
+    push 4
+    sll
+    push 0x7c00
+    add
+    dup
+    push 0x7b02
+    sw
+    pop rx
+    push 12
+    rel rx
+    lw
+    bnez _pick
+
+    ; Reload the stack bottom first, from the end of the save area down
+    push 10
+    rel rx
+    lw
+    dup
+    add
+    push 14
+    rel rx
+    lw
+    add
+    pop ry
+_reload:
+    push ry
+    push 14
+    rel rx
+    lw
+    xor
+    beqz _reloaded
+    add ry, -2
+    push ry
+    lw
+    jump _reload
+
+_reloaded:
+    push 0x7b00
+    lw
+    add 8
+    pop udset
+    push 8
+    rel rx
+    lw
+    pop afp
+    push 2
+    rel rx
+    lw
+    pop estatus
+    push rx
+    lw
+    pop epc
+    push 6
+    rel rx
+    lw
+    pop ry
+    push 4
+    rel rx
+    lw
+    pop rx
+    rets
+
+_all_done:
+    ; Each task's window must hold its own final count
+    push 0x8000
+    lw
+    push 50
+    xor
+    failnez
+    push 0x9000
+    lw
+    push 50
+    xor
+    failnez
+    push 0xa000
+    lw
+    push 50
+    xor
+    failnez
+    push 0xb000
+    lw
+    push 50
+    xor
+    failnez
+    push 0xc000
+    lw
+    push 50
+    xor
+    failnez
+    push 0xd000
+    lw
+    push 50
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
+
+_task_0:
+
+_t0_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+    push 0
+    syscall
+    push 0
+    lw
+    push 50
+    xor
+    bnez _t0_loop
+
+    llw 0
+    push 50
+    xor
+    failnez
+
+    push 1
+    syscall
+
+_task_1:
+    ; Sentinels 0x0100..0x0107, deepest first
+    li rx, 0
+_t1_build:
+    push rx
+    add 256
+    add rx, 1
+    push rx
+    push 8
+    xor
+    bnez _t1_build
+
+_t1_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+    push 0
+    syscall
+    push 0
+    lw
+    push 50
+    xor
+    bnez _t1_loop
+
+    llw 0
+    push 50
+    xor
+    failnez
+
+    li rx, 8
+_t1_check:
+    add rx, -1
+    push rx
+    add 256
+    xor
+    failnez
+    push rx
+    bnez _t1_check
+
+    push 1
+    syscall
+
+_task_2:
+    ; Sentinels 0x0200..0x021f, deepest first
+    li rx, 0
+_t2_build:
+    push rx
+    add 512
+    add rx, 1
+    push rx
+    push 32
+    xor
+    bnez _t2_build
+
+_t2_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+    push 0
+    syscall
+    push 0
+    lw
+    push 50
+    xor
+    bnez _t2_loop
+
+    llw 0
+    push 50
+    xor
+    failnez
+
+    li rx, 32
+_t2_check:
+    add rx, -1
+    push rx
+    add 512
+    xor
+    failnez
+    push rx
+    bnez _t2_check
+
+    push 1
+    syscall
+
+_task_3:
+    ; Sentinels 0x0300..0x037f, deepest first
+    li rx, 0
+_t3_build:
+    push rx
+    add 768
+    add rx, 1
+    push rx
+    push 128
+    xor
+    bnez _t3_build
+
+_t3_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+    push 0
+    syscall
+    push 0
+    lw
+    push 50
+    xor
+    bnez _t3_loop
+
+    llw 0
+    push 50
+    xor
+    failnez
+
+    li rx, 128
+_t3_check:
+    add rx, -1
+    push rx
+    add 768
+    xor
+    failnez
+    push rx
+    bnez _t3_check
+
+    push 1
+    syscall
+
+_task_4:
+    ; Sentinels 0x0400..0x04ff, deepest first
+    li rx, 0
+_t4_build:
+    push rx
+    add 1024
+    add rx, 1
+    push rx
+    push 256
+    xor
+    bnez _t4_build
+
+_t4_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+    push 0
+    syscall
+    push 0
+    lw
+    push 50
+    xor
+    bnez _t4_loop
+
+    llw 0
+    push 50
+    xor
+    failnez
+
+    li rx, 256
+_t4_check:
+    add rx, -1
+    push rx
+    add 1024
+    xor
+    failnez
+    push rx
+    bnez _t4_check
+
+    push 1
+    syscall
+
+_task_5:
+    ; Sentinels 0x0500..0x06df, deepest first
+    li rx, 0
+_t5_build:
+    push rx
+    add 1280
+    add rx, 1
+    push rx
+    push 480
+    xor
+    bnez _t5_build
+
+_t5_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+    push 0
+    syscall
+    push 0
+    lw
+    push 50
+    xor
+    bnez _t5_loop
+
+    llw 0
+    push 50
+    xor
+    failnez
+
+    li rx, 480
+_t5_check:
+    add rx, -1
+    push rx
+    add 1280
+    xor
+    failnez
+    push rx
+    bnez _t5_check
+
+    push 1
+    syscall
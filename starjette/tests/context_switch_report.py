@@ -0,0 +1,93 @@
+"""
+Run the context switch suite on the reference model and report what a
+switch costs as a function of the stack depths being flushed and reloaded
+and of the number of tasks.
+
+A switch is measured from the trapping instruction to the `rets` into the
+next task. Its cost is fitted as `fixed + per_item * (flushed + reloaded)`.
+
+Usage (from starjette/): python tests/context_switch_report.py [manifest.json]
+The ROMs must be built first with `make context_switch`.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from exception_report import trap_costs
+from starjette_model import ECAUSE_INTERRUPT, ECAUSE_SYSCALL
+from starjette_system import System
+
+
+def linear_fit(xs, ys):
+    """Least squares y = a + b * x. Returns (a, b)."""
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if var == 0:
+        return mean_y, 0.0
+    b = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var
+    return mean_y - b * mean_x, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("manifest", nargs="?", default="tests/context_switch/manifest.json")
+    args = parser.parse_args()
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    base = os.path.dirname(args.manifest)
+
+    failures = 0
+    summary = []
+    for test in manifest["tests"]:
+        rom = os.path.join(base, test["rom"])
+        if not os.path.exists(rom):
+            print(f"{rom}: missing, run `make context_switch` first")
+            failures += 1
+            continue
+
+        cpu = System(wordsize=manifest.get("wordsize", 16))
+        cpu.load_rom(rom)
+        cpu.trap_log = []
+        cpu.run(test["max_cycles"])
+        passed = cpu.halted and cpu.depth == 1 and cpu.peek() == test["expect"]
+        failures += not passed
+
+        switches = [
+            (entry_depth, exit_depth, cycles)
+            for cause, cycles, entry_depth, exit_depth in trap_costs(cpu.trap_log)
+            if cause in (ECAUSE_SYSCALL, ECAUSE_INTERRUPT)
+        ]
+        print(f"{test['rom']}: {'ok' if passed else 'FAIL'}, {cpu.cycles} cycles, "
+              f"{len(switches)} switches, {test['tasks']} tasks, depths {test['depths']}")
+        if not switches:
+            continue
+
+        total = sum(c for _, _, c in switches)
+        fixed, per_item = linear_fit([o + i for o, i, _ in switches], [c for _, _, c in switches])
+        print(f"    avg {total / len(switches):.1f} cycles/switch, "
+              f"{100 * total / cpu.cycles:.1f}% of run, "
+              f"fit {fixed:.1f} + {per_item:.2f} per stack item")
+
+        pairs = {}
+        for out_depth, in_depth, cycles in switches:
+            pairs.setdefault((out_depth, in_depth), []).append(cycles)
+        for (out_depth, in_depth), costs in sorted(pairs.items()):
+            print(f"    flush {out_depth:4d} reload {in_depth:4d}: {len(costs):5d} x "
+                  f"avg {sum(costs) / len(costs):8.1f} cycles")
+        summary.append((test["rom"], test["tasks"], total / len(switches), fixed, per_item))
+
+    if summary:
+        print("\nby task count:")
+        for rom, tasks, avg, fixed, per_item in summary:
+            print(f"    {rom:<16} {tasks} tasks  avg {avg:8.1f}  fixed {fixed:6.1f}  per item {per_item:5.2f}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+; Expression DAG program 0, best scheduling
+; 4 locals, 2 memory words, 0 temporaries
+    add fp, -8
+    push 0x40e3
+    slw 0
+    push 0x0a91
+    slw 2
+    push 0xea9a
+    slw 4
+    push 0xc38f
+    slw 6
+    push 0xd983
+    push 0x7000
+    sw
+    push 0xc4d2
+    push 0x7002
+    sw
+
+    ; local0 = node 16 (0xffff)
+    push 0x7000
+    lw
+    push 0x0c2b
+    llw 2
+    add
+    or
+    push 0x7190
+    sub
+    dup
+    push 0xffeb
+    add
+    swap
+    sub
+    dup
+    sra
+    slw 0
+
+    ; local3 = node 25 (0x0001)
+    push 0x7000
+    lw
+    llw 6
+    srl
+    slw 6
+
+    ; mem0 = node 33 (0x0000)
+    llw 2
+    push 0x7000
+    lw
+    add
+    dup
+    push 0xfff1
+    swap
+    srl
+    swap
+    sub
+    dup
+    xor
+    push 0x7000
+    sw
+
+    ; mem0 = node 43 (0xffff)
+    llw 0
+    push 0x2a5b
+    sra
+    push 0x7000
+    sw
+
+    ; local2 = node 59 (0x4b2c)
+    push 0x05c7
+    push 0xffed
+    sub
+    dup
+    over
+    sra
+    push 0x7000
+    lw
+    or
+    swap
+    mul
+    drop
+    push 0x7002
+    lw
+    mul
+    drop
+    slw 4
+
+    ; local1 = node 71 (0xc4d2)
+    push 0x000c
+    llw 4
+    mul
+    drop
+    llw 6
+    and
+    push 0x7002
+    lw
+    add
+    slw 2
+
+    ; mem1 = node 86 (0x0000)
+    push 0xb16a
+    llw 0
+    ltu
+    llw 6
+    llw 0
+    sub
+    push 0x7002
+    lw
+    xor
+    and
+    push 0x7002
+    sw
+
+    ; Check the results
+    llw 0
+    push 0xffff
+    xor
+    failnez
+    llw 2
+    push 0xc4d2
+    xor
+    failnez
+    llw 4
+    push 0x4b2c
+    xor
+    failnez
+    llw 6
+    push 0x0001
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0xffff
+    xor
+    failnez
+    push 0x7002
+    lw
+    push 0x0000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
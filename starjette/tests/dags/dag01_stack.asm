@@ -0,0 +1,151 @@
+; Expression DAG program 1, stack scheduling
+; 4 locals, 3 memory words, 1 temporaries
+    add fp, -10
+    push 0x7b20
+    slw 0
+    push 0x5c73
+    slw 2
+    push 0xcf1e
+    slw 4
+    push 0x9f10
+    slw 6
+    push 0xcf3d
+    push 0x7000
+    sw
+    push 0x7d1c
+    push 0x7002
+    sw
+    push 0x323c
+    push 0x7004
+    sw
+
+    ; mem0 = node 15 (0x9f10)
+    llw 0
+    push 0x7000
+    lw
+    ltu
+    dup
+    xor
+    llw 2
+    clz
+    add
+    llw 6
+    mul
+    drop
+    push 0x7000
+    sw
+
+    ; local0 = node 31 (0xff30)
+    llw 6
+    llw 0
+    or
+    slw 0
+
+    ; local0 = node 39 (0xfb83)
+    push 0x7000
+    lw
+    llw 2
+    add
+    slw 0
+
+    ; local1 = node 55 (0x132c)
+    push 0x7002
+    lw
+    llw 0
+    sub
+    push 0x7000
+    lw
+    clz
+    dup
+    push 0x0006
+    add
+    xor
+    dup
+    add
+    mul
+    drop
+    slw 2
+
+    ; local0 = node 70 (0x2dc7)
+    push 0xfff7
+    push 0x0006
+    sra
+    llw 6
+    lt
+    dup
+    over
+    llw 2
+    sra
+    add
+    swap
+    push 0x7004
+    lw
+    xor
+    add
+    llw 0
+    add
+    push 0x0008
+    add
+    slw 0
+
+    ; local0 = node 89 (0x132c)
+    push 0x7002
+    lw
+    push 0x0019
+    push 0xffe6
+    add
+    dup
+    slw 8
+    or
+    dup
+    push 0xfff3
+    sll
+    dup
+    llw 8
+    rot
+    rot
+    xor
+    rot
+    rot
+    and
+    add
+    llw 2
+    and
+    slw 0
+
+    ; Check the results
+    llw 0
+    push 0x132c
+    xor
+    failnez
+    llw 2
+    push 0x132c
+    xor
+    failnez
+    llw 4
+    push 0xcf1e
+    xor
+    failnez
+    llw 6
+    push 0x9f10
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x9f10
+    xor
+    failnez
+    push 0x7002
+    lw
+    push 0x7d1c
+    xor
+    failnez
+    push 0x7004
+    lw
+    push 0x323c
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
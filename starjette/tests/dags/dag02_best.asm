@@ -0,0 +1,120 @@
+; Expression DAG program 2, best scheduling
+; 3 locals, 1 memory words, 0 temporaries
+    add fp, -6
+    push 0x0df2
+    slw 0
+    push 0xca70
+    slw 2
+    push 0x7ffa
+    slw 4
+    push 0xca3d
+    push 0x7000
+    sw
+
+    ; local0 = node 17 (0x7d26)
+    push 0x603d
+    push 0xfffa
+    mul
+    drop
+    dup
+    over
+    sll
+    dup
+    over
+    add
+    dup
+    llw 4
+    or
+    push 0x0c18
+    xor
+    rot
+    rot
+    swap
+    sub
+    swap
+    ltu
+    swap
+    add
+    dup
+    add
+    slw 0
+
+    ; local0 = node 25 (0x0001)
+    llw 2
+    dup
+    push 0x0004
+    lt
+    dup
+    rot
+    rot
+    xor
+    and
+    slw 0
+
+    ; mem0 = node 37 (0x007f)
+    push 0xb2dc
+    llw 2
+    llw 4
+    push 0x7000
+    lw
+    and
+    clz
+    and
+    sra
+    push 0x000f
+    sra
+    push 0xce19
+    srl
+    push 0x7000
+    sw
+
+    ; local0 = node 44 (0x0000)
+    llw 2
+    llw 0
+    llw 0
+    add
+    dup
+    sub
+    and
+    slw 0
+
+    ; local1 = node 56 (0xdef8)
+    push 0x9ea8
+    llw 2
+    or
+    slw 2
+
+    ; mem0 = node 70 (0x0000)
+    push 0x7000
+    lw
+    llw 0
+    ltu
+    dup
+    push 0xffef
+    xor
+    and
+    push 0x7000
+    sw
+
+    ; Check the results
+    llw 0
+    push 0x0000
+    xor
+    failnez
+    llw 2
+    push 0xdef8
+    xor
+    failnez
+    llw 4
+    push 0x7ffa
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,136 @@
+; Expression DAG program 3, best scheduling
+; 4 locals, 1 memory words, 0 temporaries
+    add fp, -8
+    push 0xa39d
+    slw 0
+    push 0xb1da
+    slw 2
+    push 0xac69
+    slw 4
+    push 0x95b8
+    slw 6
+    push 0x4fdf
+    push 0x7000
+    sw
+
+    ; local0 = node 18 (0x1158)
+    llw 0
+    push 0x57ee
+    mul
+    drop
+    push 0x7000
+    lw
+    ltu
+    dup
+    over
+    llw 0
+    sll
+    dup
+    rot
+    rot
+    swap
+    add
+    dup
+    llw 2
+    swap
+    sub
+    rot
+    rot
+    rot
+    rot
+    sll
+    push 0x5b58
+    swap
+    sub
+    rot
+    rot
+    sra
+    and
+    slw 0
+
+    ; mem0 = node 24 (0x0010)
+    push 0x6277
+    push 0x7000
+    lw
+    sub
+    dup
+    sub
+    clz
+    dup
+    srl
+    push 0x7000
+    sw
+
+    ; local0 = node 36 (0xb0d2)
+    llw 2
+    llw 6
+    push 0x234f
+    sub
+    push 0x17f4
+    and
+    sub
+    llw 0
+    add
+    slw 0
+
+    ; local3 = node 47 (0xea10)
+    push 0xe2ce
+    llw 6
+    mul
+    drop
+    slw 6
+
+    ; mem0 = node 59 (0x0000)
+    push 0x7000
+    lw
+    llw 0
+    add
+    dup
+    over
+    xor
+    swap
+    push 0x7000
+    lw
+    and
+    dup
+    push 0x7000
+    lw
+    and
+    llw 0
+    clz
+    and
+    swap
+    llw 0
+    and
+    mul
+    drop
+    sub
+    push 0x7000
+    sw
+
+    ; Check the results
+    llw 0
+    push 0xb0d2
+    xor
+    failnez
+    llw 2
+    push 0xb1da
+    xor
+    failnez
+    llw 4
+    push 0xac69
+    xor
+    failnez
+    llw 6
+    push 0xea10
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
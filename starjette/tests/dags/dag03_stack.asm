@@ -0,0 +1,143 @@
+; Expression DAG program 3, stack scheduling
+; 4 locals, 1 memory words, 2 temporaries
+    add fp, -12
+    push 0xa39d
+    slw 0
+    push 0xb1da
+    slw 2
+    push 0xac69
+    slw 4
+    push 0x95b8
+    slw 6
+    push 0x4fdf
+    push 0x7000
+    sw
+
+    ; local0 = node 18 (0x1158)
+    llw 2
+    llw 0
+    dup
+    push 0x57ee
+    mul
+    drop
+    push 0x7000
+    lw
+    ltu
+    dup
+    slw 8
+    swap
+    sll
+    dup
+    llw 8
+    add
+    dup
+    slw 10
+    rot
+    rot
+    swap
+    sub
+    push 0x5b58
+    rot
+    rot
+    llw 10
+    sll
+    sub
+    llw 8
+    sra
+    and
+    slw 0
+
+    ; mem0 = node 24 (0x0010)
+    push 0x6277
+    push 0x7000
+    lw
+    sub
+    dup
+    sub
+    clz
+    dup
+    srl
+    push 0x7000
+    sw
+
+    ; local0 = node 36 (0xb0d2)
+    llw 2
+    llw 6
+    push 0x234f
+    sub
+    push 0x17f4
+    and
+    sub
+    llw 0
+    add
+    slw 0
+
+    ; local3 = node 47 (0xea10)
+    push 0xe2ce
+    llw 6
+    mul
+    drop
+    slw 6
+
+    ; mem0 = node 59 (0x0000)
+    llw 0
+    push 0x7000
+    lw
+    dup
+    rot
+    rot
+    swap
+    add
+    dup
+    slw 8
+    llw 8
+    xor
+    over
+    rot
+    rot
+    llw 8
+    and
+    dup
+    rot
+    rot
+    swap
+    and
+    llw 0
+    clz
+    and
+    llw 0
+    rot
+    rot
+    and
+    mul
+    drop
+    sub
+    push 0x7000
+    sw
+
+    ; Check the results
+    llw 0
+    push 0xb0d2
+    xor
+    failnez
+    llw 2
+    push 0xb1da
+    xor
+    failnez
+    llw 4
+    push 0xac69
+    xor
+    failnez
+    llw 6
+    push 0xea10
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
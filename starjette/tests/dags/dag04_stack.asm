@@ -0,0 +1,118 @@
+; Expression DAG program 4, stack scheduling
+; 4 locals, 1 memory words, 2 temporaries
+    add fp, -12
+    push 0x5afe
+    slw 0
+    push 0x17d8
+    slw 2
+    push 0xf4fa
+    slw 4
+    push 0x6fee
+    slw 6
+    push 0x93c3
+    push 0x7000
+    sw
+
+    ; mem0 = node 15 (0x0000)
+    push 0x1d78
+    push 0xfff8
+    lt
+    dup
+    mul
+    drop
+    push 0x7000
+    sw
+
+    ; mem0 = node 25 (0x0000)
+    push 0xb1a3
+    push 0x7000
+    lw
+    push 0x7000
+    lw
+    llw 6
+    sll
+    dup
+    rot
+    rot
+    swap
+    or
+    swap
+    add
+    ltu
+    push 0x7000
+    sw
+
+    ; local2 = node 34 (0x6fef)
+    llw 6
+    llw 2
+    llw 2
+    add
+    push 0x7000
+    lw
+    lt
+    push 0x0018
+    lt
+    add
+    slw 4
+
+    ; local3 = node 48 (0x0000)
+    llw 0
+    llw 0
+    llw 4
+    sub
+    dup
+    slw 8
+    llw 8
+    sra
+    dup
+    slw 10
+    sub
+    llw 6
+    push 0x7000
+    lw
+    dup
+    rot
+    rot
+    swap
+    sub
+    rot
+    rot
+    swap
+    add
+    dup
+    llw 8
+    lt
+    srl
+    llw 10
+    sub
+    swap
+    mul
+    drop
+    slw 6
+
+    ; Check the results
+    llw 0
+    push 0x5afe
+    xor
+    failnez
+    llw 2
+    push 0x17d8
+    xor
+    failnez
+    llw 4
+    push 0x6fef
+    xor
+    failnez
+    llw 6
+    push 0x0000
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
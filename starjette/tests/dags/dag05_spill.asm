@@ -0,0 +1,146 @@
+; Expression DAG program 5, spill scheduling
+; 4 locals, 1 memory words, 2 temporaries
+    add fp, -12
+    push 0xb60c
+    slw 0
+    push 0xaa25
+    slw 2
+    push 0x9cb9
+    slw 4
+    push 0xe70e
+    slw 6
+    push 0xade3
+    push 0x7000
+    sw
+
+    ; mem0 = node 17 (0x0000)
+    llw 4
+    llw 2
+    llw 2
+    llw 6
+    add
+    dup
+    slw 8
+    llw 8
+    sll
+    sub
+    and
+    dup
+    slw 10
+    llw 10
+    xor
+    push 0x7000
+    sw
+
+    ; mem0 = node 22 (0x4101)
+    push 0x7000
+    lw
+    clz
+    clz
+    push 0xbf0a
+    sub
+    push 0x7000
+    sw
+
+    ; local0 = node 28 (0xbf62)
+    push 0x7000
+    lw
+    llw 4
+    mul
+    drop
+    dup
+    slw 8
+    llw 8
+    mul
+    drop
+    push 0x7000
+    lw
+    sll
+    slw 0
+
+    ; local0 = node 47 (0x40ff)
+    push 0x7000
+    lw
+    llw 6
+    push 0xffe8
+    and
+    and
+    push 0xfff2
+    or
+    push 0x7000
+    lw
+    and
+    push 0xfffb
+    llw 6
+    or
+    add
+    slw 0
+
+    ; mem0 = node 56 (0x0000)
+    llw 4
+    llw 4
+    sub
+    push 0x7000
+    sw
+
+    ; local3 = node 72 (0xa7f1)
+    llw 0
+    llw 6
+    xor
+    slw 6
+
+    ; local3 = node 78 (0x9cba)
+    llw 4
+    push 0xfffb
+    push 0x7000
+    lw
+    add
+    dup
+    slw 8
+    sub
+    llw 8
+    and
+    slw 6
+
+    ; mem0 = node 83 (0x0001)
+    push 0x7000
+    lw
+    push 0x0019
+    lt
+    dup
+    slw 8
+    llw 8
+    and
+    dup
+    slw 10
+    llw 10
+    or
+    push 0x7000
+    sw
+
+    ; Check the results
+    llw 0
+    push 0x40ff
+    xor
+    failnez
+    llw 2
+    push 0xaa25
+    xor
+    failnez
+    llw 4
+    push 0x9cb9
+    xor
+    failnez
+    llw 6
+    push 0x9cba
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0001
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,144 @@
+; Expression DAG program 5, stack scheduling
+; 4 locals, 1 memory words, 0 temporaries
+    add fp, -8
+    push 0xb60c
+    slw 0
+    push 0xaa25
+    slw 2
+    push 0x9cb9
+    slw 4
+    push 0xe70e
+    slw 6
+    push 0xade3
+    push 0x7000
+    sw
+
+    ; mem0 = node 17 (0x0000)
+    llw 4
+    llw 2
+    dup
+    llw 6
+    add
+    dup
+    sll
+    sub
+    and
+    dup
+    xor
+    push 0x7000
+    sw
+
+    ; mem0 = node 22 (0x4101)
+    push 0x7000
+    lw
+    clz
+    clz
+    push 0xbf0a
+    sub
+    push 0x7000
+    sw
+
+    ; local0 = node 28 (0xbf62)
+    push 0x7000
+    lw
+    llw 4
+    mul
+    drop
+    dup
+    mul
+    drop
+    push 0x7000
+    lw
+    sll
+    slw 0
+
+    ; local0 = node 47 (0x40ff)
+    push 0x7000
+    lw
+    dup
+    llw 6
+    dup
+    push 0xffe8
+    and
+    rot
+    rot
+    swap
+    and
+    push 0xfff2
+    or
+    rot
+    rot
+    and
+    push 0xfffb
+    rot
+    rot
+    or
+    add
+    slw 0
+
+    ; mem0 = node 56 (0x0000)
+    llw 4
+    dup
+    sub
+    push 0x7000
+    sw
+
+    ; local3 = node 72 (0xa7f1)
+    llw 0
+    llw 6
+    xor
+    slw 6
+
+    ; local3 = node 78 (0x9cba)
+    llw 4
+    push 0xfffb
+    push 0x7000
+    lw
+    add
+    dup
+    rot
+    rot
+    swap
+    sub
+    swap
+    and
+    slw 6
+
+    ; mem0 = node 83 (0x0001)
+    push 0x7000
+    lw
+    push 0x0019
+    lt
+    dup
+    and
+    dup
+    or
+    push 0x7000
+    sw
+
+    ; Check the results
+    llw 0
+    push 0x40ff
+    xor
+    failnez
+    llw 2
+    push 0xaa25
+    xor
+    failnez
+    llw 4
+    push 0x9cb9
+    xor
+    failnez
+    llw 6
+    push 0x9cba
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0001
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
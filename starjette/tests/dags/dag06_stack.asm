@@ -0,0 +1,129 @@
+; Expression DAG program 6, stack scheduling
+; 4 locals, 2 memory words, 0 temporaries
+    add fp, -8
+    push 0x5286
+    slw 0
+    push 0xa81f
+    slw 2
+    push 0x5f63
+    slw 4
+    push 0xce09
+    slw 6
+    push 0x920d
+    push 0x7000
+    sw
+    push 0x9ea8
+    push 0x7002
+    sw
+
+    ; local1 = node 14 (0xdfbd)
+    push 0x4d15
+    push 0x7002
+    lw
+    or
+    slw 2
+
+    ; local1 = node 26 (0x001b)
+    llw 6
+    push 0x5271
+    push 0x7000
+    lw
+    or
+    or
+    dup
+    over
+    srl
+    swap
+    add
+    push 0x315b
+    srl
+    slw 2
+
+    ; local1 = node 32 (0x3870)
+    llw 6
+    dup
+    or
+    push 0x6a82
+    add
+    llw 2
+    sub
+    slw 2
+
+    ; local1 = node 40 (0x0010)
+    push 0x8700
+    push 0x001b
+    and
+    clz
+    slw 2
+
+    ; local0 = node 54 (0xc52e)
+    push 0x5e18
+    push 0x0000
+    lt
+    llw 0
+    add
+    llw 2
+    push 0x7000
+    lw
+    add
+    mul
+    drop
+    slw 0
+
+    ; local1 = node 70 (0xfff1)
+    push 0xffe1
+    llw 2
+    or
+    slw 2
+
+    ; local0 = node 87 (0xefcf)
+    llw 6
+    llw 0
+    llw 2
+    push 0x7002
+    lw
+    and
+    add
+    or
+    slw 0
+
+    ; local1 = node 97 (0xddf9)
+    push 0xffec
+    llw 6
+    push 0x7000
+    lw
+    or
+    add
+    slw 2
+
+    ; Check the results
+    llw 0
+    push 0xefcf
+    xor
+    failnez
+    llw 2
+    push 0xddf9
+    xor
+    failnez
+    llw 4
+    push 0x5f63
+    xor
+    failnez
+    llw 6
+    push 0xce09
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x920d
+    xor
+    failnez
+    push 0x7002
+    lw
+    push 0x9ea8
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
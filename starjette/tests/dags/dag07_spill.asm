@@ -0,0 +1,150 @@
+; Expression DAG program 7, spill scheduling
+; 3 locals, 1 memory words, 2 temporaries
+    add fp, -10
+    push 0xf2f6
+    slw 0
+    push 0x466c
+    slw 2
+    push 0x7203
+    slw 4
+    push 0x3d3f
+    push 0x7000
+    sw
+
+    ; mem0 = node 15 (0x0000)
+    llw 0
+    llw 0
+    lt
+    dup
+    slw 6
+    llw 6
+    add
+    dup
+    slw 8
+    push 0x000a
+    llw 8
+    add
+    llw 2
+    lt
+    llw 4
+    mul
+    drop
+    push 0x7d6e
+    ltu
+    sll
+    push 0x7000
+    sw
+
+    ; local1 = node 21 (0x0000)
+    llw 4
+    push 0x7000
+    lw
+    add
+    dup
+    slw 6
+    llw 6
+    sub
+    llw 0
+    sra
+    slw 2
+
+    ; local1 = node 31 (0xe5ec)
+    llw 0
+    llw 0
+    add
+    push 0x7000
+    lw
+    sub
+    slw 2
+
+    ; local2 = node 43 (0x0000)
+    push 0x7000
+    lw
+    llw 2
+    push 0x5823
+    mul
+    drop
+    clz
+    dup
+    slw 6
+    sub
+    llw 6
+    and
+    slw 4
+
+    ; local0 = node 58 (0x8160)
+    push 0x71e8
+    push 0x0012
+    llw 2
+    add
+    dup
+    slw 6
+    llw 6
+    xor
+    push 0x7000
+    lw
+    sll
+    add
+    push 0x0002
+    sub
+    llw 6
+    sub
+    llw 2
+    and
+    push 0x8d76
+    and
+    slw 0
+
+    ; local2 = node 70 (0x0001)
+    push 0x6fc5
+    clz
+    slw 4
+
+    ; local1 = node 87 (0x8000)
+    llw 0
+    push 0x7000
+    lw
+    push 0x6b59
+    push 0xffe7
+    push 0x7000
+    lw
+    lt
+    dup
+    slw 6
+    add
+    dup
+    slw 8
+    add
+    llw 6
+    mul
+    drop
+    srl
+    llw 8
+    sll
+    push 0x7000
+    lw
+    add
+    slw 2
+
+    ; Check the results
+    llw 0
+    push 0x8160
+    xor
+    failnez
+    llw 2
+    push 0x8000
+    xor
+    failnez
+    llw 4
+    push 0x0001
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0x0000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,1804 @@
+; Dispatch benchmark: 256 byte values (20 trapping) x 100
+; Trap handler and macro vectors: record the cause in TRAP_VAR and continue
+    jump _main
+
+#addr 0x100
+    push 0x100
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x108
+    push 0x101
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x110
+    push 0x102
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x118
+    push 0x103
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x120
+    push 0x104
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x128
+    push 0x105
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x130
+    push 0x106
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x138
+    push 0x107
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x140
+    push 0x108
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x148
+    push 0x109
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x150
+    push 0x10a
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x158
+    push 0x10b
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x160
+    push 0x10c
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x168
+    push 0x10d
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x170
+    push 0x10e
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x178
+    push 0x10f
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x180
+    push 0x110
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x188
+    push 0x111
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x190
+    push 0x112
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x198
+    push 0x113
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1a0
+    push 0x114
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1a8
+    push 0x115
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1b0
+    push 0x116
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1b8
+    push 0x117
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1c0
+    push 0x118
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1c8
+    push 0x119
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1d0
+    push 0x11a
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1d8
+    push 0x11b
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1e0
+    push 0x11c
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1e8
+    push 0x11d
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1f0
+    push 0x11e
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1f8
+    push 0x11f
+    push 0x7f00
+    sw
+    rets
+
+#bank code
+
+_trap:
+    push ecause
+    push 0x7f00
+    sw
+    push 0x7f02
+    lw
+    bnez _finish
+    rets
+
+_finish:
+    li status, 1
+    push 0x7f02
+    lw
+    halt
+
+_fail:
+    push 0x7f04
+    lw
+    add 2
+    push 0x7f02
+    sw
+    syscall
+
+_main:
+    li evec, _trap
+    li fp, 0x7e00
+    li afp, 0x7d00
+    push 0
+    push 0x7f02
+    sw
+    li status, 5
+    push 100
+    push 0x7f06
+    sw
+
+_loop:
+    ; push -7
+    push 0x0123
+    #d8 0x79
+_b0:
+    drop
+    drop
+    ; shi 0x0a
+    push 0x0123
+    #d8 0x8a
+_b1:
+    drop
+    ; halt -> ecause 0x12
+    #d8 0x00
+_b2:
+    ; shi 0x1f
+    push 0x0123
+    #d8 0x9f
+_b3:
+    drop
+    ; rel pc
+    push 0x0005
+    #d8 0x10
+_b4:
+    drop
+    ; #d8 0x39 -> macro vector 0x19
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x39
+_b5:
+    drop
+    drop
+    drop
+    ; shi 0x07
+    push 0x0123
+    #d8 0x87
+_b6:
+    drop
+    ; #d8 0x38 -> macro vector 0x18
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x38
+_b7:
+    drop
+    drop
+    drop
+    ; push 31
+    push 0x0123
+    #d8 0x5f
+_b8:
+    drop
+    drop
+    ; push 28
+    push 0x0123
+    #d8 0x5c
+_b9:
+    drop
+    drop
+    ; shi 0x06
+    push 0x0123
+    #d8 0x86
+_b10:
+    drop
+    ; or
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x27
+_b11:
+    drop
+    drop
+    ; push -17
+    push 0x0123
+    #d8 0x6f
+_b12:
+    drop
+    drop
+    ; pop fp
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x15
+_b13:
+    drop
+    drop
+    ; shi 0x31
+    push 0x0123
+    #d8 0xb1
+_b14:
+    drop
+    ; shi 0x24
+    push 0x0123
+    #d8 0xa4
+_b15:
+    drop
+    ; #d8 0x34 -> macro vector 0x14
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x34
+_b16:
+    drop
+    drop
+    drop
+    ; shi 0x26
+    push 0x0123
+    #d8 0xa6
+_b17:
+    drop
+    ; shi 0x40
+    push 0x0123
+    #d8 0xc0
+_b18:
+    drop
+    ; shi 0x36
+    push 0x0123
+    #d8 0xb6
+_b19:
+    drop
+    ; shi 0x45
+    push 0x0123
+    #d8 0xc5
+_b20:
+    drop
+    ; push 4
+    push 0x0123
+    #d8 0x44
+_b21:
+    drop
+    drop
+    ; push -10
+    push 0x0123
+    #d8 0x76
+_b22:
+    drop
+    drop
+    ; add fp
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x19
+_b23:
+    drop
+    drop
+    ; shi 0x00
+    push 0x0123
+    #d8 0x80
+_b24:
+    drop
+    ; shi 0x11
+    push 0x0123
+    #d8 0x91
+_b25:
+    drop
+    ; push -15
+    push 0x0123
+    #d8 0x71
+_b26:
+    drop
+    drop
+    ; push -8
+    push 0x0123
+    #d8 0x78
+_b27:
+    drop
+    drop
+    ; shi 0x79
+    push 0x0123
+    #d8 0xf9
+_b28:
+    drop
+    ; push 0
+    push 0x0123
+    #d8 0x40
+_b29:
+    drop
+    drop
+    ; push 26
+    push 0x0123
+    #d8 0x5a
+_b30:
+    drop
+    drop
+    ; rel fp
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x11
+_b31:
+    drop
+    drop
+    drop
+    ; shi 0x75
+    push 0x0123
+    #d8 0xf5
+_b32:
+    drop
+    ; rel ry
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x13
+_b33:
+    drop
+    drop
+    drop
+    ; shi 0x12
+    push 0x0123
+    #d8 0x92
+_b34:
+    drop
+    ; shi 0x5b
+    push 0x0123
+    #d8 0xdb
+_b35:
+    drop
+    ; xor
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0e
+_b36:
+    drop
+    drop
+    ; and
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0d
+_b37:
+    drop
+    drop
+    ; shi 0x60
+    push 0x0123
+    #d8 0xe0
+_b38:
+    drop
+    ; shi 0x23
+    push 0x0123
+    #d8 0xa3
+_b39:
+    drop
+    ; shi 0x41
+    push 0x0123
+    #d8 0xc1
+_b40:
+    drop
+    ; sb
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0xa5c3
+    push 0x7f80
+    #d8 0x2b
+_b41:
+    ; shi 0x7b
+    push 0x0123
+    #d8 0xfb
+_b42:
+    drop
+    ; shi 0x2e
+    push 0x0123
+    #d8 0xae
+_b43:
+    drop
+    ; shi 0x0d
+    push 0x0123
+    #d8 0x8d
+_b44:
+    drop
+    ; shi 0x47
+    push 0x0123
+    #d8 0xc7
+_b45:
+    drop
+    ; shi 0x03
+    push 0x0123
+    #d8 0x83
+_b46:
+    drop
+    ; shi 0x2a
+    push 0x0123
+    #d8 0xaa
+_b47:
+    drop
+    ; shi 0x1a
+    push 0x0123
+    #d8 0x9a
+_b48:
+    drop
+    ; push 7
+    push 0x0123
+    #d8 0x47
+_b49:
+    drop
+    drop
+    ; shi 0x74
+    push 0x0123
+    #d8 0xf4
+_b50:
+    drop
+    ; shi 0x34
+    push 0x0123
+    #d8 0xb4
+_b51:
+    drop
+    ; push 22
+    push 0x0123
+    #d8 0x56
+_b52:
+    drop
+    drop
+    ; clz
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x29
+_b53:
+    drop
+    drop
+    drop
+    ; shi 0x19
+    push 0x0123
+    #d8 0x99
+_b54:
+    drop
+    ; shi 0x32
+    push 0x0123
+    #d8 0xb2
+_b55:
+    drop
+    ; lnw
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    #d8 0x2e
+_b56:
+    drop
+    ; shi 0x46
+    push 0x0123
+    #d8 0xc6
+_b57:
+    drop
+    ; push -22
+    push 0x0123
+    #d8 0x6a
+_b58:
+    drop
+    drop
+    ; shi 0x6a
+    push 0x0123
+    #d8 0xea
+_b59:
+    drop
+    ; #d8 0x3b -> macro vector 0x1b
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3b
+_b60:
+    drop
+    drop
+    drop
+    ; div -> macro vector 0x00
+    push 0x0064
+    push 0x0007
+    #d8 0x20
+_b61:
+    drop
+    drop
+    ; push -26
+    push 0x0123
+    #d8 0x66
+_b62:
+    drop
+    drop
+    ; pop pc
+    push _b63
+    #d8 0x14
+_b63:
+    ; shi 0x1e
+    push 0x0123
+    #d8 0x9e
+_b64:
+    drop
+    ; rel rx
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x12
+_b65:
+    drop
+    drop
+    drop
+    ; push -9
+    push 0x0123
+    #d8 0x77
+_b66:
+    drop
+    drop
+    ; shi 0x3d
+    push 0x0123
+    #d8 0xbd
+_b67:
+    drop
+    ; over
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x07
+_b68:
+    drop
+    drop
+    drop
+    drop
+    ; shi 0x0e
+    push 0x0123
+    #d8 0x8e
+_b69:
+    drop
+    ; pop rx
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x16
+_b70:
+    drop
+    drop
+    ; divu -> macro vector 0x01
+    push 0x0064
+    push 0x0007
+    #d8 0x21
+_b71:
+    drop
+    drop
+    ; push 25
+    push 0x0123
+    #d8 0x59
+_b72:
+    drop
+    drop
+    ; shi 0x2c
+    push 0x0123
+    #d8 0xac
+_b73:
+    drop
+    ; shi 0x37
+    push 0x0123
+    #d8 0xb7
+_b74:
+    drop
+    ; shi 0x7d
+    push 0x0123
+    #d8 0xfd
+_b75:
+    drop
+    ; push -12
+    push 0x0123
+    #d8 0x74
+_b76:
+    drop
+    drop
+    ; push -2
+    push 0x0123
+    #d8 0x7e
+_b77:
+    drop
+    drop
+    ; shi 0x0f
+    push 0x0123
+    #d8 0x8f
+_b78:
+    drop
+    ; #d8 0x35 -> macro vector 0x15
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x35
+_b79:
+    drop
+    drop
+    drop
+    ; push -25
+    push 0x0123
+    #d8 0x67
+_b80:
+    drop
+    drop
+    ; push 18
+    push 0x0123
+    #d8 0x52
+_b81:
+    drop
+    drop
+    ; shi 0x4f
+    push 0x0123
+    #d8 0xcf
+_b82:
+    drop
+    ; shi 0x58
+    push 0x0123
+    #d8 0xd8
+_b83:
+    drop
+    ; add ry
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x1b
+_b84:
+    drop
+    drop
+    ; shi 0x54
+    push 0x0123
+    #d8 0xd4
+_b85:
+    drop
+    ; shi 0x5e
+    push 0x0123
+    #d8 0xde
+_b86:
+    drop
+    ; shi 0x48
+    push 0x0123
+    #d8 0xc8
+_b87:
+    drop
+    ; shi 0x43
+    push 0x0123
+    #d8 0xc3
+_b88:
+    drop
+    ; #d8 0x3d -> macro vector 0x1d
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3d
+_b89:
+    drop
+    drop
+    drop
+    ; push 11
+    push 0x0123
+    #d8 0x4b
+_b90:
+    drop
+    drop
+    ; #d8 0x3e -> macro vector 0x1e
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3e
+_b91:
+    drop
+    drop
+    drop
+    ; push 12
+    push 0x0123
+    #d8 0x4c
+_b92:
+    drop
+    drop
+    ; shi 0x16
+    push 0x0123
+    #d8 0x96
+_b93:
+    drop
+    ; shi 0x3a
+    push 0x0123
+    #d8 0xba
+_b94:
+    drop
+    ; push -6
+    push 0x0123
+    #d8 0x7a
+_b95:
+    drop
+    drop
+    ; shi 0x3f
+    push 0x0123
+    #d8 0xbf
+_b96:
+    drop
+    ; shi 0x65
+    push 0x0123
+    #d8 0xe5
+_b97:
+    drop
+    ; shi 0x51
+    push 0x0123
+    #d8 0xd1
+_b98:
+    drop
+    ; shi 0x44
+    push 0x0123
+    #d8 0xc4
+_b99:
+    drop
+    ; push 27
+    push 0x0123
+    #d8 0x5b
+_b100:
+    drop
+    drop
+    ; push 6
+    push 0x0123
+    #d8 0x46
+_b101:
+    drop
+    drop
+    ; shi 0x05
+    push 0x0123
+    #d8 0x85
+_b102:
+    drop
+    ; shi 0x7a
+    push 0x0123
+    #d8 0xfa
+_b103:
+    drop
+    ; shi 0x4b
+    push 0x0123
+    #d8 0xcb
+_b104:
+    drop
+    ; #d8 0x30 -> macro vector 0x10
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x30
+_b105:
+    drop
+    drop
+    drop
+    ; push 5
+    push 0x0123
+    #d8 0x45
+_b106:
+    drop
+    drop
+    ; mul
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x22
+_b107:
+    drop
+    drop
+    drop
+    ; shi 0x52
+    push 0x0123
+    #d8 0xd2
+_b108:
+    drop
+    ; #d8 0x31 -> macro vector 0x11
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x31
+_b109:
+    drop
+    drop
+    drop
+    ; shi 0x3b
+    push 0x0123
+    #d8 0xbb
+_b110:
+    drop
+    ; shi 0x6f
+    push 0x0123
+    #d8 0xef
+_b111:
+    drop
+    ; shi 0x72
+    push 0x0123
+    #d8 0xf2
+_b112:
+    drop
+    ; fsl
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0f
+_b113:
+    drop
+    ; push -29
+    push 0x0123
+    #d8 0x63
+_b114:
+    drop
+    drop
+    ; shi 0x6c
+    push 0x0123
+    #d8 0xec
+_b115:
+    drop
+    ; shi 0x77
+    push 0x0123
+    #d8 0xf7
+_b116:
+    drop
+    ; shi 0x4a
+    push 0x0123
+    #d8 0xca
+_b117:
+    drop
+    ; push -28
+    push 0x0123
+    #d8 0x64
+_b118:
+    drop
+    drop
+    ; shi 0x5c
+    push 0x0123
+    #d8 0xdc
+_b119:
+    drop
+    ; push -4
+    push 0x0123
+    #d8 0x7c
+_b120:
+    drop
+    drop
+    ; drop
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x08
+_b121:
+    drop
+    drop
+    ; beqz
+    push 0x00a5
+    push 0x0000
+    #d8 0x04
+_b122:
+    ; #d8 0x33 -> macro vector 0x13
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x33
+_b123:
+    drop
+    drop
+    drop
+    ; shi 0x22
+    push 0x0123
+    #d8 0xa2
+_b124:
+    drop
+    ; sh
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0xa5c3
+    push 0x7f80
+    #d8 0x2d
+_b125:
+    ; push 19
+    push 0x0123
+    #d8 0x53
+_b126:
+    drop
+    drop
+    ; push 23
+    push 0x0123
+    #d8 0x57
+_b127:
+    drop
+    drop
+    ; push -32
+    push 0x0123
+    #d8 0x60
+_b128:
+    drop
+    drop
+    ; shi 0x29
+    push 0x0123
+    #d8 0xa9
+_b129:
+    drop
+    ; push -20
+    push 0x0123
+    #d8 0x6c
+_b130:
+    drop
+    drop
+    ; shi 0x42
+    push 0x0123
+    #d8 0xc2
+_b131:
+    drop
+    ; shi 0x7e
+    push 0x0123
+    #d8 0xfe
+_b132:
+    drop
+    ; push -27
+    push 0x0123
+    #d8 0x65
+_b133:
+    drop
+    drop
+    ; shi 0x6e
+    push 0x0123
+    #d8 0xee
+_b134:
+    drop
+    ; push 16
+    push 0x0123
+    #d8 0x50
+_b135:
+    drop
+    drop
+    ; shi 0x0b
+    push 0x0123
+    #d8 0x8b
+_b136:
+    drop
+    ; push -11
+    push 0x0123
+    #d8 0x75
+_b137:
+    drop
+    drop
+    ; shi 0x5d
+    push 0x0123
+    #d8 0xdd
+_b138:
+    drop
+    ; shi 0x68
+    push 0x0123
+    #d8 0xe8
+_b139:
+    drop
+    ; shi 0x1b
+    push 0x0123
+    #d8 0x9b
+_b140:
+    drop
+    ; shi 0x0c
+    push 0x0123
+    #d8 0x8c
+_b141:
+    drop
+    ; push 1
+    push 0x0123
+    #d8 0x41
+_b142:
+    drop
+    drop
+    ; shi 0x30
+    push 0x0123
+    #d8 0xb0
+_b143:
+    drop
+    ; dup
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x09
+_b144:
+    drop
+    drop
+    drop
+    drop
+    ; push 13
+    push 0x0123
+    #d8 0x4d
+_b145:
+    drop
+    drop
+    ; shi 0x4c
+    push 0x0123
+    #d8 0xcc
+_b146:
+    drop
+    ; shi 0x62
+    push 0x0123
+    #d8 0xe2
+_b147:
+    drop
+    ; lw
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x7f80
+    #d8 0x1e
+_b148:
+    drop
+    ; shi 0x56
+    push 0x0123
+    #d8 0xd6
+_b149:
+    drop
+    ; sll
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x26
+_b150:
+    drop
+    drop
+    ; shi 0x73
+    push 0x0123
+    #d8 0xf3
+_b151:
+    drop
+    ; push 15
+    push 0x0123
+    #d8 0x4f
+_b152:
+    drop
+    drop
+    ; popcsr (csr 3, written back)
+    push 3
+    pushcsr
+    push 3
+    #d8 0x1d
+_b153:
+    ; shi 0x15
+    push 0x0123
+    #d8 0x95
+_b154:
+    drop
+    ; shi 0x70
+    push 0x0123
+    #d8 0xf0
+_b155:
+    drop
+    ; sra
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x25
+_b156:
+    drop
+    drop
+    ; shi 0x27
+    push 0x0123
+    #d8 0xa7
+_b157:
+    drop
+    ; shi 0x7c
+    push 0x0123
+    #d8 0xfc
+_b158:
+    drop
+    ; #d8 0x3c -> macro vector 0x1c
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3c
+_b159:
+    drop
+    drop
+    drop
+    ; add rx
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x1a
+_b160:
+    drop
+    drop
+    ; push -3
+    push 0x0123
+    #d8 0x7d
+_b161:
+    drop
+    drop
+    ; callp
+    push _b162
+    #d8 0x03
+_b162:
+    ; shi 0x33
+    push 0x0123
+    #d8 0xb3
+_b163:
+    drop
+    ; shi 0x18
+    push 0x0123
+    #d8 0x98
+_b164:
+    drop
+    ; shi 0x1d
+    push 0x0123
+    #d8 0x9d
+_b165:
+    drop
+    ; rets
+    li epc, _b166
+    li estatus, 5
+    #d8 0x01
+_b166:
+    ; push 3
+    push 0x0123
+    #d8 0x43
+_b167:
+    drop
+    drop
+    ; #d8 0x3a -> macro vector 0x1a
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3a
+_b168:
+    drop
+    drop
+    drop
+    ; shi 0x5a
+    push 0x0123
+    #d8 0xda
+_b169:
+    drop
+    ; srl
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x24
+_b170:
+    drop
+    drop
+    ; add pc
+    push 0x0000
+    #d8 0x18
+_b171:
+    ; shi 0x10
+    push 0x0123
+    #d8 0x90
+_b172:
+    drop
+    ; push 2
+    push 0x0123
+    #d8 0x42
+_b173:
+    drop
+    drop
+    ; shi 0x6d
+    push 0x0123
+    #d8 0xed
+_b174:
+    drop
+    ; push 24
+    push 0x0123
+    #d8 0x58
+_b175:
+    drop
+    drop
+    ; shi 0x71
+    push 0x0123
+    #d8 0xf1
+_b176:
+    drop
+    ; shi 0x4d
+    push 0x0123
+    #d8 0xcd
+_b177:
+    drop
+    ; shi 0x01
+    push 0x0123
+    #d8 0x81
+_b178:
+    drop
+    ; shi 0x25
+    push 0x0123
+    #d8 0xa5
+_b179:
+    drop
+    ; shi 0x35
+    push 0x0123
+    #d8 0xb5
+_b180:
+    drop
+    ; push 30
+    push 0x0123
+    #d8 0x5e
+_b181:
+    drop
+    drop
+    ; shi 0x2d
+    push 0x0123
+    #d8 0xad
+_b182:
+    drop
+    ; swap
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x06
+_b183:
+    drop
+    drop
+    drop
+    ; push -14
+    push 0x0123
+    #d8 0x72
+_b184:
+    drop
+    drop
+    ; syscall -> ecause 0x00
+    #d8 0x02
+_b185:
+    ; shi 0x38
+    push 0x0123
+    #d8 0xb8
+_b186:
+    drop
+    ; pop ry
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x17
+_b187:
+    drop
+    drop
+    ; push 14
+    push 0x0123
+    #d8 0x4e
+_b188:
+    drop
+    drop
+    ; lt
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0b
+_b189:
+    drop
+    drop
+    ; shi 0x28
+    push 0x0123
+    #d8 0xa8
+_b190:
+    drop
+    ; shi 0x21
+    push 0x0123
+    #d8 0xa1
+_b191:
+    drop
+    ; push -5
+    push 0x0123
+    #d8 0x7b
+_b192:
+    drop
+    drop
+    ; push -16
+    push 0x0123
+    #d8 0x70
+_b193:
+    drop
+    drop
+    ; push -18
+    push 0x0123
+    #d8 0x6e
+_b194:
+    drop
+    drop
+    ; #d8 0x37 -> macro vector 0x17
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x37
+_b195:
+    drop
+    drop
+    drop
+    ; shi 0x63
+    push 0x0123
+    #d8 0xe3
+_b196:
+    drop
+    ; push 29
+    push 0x0123
+    #d8 0x5d
+_b197:
+    drop
+    drop
+    ; shi 0x5f
+    push 0x0123
+    #d8 0xdf
+_b198:
+    drop
+    ; shi 0x49
+    push 0x0123
+    #d8 0xc9
+_b199:
+    drop
+    ; push 17
+    push 0x0123
+    #d8 0x51
+_b200:
+    drop
+    drop
+    ; shi 0x66
+    push 0x0123
+    #d8 0xe6
+_b201:
+    drop
+    ; push -23
+    push 0x0123
+    #d8 0x69
+_b202:
+    drop
+    drop
+    ; shi 0x14
+    push 0x0123
+    #d8 0x94
+_b203:
+    drop
+    ; push -21
+    push 0x0123
+    #d8 0x6b
+_b204:
+    drop
+    drop
+    ; shi 0x3e
+    push 0x0123
+    #d8 0xbe
+_b205:
+    drop
+    ; sw
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0xa5c3
+    push 0x7f80
+    #d8 0x1f
+_b206:
+    ; shi 0x76
+    push 0x0123
+    #d8 0xf6
+_b207:
+    drop
+    ; #d8 0x36 -> macro vector 0x16
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x36
+_b208:
+    drop
+    drop
+    drop
+    ; shi 0x4e
+    push 0x0123
+    #d8 0xce
+_b209:
+    drop
+    ; push -31
+    push 0x0123
+    #d8 0x61
+_b210:
+    drop
+    drop
+    ; shi 0x08
+    push 0x0123
+    #d8 0x88
+_b211:
+    drop
+    ; shi 0x53
+    push 0x0123
+    #d8 0xd3
+_b212:
+    drop
+    ; lb
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x7f80
+    #d8 0x2a
+_b213:
+    drop
+    ; shi 0x2b
+    push 0x0123
+    #d8 0xab
+_b214:
+    drop
+    ; push 9
+    push 0x0123
+    #d8 0x49
+_b215:
+    drop
+    drop
+    ; shi 0x39
+    push 0x0123
+    #d8 0xb9
+_b216:
+    drop
+    ; shi 0x17
+    push 0x0123
+    #d8 0x97
+_b217:
+    drop
+    ; shi 0x04
+    push 0x0123
+    #d8 0x84
+_b218:
+    drop
+    ; rot
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x23
+_b219:
+    drop
+    drop
+    drop
+    ; sub
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x28
+_b220:
+    drop
+    drop
+    ; push -1
+    push 0x0123
+    #d8 0x7f
+_b221:
+    drop
+    drop
+    ; push 21
+    push 0x0123
+    #d8 0x55
+_b222:
+    drop
+    drop
+    ; shi 0x6b
+    push 0x0123
+    #d8 0xeb
+_b223:
+    drop
+    ; push -19
+    push 0x0123
+    #d8 0x6d
+_b224:
+    drop
+    drop
+    ; shi 0x78
+    push 0x0123
+    #d8 0xf8
+_b225:
+    drop
+    ; push -24
+    push 0x0123
+    #d8 0x68
+_b226:
+    drop
+    drop
+    ; shi 0x64
+    push 0x0123
+    #d8 0xe4
+_b227:
+    drop
+    ; shi 0x7f
+    push 0x0123
+    #d8 0xff
+_b228:
+    drop
+    ; shi 0x59
+    push 0x0123
+    #d8 0xd9
+_b229:
+    drop
+    ; push 20
+    push 0x0123
+    #d8 0x54
+_b230:
+    drop
+    drop
+    ; shi 0x69
+    push 0x0123
+    #d8 0xe9
+_b231:
+    drop
+    ; shi 0x57
+    push 0x0123
+    #d8 0xd7
+_b232:
+    drop
+    ; add
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0c
+_b233:
+    drop
+    drop
+    ; pushcsr (csr 4)
+    push 0x0004
+    #d8 0x1c
+_b234:
+    drop
+    ; shi 0x02
+    push 0x0123
+    #d8 0x82
+_b235:
+    drop
+    ; shi 0x67
+    push 0x0123
+    #d8 0xe7
+_b236:
+    drop
+    ; shi 0x20
+    push 0x0123
+    #d8 0xa0
+_b237:
+    drop
+    ; #d8 0x32 -> macro vector 0x12
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x32
+_b238:
+    drop
+    drop
+    drop
+    ; push -13
+    push 0x0123
+    #d8 0x73
+_b239:
+    drop
+    drop
+    ; shi 0x61
+    push 0x0123
+    #d8 0xe1
+_b240:
+    drop
+    ; push 8
+    push 0x0123
+    #d8 0x48
+_b241:
+    drop
+    drop
+    ; push 10
+    push 0x0123
+    #d8 0x4a
+_b242:
+    drop
+    drop
+    ; shi 0x2f
+    push 0x0123
+    #d8 0xaf
+_b243:
+    drop
+    ; lh
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x7f80
+    #d8 0x2c
+_b244:
+    drop
+    ; shi 0x1c
+    push 0x0123
+    #d8 0x9c
+_b245:
+    drop
+    ; snw
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x5a5a
+    #d8 0x2f
+_b246:
+    ; bnez
+    push 0x00a5
+    push 0x0000
+    #d8 0x05
+_b247:
+    ; shi 0x09
+    push 0x0123
+    #d8 0x89
+_b248:
+    drop
+    ; shi 0x13
+    push 0x0123
+    #d8 0x93
+_b249:
+    drop
+    ; push -30
+    push 0x0123
+    #d8 0x62
+_b250:
+    drop
+    drop
+    ; ltu
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0a
+_b251:
+    drop
+    drop
+    ; shi 0x3c
+    push 0x0123
+    #d8 0xbc
+_b252:
+    drop
+    ; shi 0x55
+    push 0x0123
+    #d8 0xd5
+_b253:
+    drop
+    ; #d8 0x3f -> macro vector 0x1f
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3f
+_b254:
+    drop
+    drop
+    drop
+    ; shi 0x50
+    push 0x0123
+    #d8 0xd0
+_b255:
+    drop
+
+    push 0x7f06
+    lw
+    add -1
+    dup
+    push 0x7f06
+    sw
+    bnez _loop
+
+    push depth
+    push 1
+    xor
+    bnez _fail
+
+    ; All passed
+    push 1
+    push 0x7f02
+    sw
+    syscall
@@ -0,0 +1,11669 @@
+; Decode sweep, user mode: 291 cases
+; Trap handler and macro vectors: record the cause in TRAP_VAR and continue
+    jump _main
+
+#addr 0x100
+    push 0x100
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x108
+    push 0x101
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x110
+    push 0x102
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x118
+    push 0x103
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x120
+    push 0x104
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x128
+    push 0x105
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x130
+    push 0x106
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x138
+    push 0x107
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x140
+    push 0x108
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x148
+    push 0x109
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x150
+    push 0x10a
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x158
+    push 0x10b
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x160
+    push 0x10c
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x168
+    push 0x10d
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x170
+    push 0x10e
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x178
+    push 0x10f
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x180
+    push 0x110
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x188
+    push 0x111
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x190
+    push 0x112
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x198
+    push 0x113
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1a0
+    push 0x114
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1a8
+    push 0x115
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1b0
+    push 0x116
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1b8
+    push 0x117
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1c0
+    push 0x118
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1c8
+    push 0x119
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1d0
+    push 0x11a
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1d8
+    push 0x11b
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1e0
+    push 0x11c
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1e8
+    push 0x11d
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1f0
+    push 0x11e
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1f8
+    push 0x11f
+    push 0x7f00
+    sw
+    rets
+
+#bank code
+
+_trap:
+    push ecause
+    push 0x7f00
+    sw
+    push 0x7f02
+    lw
+    bnez _finish
+    rets
+
+_finish:
+    li status, 1
+    push 0x7f02
+    lw
+    halt
+
+_fail:
+    push 0x7f04
+    lw
+    add 2
+    push 0x7f02
+    sw
+    syscall
+
+_main:
+    li evec, _trap
+    li fp, 0x7e00
+    li afp, 0x7d00
+    push 0
+    push 0x7f02
+    sw
+    li status, 5
+
+    ; Enter user mode (th set) at _user
+    li estatus, 4
+    li epc, _user
+    rets
+
+_user:
+
+    ; case 0: halt -> ecause 0x12
+    push 0
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x00
+_d0:
+    push 0x7f00
+    lw
+    push 0x0012
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 1: syscall -> ecause 0x00
+    push 1
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x02
+_d1:
+    push 0x7f00
+    lw
+    push 0x0000
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 2: callp
+    push 2
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push _d2
+    #d8 0x03
+_d2:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push _d2 + 0
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 3: beqz
+    push 3
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x00a5
+    push 0x0000
+    #d8 0x04
+_d3:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 4: bnez
+    push 4
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x00a5
+    push 0x0000
+    #d8 0x05
+_d4:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 5: swap
+    push 5
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x06
+_d5:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 6: over
+    push 6
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x07
+_d6:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 5
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 7: drop
+    push 7
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x08
+_d7:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 8: dup
+    push 8
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x09
+_d8:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 5
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 9: ltu
+    push 9
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0a
+_d9:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0000
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 10: lt
+    push 10
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0b
+_d10:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0000
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 11: add
+    push 11
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0c
+_d11:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x123b
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 12: and
+    push 12
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0d
+_d12:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0004
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 13: xor
+    push 13
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0e
+_d13:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1233
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 14: fsl
+    push 14
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x0f
+_d14:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x1089
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 15: rel pc
+    push 15
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0005
+    #d8 0x10
+_d15:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push _d15 + 5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 16: rel fp
+    push 16
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x11
+_d16:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x7d07
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 17: rel rx
+    push 17
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x12
+_d17:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x7f47
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 18: rel ry
+    push 18
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x13
+_d18:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x7f87
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 19: pop pc
+    push 19
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push _d19
+    #d8 0x14
+_d19:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 20: pop fp
+    push 20
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x15
+_d20:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x0007
+    xor
+    bnez _fail
+    li fp, 0x7d00
+
+    ; case 21: pop rx
+    push 21
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x16
+_d21:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x0007
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 22: pop ry
+    push 22
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x17
+_d22:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x0007
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 23: add pc
+    push 23
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0000
+    #d8 0x18
+_d23:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 24: add fp
+    push 24
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x19
+_d24:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d07
+    xor
+    bnez _fail
+    li fp, 0x7d00
+
+    ; case 25: add rx
+    push 25
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x1a
+_d25:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f47
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 26: add ry
+    push 26
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x1b
+_d26:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f87
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 27: pushcsr (csr 4)
+    push 27
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0004
+    #d8 0x1c
+_d27:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0001
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 28: popcsr (csr 3) -> ecause 0x11
+    push 28
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0003
+    #d8 0x1d
+_d28:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0003
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 29: lw
+    push 29
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x7f80
+    #d8 0x1e
+_d29:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x1122
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0x1122
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 30: sw
+    push 30
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0xa5c3
+    push 0x7f80
+    #d8 0x1f
+_d30:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0xa5c3
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 31: div -> macro vector 0x00
+    push 31
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0064
+    push 0x0007
+    #d8 0x20
+_d31:
+    push 0x7f00
+    lw
+    push 0x0100
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x0064
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 32: divu -> macro vector 0x01
+    push 32
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0064
+    push 0x0007
+    #d8 0x21
+_d32:
+    push 0x7f00
+    lw
+    push 0x0101
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x0064
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 33: mul
+    push 33
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x22
+_d33:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0000
+    xor
+    bnez _fail
+    push 0x7f6c
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 34: rot
+    push 34
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x23
+_d34:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 35: srl
+    push 35
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x24
+_d35:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0024
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 36: sra
+    push 36
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x25
+_d36:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0024
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 37: sll
+    push 37
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x26
+_d37:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1a00
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 38: or
+    push 38
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x27
+_d38:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x1237
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 39: sub
+    push 39
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x28
+_d39:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x122d
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 40: clz
+    push 40
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x29
+_d40:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x000d
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 41: lb
+    push 41
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x7f80
+    #d8 0x2a
+_d41:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0022
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0x1122
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 42: sb
+    push 42
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0xa5c3
+    push 0x7f80
+    #d8 0x2b
+_d42:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0x11c3
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 43: lh
+    push 43
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x7f80
+    #d8 0x2c
+_d43:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x1122
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0x1122
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 44: sh
+    push 44
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0xa5c3
+    push 0x7f80
+    #d8 0x2d
+_d44:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0xa5c3
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 45: lnw
+    push 45
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    #d8 0x2e
+_d45:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x1122
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f82
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0x1122
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 46: snw
+    push 46
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x1122
+    push 0x7f80
+    sw
+    push 0x3344
+    push 0x7f82
+    sw
+    push 0x5a5a
+    #d8 0x2f
+_d46:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f82
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+    push 0x7f80
+    lw
+    push 0x5a5a
+    xor
+    bnez _fail
+    push 0x7f82
+    lw
+    push 0x3344
+    xor
+    bnez _fail
+
+    ; case 47: #d8 0x30 -> macro vector 0x10
+    push 47
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x30
+_d47:
+    push 0x7f00
+    lw
+    push 0x0110
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 48: #d8 0x31 -> macro vector 0x11
+    push 48
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x31
+_d48:
+    push 0x7f00
+    lw
+    push 0x0111
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 49: #d8 0x32 -> macro vector 0x12
+    push 49
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x32
+_d49:
+    push 0x7f00
+    lw
+    push 0x0112
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 50: #d8 0x33 -> macro vector 0x13
+    push 50
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x33
+_d50:
+    push 0x7f00
+    lw
+    push 0x0113
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 51: #d8 0x34 -> macro vector 0x14
+    push 51
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x34
+_d51:
+    push 0x7f00
+    lw
+    push 0x0114
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 52: #d8 0x35 -> macro vector 0x15
+    push 52
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x35
+_d52:
+    push 0x7f00
+    lw
+    push 0x0115
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 53: #d8 0x36 -> macro vector 0x16
+    push 53
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x36
+_d53:
+    push 0x7f00
+    lw
+    push 0x0116
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 54: #d8 0x37 -> macro vector 0x17
+    push 54
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x37
+_d54:
+    push 0x7f00
+    lw
+    push 0x0117
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 55: #d8 0x38 -> macro vector 0x18
+    push 55
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x38
+_d55:
+    push 0x7f00
+    lw
+    push 0x0118
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 56: #d8 0x39 -> macro vector 0x19
+    push 56
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x39
+_d56:
+    push 0x7f00
+    lw
+    push 0x0119
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 57: #d8 0x3a -> macro vector 0x1a
+    push 57
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3a
+_d57:
+    push 0x7f00
+    lw
+    push 0x011a
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 58: #d8 0x3b -> macro vector 0x1b
+    push 58
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3b
+_d58:
+    push 0x7f00
+    lw
+    push 0x011b
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 59: #d8 0x3c -> macro vector 0x1c
+    push 59
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3c
+_d59:
+    push 0x7f00
+    lw
+    push 0x011c
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 60: #d8 0x3d -> macro vector 0x1d
+    push 60
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3d
+_d60:
+    push 0x7f00
+    lw
+    push 0x011d
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 61: #d8 0x3e -> macro vector 0x1e
+    push 61
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3e
+_d61:
+    push 0x7f00
+    lw
+    push 0x011e
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 62: #d8 0x3f -> macro vector 0x1f
+    push 62
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x8421
+    push 0x1234
+    push 0x0007
+    #d8 0x3f
+_d62:
+    push 0x7f00
+    lw
+    push 0x011f
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x1234
+    xor
+    bnez _fail
+    push 0x8421
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 63: push 0
+    push 63
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x40
+_d63:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0000
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 64: push 1
+    push 64
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x41
+_d64:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0001
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 65: push 2
+    push 65
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x42
+_d65:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0002
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 66: push 3
+    push 66
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x43
+_d66:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0003
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 67: push 4
+    push 67
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x44
+_d67:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0004
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 68: push 5
+    push 68
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x45
+_d68:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0005
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 69: push 6
+    push 69
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x46
+_d69:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0006
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 70: push 7
+    push 70
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x47
+_d70:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 71: push 8
+    push 71
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x48
+_d71:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0008
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 72: push 9
+    push 72
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x49
+_d72:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0009
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 73: push 10
+    push 73
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x4a
+_d73:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000a
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 74: push 11
+    push 74
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x4b
+_d74:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000b
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 75: push 12
+    push 75
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x4c
+_d75:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000c
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 76: push 13
+    push 76
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x4d
+_d76:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000d
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 77: push 14
+    push 77
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x4e
+_d77:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000e
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 78: push 15
+    push 78
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x4f
+_d78:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000f
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 79: push 16
+    push 79
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x50
+_d79:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0010
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 80: push 17
+    push 80
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x51
+_d80:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0011
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 81: push 18
+    push 81
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x52
+_d81:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0012
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 82: push 19
+    push 82
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x53
+_d82:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0013
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 83: push 20
+    push 83
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x54
+_d83:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0014
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 84: push 21
+    push 84
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x55
+_d84:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0015
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 85: push 22
+    push 85
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x56
+_d85:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0016
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 86: push 23
+    push 86
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x57
+_d86:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0017
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 87: push 24
+    push 87
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x58
+_d87:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0018
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 88: push 25
+    push 88
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x59
+_d88:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0019
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 89: push 26
+    push 89
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x5a
+_d89:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x001a
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 90: push 27
+    push 90
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x5b
+_d90:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x001b
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 91: push 28
+    push 91
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x5c
+_d91:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x001c
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 92: push 29
+    push 92
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x5d
+_d92:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x001d
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 93: push 30
+    push 93
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x5e
+_d93:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x001e
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 94: push 31
+    push 94
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x5f
+_d94:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x001f
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 95: push -32
+    push 95
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x60
+_d95:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe0
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 96: push -31
+    push 96
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x61
+_d96:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe1
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 97: push -30
+    push 97
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x62
+_d97:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe2
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 98: push -29
+    push 98
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x63
+_d98:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe3
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 99: push -28
+    push 99
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x64
+_d99:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe4
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 100: push -27
+    push 100
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x65
+_d100:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe5
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 101: push -26
+    push 101
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x66
+_d101:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe6
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 102: push -25
+    push 102
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x67
+_d102:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe7
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 103: push -24
+    push 103
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x68
+_d103:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe8
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 104: push -23
+    push 104
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x69
+_d104:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffe9
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 105: push -22
+    push 105
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x6a
+_d105:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffea
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 106: push -21
+    push 106
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x6b
+_d106:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffeb
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 107: push -20
+    push 107
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x6c
+_d107:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffec
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 108: push -19
+    push 108
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x6d
+_d108:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffed
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 109: push -18
+    push 109
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x6e
+_d109:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffee
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 110: push -17
+    push 110
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x6f
+_d110:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffef
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 111: push -16
+    push 111
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x70
+_d111:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff0
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 112: push -15
+    push 112
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x71
+_d112:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff1
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 113: push -14
+    push 113
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x72
+_d113:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff2
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 114: push -13
+    push 114
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x73
+_d114:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff3
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 115: push -12
+    push 115
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x74
+_d115:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff4
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 116: push -11
+    push 116
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x75
+_d116:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff5
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 117: push -10
+    push 117
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x76
+_d117:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff6
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 118: push -9
+    push 118
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x77
+_d118:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff7
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 119: push -8
+    push 119
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x78
+_d119:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff8
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 120: push -7
+    push 120
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x79
+_d120:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfff9
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 121: push -6
+    push 121
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x7a
+_d121:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfffa
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 122: push -5
+    push 122
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x7b
+_d122:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfffb
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 123: push -4
+    push 123
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x7c
+_d123:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfffc
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 124: push -3
+    push 124
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x7d
+_d124:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfffd
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 125: push -2
+    push 125
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x7e
+_d125:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xfffe
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 126: push -1
+    push 126
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x7f
+_d126:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0xffff
+    xor
+    bnez _fail
+    push 0x0123
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 127: shi 0x00
+    push 127
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x80
+_d127:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9180
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 128: shi 0x01
+    push 128
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x81
+_d128:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9181
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 129: shi 0x02
+    push 129
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x82
+_d129:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9182
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 130: shi 0x03
+    push 130
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x83
+_d130:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9183
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 131: shi 0x04
+    push 131
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x84
+_d131:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9184
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 132: shi 0x05
+    push 132
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x85
+_d132:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9185
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 133: shi 0x06
+    push 133
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x86
+_d133:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9186
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 134: shi 0x07
+    push 134
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x87
+_d134:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9187
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 135: shi 0x08
+    push 135
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x88
+_d135:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9188
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 136: shi 0x09
+    push 136
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x89
+_d136:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9189
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 137: shi 0x0a
+    push 137
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x8a
+_d137:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x918a
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 138: shi 0x0b
+    push 138
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x8b
+_d138:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x918b
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 139: shi 0x0c
+    push 139
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x8c
+_d139:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x918c
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 140: shi 0x0d
+    push 140
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x8d
+_d140:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x918d
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 141: shi 0x0e
+    push 141
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x8e
+_d141:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x918e
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 142: shi 0x0f
+    push 142
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x8f
+_d142:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x918f
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 143: shi 0x10
+    push 143
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x90
+_d143:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9190
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 144: shi 0x11
+    push 144
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x91
+_d144:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9191
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 145: shi 0x12
+    push 145
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x92
+_d145:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9192
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 146: shi 0x13
+    push 146
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x93
+_d146:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9193
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 147: shi 0x14
+    push 147
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x94
+_d147:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9194
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 148: shi 0x15
+    push 148
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x95
+_d148:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9195
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 149: shi 0x16
+    push 149
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x96
+_d149:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9196
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 150: shi 0x17
+    push 150
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x97
+_d150:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9197
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 151: shi 0x18
+    push 151
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x98
+_d151:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9198
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 152: shi 0x19
+    push 152
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x99
+_d152:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x9199
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 153: shi 0x1a
+    push 153
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x9a
+_d153:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x919a
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 154: shi 0x1b
+    push 154
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x9b
+_d154:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x919b
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 155: shi 0x1c
+    push 155
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x9c
+_d155:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x919c
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 156: shi 0x1d
+    push 156
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x9d
+_d156:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x919d
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 157: shi 0x1e
+    push 157
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x9e
+_d157:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x919e
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 158: shi 0x1f
+    push 158
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0x9f
+_d158:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x919f
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 159: shi 0x20
+    push 159
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa0
+_d159:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a0
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 160: shi 0x21
+    push 160
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa1
+_d160:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 161: shi 0x22
+    push 161
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa2
+_d161:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a2
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 162: shi 0x23
+    push 162
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa3
+_d162:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a3
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 163: shi 0x24
+    push 163
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa4
+_d163:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a4
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 164: shi 0x25
+    push 164
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa5
+_d164:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 165: shi 0x26
+    push 165
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa6
+_d165:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a6
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 166: shi 0x27
+    push 166
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa7
+_d166:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a7
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 167: shi 0x28
+    push 167
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa8
+_d167:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a8
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 168: shi 0x29
+    push 168
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xa9
+_d168:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91a9
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 169: shi 0x2a
+    push 169
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xaa
+_d169:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91aa
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 170: shi 0x2b
+    push 170
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xab
+_d170:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ab
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 171: shi 0x2c
+    push 171
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xac
+_d171:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ac
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 172: shi 0x2d
+    push 172
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xad
+_d172:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ad
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 173: shi 0x2e
+    push 173
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xae
+_d173:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ae
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 174: shi 0x2f
+    push 174
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xaf
+_d174:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91af
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 175: shi 0x30
+    push 175
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb0
+_d175:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b0
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 176: shi 0x31
+    push 176
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb1
+_d176:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 177: shi 0x32
+    push 177
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb2
+_d177:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b2
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 178: shi 0x33
+    push 178
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb3
+_d178:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b3
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 179: shi 0x34
+    push 179
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb4
+_d179:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b4
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 180: shi 0x35
+    push 180
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb5
+_d180:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 181: shi 0x36
+    push 181
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb6
+_d181:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b6
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 182: shi 0x37
+    push 182
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb7
+_d182:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b7
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 183: shi 0x38
+    push 183
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb8
+_d183:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b8
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 184: shi 0x39
+    push 184
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xb9
+_d184:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91b9
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 185: shi 0x3a
+    push 185
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xba
+_d185:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ba
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 186: shi 0x3b
+    push 186
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xbb
+_d186:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91bb
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 187: shi 0x3c
+    push 187
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xbc
+_d187:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91bc
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 188: shi 0x3d
+    push 188
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xbd
+_d188:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91bd
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 189: shi 0x3e
+    push 189
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xbe
+_d189:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91be
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 190: shi 0x3f
+    push 190
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xbf
+_d190:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91bf
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 191: shi 0x40
+    push 191
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc0
+_d191:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c0
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 192: shi 0x41
+    push 192
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc1
+_d192:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 193: shi 0x42
+    push 193
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc2
+_d193:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c2
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 194: shi 0x43
+    push 194
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc3
+_d194:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c3
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 195: shi 0x44
+    push 195
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc4
+_d195:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c4
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 196: shi 0x45
+    push 196
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc5
+_d196:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 197: shi 0x46
+    push 197
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc6
+_d197:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c6
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 198: shi 0x47
+    push 198
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc7
+_d198:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c7
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 199: shi 0x48
+    push 199
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc8
+_d199:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c8
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 200: shi 0x49
+    push 200
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xc9
+_d200:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91c9
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 201: shi 0x4a
+    push 201
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xca
+_d201:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ca
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 202: shi 0x4b
+    push 202
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xcb
+_d202:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91cb
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 203: shi 0x4c
+    push 203
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xcc
+_d203:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91cc
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 204: shi 0x4d
+    push 204
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xcd
+_d204:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91cd
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 205: shi 0x4e
+    push 205
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xce
+_d205:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ce
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 206: shi 0x4f
+    push 206
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xcf
+_d206:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91cf
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 207: shi 0x50
+    push 207
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd0
+_d207:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d0
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 208: shi 0x51
+    push 208
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd1
+_d208:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 209: shi 0x52
+    push 209
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd2
+_d209:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d2
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 210: shi 0x53
+    push 210
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd3
+_d210:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d3
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 211: shi 0x54
+    push 211
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd4
+_d211:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d4
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 212: shi 0x55
+    push 212
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd5
+_d212:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 213: shi 0x56
+    push 213
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd6
+_d213:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d6
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 214: shi 0x57
+    push 214
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd7
+_d214:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d7
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 215: shi 0x58
+    push 215
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd8
+_d215:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d8
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 216: shi 0x59
+    push 216
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xd9
+_d216:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91d9
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 217: shi 0x5a
+    push 217
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xda
+_d217:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91da
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 218: shi 0x5b
+    push 218
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xdb
+_d218:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91db
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 219: shi 0x5c
+    push 219
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xdc
+_d219:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91dc
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 220: shi 0x5d
+    push 220
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xdd
+_d220:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91dd
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 221: shi 0x5e
+    push 221
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xde
+_d221:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91de
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 222: shi 0x5f
+    push 222
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xdf
+_d222:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91df
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 223: shi 0x60
+    push 223
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe0
+_d223:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e0
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 224: shi 0x61
+    push 224
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe1
+_d224:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 225: shi 0x62
+    push 225
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe2
+_d225:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e2
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 226: shi 0x63
+    push 226
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe3
+_d226:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e3
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 227: shi 0x64
+    push 227
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe4
+_d227:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e4
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 228: shi 0x65
+    push 228
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe5
+_d228:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 229: shi 0x66
+    push 229
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe6
+_d229:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e6
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 230: shi 0x67
+    push 230
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe7
+_d230:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e7
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 231: shi 0x68
+    push 231
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe8
+_d231:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e8
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 232: shi 0x69
+    push 232
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xe9
+_d232:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91e9
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 233: shi 0x6a
+    push 233
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xea
+_d233:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ea
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 234: shi 0x6b
+    push 234
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xeb
+_d234:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91eb
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 235: shi 0x6c
+    push 235
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xec
+_d235:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ec
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 236: shi 0x6d
+    push 236
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xed
+_d236:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ed
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 237: shi 0x6e
+    push 237
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xee
+_d237:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ee
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 238: shi 0x6f
+    push 238
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xef
+_d238:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ef
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 239: shi 0x70
+    push 239
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf0
+_d239:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f0
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 240: shi 0x71
+    push 240
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf1
+_d240:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 241: shi 0x72
+    push 241
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf2
+_d241:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f2
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 242: shi 0x73
+    push 242
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf3
+_d242:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f3
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 243: shi 0x74
+    push 243
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf4
+_d243:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f4
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 244: shi 0x75
+    push 244
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf5
+_d244:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f5
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 245: shi 0x76
+    push 245
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf6
+_d245:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f6
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 246: shi 0x77
+    push 246
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf7
+_d246:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f7
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 247: shi 0x78
+    push 247
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf8
+_d247:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f8
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 248: shi 0x79
+    push 248
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xf9
+_d248:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91f9
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 249: shi 0x7a
+    push 249
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xfa
+_d249:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91fa
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 250: shi 0x7b
+    push 250
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xfb
+_d250:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91fb
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 251: shi 0x7c
+    push 251
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xfc
+_d251:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91fc
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 252: shi 0x7d
+    push 252
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xfd
+_d252:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91fd
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 253: shi 0x7e
+    push 253
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xfe
+_d253:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91fe
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 254: shi 0x7f
+    push 254
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0123
+    #d8 0xff
+_d254:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x91ff
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 255: beqz (condition zero)
+    push 255
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0000
+    push 0x0000
+    #d8 0x04
+_d255:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 256: bnez (condition zero)
+    push 256
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0000
+    push 0x0000
+    #d8 0x05
+_d256:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 257: pushcsr (csr 0) -> ecause 0x11
+    push 257
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0000
+    #d8 0x1c
+_d257:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0000
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 258: popcsr (csr 0) -> ecause 0x11
+    push 258
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0000
+    #d8 0x1d
+_d258:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0000
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 259: pushcsr (csr 1) -> ecause 0x11
+    push 259
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0001
+    #d8 0x1c
+_d259:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0001
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 260: popcsr (csr 1) -> ecause 0x11
+    push 260
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0001
+    #d8 0x1d
+_d260:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0001
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 261: pushcsr (csr 2) -> ecause 0x11
+    push 261
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0002
+    #d8 0x1c
+_d261:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0002
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 262: popcsr (csr 2) -> ecause 0x11
+    push 262
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0002
+    #d8 0x1d
+_d262:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0002
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 263: pushcsr (csr 3) -> ecause 0x11
+    push 263
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0003
+    #d8 0x1c
+_d263:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0003
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 264: popcsr (csr 3) -> ecause 0x11
+    push 264
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0003
+    #d8 0x1d
+_d264:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0003
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 265: pushcsr (csr 4)
+    push 265
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0004
+    #d8 0x1c
+_d265:
+    push 0x7f00
+    lw
+    push 0xffff
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0001
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 266: popcsr (csr 4) -> ecause 0x11
+    push 266
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0004
+    #d8 0x1d
+_d266:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0004
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 267: pushcsr (csr 5) -> ecause 0x11
+    push 267
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0005
+    #d8 0x1c
+_d267:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0005
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 268: popcsr (csr 5) -> ecause 0x11
+    push 268
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0005
+    #d8 0x1d
+_d268:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0005
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 269: pushcsr (csr 6) -> ecause 0x11
+    push 269
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0006
+    #d8 0x1c
+_d269:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0006
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 270: popcsr (csr 6) -> ecause 0x11
+    push 270
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0006
+    #d8 0x1d
+_d270:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0006
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 271: pushcsr (csr 7) -> ecause 0x10
+    push 271
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0007
+    #d8 0x1c
+_d271:
+    push 0x7f00
+    lw
+    push 0x0010
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 272: popcsr (csr 7) -> ecause 0x10
+    push 272
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0007
+    #d8 0x1d
+_d272:
+    push 0x7f00
+    lw
+    push 0x0010
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0007
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 273: pushcsr (csr 8) -> ecause 0x11
+    push 273
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0008
+    #d8 0x1c
+_d273:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0008
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 274: popcsr (csr 8) -> ecause 0x11
+    push 274
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0008
+    #d8 0x1d
+_d274:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0008
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 275: pushcsr (csr 9) -> ecause 0x11
+    push 275
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0009
+    #d8 0x1c
+_d275:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0009
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 276: popcsr (csr 9) -> ecause 0x11
+    push 276
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0009
+    #d8 0x1d
+_d276:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0009
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 277: pushcsr (csr 10) -> ecause 0x11
+    push 277
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x000a
+    #d8 0x1c
+_d277:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x000a
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 278: popcsr (csr 10) -> ecause 0x11
+    push 278
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x000a
+    #d8 0x1d
+_d278:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000a
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 279: pushcsr (csr 11) -> ecause 0x11
+    push 279
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x000b
+    #d8 0x1c
+_d279:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x000b
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 280: popcsr (csr 11) -> ecause 0x11
+    push 280
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x000b
+    #d8 0x1d
+_d280:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000b
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 281: pushcsr (csr 12) -> ecause 0x11
+    push 281
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x000c
+    #d8 0x1c
+_d281:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x000c
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 282: popcsr (csr 12) -> ecause 0x11
+    push 282
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x000c
+    #d8 0x1d
+_d282:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000c
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 283: pushcsr (csr 13) -> ecause 0x11
+    push 283
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x000d
+    #d8 0x1c
+_d283:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x000d
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 284: popcsr (csr 13) -> ecause 0x11
+    push 284
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x000d
+    #d8 0x1d
+_d284:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000d
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 285: pushcsr (csr 14) -> ecause 0x11
+    push 285
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x000e
+    #d8 0x1c
+_d285:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x000e
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 286: popcsr (csr 14) -> ecause 0x11
+    push 286
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x000e
+    #d8 0x1d
+_d286:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000e
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 287: pushcsr (csr 15) -> ecause 0x11
+    push 287
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x000f
+    #d8 0x1c
+_d287:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x000f
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 288: popcsr (csr 15) -> ecause 0x11
+    push 288
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x000f
+    #d8 0x1d
+_d288:
+    push 0x7f00
+    lw
+    push 0x0011
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x000f
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 289: pushcsr (csr 16) -> ecause 0x10
+    push 289
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0010
+    #d8 0x1c
+_d289:
+    push 0x7f00
+    lw
+    push 0x0010
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0x0010
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; case 290: popcsr (csr 16) -> ecause 0x10
+    push 290
+    push 0x7f04
+    sw
+    push -1
+    push 0x7f00
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0x0055
+    push 0x0010
+    #d8 0x1d
+_d290:
+    push 0x7f00
+    lw
+    push 0x0010
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0x0010
+    xor
+    bnez _fail
+    push 0x0055
+    xor
+    bnez _fail
+    push rx
+    push 0x7f40
+    xor
+    bnez _fail
+    push ry
+    push 0x7f80
+    xor
+    bnez _fail
+    push fp
+    push 0x7d00
+    xor
+    bnez _fail
+
+    ; All passed
+    push 1
+    push 0x7f02
+    sw
+    syscall
@@ -0,0 +1,205 @@
+; Depth benchmark: 26 cases x 1000 on a stack of 1016 items
+    li rx, 1016
+_sweep0_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep0_fill
+    push 1000
+    push 0x7f00
+    sw
+
+_loop:
+    ; add: 10 add 20
+    push 10
+    push 20
+    add
+    drop
+    ; sub: 20 sub 10
+    push 20
+    push 10
+    sub
+    drop
+    ; ltu: 10 ltu 20
+    push 10
+    push 20
+    ltu
+    drop
+    ; lt: 10 lt 20
+    push 10
+    push 20
+    lt
+    drop
+    ; and: 12 and 10
+    push 12
+    push 10
+    and
+    drop
+    ; or: 12 or 10
+    push 12
+    push 10
+    or
+    drop
+    ; xor: 12 xor 10
+    push 12
+    push 10
+    xor
+    drop
+    ; srl: 15 srl 1
+    push 15
+    push 1
+    srl
+    drop
+    ; sra: 15 sra 1
+    push 15
+    push 1
+    sra
+    drop
+    ; sll: 1 sll 1
+    push 1
+    push 1
+    sll
+    drop
+    ; clz: clz 0
+    push 0
+    clz
+    drop
+    ; dup: dup 0x1234
+    push 0x1234
+    dup
+    drop
+    drop
+    ; drop: drop 2 of 1 2
+    push 1
+    push 2
+    drop
+    drop
+    ; swap: swap 1 2
+    push 1
+    push 2
+    swap
+    drop
+    drop
+    ; over: over 1 2
+    push 1
+    push 2
+    over
+    drop
+    drop
+    drop
+    ; rot: rot 1 2 3
+    push 1
+    push 2
+    push 3
+    rot
+    drop
+    drop
+    drop
+    ; fsl: {0xaaaa, 0x5555} << 4
+    push 0xAAAA
+    push 0x5555
+    push 4
+    fsl
+    drop
+    ; mul: 0x1234 * 0x5678
+    push 0x1234
+    push 0x5678
+    mul
+    drop
+    drop
+    ; shi: push 3; shi 0x7f
+    push 3
+    shi 0x7F
+    drop
+    ; beqz: taken over push 7
+    push 0
+    push 1
+    beqz
+    push 7
+    ; bnez: taken over push 7
+    push 1
+    push 1
+    bnez
+    push 7
+    ; lw_sw: store and load 0x1234 at fp-4
+    push 0x1234
+    push fp
+    push -4
+    add
+    sw
+    push fp
+    push -4
+    add
+    lw
+    drop
+    ; lh_sh: store and load half 0x8765 at fp-6
+    push 0x8765
+    push fp
+    push -6
+    add
+    sh
+    push fp
+    push -6
+    add
+    lh
+    drop
+    ; lb_sb: store and load byte 0x85 at fp-5
+    push 0x85
+    push fp
+    push -5
+    add
+    sb
+    push fp
+    push -5
+    add
+    lb
+    drop
+    ; llw_slw: store and load 0x4321 at fp-8
+    push 0x4321
+    push -8
+    slw
+    push -8
+    llw
+    drop
+    ; lnw_snw: store and load 0x2468 through ry at fp-16
+    push fp
+    push -16
+    add
+    pop ry
+    push 0x2468
+    snw
+    push fp
+    push -16
+    add
+    pop ry
+    lnw
+    drop
+
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    li rx, 0
+_sweep0_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1016
+    xor
+    bnez _sweep0_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
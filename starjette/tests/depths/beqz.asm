@@ -0,0 +1,505 @@
+; Depth sweep of beqz at depths 0, 1, 2, 3, 4, 5, 6, 7 and near the high-water mark
+; Expected values from the ISA manual at 16 bits, checked against the reference model
+    jump _sweep
+
+#bank code
+
+_sweep:
+    ; Case 0 at depth 0: taken over push 7
+    push 0
+    push 1
+    beqz
+    push 7
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 1: taken over push 7
+    li rx, 1
+_sweep1_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep1_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep1_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep1_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 2: taken over push 7
+    li rx, 2
+_sweep2_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep2_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep2_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep2_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 3: taken over push 7
+    li rx, 3
+_sweep3_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep3_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep3_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep3_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 4: taken over push 7
+    li rx, 4
+_sweep4_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep4_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep4_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep4_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 5: taken over push 7
+    li rx, 5
+_sweep5_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep5_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep5_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep5_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 6: taken over push 7
+    li rx, 6
+_sweep6_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep6_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep6_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep6_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 7: taken over push 7
+    li rx, 7
+_sweep7_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep7_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep7_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep7_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 1018: taken over push 7
+    li rx, 1018
+_sweep8_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep8_fill
+    push 0
+    push 1
+    beqz
+    push 7
+    li rx, 0
+_sweep8_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep8_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 0: not taken
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 1: not taken
+    li rx, 1
+_sweep10_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep10_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep10_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep10_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 2: not taken
+    li rx, 2
+_sweep11_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep11_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep11_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep11_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 3: not taken
+    li rx, 3
+_sweep12_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep12_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep12_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep12_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 4: not taken
+    li rx, 4
+_sweep13_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep13_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep13_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep13_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 5: not taken
+    li rx, 5
+_sweep14_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep14_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep14_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep14_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 6: not taken
+    li rx, 6
+_sweep15_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep15_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep15_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep15_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 7: not taken
+    li rx, 7
+_sweep16_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep16_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep16_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep16_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 1018: not taken
+    li rx, 1018
+_sweep17_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep17_fill
+    push 1
+    push 1
+    beqz
+    push 7
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep17_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep17_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
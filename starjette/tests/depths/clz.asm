@@ -0,0 +1,6328 @@
+; Depth sweep of clz at depths 0, 1, 2, 3, 4, 5, 6, 7 and near the high-water mark
+; Expected values from the ISA manual at 16 bits, checked against the reference model
+    jump _sweep
+
+#bank code
+
+_sweep:
+    ; Case 0 at depth 0: clz 0
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 1: clz 0
+    li rx, 1
+_sweep1_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep1_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep1_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep1_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 2: clz 0
+    li rx, 2
+_sweep2_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep2_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep2_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep2_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 3: clz 0
+    li rx, 3
+_sweep3_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep3_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep3_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep3_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 4: clz 0
+    li rx, 4
+_sweep4_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep4_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep4_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep4_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 5: clz 0
+    li rx, 5
+_sweep5_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep5_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep5_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep5_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 6: clz 0
+    li rx, 6
+_sweep6_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep6_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep6_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep6_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 7: clz 0
+    li rx, 7
+_sweep7_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep7_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep7_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep7_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 1018: clz 0
+    li rx, 1018
+_sweep8_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep8_fill
+    push 0
+    clz
+    push 16
+    xor
+    failnez
+    li rx, 0
+_sweep8_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep8_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 0: clz 1
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 1: clz 1
+    li rx, 1
+_sweep10_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep10_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep10_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep10_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 2: clz 1
+    li rx, 2
+_sweep11_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep11_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep11_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep11_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 3: clz 1
+    li rx, 3
+_sweep12_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep12_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep12_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep12_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 4: clz 1
+    li rx, 4
+_sweep13_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep13_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep13_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep13_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 5: clz 1
+    li rx, 5
+_sweep14_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep14_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep14_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep14_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 6: clz 1
+    li rx, 6
+_sweep15_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep15_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep15_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep15_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 7: clz 1
+    li rx, 7
+_sweep16_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep16_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep16_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep16_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 1018: clz 1
+    li rx, 1018
+_sweep17_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep17_fill
+    push 1
+    clz
+    push 15
+    xor
+    failnez
+    li rx, 0
+_sweep17_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep17_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 0: clz 2
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 1: clz 2
+    li rx, 1
+_sweep19_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep19_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep19_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep19_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 2: clz 2
+    li rx, 2
+_sweep20_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep20_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep20_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep20_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 3: clz 2
+    li rx, 3
+_sweep21_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep21_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep21_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep21_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 4: clz 2
+    li rx, 4
+_sweep22_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep22_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep22_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep22_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 5: clz 2
+    li rx, 5
+_sweep23_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep23_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep23_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep23_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 6: clz 2
+    li rx, 6
+_sweep24_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep24_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep24_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep24_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 7: clz 2
+    li rx, 7
+_sweep25_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep25_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep25_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep25_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 1018: clz 2
+    li rx, 1018
+_sweep26_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep26_fill
+    push 2
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep26_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep26_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 0: clz 4
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 1: clz 4
+    li rx, 1
+_sweep28_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep28_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep28_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep28_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 2: clz 4
+    li rx, 2
+_sweep29_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep29_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep29_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep29_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 3: clz 4
+    li rx, 3
+_sweep30_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep30_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep30_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep30_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 4: clz 4
+    li rx, 4
+_sweep31_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep31_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep31_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep31_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 5: clz 4
+    li rx, 5
+_sweep32_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep32_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep32_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep32_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 6: clz 4
+    li rx, 6
+_sweep33_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep33_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep33_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep33_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 7: clz 4
+    li rx, 7
+_sweep34_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep34_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep34_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep34_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 1018: clz 4
+    li rx, 1018
+_sweep35_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep35_fill
+    push 4
+    clz
+    push 13
+    xor
+    failnez
+    li rx, 0
+_sweep35_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep35_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 0: clz 8
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 1: clz 8
+    li rx, 1
+_sweep37_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep37_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep37_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep37_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 2: clz 8
+    li rx, 2
+_sweep38_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep38_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep38_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep38_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 3: clz 8
+    li rx, 3
+_sweep39_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep39_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep39_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep39_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 4: clz 8
+    li rx, 4
+_sweep40_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep40_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep40_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep40_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 5: clz 8
+    li rx, 5
+_sweep41_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep41_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep41_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep41_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 6: clz 8
+    li rx, 6
+_sweep42_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep42_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep42_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep42_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 7: clz 8
+    li rx, 7
+_sweep43_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep43_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep43_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep43_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 1018: clz 8
+    li rx, 1018
+_sweep44_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep44_fill
+    push 8
+    clz
+    push 12
+    xor
+    failnez
+    li rx, 0
+_sweep44_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep44_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 0: clz 16
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 1: clz 16
+    li rx, 1
+_sweep46_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep46_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep46_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep46_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 2: clz 16
+    li rx, 2
+_sweep47_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep47_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep47_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep47_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 3: clz 16
+    li rx, 3
+_sweep48_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep48_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep48_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep48_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 4: clz 16
+    li rx, 4
+_sweep49_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep49_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep49_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep49_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 5: clz 16
+    li rx, 5
+_sweep50_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep50_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep50_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep50_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 6: clz 16
+    li rx, 6
+_sweep51_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep51_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep51_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep51_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 7: clz 16
+    li rx, 7
+_sweep52_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep52_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep52_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep52_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 1018: clz 16
+    li rx, 1018
+_sweep53_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep53_fill
+    push 16
+    clz
+    push 11
+    xor
+    failnez
+    li rx, 0
+_sweep53_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep53_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 0: clz 32
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 1: clz 32
+    li rx, 1
+_sweep55_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep55_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep55_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep55_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 2: clz 32
+    li rx, 2
+_sweep56_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep56_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep56_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep56_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 3: clz 32
+    li rx, 3
+_sweep57_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep57_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep57_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep57_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 4: clz 32
+    li rx, 4
+_sweep58_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep58_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep58_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep58_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 5: clz 32
+    li rx, 5
+_sweep59_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep59_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep59_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep59_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 6: clz 32
+    li rx, 6
+_sweep60_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep60_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep60_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep60_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 7: clz 32
+    li rx, 7
+_sweep61_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep61_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep61_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep61_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 6 at depth 1018: clz 32
+    li rx, 1018
+_sweep62_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep62_fill
+    push 32
+    clz
+    push 10
+    xor
+    failnez
+    li rx, 0
+_sweep62_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep62_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 0: clz 64
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 1: clz 64
+    li rx, 1
+_sweep64_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep64_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep64_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep64_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 2: clz 64
+    li rx, 2
+_sweep65_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep65_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep65_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep65_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 3: clz 64
+    li rx, 3
+_sweep66_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep66_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep66_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep66_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 4: clz 64
+    li rx, 4
+_sweep67_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep67_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep67_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep67_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 5: clz 64
+    li rx, 5
+_sweep68_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep68_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep68_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep68_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 6: clz 64
+    li rx, 6
+_sweep69_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep69_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep69_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep69_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 7: clz 64
+    li rx, 7
+_sweep70_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep70_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep70_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep70_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 7 at depth 1018: clz 64
+    li rx, 1018
+_sweep71_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep71_fill
+    push 64
+    clz
+    push 9
+    xor
+    failnez
+    li rx, 0
+_sweep71_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep71_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 0: clz 128
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 1: clz 128
+    li rx, 1
+_sweep73_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep73_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep73_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep73_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 2: clz 128
+    li rx, 2
+_sweep74_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep74_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep74_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep74_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 3: clz 128
+    li rx, 3
+_sweep75_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep75_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep75_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep75_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 4: clz 128
+    li rx, 4
+_sweep76_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep76_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep76_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep76_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 5: clz 128
+    li rx, 5
+_sweep77_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep77_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep77_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep77_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 6: clz 128
+    li rx, 6
+_sweep78_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep78_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep78_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep78_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 7: clz 128
+    li rx, 7
+_sweep79_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep79_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep79_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep79_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 8 at depth 1018: clz 128
+    li rx, 1018
+_sweep80_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep80_fill
+    push 128
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep80_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep80_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 0: clz 256
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 1: clz 256
+    li rx, 1
+_sweep82_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep82_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep82_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep82_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 2: clz 256
+    li rx, 2
+_sweep83_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep83_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep83_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep83_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 3: clz 256
+    li rx, 3
+_sweep84_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep84_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep84_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep84_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 4: clz 256
+    li rx, 4
+_sweep85_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep85_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep85_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep85_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 5: clz 256
+    li rx, 5
+_sweep86_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep86_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep86_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep86_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 6: clz 256
+    li rx, 6
+_sweep87_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep87_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep87_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep87_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 7: clz 256
+    li rx, 7
+_sweep88_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep88_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep88_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep88_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 9 at depth 1018: clz 256
+    li rx, 1018
+_sweep89_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep89_fill
+    push 256
+    clz
+    push 7
+    xor
+    failnez
+    li rx, 0
+_sweep89_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep89_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 0: clz 512
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 1: clz 512
+    li rx, 1
+_sweep91_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep91_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep91_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep91_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 2: clz 512
+    li rx, 2
+_sweep92_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep92_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep92_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep92_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 3: clz 512
+    li rx, 3
+_sweep93_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep93_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep93_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep93_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 4: clz 512
+    li rx, 4
+_sweep94_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep94_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep94_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep94_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 5: clz 512
+    li rx, 5
+_sweep95_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep95_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep95_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep95_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 6: clz 512
+    li rx, 6
+_sweep96_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep96_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep96_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep96_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 7: clz 512
+    li rx, 7
+_sweep97_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep97_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep97_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep97_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 10 at depth 1018: clz 512
+    li rx, 1018
+_sweep98_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep98_fill
+    push 512
+    clz
+    push 6
+    xor
+    failnez
+    li rx, 0
+_sweep98_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep98_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 0: clz 1024
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 1: clz 1024
+    li rx, 1
+_sweep100_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep100_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep100_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep100_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 2: clz 1024
+    li rx, 2
+_sweep101_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep101_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep101_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep101_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 3: clz 1024
+    li rx, 3
+_sweep102_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep102_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep102_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep102_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 4: clz 1024
+    li rx, 4
+_sweep103_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep103_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep103_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep103_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 5: clz 1024
+    li rx, 5
+_sweep104_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep104_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep104_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep104_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 6: clz 1024
+    li rx, 6
+_sweep105_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep105_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep105_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep105_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 7: clz 1024
+    li rx, 7
+_sweep106_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep106_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep106_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep106_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 11 at depth 1018: clz 1024
+    li rx, 1018
+_sweep107_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep107_fill
+    push 1024
+    clz
+    push 5
+    xor
+    failnez
+    li rx, 0
+_sweep107_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep107_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 0: clz 2048
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 1: clz 2048
+    li rx, 1
+_sweep109_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep109_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep109_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep109_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 2: clz 2048
+    li rx, 2
+_sweep110_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep110_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep110_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep110_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 3: clz 2048
+    li rx, 3
+_sweep111_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep111_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep111_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep111_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 4: clz 2048
+    li rx, 4
+_sweep112_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep112_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep112_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep112_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 5: clz 2048
+    li rx, 5
+_sweep113_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep113_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep113_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep113_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 6: clz 2048
+    li rx, 6
+_sweep114_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep114_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep114_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep114_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 7: clz 2048
+    li rx, 7
+_sweep115_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep115_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep115_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep115_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 12 at depth 1018: clz 2048
+    li rx, 1018
+_sweep116_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep116_fill
+    push 2048
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep116_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep116_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 0: clz 4096
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 1: clz 4096
+    li rx, 1
+_sweep118_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep118_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep118_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep118_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 2: clz 4096
+    li rx, 2
+_sweep119_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep119_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep119_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep119_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 3: clz 4096
+    li rx, 3
+_sweep120_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep120_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep120_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep120_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 4: clz 4096
+    li rx, 4
+_sweep121_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep121_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep121_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep121_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 5: clz 4096
+    li rx, 5
+_sweep122_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep122_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep122_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep122_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 6: clz 4096
+    li rx, 6
+_sweep123_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep123_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep123_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep123_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 7: clz 4096
+    li rx, 7
+_sweep124_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep124_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep124_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep124_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 13 at depth 1018: clz 4096
+    li rx, 1018
+_sweep125_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep125_fill
+    push 4096
+    clz
+    push 3
+    xor
+    failnez
+    li rx, 0
+_sweep125_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep125_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 0: clz 8192
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 1: clz 8192
+    li rx, 1
+_sweep127_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep127_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep127_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep127_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 2: clz 8192
+    li rx, 2
+_sweep128_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep128_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep128_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep128_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 3: clz 8192
+    li rx, 3
+_sweep129_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep129_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep129_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep129_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 4: clz 8192
+    li rx, 4
+_sweep130_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep130_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep130_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep130_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 5: clz 8192
+    li rx, 5
+_sweep131_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep131_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep131_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep131_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 6: clz 8192
+    li rx, 6
+_sweep132_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep132_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep132_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep132_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 7: clz 8192
+    li rx, 7
+_sweep133_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep133_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep133_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep133_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 14 at depth 1018: clz 8192
+    li rx, 1018
+_sweep134_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep134_fill
+    push 8192
+    clz
+    push 2
+    xor
+    failnez
+    li rx, 0
+_sweep134_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep134_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 0: clz 16384
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 1: clz 16384
+    li rx, 1
+_sweep136_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep136_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep136_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep136_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 2: clz 16384
+    li rx, 2
+_sweep137_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep137_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep137_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep137_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 3: clz 16384
+    li rx, 3
+_sweep138_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep138_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep138_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep138_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 4: clz 16384
+    li rx, 4
+_sweep139_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep139_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep139_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep139_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 5: clz 16384
+    li rx, 5
+_sweep140_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep140_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep140_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep140_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 6: clz 16384
+    li rx, 6
+_sweep141_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep141_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep141_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep141_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 7: clz 16384
+    li rx, 7
+_sweep142_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep142_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep142_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep142_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 15 at depth 1018: clz 16384
+    li rx, 1018
+_sweep143_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep143_fill
+    push 16384
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep143_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep143_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 0: clz 32768
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 1: clz 32768
+    li rx, 1
+_sweep145_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep145_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep145_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep145_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 2: clz 32768
+    li rx, 2
+_sweep146_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep146_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep146_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep146_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 3: clz 32768
+    li rx, 3
+_sweep147_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep147_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep147_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep147_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 4: clz 32768
+    li rx, 4
+_sweep148_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep148_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep148_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep148_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 5: clz 32768
+    li rx, 5
+_sweep149_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep149_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep149_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep149_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 6: clz 32768
+    li rx, 6
+_sweep150_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep150_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep150_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep150_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 7: clz 32768
+    li rx, 7
+_sweep151_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep151_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep151_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep151_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 16 at depth 1018: clz 32768
+    li rx, 1018
+_sweep152_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep152_fill
+    push 32768
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep152_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep152_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 0: clz 65535
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 1: clz 65535
+    li rx, 1
+_sweep154_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep154_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep154_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep154_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 2: clz 65535
+    li rx, 2
+_sweep155_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep155_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep155_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep155_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 3: clz 65535
+    li rx, 3
+_sweep156_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep156_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep156_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep156_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 4: clz 65535
+    li rx, 4
+_sweep157_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep157_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep157_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep157_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 5: clz 65535
+    li rx, 5
+_sweep158_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep158_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep158_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep158_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 6: clz 65535
+    li rx, 6
+_sweep159_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep159_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep159_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep159_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 7: clz 65535
+    li rx, 7
+_sweep160_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep160_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep160_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep160_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 17 at depth 1018: clz 65535
+    li rx, 1018
+_sweep161_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep161_fill
+    push 65535
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep161_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep161_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 0: clz 255
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 1: clz 255
+    li rx, 1
+_sweep163_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep163_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep163_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep163_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 2: clz 255
+    li rx, 2
+_sweep164_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep164_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep164_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep164_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 3: clz 255
+    li rx, 3
+_sweep165_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep165_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep165_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep165_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 4: clz 255
+    li rx, 4
+_sweep166_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep166_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep166_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep166_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 5: clz 255
+    li rx, 5
+_sweep167_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep167_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep167_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep167_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 6: clz 255
+    li rx, 6
+_sweep168_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep168_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep168_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep168_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 7: clz 255
+    li rx, 7
+_sweep169_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep169_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep169_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep169_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 18 at depth 1018: clz 255
+    li rx, 1018
+_sweep170_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep170_fill
+    push 255
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep170_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep170_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 0: clz 65280
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 1: clz 65280
+    li rx, 1
+_sweep172_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep172_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep172_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep172_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 2: clz 65280
+    li rx, 2
+_sweep173_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep173_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep173_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep173_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 3: clz 65280
+    li rx, 3
+_sweep174_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep174_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep174_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep174_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 4: clz 65280
+    li rx, 4
+_sweep175_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep175_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep175_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep175_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 5: clz 65280
+    li rx, 5
+_sweep176_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep176_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep176_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep176_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 6: clz 65280
+    li rx, 6
+_sweep177_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep177_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep177_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep177_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 7: clz 65280
+    li rx, 7
+_sweep178_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep178_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep178_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep178_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 19 at depth 1018: clz 65280
+    li rx, 1018
+_sweep179_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep179_fill
+    push 65280
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep179_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep179_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 0: clz 3840
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 1: clz 3840
+    li rx, 1
+_sweep181_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep181_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep181_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep181_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 2: clz 3840
+    li rx, 2
+_sweep182_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep182_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep182_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep182_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 3: clz 3840
+    li rx, 3
+_sweep183_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep183_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep183_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep183_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 4: clz 3840
+    li rx, 4
+_sweep184_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep184_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep184_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep184_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 5: clz 3840
+    li rx, 5
+_sweep185_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep185_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep185_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep185_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 6: clz 3840
+    li rx, 6
+_sweep186_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep186_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep186_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep186_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 7: clz 3840
+    li rx, 7
+_sweep187_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep187_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep187_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep187_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 20 at depth 1018: clz 3840
+    li rx, 1018
+_sweep188_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep188_fill
+    push 3840
+    clz
+    push 4
+    xor
+    failnez
+    li rx, 0
+_sweep188_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep188_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 0: clz 240
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 1: clz 240
+    li rx, 1
+_sweep190_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep190_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep190_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep190_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 2: clz 240
+    li rx, 2
+_sweep191_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep191_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep191_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep191_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 3: clz 240
+    li rx, 3
+_sweep192_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep192_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep192_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep192_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 4: clz 240
+    li rx, 4
+_sweep193_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep193_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep193_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep193_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 5: clz 240
+    li rx, 5
+_sweep194_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep194_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep194_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep194_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 6: clz 240
+    li rx, 6
+_sweep195_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep195_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep195_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep195_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 7: clz 240
+    li rx, 7
+_sweep196_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep196_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep196_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep196_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 21 at depth 1018: clz 240
+    li rx, 1018
+_sweep197_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep197_fill
+    push 240
+    clz
+    push 8
+    xor
+    failnez
+    li rx, 0
+_sweep197_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep197_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 0: clz 21845
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 1: clz 21845
+    li rx, 1
+_sweep199_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep199_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep199_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep199_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 2: clz 21845
+    li rx, 2
+_sweep200_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep200_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep200_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep200_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 3: clz 21845
+    li rx, 3
+_sweep201_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep201_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep201_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep201_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 4: clz 21845
+    li rx, 4
+_sweep202_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep202_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep202_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep202_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 5: clz 21845
+    li rx, 5
+_sweep203_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep203_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep203_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep203_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 6: clz 21845
+    li rx, 6
+_sweep204_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep204_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep204_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep204_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 7: clz 21845
+    li rx, 7
+_sweep205_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep205_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep205_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep205_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 22 at depth 1018: clz 21845
+    li rx, 1018
+_sweep206_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep206_fill
+    push 21845
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep206_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep206_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 0: clz 43690
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 1: clz 43690
+    li rx, 1
+_sweep208_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep208_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep208_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep208_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 2: clz 43690
+    li rx, 2
+_sweep209_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep209_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep209_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep209_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 3: clz 43690
+    li rx, 3
+_sweep210_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep210_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep210_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep210_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 4: clz 43690
+    li rx, 4
+_sweep211_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep211_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep211_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep211_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 5: clz 43690
+    li rx, 5
+_sweep212_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep212_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep212_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep212_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 6: clz 43690
+    li rx, 6
+_sweep213_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep213_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep213_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep213_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 7: clz 43690
+    li rx, 7
+_sweep214_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep214_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep214_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep214_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 23 at depth 1018: clz 43690
+    li rx, 1018
+_sweep215_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep215_fill
+    push 43690
+    clz
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep215_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep215_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 0: clz 3
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 1: clz 3
+    li rx, 1
+_sweep217_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep217_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep217_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep217_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 2: clz 3
+    li rx, 2
+_sweep218_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep218_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep218_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep218_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 3: clz 3
+    li rx, 3
+_sweep219_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep219_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep219_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep219_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 4: clz 3
+    li rx, 4
+_sweep220_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep220_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep220_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep220_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 5: clz 3
+    li rx, 5
+_sweep221_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep221_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep221_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep221_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 6: clz 3
+    li rx, 6
+_sweep222_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep222_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep222_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep222_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 7: clz 3
+    li rx, 7
+_sweep223_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep223_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep223_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep223_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 24 at depth 1018: clz 3
+    li rx, 1018
+_sweep224_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep224_fill
+    push 3
+    clz
+    push 14
+    xor
+    failnez
+    li rx, 0
+_sweep224_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep224_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 0: clz 32767
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 1: clz 32767
+    li rx, 1
+_sweep226_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep226_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep226_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep226_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 2: clz 32767
+    li rx, 2
+_sweep227_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep227_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep227_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep227_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 3: clz 32767
+    li rx, 3
+_sweep228_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep228_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep228_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep228_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 4: clz 32767
+    li rx, 4
+_sweep229_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep229_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep229_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep229_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 5: clz 32767
+    li rx, 5
+_sweep230_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep230_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep230_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep230_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 6: clz 32767
+    li rx, 6
+_sweep231_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep231_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep231_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep231_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 7: clz 32767
+    li rx, 7
+_sweep232_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep232_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep232_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep232_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 25 at depth 1018: clz 32767
+    li rx, 1018
+_sweep233_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep233_fill
+    push 32767
+    clz
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep233_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep233_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,1522 @@
+; Depth sweep of lt at depths 0, 1, 2, 3, 4, 5, 6, 7 and near the high-water mark
+; Expected values from the ISA manual at 16 bits, checked against the reference model
+    jump _sweep
+
+#bank code
+
+_sweep:
+    ; Case 0 at depth 0: 10 lt 20
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 1: 10 lt 20
+    li rx, 1
+_sweep1_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep1_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep1_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep1_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 2: 10 lt 20
+    li rx, 2
+_sweep2_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep2_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep2_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep2_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 3: 10 lt 20
+    li rx, 3
+_sweep3_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep3_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep3_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep3_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 4: 10 lt 20
+    li rx, 4
+_sweep4_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep4_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep4_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep4_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 5: 10 lt 20
+    li rx, 5
+_sweep5_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep5_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep5_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep5_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 6: 10 lt 20
+    li rx, 6
+_sweep6_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep6_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep6_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep6_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 7: 10 lt 20
+    li rx, 7
+_sweep7_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep7_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep7_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep7_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 0 at depth 1018: 10 lt 20
+    li rx, 1018
+_sweep8_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep8_fill
+    push 10
+    push 20
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep8_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep8_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 0: 20 lt 10
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 1: 20 lt 10
+    li rx, 1
+_sweep10_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep10_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep10_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep10_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 2: 20 lt 10
+    li rx, 2
+_sweep11_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep11_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep11_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep11_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 3: 20 lt 10
+    li rx, 3
+_sweep12_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep12_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep12_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep12_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 4: 20 lt 10
+    li rx, 4
+_sweep13_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep13_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep13_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep13_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 5: 20 lt 10
+    li rx, 5
+_sweep14_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep14_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep14_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep14_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 6: 20 lt 10
+    li rx, 6
+_sweep15_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep15_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep15_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep15_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 7: 20 lt 10
+    li rx, 7
+_sweep16_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep16_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep16_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep16_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 1 at depth 1018: 20 lt 10
+    li rx, 1018
+_sweep17_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep17_fill
+    push 20
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep17_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep17_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 0: 10 lt 10
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 1: 10 lt 10
+    li rx, 1
+_sweep19_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep19_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep19_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep19_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 2: 10 lt 10
+    li rx, 2
+_sweep20_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep20_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep20_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep20_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 3: 10 lt 10
+    li rx, 3
+_sweep21_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep21_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep21_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep21_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 4: 10 lt 10
+    li rx, 4
+_sweep22_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep22_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep22_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep22_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 5: 10 lt 10
+    li rx, 5
+_sweep23_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep23_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep23_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep23_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 6: 10 lt 10
+    li rx, 6
+_sweep24_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep24_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep24_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep24_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 7: 10 lt 10
+    li rx, 7
+_sweep25_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep25_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep25_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep25_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 2 at depth 1018: 10 lt 10
+    li rx, 1018
+_sweep26_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep26_fill
+    push 10
+    push 10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep26_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep26_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 0: -10 lt 5
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 1: -10 lt 5
+    li rx, 1
+_sweep28_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep28_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep28_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep28_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 2: -10 lt 5
+    li rx, 2
+_sweep29_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep29_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep29_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep29_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 3: -10 lt 5
+    li rx, 3
+_sweep30_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep30_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep30_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep30_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 4: -10 lt 5
+    li rx, 4
+_sweep31_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep31_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep31_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep31_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 5: -10 lt 5
+    li rx, 5
+_sweep32_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep32_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep32_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep32_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 6: -10 lt 5
+    li rx, 6
+_sweep33_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep33_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep33_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep33_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 7: -10 lt 5
+    li rx, 7
+_sweep34_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep34_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep34_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep34_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 3 at depth 1018: -10 lt 5
+    li rx, 1018
+_sweep35_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep35_fill
+    push -10
+    push 5
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep35_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep35_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 0: 5 lt -10
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 1: 5 lt -10
+    li rx, 1
+_sweep37_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep37_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep37_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep37_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 2: 5 lt -10
+    li rx, 2
+_sweep38_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep38_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep38_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep38_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 3: 5 lt -10
+    li rx, 3
+_sweep39_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep39_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep39_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep39_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 4: 5 lt -10
+    li rx, 4
+_sweep40_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep40_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep40_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep40_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 5: 5 lt -10
+    li rx, 5
+_sweep41_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep41_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep41_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep41_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 6: 5 lt -10
+    li rx, 6
+_sweep42_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep42_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep42_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep42_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 7: 5 lt -10
+    li rx, 7
+_sweep43_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep43_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep43_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep43_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 4 at depth 1018: 5 lt -10
+    li rx, 1018
+_sweep44_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep44_fill
+    push 5
+    push -10
+    lt
+    push 0
+    xor
+    failnez
+    li rx, 0
+_sweep44_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep44_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 0: -20 lt -10
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 1: -20 lt -10
+    li rx, 1
+_sweep46_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep46_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep46_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1
+    xor
+    bnez _sweep46_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 2: -20 lt -10
+    li rx, 2
+_sweep47_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep47_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep47_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 2
+    xor
+    bnez _sweep47_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 3: -20 lt -10
+    li rx, 3
+_sweep48_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep48_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep48_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 3
+    xor
+    bnez _sweep48_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 4: -20 lt -10
+    li rx, 4
+_sweep49_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep49_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep49_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 4
+    xor
+    bnez _sweep49_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 5: -20 lt -10
+    li rx, 5
+_sweep50_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep50_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep50_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 5
+    xor
+    bnez _sweep50_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 6: -20 lt -10
+    li rx, 6
+_sweep51_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep51_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep51_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 6
+    xor
+    bnez _sweep51_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 7: -20 lt -10
+    li rx, 7
+_sweep52_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep52_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep52_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 7
+    xor
+    bnez _sweep52_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; Case 5 at depth 1018: -20 lt -10
+    li rx, 1018
+_sweep53_fill:
+    push rx
+    add 0x5a00
+    add rx, -1
+    push rx
+    bnez _sweep53_fill
+    push -20
+    push -10
+    lt
+    push 1
+    xor
+    failnez
+    li rx, 0
+_sweep53_check:
+    add rx, 1
+    push rx
+    add 0x5a00
+    xor
+    failnez
+    push rx
+    push 1018
+    xor
+    bnez _sweep53_check
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
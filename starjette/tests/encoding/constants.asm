@@ -0,0 +1,133 @@
+; Push encoding boundaries: 14 constants checked against raw bytes
+
+    ; push 31: 1 bytes
+    push 31
+    push _k0
+    lw
+    xor
+    failnez
+
+    ; push 32: 2 bytes
+    push 32
+    push _k1
+    lw
+    xor
+    failnez
+
+    ; push -32: 1 bytes
+    push -32
+    push _k2
+    lw
+    xor
+    failnez
+
+    ; push 0xffe0: 1 bytes
+    push 0xffe0
+    push _k3
+    lw
+    xor
+    failnez
+
+    ; push -33: 2 bytes
+    push -33
+    push _k4
+    lw
+    xor
+    failnez
+
+    ; push 0xffdf: 2 bytes
+    push 0xffdf
+    push _k5
+    lw
+    xor
+    failnez
+
+    ; push 4095: 2 bytes
+    push 4095
+    push _k6
+    lw
+    xor
+    failnez
+
+    ; push 4096: 3 bytes
+    push 4096
+    push _k7
+    lw
+    xor
+    failnez
+
+    ; push -4096: 2 bytes
+    push -4096
+    push _k8
+    lw
+    xor
+    failnez
+
+    ; push 0xf000: 2 bytes
+    push 0xf000
+    push _k9
+    lw
+    xor
+    failnez
+
+    ; push -4097: 3 bytes
+    push -4097
+    push _k10
+    lw
+    xor
+    failnez
+
+    ; push 0xefff: 3 bytes
+    push 0xefff
+    push _k11
+    lw
+    xor
+    failnez
+
+    ; push 32767: 3 bytes
+    push 32767
+    push _k12
+    lw
+    xor
+    failnez
+
+    ; push 0x8000: 3 bytes
+    push 0x8000
+    push _k13
+    lw
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
+
+#align 16
+_k0:
+    #d8 0x1f, 0x00
+_k1:
+    #d8 0x20, 0x00
+_k2:
+    #d8 0xe0, 0xff
+_k3:
+    #d8 0xe0, 0xff
+_k4:
+    #d8 0xdf, 0xff
+_k5:
+    #d8 0xdf, 0xff
+_k6:
+    #d8 0xff, 0x0f
+_k7:
+    #d8 0x00, 0x10
+_k8:
+    #d8 0x00, 0xf0
+_k9:
+    #d8 0x00, 0xf0
+_k10:
+    #d8 0xff, 0xef
+_k11:
+    #d8 0xff, 0xef
+_k12:
+    #d8 0xff, 0x7f
+_k13:
+    #d8 0x00, 0x80
@@ -0,0 +1,38 @@
+; Branch encoding cost: call, jump and bnez with 2 byte offsets, 1000 iterations
+    push 1000
+    push 0x7f00
+    sw
+    jump _loop
+
+#bank code
+
+_loop:
+    call _sub
+    jump _over
+
+    ; never executed
+    #res 100
+
+_over:
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    push depth
+    push 1
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
+
+    ; never executed
+    #res 100
+
+_sub:
+    ret rx
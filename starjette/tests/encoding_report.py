@@ -0,0 +1,101 @@
+"""
+Report what branch offset encodings cost in every built test and benchmark
+ROM.
+
+The `push_pcrel` in front of a beqz/bnez/jump/call takes 1, 2 or 3 bytes
+depending on the distance to its target. Branch sites are found the way
+starjette_disasm.py folds them back into labels; each ROM then runs on the
+reference system to count how often each site executed. Per offset size the
+report gives the sites, the offset bytes they take in the image and their
+executions, then the cycles spent fetching offset bytes beyond the first:
+what the ROM would save if every branch reached its target with a 1 byte
+offset.
+
+Arguments may be .bin files or suite manifest.json files, as for
+pipeline_report.py.
+
+Usage (from starjette/): python tests/encoding_report.py [ROM or manifest ...]
+Build the ROMs first with `make tests` and the suite targets.
+"""
+
+import argparse
+import os
+import sys
+
+from pipeline_report import collect_roms
+from starjette_disasm import chain, code_regions, decode_groups
+from starjette_system import System
+
+SIZES = (1, 2, 3)
+
+
+def branch_sites(buf):
+    """{address of the push_pcrel: offset bytes} for every branch in a ROM image."""
+    sites = {}
+    for _, start, end in code_regions(len(buf), None):
+        for addr, length, kind, args in decode_groups(buf, start, end, file_end=len(buf)):
+            if kind == "pcrel":
+                sites[addr] = chain(buf, addr, end)[0]
+    return sites
+
+
+def count_runs(cpu, sites, max_cycles):
+    """Executions of each site until cpu halts or runs max_cycles instructions."""
+    runs = dict.fromkeys(sites, 0)
+    step = cpu.step
+    while not cpu.halted and cpu.cycles < max_cycles:
+        pc = cpu.pc
+        if pc in runs:
+            runs[pc] += 1
+        step()
+    return runs
+
+
+def format_row(label, width, row):
+    return (f"{label:<{width}} {row['instrs']:>9} "
+            + " ".join(f"{row['sites', s]:>7} {row['bytes', s]:>7} {row['runs', s]:>9}" for s in SIZES)
+            + f" {row['extra']:>8} {row['extra'] / max(row['instrs'], 1):>7.2%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    args = parser.parse_args()
+
+    roms = collect_roms(args.paths)
+    width = max([len(label) for label, *_ in roms] + [8])
+    print("branch sites, offset bytes and executions per offset size; extra = cycles fetching offset bytes past the first")
+    print(f"{'rom':<{width}} {'instrs':>9} "
+          + " ".join(f"{f'sites{s}':>7} {f'bytes{s}':>7} {f'runs{s}':>9}" for s in SIZES)
+          + f" {'extra':>8} {'share':>7}")
+
+    totals = {"instrs": 0, "extra": 0, **{(key, s): 0 for key in ("sites", "bytes", "runs") for s in SIZES}}
+    skipped = 0
+    for label, path, max_cycles, wordsize in roms:
+        if not os.path.exists(path):
+            skipped += 1
+            continue
+        with open(path, "rb") as f:
+            sites = branch_sites(f.read())
+        cpu = System(wordsize=wordsize)
+        cpu.load_rom(path)
+        runs = count_runs(cpu, sites, max_cycles)
+
+        row = {"instrs": cpu.cycles, "extra": sum(runs[a] * (size - 1) for a, size in sites.items())}
+        for s in SIZES:
+            row["sites", s] = sum(size == s for size in sites.values())
+            row["bytes", s] = s * row["sites", s]
+            row["runs", s] = sum(runs[a] for a, size in sites.items() if size == s)
+        for key, value in row.items():
+            totals[key] += value
+        note = "" if cpu.halted else "  (did not halt)"
+        print(format_row(label, width, row) + note)
+
+    print(format_row("total", width, totals))
+    if skipped:
+        print(f"({skipped} ROMs not built, skipped)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Run the exception suite on the reference model and report what each trap
+costs: cycles from the trapping instruction up to and including the `rets`
+that leaves the handler, per ecause.
+
+Usage (from starjette/): python tests/exception_report.py [manifest.json ...]
+The ROMs must be built first with `make exceptions`.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from starjette_model import Cpu
+
+CAUSE_NAMES = {
+    0x00: "syscall",
+    0x30: "underflow",
+    0x31: "overflow",
+}
+
+
+def trap_costs(trap_log):
+    """
+    Pair trap entries with the rets that ends them.
+    Returns [(cause, cycles, depth at entry, depth at exit)].
+    """
+    costs = []
+    open_traps = []
+    for event in trap_log:
+        kind, cycle, value, depth = event
+        if kind == "enter":
+            open_traps.append((value, cycle, depth))
+        elif kind == "macro":
+            open_traps.append((0x100 | value, cycle, depth))
+        elif open_traps:
+            cause, start, entry_depth = open_traps.pop()
+            costs.append((cause, cycle - start + 1, entry_depth, depth))
+    return costs
+
+
+def cause_name(cause):
+    if cause & 0x100:
+        return f"macro 0x{cause & 0xFF:02x}"
+    return CAUSE_NAMES.get(cause, f"0x{cause:02x}")
+
+
+def run_test(path, expect, max_cycles, wordsize=16):
+    cpu = Cpu(wordsize=wordsize)
+    cpu.load_rom(path)
+    cpu.trap_log = []
+    cpu.run(max_cycles)
+
+    passed = cpu.halted and cpu.depth == 1 and cpu.peek() == expect
+    stats = {}
+    for cause, cycles, *_ in trap_costs(cpu.trap_log):
+        entry = stats.setdefault(cause, [0, 0, None, 0])
+        entry[0] += 1
+        entry[1] += cycles
+        entry[2] = cycles if entry[2] is None else min(entry[2], cycles)
+        entry[3] = max(entry[3], cycles)
+    return cpu, passed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("manifests", nargs="*", default=["tests/exceptions/manifest.json"])
+    args = parser.parse_args()
+
+    failures = 0
+    for manifest_path in args.manifests:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        base = os.path.dirname(manifest_path)
+
+        for test in manifest["tests"]:
+            rom = os.path.join(base, test["rom"])
+            if not os.path.exists(rom):
+                print(f"{rom}: missing, run `make exceptions` first")
+                failures += 1
+                continue
+
+            cpu, passed, stats = run_test(rom, test["expect"], test["max_cycles"], manifest.get("wordsize", 16))
+            failures += not passed
+            status = "ok" if passed else f"FAIL (tos={cpu.peek() if cpu.depth else None}, depth={cpu.depth})"
+            trap_cycles = sum(s[1] for s in stats.values())
+            print(f"{test['rom']}: {status}, {cpu.cycles} cycles, "
+                  f"{trap_cycles} in handlers ({100 * trap_cycles / max(cpu.cycles, 1):.1f}%)")
+            for cause, (count, total, low, high) in sorted(stats.items()):
+                print(f"    {cause_name(cause):<10} {count:6d} events  "
+                      f"avg {total / count:8.1f}  min {low:6d}  max {high:6d} cycles/event")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+; Spill/fill kernel: keep 8 items on overflow, refill 64 on underflow
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _sj_exception
+    push 0x8000
+    push 0x7f00
+    sw
+    push 0
+    push 0x7f0c
+    sw
+
+    ; Enter user mode at _user_main with interrupts off
+    push 0
+    pop estatus
+    li epc, _user_main
+    rets
+
+_sj_exception:
+    push ecause
+    push 0x31
+    xor
+    beqz _sj_spill
+    push ecause
+    push 0x30
+    xor
+    beqz _sj_fill
+    push ecause
+    beqz _sj_syscall
+
+_sj_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
+
+_sj_syscall:
+    push 0x7f0c
+    lw
+    add 1
+    push 0x7f0c
+    sw
+    rets
+
+; Overflow: flush all but the top 8 items to the memory stack
+_sj_spill:
+    push epc
+    push 0x7f02
+    sw
+    push estatus
+    push 0x7f04
+    sw
+    push ry
+    push 0x7f08
+    sw
+    push rx
+    push 0x7f06
+    sw
+    push 0x7f20
+    sw
+    push 0x7f22
+    sw
+    push 0x7f24
+    sw
+    push 0x7f26
+    sw
+    push 0x7f28
+    sw
+    push 0x7f2a
+    sw
+    push 0x7f2c
+    sw
+    push 0x7f2e
+    sw
+
+    ; ry = sp + 2 * count, the new top of the memory stack
+    push depth
+    add -1
+    dup
+    add
+    push 0x7f00
+    lw
+    add
+    dup
+    push 0x7f00
+    sw
+    pop ry
+
+_sj_spill_loop:
+    push depth
+    add -1
+    beqz _sj_spill_done
+    add ry, -2
+    push ry
+    sw
+    jump _sj_spill_loop
+
+_sj_spill_done:
+    push 0x7f2e
+    lw
+    push 0x7f2c
+    lw
+    push 0x7f2a
+    lw
+    push 0x7f28
+    lw
+    push 0x7f26
+    lw
+    push 0x7f24
+    lw
+    push 0x7f22
+    lw
+    push 0x7f20
+    lw
+    push 0x7f06
+    lw
+    pop rx
+    push 0x7f08
+    lw
+    pop ry
+    push 0x7f04
+    lw
+    pop estatus
+    push 0x7f02
+    lw
+    add -1          ; epc points past the faulting instruction
+    pop epc
+    rets
+
+; Underflow: set aside the 0-2 live items, then reload up to 64 items
+_sj_fill:
+    push epc
+    push 0x7f02
+    sw
+    push estatus
+    push 0x7f04
+    sw
+    push ry
+    push 0x7f08
+    sw
+    push rx
+    push 0x7f06
+    sw
+    push depth
+    add -1
+    push 0x7f0a
+    sw
+    push depth
+    add -1
+    beqz _sj_fill_saved
+    push 0x7f20
+    sw
+    push depth
+    add -1
+    beqz _sj_fill_saved
+    push 0x7f22
+    sw
+
+_sj_fill_saved:
+    ; rx = old sp, ry = old sp - min(2 * fill, sp - SPILL_BASE)
+    push 0x7f00
+    lw
+    dup
+    pop rx
+    push -32768
+    add
+    dup
+    beqz _sj_fatal_underflow
+    dup
+    push 128
+    ltu
+    bnez _sj_fill_some
+    drop
+    push 128
+_sj_fill_some:
+    xor -1
+    add 1
+    push rx
+    add
+    dup
+    push 0x7f00
+    sw
+    pop ry
+
+_sj_fill_loop:
+    lnw
+    push ry
+    push rx
+    xor
+    bnez _sj_fill_loop
+
+    ; Put the live items back on top
+    push 0x7f0a
+    lw
+    beqz _sj_fill_done
+    push 0x7f0a
+    lw
+    add -1
+    beqz _sj_fill_one
+    push 0x7f22
+    lw
+_sj_fill_one:
+    push 0x7f20
+    lw
+_sj_fill_done:
+    push 0x7f06
+    lw
+    pop rx
+    push 0x7f08
+    lw
+    pop ry
+    push 0x7f04
+    lw
+    pop estatus
+    push 0x7f02
+    lw
+    add -1          ; epc points past the faulting instruction
+    pop epc
+    rets
+
+_sj_fatal_underflow:
+    drop
+    jump _sj_fatal
+
+_user_main:
+    ; Push 0..3999, far deeper than the hardware stack
+    li rx, 0
+_churn_push:
+    push rx
+    add rx, 1
+    push rx
+    push 4000
+    xor
+    bnez _churn_push
+
+    ; Pop them back in reverse, each must match the counter
+_churn_pop:
+    add rx, -1
+    push rx
+    xor
+    failnez
+    push rx
+    bnez _churn_pop
+
+    ; All passed
+    push 1
+    halt
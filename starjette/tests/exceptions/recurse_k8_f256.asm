@@ -0,0 +1,252 @@
+; Spill/fill kernel: keep 8 items on overflow, refill 256 on underflow
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _sj_exception
+    push 0x8000
+    push 0x7f00
+    sw
+    push 0
+    push 0x7f0c
+    sw
+
+    ; Enter user mode at _user_main with interrupts off
+    push 0
+    pop estatus
+    li epc, _user_main
+    rets
+
+_sj_exception:
+    push ecause
+    push 0x31
+    xor
+    beqz _sj_spill
+    push ecause
+    push 0x30
+    xor
+    beqz _sj_fill
+    push ecause
+    beqz _sj_syscall
+
+_sj_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
+
+_sj_syscall:
+    push 0x7f0c
+    lw
+    add 1
+    push 0x7f0c
+    sw
+    rets
+
+; Overflow: flush all but the top 8 items to the memory stack
+_sj_spill:
+    push epc
+    push 0x7f02
+    sw
+    push estatus
+    push 0x7f04
+    sw
+    push ry
+    push 0x7f08
+    sw
+    push rx
+    push 0x7f06
+    sw
+    push 0x7f20
+    sw
+    push 0x7f22
+    sw
+    push 0x7f24
+    sw
+    push 0x7f26
+    sw
+    push 0x7f28
+    sw
+    push 0x7f2a
+    sw
+    push 0x7f2c
+    sw
+    push 0x7f2e
+    sw
+
+    ; ry = sp + 2 * count, the new top of the memory stack
+    push depth
+    add -1
+    dup
+    add
+    push 0x7f00
+    lw
+    add
+    dup
+    push 0x7f00
+    sw
+    pop ry
+
+_sj_spill_loop:
+    push depth
+    add -1
+    beqz _sj_spill_done
+    add ry, -2
+    push ry
+    sw
+    jump _sj_spill_loop
+
+_sj_spill_done:
+    push 0x7f2e
+    lw
+    push 0x7f2c
+    lw
+    push 0x7f2a
+    lw
+    push 0x7f28
+    lw
+    push 0x7f26
+    lw
+    push 0x7f24
+    lw
+    push 0x7f22
+    lw
+    push 0x7f20
+    lw
+    push 0x7f06
+    lw
+    pop rx
+    push 0x7f08
+    lw
+    pop ry
+    push 0x7f04
+    lw
+    pop estatus
+    push 0x7f02
+    lw
+    add -1          ; epc points past the faulting instruction
+    pop epc
+    rets
+
+; Underflow: set aside the 0-2 live items, then reload up to 256 items
+_sj_fill:
+    push epc
+    push 0x7f02
+    sw
+    push estatus
+    push 0x7f04
+    sw
+    push ry
+    push 0x7f08
+    sw
+    push rx
+    push 0x7f06
+    sw
+    push depth
+    add -1
+    push 0x7f0a
+    sw
+    push depth
+    add -1
+    beqz _sj_fill_saved
+    push 0x7f20
+    sw
+    push depth
+    add -1
+    beqz _sj_fill_saved
+    push 0x7f22
+    sw
+
+_sj_fill_saved:
+    ; rx = old sp, ry = old sp - min(2 * fill, sp - SPILL_BASE)
+    push 0x7f00
+    lw
+    dup
+    pop rx
+    push -32768
+    add
+    dup
+    beqz _sj_fatal_underflow
+    dup
+    push 512
+    ltu
+    bnez _sj_fill_some
+    drop
+    push 512
+_sj_fill_some:
+    xor -1
+    add 1
+    push rx
+    add
+    dup
+    push 0x7f00
+    sw
+    pop ry
+
+_sj_fill_loop:
+    lnw
+    push ry
+    push rx
+    xor
+    bnez _sj_fill_loop
+
+    ; Put the live items back on top
+    push 0x7f0a
+    lw
+    beqz _sj_fill_done
+    push 0x7f0a
+    lw
+    add -1
+    beqz _sj_fill_one
+    push 0x7f22
+    lw
+_sj_fill_one:
+    push 0x7f20
+    lw
+_sj_fill_done:
+    push 0x7f06
+    lw
+    pop rx
+    push 0x7f08
+    lw
+    pop ry
+    push 0x7f04
+    lw
+    pop estatus
+    push 0x7f02
+    lw
+    add -1          ; epc points past the faulting instruction
+    pop epc
+    rets
+
+_sj_fatal_underflow:
+    drop
+    jump _sj_fatal
+
+_user_main:
+    ; sum(1500) recursing 1500 calls deep, two stack items per frame
+    push 1500
+    call _sum
+    push 11638
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
+
+_sum:               ; ( n -- sum )
+    push rx         ; n ra
+    over            ; n ra n
+    beqz _sum_base
+    over            ; n ra n
+    add -1          ; n ra n-1
+    call _sum       ; n ra s
+    swap            ; n s ra
+    pop rx          ; n s
+    add             ; n+s
+    ret ra
+_sum_base:          ; 0 ra
+    pop rx
+    ret ra
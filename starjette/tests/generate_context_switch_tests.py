@@ -0,0 +1,398 @@
+"""
+Generate user/kernel context switch benchmarks.
+
+A minimal round robin kernel runs N user tasks. Every task builds its own
+data stack of a different depth, then loops incrementing a counter in its
+private data window before verifying its stack and exiting. Tasks are
+switched either when they yield (syscall 0) or, in the timer variants, when
+the CLINT from starjette_system.py preempts them.
+
+On each switch the kernel saves epc/estatus/rx/ry/afp to the task control
+block and flushes the data stack to the task's save area, using the `depth`
+CSR for the count and `ry`/`snw` for the copy. The incoming task's stack is
+then reloaded from its save area and its `udset` selects its 4 KiB data
+window (`udmask` = 0xF makes any address above 0x0FFF fault).
+
+Usage (from starjette/): python tests/generate_context_switch_tests.py
+Then `make context_switch` and `python tests/context_switch_report.py`.
+"""
+
+import json
+import os
+
+from generate_tests import TESTS_DIR, WORDBYTES, WORDSIZE, spell, write_test
+from starjette_system import CLINT_BASE
+
+SUITE_DIR = f"{TESTS_DIR}/context_switch"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+CLINT_MSIP = CLINT_BASE + 0x00
+CLINT_MTIMECMP = CLINT_BASE + 0x08
+CLINT_MTIME = CLINT_BASE + 0x10
+
+# Kernel variables
+KVARS = 0x7B00
+K_CUR = KVARS + 0 * WORDBYTES           # current task index
+K_CURTCB = KVARS + 1 * WORDBYTES        # current task control block
+K_LIVE = KVARS + 2 * WORDBYTES          # tasks that have not exited
+K_TMP_RX = KVARS + 3 * WORDBYTES
+K_TMP_RY = KVARS + 4 * WORDBYTES
+
+# Task control blocks, 8 words each
+TCB_BASE = 0x7C00
+TCB_SIZE = 8 * WORDBYTES
+TCB_SHIFT = TCB_SIZE.bit_length() - 1
+TCB_EPC = 0 * WORDBYTES
+TCB_ESTATUS = 1 * WORDBYTES
+TCB_RX = 2 * WORDBYTES
+TCB_RY = 3 * WORDBYTES
+TCB_AFP = 4 * WORDBYTES
+TCB_COUNT = 5 * WORDBYTES
+TCB_DONE = 6 * WORDBYTES
+TCB_SAVE = 7 * WORDBYTES
+
+# Data stack save areas of 512 words, tos at the lowest address
+SAVE_BASE = 0x4000
+SAVE_SIZE = 0x200 * WORDBYTES
+
+# Per task data windows: virtual 0x0000-0x0FFF maps to (UDSET_BASE + task) << 12.
+# The MMU registers hold 4 KiB page numbers on 16-bit builds and addresses on
+# 32-bit ones
+PAGE_SHIFT = 0 if WORDSIZE == 16 else 12
+UDMASK = 0xF if WORDSIZE == 16 else -0x1000
+UDSET_BASE = 0x8
+TASK_FP = 0x0F00
+MAX_TASKS = 6               # windows up to 0xDFFF stay clear of the device map
+
+
+def kernel(tasks, timer_period):
+    """Boot, trap dispatch, save/flush, round robin pick and restore."""
+    n = len(tasks)
+    estatus = 2 if timer_period else 0     # user mode, interrupts on for preemption
+    # Item count to bytes by doubling
+    double = "    dup\n    add\n" * (WORDBYTES // 2)
+    page = f"    push {PAGE_SHIFT}\n    sll\n" if PAGE_SHIFT else ""
+
+    code = f"""; Context switch kernel: {n} tasks, {'timer every ' + str(timer_period) + ' cycles' if timer_period else 'cooperative yield'}
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _trap
+    li udmask, {UDMASK:#x}
+    push {n}
+    push {K_LIVE:#06x}
+    sw
+    push {n - 1}
+    push {K_CUR:#06x}
+    sw
+"""
+    for i in range(n):
+        tcb = TCB_BASE + i * TCB_SIZE
+        code += f"""
+    ; Task {i}: depth {tasks[i]}
+    li rx, {tcb:#06x}
+    li ry, _task_{i}
+    push ry
+    push rx
+    sw
+    push {estatus}
+    push {TCB_ESTATUS}
+    rel rx
+    sw
+    push {TASK_FP:#06x}
+    push {TCB_AFP}
+    rel rx
+    sw
+    push {SAVE_BASE + i * SAVE_SIZE:#06x}
+    push {TCB_SAVE}
+    rel rx
+    sw
+"""
+    if timer_period:
+        code += f"""
+    ; Timer on, each switch starts a new {timer_period} cycle quantum
+    push 1
+    {spell(f"push {CLINT_MSIP:#06x}")}
+    sw
+"""
+    code += f"""    li rx, 0
+    li ry, 0
+    jump _pick
+
+_trap:
+    push ecause
+    beqz _syscall
+    push ecause
+    push 0x50
+    xor
+    bnez _fatal
+    jump _switch
+
+_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
+
+; Syscall number on the user's tos: 0 yield, 1 exit
+_syscall:
+    beqz _switch
+    push 1
+    push {K_CURTCB:#06x}
+    lw
+    add {TCB_DONE}
+    sw
+    push {K_LIVE:#06x}
+    lw
+    add -1
+    dup
+    push {K_LIVE:#06x}
+    sw
+    beqz _all_done
+
+_switch:
+    push ry
+    push {K_TMP_RY:#06x}
+    sw
+    push rx
+    push {K_TMP_RX:#06x}
+    sw
+    push {K_CURTCB:#06x}
+    lw
+    pop rx
+
+    push epc
+    push rx
+    sw
+    push estatus
+    push {TCB_ESTATUS}
+    rel rx
+    sw
+    push {K_TMP_RX:#06x}
+    lw
+    push {TCB_RX}
+    rel rx
+    sw
+    push {K_TMP_RY:#06x}
+    lw
+    push {TCB_RY}
+    rel rx
+    sw
+    push afp
+    push {TCB_AFP}
+    rel rx
+    sw
+
+    ; Flush the data stack: count from depth, copy with snw
+    push depth
+    add -1
+    push {TCB_COUNT}
+    rel rx
+    sw
+    push {TCB_SAVE}
+    rel rx
+    lw
+    pop ry
+_flush:
+    push depth
+    add -1
+    beqz _pick
+    snw
+    jump _flush
+
+; Round robin to the next task that has not exited
+_pick:
+    push {K_CUR:#06x}
+    lw
+    add 1
+    dup
+    push {n}
+    xor
+    bnez _pick_wrap
+    drop
+    push 0
+_pick_wrap:
+    dup
+    push {K_CUR:#06x}
+    sw
+    push {TCB_SHIFT}
+    sll
+    push {TCB_BASE:#06x}
+    add
+    dup
+    push {K_CURTCB:#06x}
+    sw
+    pop rx
+    push {TCB_DONE}
+    rel rx
+    lw
+    bnez _pick
+
+    ; Reload the stack bottom first, from the end of the save area down
+    push {TCB_COUNT}
+    rel rx
+    lw
+{double}    push {TCB_SAVE}
+    rel rx
+    lw
+    add
+    pop ry
+_reload:
+    push ry
+    push {TCB_SAVE}
+    rel rx
+    lw
+    xor
+    beqz _reloaded
+    add ry, -{WORDBYTES}
+    push ry
+    lw
+    jump _reload
+
+_reloaded:
+    push {K_CUR:#06x}
+    lw
+    add {UDSET_BASE}
+{page}    pop udset
+    push {TCB_AFP}
+    rel rx
+    lw
+    pop afp
+    push {TCB_ESTATUS}
+    rel rx
+    lw
+    pop estatus
+    push rx
+    lw
+    pop epc
+    push {TCB_RY}
+    rel rx
+    lw
+    pop ry
+    push {TCB_RX}
+    rel rx
+    lw
+    pop rx
+"""
+    if timer_period:
+        code += f"""
+    ; Quantum ends {timer_period} cycles from now, carrying into the next word
+    {spell(f"push {CLINT_MTIME:#06x}")}
+    lw
+    add {timer_period}
+    dup
+    {spell(f"push {CLINT_MTIMECMP:#06x}")}
+    sw
+    push {timer_period}
+    ltu
+    {spell(f"push {CLINT_MTIME + WORDBYTES:#06x}")}
+    lw
+    add
+    {spell(f"push {CLINT_MTIMECMP + WORDBYTES:#06x}")}
+    sw
+"""
+    code += """    rets
+
+_all_done:
+"""
+    return code
+
+
+def task(i, depth, iterations, yields):
+    """Task i: build `depth` sentinels, count to `iterations`, check, exit."""
+    tag = i << 8
+    code = f"""
+_task_{i}:
+"""
+    if depth:
+        code += f"""    ; Sentinels {tag:#06x}..{tag + depth - 1:#06x}, deepest first
+    li rx, 0
+_t{i}_build:
+    push rx
+    add {tag}
+    add rx, 1
+    push rx
+    push {depth}
+    xor
+    bnez _t{i}_build
+"""
+    code += f"""
+_t{i}_loop:
+    ; Counter in this task's data window and frame
+    push 0
+    lw
+    add 1
+    dup
+    push 0
+    sw
+    slw 0
+"""
+    if yields:
+        code += "    push 0\n    syscall\n"
+    code += f"""    push 0
+    lw
+    push {iterations}
+    xor
+    bnez _t{i}_loop
+
+    llw 0
+    push {iterations}
+    xor
+    failnez
+"""
+    if depth:
+        code += f"""
+    li rx, {depth}
+_t{i}_check:
+    add rx, -1
+    push rx
+    add {tag}
+    xor
+    failnez
+    push rx
+    bnez _t{i}_check
+"""
+    code += "\n    push 1\n    syscall\n"
+    return code
+
+
+def generate_switch_test(name, depths, iterations, timer_period=0):
+    code = kernel(depths, timer_period)
+    code += "    ; Each task's window must hold its own final count\n"
+    for i in range(len(depths)):
+        code += f"    {spell(f'push {(UDSET_BASE + i) << 12:#06x}')}\n    lw\n    push {iterations}\n    xor\n    failnez\n"
+    code += "\n    ; All passed\n    push 1\n    halt\n"
+    for i, depth in enumerate(depths):
+        code += task(i, depth, iterations, yields=not timer_period)
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+DEPTHS = [0, 8, 32, 128, 256, 480]
+
+
+def main():
+    tests = []
+    for n in [2, 4, MAX_TASKS]:
+        name = f"yield_n{n}"
+        generate_switch_test(name, DEPTHS[:n], 50)
+        tests.append({"rom": f"{name}.bin", "expect": 1, "max_cycles": 5_000_000, "tasks": n, "depths": DEPTHS[:n]})
+
+    for n in [2, 4]:
+        name = f"timer_n{n}"
+        generate_switch_test(name, DEPTHS[:n], 2000, timer_period=500)
+        tests.append({"rom": f"{name}.bin", "expect": 1, "max_cycles": 5_000_000, "tasks": n, "depths": DEPTHS[:n],
+                      "requires": ["traps", "interrupts", "devices"]})
+
+    manifest = {"suite": "context_switch", "wordsize": WORDSIZE, "requires": ["traps"], "tests": tests}
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Context switch tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+Generate random expression DAG programs compiled to stack code.
+
+Each program is a run of assignments to frame locals and memory words, the
+kind of straight line code a compiler emits for a basic block. Right hand
+sides are random expression DAGs over constants, locals and memory operands
+with shared subexpressions (a node used by several parents), so the stack
+code has to keep values alive with dup/over/swap/rot or spill them to a
+frame temporary with llw/slw. Expected results come from the oracle compiled
+from the ISA manual (spec_oracle.py), evaluated for all programs at once, one
+vectorized call per (DAG level, operation). Every program checks its final
+locals and memory words and exits with tos == 1 like the regular tests.
+
+Each program is emitted three times so scheduling quality shows up as a
+cycle difference on identical work:
+
+    spill   every shared value goes through a frame temporary
+    stack   shared values stay on the stack while they are within reach of
+            dup/over/swap/rot (third item), spilled only when they sink
+            deeper or the stack grows past MAX_STACK
+    best    as stack, with the operand evaluation order of every binary
+            node chosen to minimize instruction bytes: exhaustively for up
+            to SEARCH_EXHAUSTIVE nodes per statement, otherwise greedily
+
+The code is straight line, so bytes executed equals instructions executed;
+the manifest records each ROM's byte count next to its cycle budget.
+
+Usage (from starjette/): python tests/generate_dag_tests.py
+Then `make dags`; `python tests/run_emulator_tests.py -v tests/dags/manifest.json`
+prints the cycles of each variant.
+"""
+
+import itertools
+import json
+import os
+import random
+
+import spec_oracle
+from generate_tests import TESTS_DIR, WORDBYTES, WORDMASK, WORDSIZE, push_chain, spell, test_epilogue, write_test
+
+SUITE_DIR = f"{TESTS_DIR}/dags"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+PROGRAMS = 8
+SEED = 0xDA6
+
+# Memory operands, clear of the code bank contents
+MEM_BASE = 0x7000
+
+# Deepest stack the scheduler keeps shared values in before spilling one
+MAX_STACK = 8
+SEARCH_EXHAUSTIVE = 8
+
+# name: (operands, instructions, result slot after the instructions ran, commutative)
+OPS = {
+    "add": (2, ["add"], "s0", True),
+    "sub": (2, ["sub"], "s0", False),
+    "and": (2, ["and"], "s0", True),
+    "or": (2, ["or"], "s0", True),
+    "xor": (2, ["xor"], "s0", True),
+    "mul": (2, ["mul", "drop"], "s1", True),
+    "sll": (2, ["sll"], "s0", False),
+    "srl": (2, ["srl"], "s0", False),
+    "sra": (2, ["sra"], "s0", False),
+    "lt": (2, ["lt"], "s0", False),
+    "ltu": (2, ["ltu"], "s0", False),
+    "clz": (1, ["clz"], "s0", False),
+}
+OP_WEIGHTS = {"add": 4, "sub": 3, "and": 2, "or": 2, "xor": 2, "mul": 2,
+              "sll": 1, "srl": 1, "sra": 1, "lt": 1, "ltu": 1, "clz": 1}
+
+STRATEGIES = ["spill", "stack", "best"]
+
+
+class NeedSpill(Exception):
+    def __init__(self, node):
+        super().__init__(node)
+        self.node = node
+
+
+def push_bytes(value):
+    """Bytes of `push value`: one push plus a shi per extra 7 bits."""
+    return 1 + len(push_chain(value)[1])
+
+
+def cost(line):
+    parts = line.replace(",", "").split()
+    if parts[0] == "push":
+        return push_bytes(int(parts[1], 0))
+    if parts[:2] == ["add", "fp"]:
+        return push_bytes(int(parts[2], 0)) + 1
+    if parts[0] in ("llw", "slw"):
+        return push_bytes(int(parts[1], 0)) + 2     # push off; rel fp; lw/sw
+    return 1
+
+
+# --- Programs ------------------------------------------------------------
+
+class Program:
+    """
+    Nodes are tuples: ("const", value), ("local", slot, value node),
+    ("mem", slot, value node) for loads, and (op, operand, ...).
+    """
+
+    def __init__(self, rng):
+        self.nodes = []
+        self.locals = rng.randint(2, 4)
+        self.mems = rng.randint(1, 3)
+        self.initial = [rng.getrandbits(WORDSIZE) for _ in range(self.locals + self.mems)]
+        env = {("local", i): self.add(("const", v)) for i, v in enumerate(self.initial[:self.locals])}
+        env.update({("mem", i): self.add(("const", v)) for i, v in enumerate(self.initial[self.locals:])})
+        self.statements = []
+        for _ in range(rng.randint(4, 8)):
+            target = ("local", rng.randrange(self.locals)) if rng.random() < 0.7 else ("mem", rng.randrange(self.mems))
+            root = self.expression(rng, env, rng.randint(3, 10))
+            self.statements.append((target, root))
+            env[target] = root
+        self.final = env
+
+    def add(self, node):
+        self.nodes.append(node)
+        return len(self.nodes) - 1
+
+    def expression(self, rng, env, size):
+        loads = {}
+        unused = []
+        made = []
+
+        def operand():
+            if made and rng.random() < 0.25:
+                return rng.choice(made)             # shared subexpression
+            if unused and rng.random() < 0.6:
+                return unused.pop(rng.randrange(len(unused)))
+            r = rng.random()
+            if r < 0.35:
+                value = rng.randrange(-32, 32) if rng.random() < 0.5 else rng.getrandbits(WORDSIZE)
+                return self.add(("const", value & WORDMASK))
+            key = ("local", rng.randrange(self.locals)) if r < 0.75 else ("mem", rng.randrange(self.mems))
+            if key not in loads or rng.random() < 0.2:
+                loads[key] = self.add(key + (env[key],))
+            return loads[key]
+
+        for _ in range(size):
+            op = rng.choices(list(OP_WEIGHTS), list(OP_WEIGHTS.values()))[0]
+            node = self.add((op,) + tuple(operand() for _ in range(OPS[op][0])))
+            unused.append(node)
+            made.append(node)
+        return made[-1]
+
+    def resolve(self, node):
+        while self.nodes[node][0] in ("local", "mem"):
+            node = self.nodes[node][2]
+        return node
+
+
+def evaluate(programs):
+    """{(program index, node): value} through the spec oracle, batched over all programs."""
+    module = spec_oracle.load()
+    values = {}
+    pending = {}
+    for p, program in enumerate(programs):
+        level = {}
+        for i, node in enumerate(program.nodes):
+            if node[0] == "const":
+                values[p, i] = node[1]
+                level[i] = 0
+            elif node[0] in ("local", "mem"):
+                level[i] = level[program.resolve(i)]
+            else:
+                level[i] = 1 + max(level[program.resolve(a)] for a in node[1:])
+                pending.setdefault((level[i], node[0]), []).append((p, i))
+
+    for (_, op), work in sorted(pending.items()):
+        columns = [[values[p, programs[p].resolve(programs[p].nodes[i][k])] for p, i in work]
+                   for k in range(1, OPS[op][0] + 1)]
+        out = spec_oracle.apply(module, op, columns[::-1], WORDSIZE)
+        for (p, i), value in zip(work, out[OPS[op][2]]):
+            values[p, i] = int(value)
+    return values
+
+
+# --- Stack code ----------------------------------------------------------
+
+def operands(node):
+    return [] if node[0] in ("const", "local", "mem") else list(node[1:])
+
+
+def use_counts(program, root):
+    """{node: references from within the statement}, the root counting once."""
+    uses = {root: 1}
+    stack = [root]
+    seen = {root}
+    while stack:
+        for a in operands(program.nodes[stack.pop()]):
+            uses[a] = uses.get(a, 0) + 1
+            if a not in seen:
+                seen.add(a)
+                stack.append(a)
+    return uses
+
+
+def rot(st):
+    """Track one `rot` on the compile time stack (top last); two bring the third item to the top."""
+    st[-1], st[-2], st[-3] = st[-2], st[-3], st[-1]
+
+
+def compile_once(program, root, uses, spilled, flipped, temp_base):
+    """
+    Instructions for one statement, or NeedSpill for a value that fell out
+    of reach. The compile time stack holds node ids for values on their way
+    to an operation and ("keep", node) for copies kept for later uses.
+    """
+    code = []
+    st = []
+    remaining = dict(uses)
+    computed = set()
+    temps = {}
+
+    def pushed(entry):
+        st.append(entry)
+        if len(st) > MAX_STACK:
+            for kept in st:
+                if isinstance(kept, tuple):
+                    raise NeedSpill(kept[1])
+
+    def fetch(x):
+        """Bring x to the top for one of its uses."""
+        node = program.nodes[x]
+        remaining[x] -= 1
+        if x in computed:
+            if x in spilled:
+                reload(x)
+                return
+            depth = st[::-1].index(("keep", x))
+            last = remaining[x] == 0
+            if depth > 2:
+                raise NeedSpill(x)
+            if depth == 1 and not (last and st[-1] == x):
+                code.append("swap" if last else "over")
+            elif depth == 2:
+                code.extend(["rot", "rot"])
+                rot(st)
+                rot(st)
+            if last:
+                if depth == 1:
+                    st[-1], st[-2] = st[-2], st[-1]
+                st[-1] = x
+            elif depth == 1:
+                pushed(x)
+            else:
+                code.append("dup")
+                pushed(x)
+            return
+
+        computed.add(x)
+        if node[0] in ("const", "local", "mem"):
+            reload(x)
+        else:
+            args = list(node[1:])
+            order = args[::-1] if x in flipped else args
+            for a in order:
+                fetch(a)
+            if len(args) == 2 and st[-2] != order[0]:
+                # A copy kept for later landed between the operands
+                if len(st) < 3 or st[-3] != order[0]:
+                    raise NeedSpill(st[-2][1])
+                code.extend(["rot", "rot", "swap"])
+                rot(st)
+                rot(st)
+                st[-1], st[-2] = st[-2], st[-1]
+            if order != args and not OPS[node[0]][3]:
+                code.append("swap")
+            code.extend(OPS[node[0]][1])
+            del st[len(st) - len(args):]
+            pushed(x)
+        if uses[x] > 1:
+            if x in spilled and node[0] not in ("const", "local", "mem"):
+                temps[x] = temp_base + WORDBYTES * len(temps)
+                code.extend(["dup", f"slw {temps[x]}"])
+            elif x not in spilled:
+                code.append("dup")
+                st[-1] = ("keep", x)
+                pushed(x)
+
+    def reload(x):
+        node = program.nodes[x]
+        if node[0] == "const":
+            code.append(f"push {node[1]:#06x}")
+        elif node[0] == "local":
+            code.append(f"llw {WORDBYTES * node[1]}")
+        elif node[0] == "mem":
+            code.extend([f"push {MEM_BASE + WORDBYTES * node[1]:#06x}", "lw"])
+        else:
+            code.append(f"llw {temps[x]}")
+        pushed(x)
+
+    fetch(root)
+    assert st == [root], st
+    return code, len(temps)
+
+
+def compile_statement(program, root, strategy, temp_base):
+    """(instructions, temporaries used) for one statement under a strategy."""
+    uses = use_counts(program, root)
+    shared = {x for x, n in uses.items() if n > 1}
+    binary = [x for x in uses if OPS.get(program.nodes[x][0], (0,))[0] == 2]
+
+    def attempt(flipped):
+        spilled = set(shared) if strategy == "spill" else set()
+        while True:
+            try:
+                return compile_once(program, root, uses, spilled, flipped, temp_base)
+            except NeedSpill as e:
+                spilled.add(e.node)
+
+    def size(result):
+        return sum(cost(line) for line in result[0])
+
+    if strategy != "best":
+        return attempt(set())
+    if len(binary) <= SEARCH_EXHAUSTIVE:
+        candidates = (attempt({x for x, f in zip(binary, flips) if f})
+                      for flips in itertools.product([False, True], repeat=len(binary)))
+        return min(candidates, key=size)
+
+    flipped = set()
+    best = attempt(flipped)
+    improved = True
+    while improved:
+        improved = False
+        for x in binary:
+            trial = attempt(flipped ^ {x})
+            if size(trial) < size(best):
+                best, flipped, improved = trial, flipped ^ {x}, True
+    return best
+
+
+def generate_program(name, program, values, strategy, p):
+    statements = []
+    temps = 0
+    temp_base = WORDBYTES * program.locals
+    for target, root in program.statements:
+        code, used = compile_statement(program, root, strategy, temp_base)
+        temps = max(temps, used)
+        kind, slot = target
+        store = [f"slw {WORDBYTES * slot}"] if kind == "local" else [f"push {MEM_BASE + WORDBYTES * slot:#06x}", "sw"]
+        statements.append((target, root, code + store))
+
+    frame = WORDBYTES * (program.locals + temps)
+    lines = [f"add fp, -{frame}"]
+    for i, value in enumerate(program.initial):
+        if i < program.locals:
+            lines += [f"push {value:#06x}", f"slw {WORDBYTES * i}"]
+        else:
+            lines += [f"push {value:#06x}", f"push {MEM_BASE + WORDBYTES * (i - program.locals):#06x}", "sw"]
+    body = sum(cost(line) for line in lines)
+
+    asm = f"; Expression DAG program {p}, {strategy} scheduling\n"
+    asm += f"; {program.locals} locals, {program.mems} memory words, {temps} temporaries\n"
+    asm += "".join(f"    {spell(line)}\n" for line in lines) + "\n"
+    for (kind, slot), root, code in statements:
+        asm += f"    ; {kind}{slot} = node {root} ({values[p, program.resolve(root)]:#06x})\n"
+        asm += "".join(f"    {spell(line)}\n" for line in code) + "\n"
+        body += sum(cost(line) for line in code)
+
+    asm += "    ; Check the results\n"
+    for (kind, slot), node in sorted(program.final.items()):
+        load = f"    llw {WORDBYTES * slot}\n" if kind == "local" else f"    push {MEM_BASE + WORDBYTES * slot:#06x}\n    lw\n"
+        asm += f"{load}    {spell(f'push {values[p, program.resolve(node)]:#06x}')}\n    xor\n    failnez\n"
+    asm += "\n" + test_epilogue()
+    write_test(f"{SUITE_DIR}/{name}.asm", asm)
+    return body
+
+
+def main():
+    rng = random.Random(SEED)
+    programs = [Program(rng) for _ in range(PROGRAMS)]
+    values = evaluate(programs)
+
+    tests = []
+    totals = dict.fromkeys(STRATEGIES, 0)
+    for p, program in enumerate(programs):
+        for strategy in STRATEGIES:
+            name = f"dag{p:02d}_{strategy}"
+            size = generate_program(name, program, values, strategy, p)
+            totals[strategy] += size
+            tests.append({"rom": f"{name}.bin", "expect": 1, "max_cycles": 20 * size + 10_000,
+                          "strategy": strategy, "bytes": size})
+
+    manifest = {"suite": "dags", "wordsize": WORDSIZE, "requires": [], "tests": tests}
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    summary = ", ".join(f"{s} {totals[s]}" for s in STRATEGIES)
+    print(f"DAG tests generated successfully ({PROGRAMS} programs, straight line bytes: {summary}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+"""
+Generate a decode sweep over all 256 instruction byte values, plus a
+dispatch throughput benchmark.
+
+The sweep ROMs execute every byte value once per mode from a table of cases
+(byte, stack setup, mode) and check the outcome the reference model predicts
+for it: the trap taken (ecause through evec, or the macro instruction vector
+at `(byte & 0x1F) * 8 + 0x100`), the data stack depth and contents, rx, ry
+and fp, and the scratch words for memory instructions. This covers the
+`0b001xxxxx` macro range, every `rel`/`pop`/`add reg` form, every CSR index
+for pushcsr/popcsr, aligned and unaligned memory access, branches taken and
+not taken, and stack underflow for every byte that reads the stack.
+
+    sweep_kernel    all bytes in kernel mode, CSR forms, unaligned access
+                    and underflow
+    sweep_user      all bytes in user mode, CSR forms
+    dispatch        the kernel mode cases without their checks, in a
+                    shuffled order, run LOOPS times; its cycles/sec is the
+                    decode/dispatch throughput of an emulator's opcode switch
+
+`halt` is tested with status.th set, so it traps (ecause 0x12) instead of
+stopping. Traps and macro vectors store their cause in TRAP_VAR and return
+to the next instruction. Every ROM finishes through syscall with FINISH set
+and exits with tos == 1. A failing case exits with its case number + 2.
+`rets` is only swept in kernel mode, where epc can be set up.
+
+Usage (from starjette/): python tests/generate_decode_tests.py
+Then `make decode`.
+"""
+
+import json
+import os
+import random
+
+from starjette_model import (
+    CSRS, MACRO_VECTOR_BASE, MIN_DEPTH, OPCODE_NAMES, OPCODES, STATUS_KM, STATUS_TH, Cpu, decode, mnemonic,
+)
+from generate_tests import TESTS_DIR, WORDBYTES, WORDMASK, WORDSIZE, spell, write_test
+
+SUITE_DIR = f"{TESTS_DIR}/decode"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+# Variables and scratch memory, clear of the code bank contents
+KVARS = 0x7F00
+TRAP_VAR = KVARS + 0 * WORDBYTES        # cause of the last trap, NONE if there was none
+FINISH = KVARS + 1 * WORDBYTES          # exit code, nonzero makes the trap handler halt
+CASE = KVARS + 2 * WORDBYTES            # case being run
+LOOP = KVARS + 3 * WORDBYTES            # dispatch benchmark iterations left
+RX0 = KVARS + 0x40
+SCRATCH = KVARS + 0x80      # two words, reset before every memory case
+SCRATCH_INIT = [0x1122, 0x3344]
+FP_K = 0x7E00
+FP_U = 0x7D00
+
+NONE = WORDMASK
+LOOPS = 100
+SEED = 0xDEC0
+
+# Where the model executes a case; the byte after it stands for the case label
+CASE_PC = 0x4000
+NEXT = CASE_PC + 1
+EVEC = 0x0400
+
+KERNEL_STATUS = STATUS_KM | STATUS_TH
+USER_STATUS = STATUS_TH
+
+MEMORY_OPS = {OPCODES[name] for name in ["lw", "sw", "lb", "sb", "lh", "sh", "lnw", "snw"]}
+PC_VALUE_OPS = {OPCODES["rel pc"], OPCODES["callp"]}
+# CSRs whose value depends on earlier traps in the ROM, so reads are not compared
+VOLATILE_CSRS = {CSRS["estatus"], CSRS["epc"], CSRS["ecause"], CSRS["evec"]}
+CSR_INDEXES = list(range(16)) + [16]
+
+
+def stack_for(byte):
+    """Stack (bottom first) that makes byte do something checkable and land on the next instruction."""
+    op = decode(byte)
+    name = OPCODE_NAMES.get(op)
+    if name in ("beqz", "bnez"):
+        return [0x00A5, 0]                      # offset 0: taken or not, execution continues
+    if name in ("callp", "pop pc"):
+        return [NEXT]
+    if name == "add pc":
+        return [0]
+    if name == "rel pc":
+        return [5]
+    if name in ("lw", "lb", "lh"):
+        return [SCRATCH]
+    if name in ("sw", "sb", "sh"):
+        return [0xA5C3, SCRATCH]
+    if name == "snw":
+        return [0x5A5A]
+    if name in ("halt", "rets", "syscall", "lnw"):
+        return []
+    if name in ("div", "divu"):
+        return [100, 7]
+    if op >= 0x40:
+        return [0x0123]
+    return [0x8421, 0x1234, 0x0007]
+
+
+class Case:
+    """One byte under test: asm setup lines, the model's view of that setup, and the outcome."""
+
+    def __init__(self, byte, items, mode, note="", setup=None, model_setup=None, volatile=False):
+        self.byte = byte
+        self.items = items
+        self.mode = mode
+        self.note = note
+        self.setup = setup or []
+        self.model_setup = model_setup
+        self.volatile = volatile
+
+    def simulate(self):
+        """Run the byte on the model with the ROM's trap handlers emulated."""
+        cpu = Cpu(wordsize=WORDSIZE)
+        status = KERNEL_STATUS if self.mode == "kernel" else USER_STATUS
+        cpu.status = status
+        cpu.kfp, cpu.ufp = FP_K, FP_U
+        cpu.rx, cpu.ry = RX0, SCRATCH
+        cpu.evec = EVEC
+        cpu.epc, cpu.estatus = NEXT, status
+        for i, word in enumerate(SCRATCH_INIT):
+            cpu.mem[SCRATCH + WORDBYTES * i:SCRATCH + WORDBYTES * (i + 1)] = word.to_bytes(WORDBYTES, "little")
+        for item in self.items:
+            cpu.push(item)
+        if self.model_setup:
+            self.model_setup(cpu)
+        cpu.pc = CASE_PC
+        cpu.mem[CASE_PC] = self.byte
+        cpu.step()
+
+        marker = NONE
+        if cpu.pc == EVEC:
+            marker = cpu.ecause
+        elif MACRO_VECTOR_BASE <= cpu.pc < MACRO_VECTOR_BASE + 0x100:
+            marker = 0x100 + (cpu.pc - MACRO_VECTOR_BASE) // 8
+        if marker != NONE:
+            cpu.pc, cpu.status = cpu.epc, cpu.estatus
+        assert cpu.pc == NEXT and cpu.status == status and not cpu.halted, (hex(self.byte), self.mode, hex(cpu.pc))
+
+        self.marker = marker
+        self.stack = [cpu.peek(i) for i in range(cpu.depth)]
+        self.rx, self.ry, self.fp = cpu.rx, cpu.ry, cpu.fp
+        self.memory = [int.from_bytes(cpu.mem[SCRATCH + WORDBYTES * i:SCRATCH + WORDBYTES * (i + 1)], "little")
+                       for i in range(2)]
+        return self
+
+
+def value(v, label):
+    """Operand text for a value, as an offset from the case label if it came from pc."""
+    return label if v == NEXT else f"{v:#06x}"
+
+
+def case_setup(case, label):
+    lines = []
+    if decode(case.byte) in MEMORY_OPS:
+        for i, word in enumerate(SCRATCH_INIT):
+            lines += [f"push {word:#06x}", f"push {SCRATCH + WORDBYTES * i:#06x}", "sw"]
+    if case.byte == OPCODES["rets"]:
+        status = KERNEL_STATUS if case.mode == "kernel" else USER_STATUS
+        lines += [f"li epc, {label}", f"li estatus, {status}"]
+    lines += [f"push {value(item, label)}" for item in case.items]
+    return lines + case.setup + [f"#d8 {case.byte:#04x}"]
+
+
+def case_checks(case, label):
+    pc_relative = decode(case.byte) in PC_VALUE_OPS and case.marker == NONE
+
+    def expect(v):
+        if pc_relative and NEXT <= v < NEXT + 0x100:
+            return f"push {label} + {v - NEXT}"
+        return f"push {v:#06x}"
+
+    lines = [f"push {TRAP_VAR:#06x}", "lw", f"push {case.marker:#06x}", "xor", "bnez _fail"]
+    lines += ["push depth", f"push {len(case.stack) + 1}", "xor", "bnez _fail"]
+    for i, item in enumerate(case.stack):
+        if case.volatile and i == 0 and case.marker == NONE:
+            lines.append("drop")
+        else:
+            lines += [expect(item), "xor", "bnez _fail"]
+    for reg in ("rx", "ry", "fp"):
+        lines += [f"push {reg}", expect(getattr(case, reg)), "xor", "bnez _fail"]
+    if decode(case.byte) in MEMORY_OPS:
+        for i, word in enumerate(case.memory):
+            lines += [f"push {SCRATCH + WORDBYTES * i:#06x}", "lw", f"push {word:#06x}", "xor", "bnez _fail"]
+    return lines
+
+
+def sweep_cases(mode):
+    cases = []
+    for byte in range(256):
+        if byte == OPCODES["rets"] and mode == "user":
+            continue
+        if byte == OPCODES["pushcsr"]:
+            cases.append(Case(byte, [CSRS["depth"]], mode, "csr 4"))
+        elif byte == OPCODES["popcsr"]:
+            cases.append(csr_write_case(CSRS["afp"], mode))
+        else:
+            cases.append(Case(byte, stack_for(byte), mode))
+
+    for name in ("beqz", "bnez"):
+        cases.append(Case(OPCODES[name], [0, 0], mode, "condition zero"))
+    for index in CSR_INDEXES:
+        cases.append(Case(OPCODES["pushcsr"], [index], mode, f"csr {index}",
+                          volatile=index in VOLATILE_CSRS))
+        cases.append(csr_write_case(index, mode))
+
+    if mode == "kernel":
+        for name in ("lw", "lb", "lh"):
+            cases.append(Case(OPCODES[name], [SCRATCH + 1], mode, "unaligned"))
+        for name in ("sw", "sb", "sh"):
+            cases.append(Case(OPCODES[name], [0xA5C3, SCRATCH + 1], mode, "unaligned"))
+        for byte in list(range(0x40)) + [0x80, 0xFF]:
+            need = MIN_DEPTH[decode(byte)]
+            if need:
+                cases.append(Case(byte, [0x0011] * (need - 1), mode, "underflow"))
+    return cases
+
+
+def csr_write_case(index, mode):
+    """popcsr writing a CSR's own value back, or a constant where it traps."""
+    if mode == "kernel" and index != 7 and index < 16:
+        return Case(OPCODES["popcsr"], [], mode, f"csr {index}, written back",
+                    setup=[f"push {index}", "pushcsr", f"push {index}"],
+                    model_setup=lambda cpu: (cpu.push(index), cpu.replace(cpu.read_csr(index)), cpu.push(index)))
+    return Case(OPCODES["popcsr"], [0x0055, index], mode, f"csr {index}")
+
+
+def describe(case):
+    text = mnemonic(case.byte)
+    if case.note:
+        text += f" ({case.note})"
+    if case.marker == NONE:
+        return text
+    if case.marker >= 0x100:
+        return f"{text} -> macro vector {case.marker & 0xFF:#04x}"
+    return f"{text} -> ecause {case.marker:#04x}"
+
+
+def kernel(mode):
+    """Trap handler, macro vectors and entry into the sweep in the given mode."""
+    code = f"""; Trap handler and macro vectors: record the cause in TRAP_VAR and continue
+    jump _main
+"""
+    for k in range(32):
+        code += f"""
+#addr {MACRO_VECTOR_BASE + 8 * k:#05x}
+    push {0x100 + k:#05x}
+    push {TRAP_VAR:#06x}
+    sw
+    rets
+"""
+    code += f"""
+#bank code
+
+_trap:
+    push ecause
+    push {TRAP_VAR:#06x}
+    sw
+    push {FINISH:#06x}
+    lw
+    bnez _finish
+    rets
+
+_finish:
+    li status, {STATUS_KM}
+    push {FINISH:#06x}
+    lw
+    halt
+
+_fail:
+    push {CASE:#06x}
+    lw
+    add 2
+    push {FINISH:#06x}
+    sw
+    syscall
+
+_main:
+    li evec, _trap
+    li fp, {FP_K:#06x}
+    li afp, {FP_U:#06x}
+    push 0
+    push {FINISH:#06x}
+    sw
+    li status, {KERNEL_STATUS}
+"""
+    if mode == "user":
+        code += f"""
+    ; Enter user mode (th set) at _user
+    li estatus, {USER_STATUS}
+    li epc, _user
+    rets
+
+_user:
+"""
+    return code
+
+
+def finish():
+    return f"""
+    ; All passed
+    push 1
+    push {FINISH:#06x}
+    sw
+    syscall
+"""
+
+
+def generate_sweep(name, mode):
+    cases = [case.simulate() for case in sweep_cases(mode)]
+    code = f"; Decode sweep, {mode} mode: {len(cases)} cases\n" + kernel(mode)
+    for n, case in enumerate(cases):
+        label = f"_d{n}"
+        code += f"\n    ; case {n}: {describe(case)}\n"
+        lines = [f"push {n}", f"push {CASE:#06x}", "sw",
+                 "push -1", f"push {TRAP_VAR:#06x}", "sw",
+                 f"li rx, {RX0:#06x}", f"li ry, {SCRATCH:#06x}"]
+        lines += case_setup(case, label)
+        code += "".join(f"    {spell(line)}\n" for line in lines) + f"{label}:\n"
+        lines = case_checks(case, label)
+        if case.fp != (FP_K if mode == "kernel" else FP_U):
+            lines.append(f"li fp, {FP_K if mode == 'kernel' else FP_U:#06x}")
+        code += "".join(f"    {spell(line)}\n" for line in lines)
+    code += finish()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    return len(cases)
+
+
+def generate_dispatch(name):
+    """Every kernel mode byte in a shuffled order, LOOPS times, checking only the final depth."""
+    cases = [case.simulate() for case in sweep_cases("kernel")[:256]]
+    random.Random(SEED).shuffle(cases)
+    traps = sum(case.marker != NONE for case in cases)
+    code = f"; Dispatch benchmark: {len(cases)} byte values ({traps} trapping) x {LOOPS}\n" + kernel("kernel")
+    code += f"""    push {LOOPS}
+    push {LOOP:#06x}
+    sw
+
+_loop:
+"""
+    for n, case in enumerate(cases):
+        label = f"_b{n}"
+        lines = [f"li ry, {SCRATCH:#06x}"] if decode(case.byte) in MEMORY_OPS else []
+        lines += case_setup(case, label)
+        code += f"    ; {describe(case)}\n" + "".join(f"    {spell(line)}\n" for line in lines) + f"{label}:\n"
+        code += "    drop\n" * len(case.stack)
+    code += f"""
+    push {LOOP:#06x}
+    lw
+    add -1
+    dup
+    push {LOOP:#06x}
+    sw
+    bnez _loop
+
+    push depth
+    push 1
+    xor
+    bnez _fail
+"""
+    code += finish()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    return len(cases), traps
+
+
+def main():
+    tests = []
+    for mode in ("kernel", "user"):
+        count = generate_sweep(f"sweep_{mode}", mode)
+        tests.append((f"sweep_{mode}", count * 200 + 10_000))
+    count, traps = generate_dispatch("dispatch")
+    tests.append(("dispatch", LOOPS * (count * 30 + traps * 20) + 10_000))
+
+    manifest = {
+        "suite": "decode",
+        "wordsize": WORDSIZE,
+        "requires": ["traps"],
+        "tests": [
+            {"rom": f"{name}.bin", "expect": 1, "max_cycles": max_cycles}
+            for name, max_cycles in tests
+        ],
+    }
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Decode tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Generate data stack depth sweeps for every opcode with straight line cases,
+plus benchmarks of the same instructions on stacks of fixed depth.
+
+    <op>            every case of the opcode (the ALU cases come from
+                    generate_tests.py) on a stack of 0..7 items, past the
+                    TOS/NOS/ROS registers, and on the deepest stack it fits
+                    under the kernel overflow high-water mark; the slots
+                    below hold distinct sentinels checked after the case
+    bench_d<N>      the first case of every opcode, LOOPS times, on a stack
+                    filled to N items and left alone. The guest cycles are
+                    the same for every N, so comparing a core's host
+                    cycles/sec across them shows what it pays once operands
+                    are in its stack memory rather than its registers.
+
+Expected values come from the oracle compiled from the ISA manual, or are
+written out for the memory cases, and are checked against the reference
+model, so the suite generates for either word size. Every ROM exits with tos == 1 like the regular tests.
+
+Usage (from starjette/): python tests/generate_depth_tests.py
+Then `make depths`.
+"""
+
+import json
+import os
+
+from generate_tests import (
+    BINARY_OP_CASES, SWEEP_ITEM_CYCLES, TESTS_DIR, UNARY_OP_CASES, WORDSIZE, generate_depth_sweep, model_cpu,
+    model_stack, spell, sweep_check, sweep_fill, sweep_high_water, test_epilogue, write_test,
+)
+from starjette_model import KERNEL_HIGH_WATER
+
+SUITE_DIR = f"{TESTS_DIR}/depths"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+# Benchmark loop counter, clear of the fp-relative addresses the cases use
+LOOP = 0x7F00
+LOOPS = 1000
+# Cycles of the counter update and backward bnez closing each iteration
+LOOP_CYCLES = 14
+BENCH_DEPTHS = [0, 1, 2, 3, 4, 8, 64]
+
+# Straight line cases of the opcodes without an ALU test table; the memory
+# cases use the words just below the frame pointer the test shim sets up and
+# give the stack they leave, as the spec oracle does not compile them
+OP_CASES = {
+    "dup": [("dup 0x1234", ["push 0x1234", "dup"])],
+    "drop": [("drop 2 of 1 2", ["push 1", "push 2", "drop"])],
+    "swap": [("swap 1 2", ["push 1", "push 2", "swap"])],
+    "over": [("over 1 2", ["push 1", "push 2", "over"])],
+    "rot": [("rot 1 2 3", ["push 1", "push 2", "push 3", "rot"])],
+    "fsl": [
+        ("{0xaaaa, 0x5555} << 4", ["push 0xAAAA", "push 0x5555", "push 4", "fsl"]),
+        ("{0, 0x8000} << 1", ["push 0", "push 0x8000", "push 1", "fsl"]),
+    ],
+    "mul": [
+        ("0x1234 * 0x5678", ["push 0x1234", "push 0x5678", "mul"]),
+        ("-3 * 7", ["push -3", "push 7", "mul"]),
+    ],
+    "shi": [("push 3; shi 0x7f", ["push 3", "shi 0x7F"])],
+    "beqz": [
+        ("taken over push 7", ["push 0", "push 1", "beqz", "push 7"]),
+        ("not taken", ["push 1", "push 1", "beqz", "push 7"]),
+    ],
+    "bnez": [
+        ("taken over push 7", ["push 1", "push 1", "bnez", "push 7"]),
+        ("not taken", ["push 0", "push 1", "bnez", "push 7"]),
+    ],
+    "lw_sw": [("store and load 0x1234 at fp-4",
+               ["push 0x1234", "push fp", "push -4", "add", "sw", "push fp", "push -4", "add", "lw"], [0x1234])],
+    "lh_sh": [("store and load half 0x8765 at fp-6",
+               ["push 0x8765", "push fp", "push -6", "add", "sh", "push fp", "push -6", "add", "lh"], [-0x789B])],
+    "lb_sb": [("store and load byte 0x85 at fp-5",
+               ["push 0x85", "push fp", "push -5", "add", "sb", "push fp", "push -5", "add", "lb"], [-0x7B])],
+    "llw_slw": [("store and load 0x4321 at fp-8",
+                 ["push 0x4321", "push -8", "slw", "push -8", "llw"], [0x4321])],
+    "lnw_snw": [("store and load 0x2468 through ry at fp-16",
+                 ["push fp", "push -16", "add", "pop ry", "push 0x2468", "snw",
+                  "push fp", "push -16", "add", "pop ry", "lnw"], [0x2468])],
+}
+
+
+def all_cases():
+    """{rom name: [(comment, asm lines[, expected stack])]} for every opcode swept."""
+    cases = {}
+    for name, table in BINARY_OP_CASES.items():
+        cases[name] = [(f"{a} {name} {b}", [f"push {a}", f"push {b}", name]) for a, b, _ in table]
+    for name, table in UNARY_OP_CASES.items():
+        cases[name] = [(f"{name} {value}", [f"push {value}", name]) for value, _ in table]
+    cases.update(OP_CASES)
+    return cases
+
+
+def generate_bench(name, depth, body):
+    """body, each case dropping its results, LOOPS times on depth sentinels."""
+    code = f"; Depth benchmark: {len(body)} cases x {LOOPS} on a stack of {depth} items\n"
+    if depth:
+        code += sweep_fill(0, depth)
+    code += f"""    push {LOOPS}
+    push {LOOP:#06x}
+    sw
+
+_loop:
+"""
+    for comment, lines, results in body:
+        code += f"    ; {comment}\n" + "".join(f"    {spell(line)}\n" for line in lines) + "    drop\n" * results
+    code += f"""
+    push {LOOP:#06x}
+    lw
+    add -1
+    dup
+    push {LOOP:#06x}
+    sw
+    bnez _loop
+
+"""
+    if depth:
+        code += sweep_check(0, depth)
+    code += "    push depth\n    push 1\n    xor\n    failnez\n\n" + test_epilogue()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def main():
+    tests = []
+    body = []
+    per_loop = LOOP_CYCLES
+    for name, cases in all_cases().items():
+        cycles = generate_depth_sweep(f"{SUITE_DIR}/{name}.asm", f"Depth sweep of {name}", cases)
+        tests.append({"rom": f"{name}.bin", "expect": 1, "max_cycles": 2 * cycles + 10_000})
+        comment, lines = cases[0][:2]
+        cpu = model_cpu()
+        results = len(model_stack(lines, cpu))
+        body.append((f"{name}: {comment}", lines, results))
+        per_loop += cpu.cycles + results
+
+    # The loop counter update goes three items above the stack it starts on
+    deepest = min(sweep_high_water(lines, results) for _, lines, results in body)
+    for depth in BENCH_DEPTHS + [min(deepest, KERNEL_HIGH_WATER - 3)]:
+        name = f"bench_d{depth}"
+        generate_bench(name, depth, body)
+        cycles = LOOPS * per_loop + SWEEP_ITEM_CYCLES * depth
+        tests.append({"rom": f"{name}.bin", "expect": 1, "max_cycles": 2 * cycles + 10_000, "depth": depth})
+
+    manifest = {"suite": "depths", "wordsize": WORDSIZE, "requires": ["high_water"], "tests": tests}
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Depth sweep tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
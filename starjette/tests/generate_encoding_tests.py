@@ -0,0 +1,293 @@
+"""
+Generate branch distance and immediate encoding boundary tests, plus
+benchmarks of what each branch offset encoding costs.
+
+`push_pcrel` (behind beqz/bnez/jump/call) and `push` use the shortest
+push/shi chain that holds the value: 1 byte for -32..31, 2 bytes for
+-4096..4095, 3 bytes beyond. A pcrel offset is taken from the end of the
+branch, so the distance at which a branch grows depends on its own size.
+
+    branches        beqz (taken), bnez (taken), jump and call with targets
+                    placed at both sides of every encoding boundary,
+                    forward and backward, plus a far target each way, all
+                    within the code bank; and every distance once more
+                    across the vector/code bank split at 0x500, with the
+                    kinds taken in turn. Sites and targets are pinned with
+                    #addr, the rest of the image stays zero.
+    constants       `push` of values at each length boundary, spelled both
+                    signed and as unsigned hex, checked against the same
+                    value stored as raw bytes; 32-bit builds add the 4 and
+                    5 byte chains cpudef.asm cannot fold, spelled as
+                    push/shi
+    loop_b1..b3     the same counted loop (a call, a jump over a gap and the
+                    backward bnez) with 1, 2 and 3 byte offsets; cycles
+                    differ only by the offset bytes fetched
+
+A wrong distance or encoding lands on a zero byte (halt with an empty stack)
+or falls through to `push 0; halt`. Every ROM exits with tos == 1 like the
+regular tests. `python tests/encoding_report.py` measures the offset bytes
+each class costs in any built ROM.
+
+Usage (from starjette/): python tests/generate_encoding_tests.py
+Then `make encoding`.
+"""
+
+import json
+import os
+
+from generate_tests import TESTS_DIR, WORDBYTES, WORDMASK, WORDSIZE, push_chain, push_word, test_epilogue, write_test
+from starjette_disasm import VECTOR_END, fits
+
+SUITE_DIR = f"{TESTS_DIR}/encoding"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+# Free addresses for pinned fragments: after the shim and the entry jump in
+# the vector bank, and the code bank below the variables
+VECTOR_FREE = 0x0040
+CODE_LIMIT = 0x7000
+
+LOOP = 0x7F00
+LOOPS = 1000
+# Gap jumped over inside the benchmark loop, per offset size
+LOOP_GAPS = {1: 0, 2: 100, 3: 5000}
+
+KINDS = ["beqz", "bnez", "jump", "call"]
+FAR = 20000
+
+
+def push_size(value):
+    """Bytes of `push value`, as the assembler picks them."""
+    return 1 + len(push_chain(value)[1])
+
+
+def pcrel_size(distance):
+    """Bytes of the `push_pcrel` of a branch whose target is distance bytes from its first byte."""
+    # The offset is taken from after the push and the instruction using it
+    return next(size for size in (1, 2, 3) if fits(distance - size - 1, size))
+
+
+def boundary_distances():
+    """Distances from the push_pcrel to the target on both sides of each size boundary, and far ones."""
+    distances = []
+    for size in (1, 2):
+        limit = 1 << (5 + 7 * (size - 1))
+        high = limit - 1 + size + 1
+        low = -limit + size + 1
+        distances += [high, high + 1, low, low - 1]
+    return distances + [FAR, -FAR]
+
+
+class Case:
+    """One branch: its site code before the push_pcrel, and where the target must be."""
+
+    def __init__(self, n, kind, distance, zone):
+        self.n = n
+        self.kind = kind
+        self.distance = distance
+        self.zone = zone
+        self.size = pcrel_size(distance)
+        self.offset = distance - self.size - 1
+        self.pre = {"beqz": ["push 0"], "bnez": ["push 1"]}.get(kind, [])
+        # pre, push_pcrel, beqz/bnez/add pc or rel pc + callp, then push 0; halt
+        self.site_size = len(self.pre) + self.size + (2 if kind == "call" else 1) + 2
+        # jump to the next case, after checking rx for a call
+        self.target_size = 4 + (10 if kind == "call" else 0)
+
+    def target_of(self, site):
+        return site + len(self.pre) + self.distance
+
+    def describe(self):
+        where = {"code": "within the code bank", "up": "vector -> code bank",
+                 "down": "code -> vector bank"}[self.zone]
+        direction = "forward" if self.distance > 0 else "backward"
+        return f"{self.kind} {direction} {abs(self.distance)}, offset {self.offset} ({self.size} bytes), {where}"
+
+
+class Layout:
+    """Byte occupancy of the address space while fragments are pinned."""
+
+    def __init__(self):
+        self.used = bytearray(CODE_LIMIT)
+        self.used[:VECTOR_FREE] = b"\x01" * VECTOR_FREE
+
+    def free(self, start, size):
+        if start < 0 or start + size > CODE_LIMIT:
+            return False
+        # A fragment may not straddle the bank split
+        if start < VECTOR_END < start + size:
+            return False
+        return not any(self.used[start:start + size])
+
+    def take(self, start, size):
+        self.used[start:start + size] = b"\x01" * size
+
+    def place(self, case):
+        """Pin a case's site and target, returning the site address."""
+        if case.zone == "up":
+            sites = range(VECTOR_END - case.site_size, VECTOR_FREE - 1, -1)
+        else:
+            sites = range(VECTOR_END, CODE_LIMIT)
+        for site in sites:
+            target = case.target_of(site)
+            if case.zone == "up" and target < VECTOR_END or case.zone == "down" and target >= VECTOR_END:
+                continue
+            if case.zone == "code" and target < VECTOR_END:
+                continue
+            if not (self.free(site, case.site_size) and self.free(target, case.target_size)):
+                continue
+            if site < target + case.target_size and target < site + case.site_size:
+                continue
+            self.take(site, case.site_size)
+            self.take(target, case.target_size)
+            return site
+        raise ValueError(f"no room for case {case.n}: {case.describe()}")
+
+
+def generate_branches(name):
+    cases = []
+    # Only a few sites fit within a short branch of the bank split, so each
+    # crossing distance is tried with one kind, in turn
+    for zone in ("up", "down"):
+        crossing = [d for d in boundary_distances() if (d > 0) == (zone == "up")]
+        for i, distance in enumerate(crossing):
+            cases.append(Case(len(cases), KINDS[i % len(KINDS)], distance, zone))
+    for distance in boundary_distances():
+        for kind in KINDS:
+            cases.append(Case(len(cases), kind, distance, "code"))
+
+    # Short branches across the split are the hardest to fit, so they are pinned first
+    layout = Layout()
+    order = sorted(cases, key=lambda c: (c.zone == "code", abs(c.distance)))
+    sites = {case.n: layout.place(case) for case in order}
+    fragments = []      # (address, text)
+    for case in cases:
+        site = sites[case.n]
+        target = case.target_of(site)
+        n = case.n
+        nxt = f"_s{n + 1}" if n + 1 < len(cases) else "_done"
+        lines = case.pre + [f"{case.kind} _t{n}"]
+        text = f"    ; case {n}: {case.describe()}\n_s{n}:\n" + "".join(f"    {line}\n" for line in lines)
+        if case.kind == "call":
+            text += f"_r{n}:\n"
+        text += "    push 0\n    halt\n"
+        fragments.append((site, text))
+
+        text = f"_t{n}:\n"
+        if case.kind == "call":
+            text += f"    push rx\n    push _r{n}\n    xor\n    failnez\n"
+        text += f"    jump {nxt}\n"
+        fragments.append((target, text))
+
+    done = next(a for a in range(VECTOR_END, CODE_LIMIT) if layout.free(a, 16))
+    fragments.append((done, "_done:\n    push depth\n    push 1\n    xor\n    failnez\n" + test_epilogue()))
+
+    counts = {size: sum(case.size == size for case in cases) for size in (1, 2, 3)}
+    code = f"; Branch encoding boundaries: {len(cases)} branches, " \
+        + ", ".join(f"{counts[size]} with {size} byte offsets" for size in counts) + "\n"
+    code += "    jump _s0\n"
+    for bank, inside in (("vector", lambda a: a < VECTOR_END), ("code", lambda a: a >= VECTOR_END)):
+        if bank != "vector":
+            code += f"\n#bank {bank}\n"
+        for address, text in sorted(f for f in fragments if inside(f[0])):
+            code += f"\n#addr {address:#06x}\n{text}"
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    return len(cases)
+
+
+def generate_constants(name):
+    values = []
+    sizes = (1, 2) if WORDSIZE == 16 else (1, 2, 3, 4)
+    for size in sizes:
+        limit = 1 << (5 + 7 * (size - 1))
+        values += [limit - 1, limit, -limit, -limit - 1]
+    values += [WORDMASK >> 1, -(WORDMASK >> 1) - 1]
+    code = ""
+    table = []
+    for value in values:
+        word = value & WORDMASK
+        if WORDSIZE == 16:
+            spellings = [str(value)] if value >= 0 else [str(value), f"{word:#06x}"]
+            if value == -0x8000:
+                spellings = [f"{word:#06x}"]
+        else:
+            # The push/shi chain is the same whichever way the value is written
+            spellings = [push_word(value).removeprefix("push ")]
+        for text in spellings:
+            code += f"""
+    ; push {text.replace(chr(10) + "    ", "; ")}: {push_size(value)} bytes
+    push {text}
+    push _k{len(table)}
+    lw
+    xor
+    failnez
+"""
+            table.append(word)
+    code = f"; Push encoding boundaries: {len(table)} constants checked against raw bytes\n" + code
+    code += "\n" + test_epilogue() + f"\n#align {8 * WORDBYTES}\n"
+    for k, word in enumerate(table):
+        data = ", ".join(f"{b:#04x}" for b in word.to_bytes(WORDBYTES, "little"))
+        code += f"_k{k}:\n    #d8 {data}\n"
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    return len(table)
+
+
+def generate_loop(name, size):
+    """LOOPS iterations of a call, a jump and a backward bnez, all with size byte offsets."""
+    gap = LOOP_GAPS[size]
+    pad = f"\n    ; never executed\n    #res {gap}\n" if gap else ""
+    # The gaps outgrow the vector bank, so the loop runs from the code bank
+    code = f"""; Branch encoding cost: call, jump and bnez with {size} byte offsets, {LOOPS} iterations
+    push {LOOPS}
+    push {LOOP:#06x}
+    sw
+    jump _loop
+
+#bank code
+
+_loop:
+    call _sub
+    jump _over
+{pad}
+_over:
+    push {LOOP:#06x}
+    lw
+    add -1
+    dup
+    push {LOOP:#06x}
+    sw
+    bnez _loop
+
+    push depth
+    push 1
+    xor
+    failnez
+
+{test_epilogue()}{pad}
+_sub:
+    ret rx
+"""
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def main():
+    tests = []
+    count = generate_branches("branches")
+    tests.append({"rom": "branches.bin", "expect": 1, "max_cycles": 40 * count + 10_000})
+    count = generate_constants("constants")
+    tests.append({"rom": "constants.bin", "expect": 1, "max_cycles": 20 * count + 10_000})
+    for size in LOOP_GAPS:
+        generate_loop(f"loop_b{size}", size)
+        tests.append({"rom": f"loop_b{size}.bin", "expect": 1, "max_cycles": 40 * LOOPS + 10_000,
+                      "offset_bytes": size})
+
+    manifest = {"suite": "encoding", "wordsize": WORDSIZE, "requires": [], "tests": tests}
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Encoding tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""
+Generate exception path benchmarks for the data stack overflow (0x31) and
+underflow (0x30) exceptions described in section 5.3 of the ISA manual.
+
+Each ROM installs spill/fill handlers through `evec`, drops to user mode and
+runs a workload far deeper than the hardware stack. The overflow handler
+flushes all but the top SPILL_KEEP items to a memory stack and the underflow
+handler refills up to FILL items, so both paths run many times. Workloads
+check their own results and exit with tos == 1 like the regular tests.
+
+Usage (from starjette/): python tests/generate_exception_tests.py
+Then `make exceptions` and `python tests/exception_report.py` for the per
+event entry/exit cost as seen by the reference model.
+"""
+
+import json
+import os
+
+from generate_tests import TESTS_DIR, WORDBYTES, WORDMASK, WORDSIZE, spell, test_epilogue, write_test
+
+SUITE_DIR = f"{TESTS_DIR}/exceptions"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+# Kernel scratch variables, kept clear of the code bank contents
+KVARS = 0x7F00
+KV_SP = KVARS + 0 * WORDBYTES           # top of the spilled memory stack
+KV_EPC = KVARS + 1 * WORDBYTES
+KV_ESTATUS = KVARS + 2 * WORDBYTES
+KV_RX = KVARS + 3 * WORDBYTES
+KV_RY = KVARS + 4 * WORDBYTES
+KV_DEPTH = KVARS + 5 * WORDBYTES        # user items set aside by the fill handler
+KV_SYSCALLS = KVARS + 6 * WORDBYTES
+KV_KEEP = KVARS + 0x20      # items kept live across a spill
+
+# Spilled items, bottom of the stack at the lowest address
+SPILL_BASE = 0x8000
+
+
+def handler_prologue():
+    """Save epc, estatus and the user's ry/rx using at most two stack slots."""
+    return f"""    push epc
+    push {KV_EPC:#06x}
+    sw
+    push estatus
+    push {KV_ESTATUS:#06x}
+    sw
+    push ry
+    push {KV_RY:#06x}
+    sw
+    push rx
+    push {KV_RX:#06x}
+    sw
+"""
+
+
+def handler_epilogue(retry):
+    """Restore state saved by handler_prologue and return to user mode."""
+    code = f"""    push {KV_RX:#06x}
+    lw
+    pop rx
+    push {KV_RY:#06x}
+    lw
+    pop ry
+    push {KV_ESTATUS:#06x}
+    lw
+    pop estatus
+    push {KV_EPC:#06x}
+    lw
+"""
+    if retry:
+        code += "    add -1          ; epc points past the faulting instruction\n"
+    code += """    pop epc
+    rets
+"""
+    return code
+
+
+def exception_kernel(spill_keep, fill):
+    """
+    Boot code, exception dispatch and the spill/fill handlers.
+    Jumps to _user_main in user mode with an empty stack.
+    """
+    code = f"""; Spill/fill kernel: keep {spill_keep} items on overflow, refill {fill} on underflow
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _sj_exception
+    {spell(f"push {SPILL_BASE:#06x}")}
+    push {KV_SP:#06x}
+    sw
+    push 0
+    push {KV_SYSCALLS:#06x}
+    sw
+
+    ; Enter user mode at _user_main with interrupts off
+    push 0
+    pop estatus
+    li epc, _user_main
+    rets
+
+_sj_exception:
+    push ecause
+    push 0x31
+    xor
+    beqz _sj_spill
+    push ecause
+    push 0x30
+    xor
+    beqz _sj_fill
+    push ecause
+    beqz _sj_syscall
+
+_sj_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
+
+_sj_syscall:
+    push {KV_SYSCALLS:#06x}
+    lw
+    add 1
+    push {KV_SYSCALLS:#06x}
+    sw
+    rets
+
+; Overflow: flush all but the top {spill_keep} items to the memory stack
+_sj_spill:
+"""
+    code += handler_prologue()
+    for i in range(spill_keep):
+        code += f"    push {KV_KEEP + WORDBYTES * i:#06x}\n    sw\n"
+    # count * WORDBYTES by doubling
+    double = "    dup\n    add\n"
+    code += f"""
+    ; ry = sp + {WORDBYTES} * count, the new top of the memory stack
+    push depth
+    add -1
+{double * (WORDBYTES // 2)}    push {KV_SP:#06x}
+    lw
+    add
+    dup
+    push {KV_SP:#06x}
+    sw
+    pop ry
+
+_sj_spill_loop:
+    push depth
+    add -1
+    beqz _sj_spill_done
+    add ry, -{WORDBYTES}
+    push ry
+    sw
+    jump _sj_spill_loop
+
+_sj_spill_done:
+"""
+    for i in reversed(range(spill_keep)):
+        code += f"    push {KV_KEEP + WORDBYTES * i:#06x}\n    lw\n"
+    code += handler_epilogue(retry=True)
+
+    code += f"""
+; Underflow: set aside the 0-2 live items, then reload up to {fill} items
+_sj_fill:
+"""
+    code += handler_prologue()
+    code += f"""    push depth
+    add -1
+    push {KV_DEPTH:#06x}
+    sw
+    push depth
+    add -1
+    beqz _sj_fill_saved
+    push {KV_KEEP:#06x}
+    sw
+    push depth
+    add -1
+    beqz _sj_fill_saved
+    push {KV_KEEP + WORDBYTES:#06x}
+    sw
+
+_sj_fill_saved:
+    ; rx = old sp, ry = old sp - min({WORDBYTES} * fill, sp - SPILL_BASE)
+    push {KV_SP:#06x}
+    lw
+    dup
+    pop rx
+    push {-SPILL_BASE}
+    add
+    dup
+    beqz _sj_fatal_underflow
+    dup
+    push {WORDBYTES * fill}
+    ltu
+    bnez _sj_fill_some
+    drop
+    push {WORDBYTES * fill}
+_sj_fill_some:
+    xor -1
+    add 1
+    push rx
+    add
+    dup
+    push {KV_SP:#06x}
+    sw
+    pop ry
+
+_sj_fill_loop:
+    lnw
+    push ry
+    push rx
+    xor
+    bnez _sj_fill_loop
+
+    ; Put the live items back on top
+    push {KV_DEPTH:#06x}
+    lw
+    beqz _sj_fill_done
+    push {KV_DEPTH:#06x}
+    lw
+    add -1
+    beqz _sj_fill_one
+    push {KV_KEEP + WORDBYTES:#06x}
+    lw
+_sj_fill_one:
+    push {KV_KEEP:#06x}
+    lw
+_sj_fill_done:
+"""
+    code += handler_epilogue(retry=True)
+    code += """
+_sj_fatal_underflow:
+    drop
+    jump _sj_fatal
+
+_user_main:
+"""
+    return code
+
+
+def generate_churn_test(name, count, spill_keep, fill):
+    """Push count distinct values then pop and check them all."""
+    code = exception_kernel(spill_keep, fill)
+    code += f"""    ; Push 0..{count - 1}, far deeper than the hardware stack
+    li rx, 0
+_churn_push:
+    push rx
+    add rx, 1
+    push rx
+    push {count}
+    xor
+    bnez _churn_push
+
+    ; Pop them back in reverse, each must match the counter
+_churn_pop:
+    add rx, -1
+    push rx
+    xor
+    failnez
+    push rx
+    bnez _churn_pop
+
+"""
+    code += test_epilogue()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def generate_recursion_test(name, n, spill_keep, fill):
+    """Non-tail recursive sum(n) keeping n and the return address on the stack."""
+    expected = (n * (n + 1) // 2) & WORDMASK
+    code = exception_kernel(spill_keep, fill)
+    code += f"""    ; sum({n}) recursing {n} calls deep, two stack items per frame
+    push {n}
+    call _sum
+    {spell(f"push {expected}")}
+    xor
+    failnez
+
+"""
+    code += test_epilogue()
+    code += """
+_sum:               ; ( n -- sum )
+    push rx         ; n ra
+    over            ; n ra n
+    beqz _sum_base
+    over            ; n ra n
+    add -1          ; n ra n-1
+    call _sum       ; n ra s
+    swap            ; n s ra
+    pop rx          ; n s
+    add             ; n+s
+    ret ra
+_sum_base:          ; 0 ra
+    pop rx
+    ret ra
+"""
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def generate_syscall_test(name, count):
+    """Round trip through the exception vector without touching the stack."""
+    code = exception_kernel(4, 16)
+    code += f"""    ; {count} syscalls, counted by the kernel
+    li rx, {count}
+_sys_loop:
+    syscall
+    add rx, -1
+    push rx
+    bnez _sys_loop
+
+    ; The kernel counter is readable from user mode (no MMU set up)
+    push {KV_SYSCALLS:#06x}
+    lw
+    push {count}
+    xor
+    failnez
+
+"""
+    code += test_epilogue()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def main():
+    tests = []
+
+    for keep, fill in [(4, 16), (8, 64), (8, 256)]:
+        name = f"churn_k{keep}_f{fill}"
+        generate_churn_test(name, 4000, keep, fill)
+        tests.append((name, 2_000_000))
+
+        name = f"recurse_k{keep}_f{fill}"
+        generate_recursion_test(name, 1500, keep, fill)
+        tests.append((name, 2_000_000))
+
+    generate_syscall_test("syscall_roundtrip", 500)
+    tests.append(("syscall_roundtrip", 100_000))
+
+    manifest = {
+        "suite": "exceptions",
+        "wordsize": WORDSIZE,
+        "requires": ["traps"],
+        "tests": [
+            {"rom": f"{name}.bin", "expect": 1, "max_cycles": max_cycles}
+            for name, max_cycles in tests
+        ],
+    }
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Exception tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
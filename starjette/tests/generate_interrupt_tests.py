@@ -0,0 +1,283 @@
+"""
+Generate timer interrupt benchmarks for the CLINT map in starjette_system.py.
+
+Each ROM runs the same xorshift compute kernel in kernel mode while the CLINT
+fires every PERIOD cycles. The handler timestamps every interrupt into a ring
+buffer, counts it, bins its latency (mtime at handler entry minus mtimecmp)
+into a 16 bucket histogram and schedules the next deadline. At the end the
+ROM checks the compute result, that every interrupt was counted and binned
+once, and that no deadline was missed by a whole period.
+
+Usage (from starjette/): python tests/generate_interrupt_tests.py
+Then `make interrupts` and `python tests/interrupt_report.py`.
+"""
+
+import json
+import os
+
+from generate_tests import TESTS_DIR, WORDBYTES, WORDMASK, WORDSIZE, spell, test_epilogue, write_test
+from starjette_system import CLINT_BASE
+
+SUITE_DIR = f"{TESTS_DIR}/interrupts"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+CLINT_MSIP = CLINT_BASE + 0x00
+CLINT_MTIMECMP = CLINT_BASE + 0x08
+CLINT_MTIME = CLINT_BASE + 0x10
+
+# Handler bookkeeping
+VARS = 0x7E00
+V_COUNT = VARS + 0 * WORDBYTES
+V_CMP0 = VARS + 1 * WORDBYTES
+V_END = VARS + 2 * WORDBYTES
+V_HIST = VARS + 0x10 * WORDBYTES        # 16 words
+V_TS = VARS + 0x20 * WORDBYTES          # 64 word ring of mtime at handler entry
+
+HIST_BUCKETS = 16
+HIST_SHIFT = 2              # 4 cycles per bucket
+TS_ENTRIES = 64
+
+WORK_ITERATIONS = 3000
+WORK_SEED = 0xACE1
+
+
+def xorshift(x, iterations):
+    """The compute kernel's 7/9/8 xorshift on words of WORDSIZE bits."""
+    for _ in range(iterations):
+        x ^= (x << 7) & WORDMASK
+        x ^= x >> 9
+        x ^= (x << 8) & WORDMASK
+    return x
+
+
+def clint(register):
+    """`push` of a CLINT register address, which is above 0x8000."""
+    return spell(f"push {register:#06x}")
+
+
+def irq_handler(period):
+    # Word index to byte offset by doubling
+    double = "    dup\n    add\n" * (WORDBYTES // 2)
+    return f"""
+_irq_handler:
+    push ecause
+    push 0x50
+    xor
+    bnez _irq_fatal
+
+    ; Ring buffer timestamp: ts[count % {TS_ENTRIES}] = mtime
+    {clint(CLINT_MTIME)}
+    lw
+    dup
+    push {V_COUNT:#06x}
+    lw
+    push {TS_ENTRIES - 1}
+    and
+{double}    push {V_TS:#06x}
+    add
+    sw
+
+    ; Latency histogram bucket = min((mtime - mtimecmp) >> {HIST_SHIFT}, {HIST_BUCKETS - 1})
+    {clint(CLINT_MTIMECMP)}
+    lw
+    sub
+    push {HIST_SHIFT}
+    srl
+    dup
+    push {HIST_BUCKETS}
+    ltu
+    bnez _irq_bucket
+    drop
+    push {HIST_BUCKETS - 1}
+_irq_bucket:
+{double}    push {V_HIST:#06x}
+    add
+    dup
+    lw
+    add 1
+    swap
+    sw
+
+    push {V_COUNT:#06x}
+    lw
+    add 1
+    push {V_COUNT:#06x}
+    sw
+
+    ; mtimecmp += {period}, carrying into the next word
+    {clint(CLINT_MTIMECMP)}
+    lw
+    add {period}
+    dup
+    {clint(CLINT_MTIMECMP)}
+    sw
+    push {period}
+    ltu
+    {clint(CLINT_MTIMECMP + WORDBYTES)}
+    lw
+    add
+    {clint(CLINT_MTIMECMP + WORDBYTES)}
+    sw
+    rets
+
+_irq_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
+"""
+
+
+def generate_timer_test(name, period):
+    """period 0 builds the baseline with the timer left off."""
+    expected = xorshift(WORK_SEED, WORK_ITERATIONS)
+
+    if period:
+        code = f"""; Timer interrupt every {period} cycles during a {WORK_ITERATIONS} iteration xorshift kernel
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _irq_handler
+
+    ; First deadline one period from now
+    {clint(CLINT_MTIME)}
+    lw
+    add {period}
+    dup
+    push {V_CMP0:#06x}
+    sw
+    {clint(CLINT_MTIMECMP)}
+    sw
+    push 1
+    {clint(CLINT_MSIP)}
+    sw
+
+    ; Kernel mode with interrupts enabled
+    push 3
+    pop status
+
+"""
+    else:
+        code = f"""; Baseline: {WORK_ITERATIONS} iteration xorshift kernel with no timer
+    jump _kmain
+
+#bank code
+
+_kmain:
+"""
+
+    code += f"""    ; Compute kernel: xorshift{WORDSIZE} from {WORK_SEED:#06x}
+    {spell(f"push {WORK_SEED:#06x}")}
+    li rx, {WORK_ITERATIONS}
+_work:
+    dup
+    push 7
+    sll
+    xor
+    dup
+    push 9
+    srl
+    xor
+    dup
+    push 8
+    sll
+    xor
+    add rx, -1
+    push rx
+    bnez _work
+
+    {spell(f"push {expected:#06x}")}
+    xor
+    failnez
+"""
+
+    if period:
+        code += f"""
+    ; Interrupts off before checking the bookkeeping
+    push 1
+    pop status
+    {clint(CLINT_MTIME)}
+    lw
+    push {V_END:#06x}
+    sw
+
+    ; At least one interrupt was taken
+    push {V_COUNT:#06x}
+    lw
+    faileqz
+
+    ; Every interrupt landed in exactly one histogram bucket
+    push 0
+"""
+        for i in range(HIST_BUCKETS):
+            code += f"    push {V_HIST + WORDBYTES * i:#06x}\n    lw\n    add\n"
+        code += f"""    push {V_COUNT:#06x}
+    lw
+    xor
+    failnez
+
+    ; Every interrupt moved the deadline exactly once
+    {clint(CLINT_MTIMECMP)}
+    lw
+    push {V_CMP0:#06x}
+    lw
+    sub
+    push {V_COUNT:#06x}
+    lw
+    push {period}
+    mul
+    drop
+    xor
+    failnez
+
+    ; No deadline missed by a whole period when the kernel finished
+    push {V_END:#06x}
+    lw
+    {clint(CLINT_MTIMECMP)}
+    lw
+    sub
+    push {period}
+    lt
+    faileqz
+
+"""
+    code += test_epilogue()
+    if period:
+        code += irq_handler(period)
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def main():
+    tests = []
+    for period in [0, 2000, 500, 200, 100]:
+        name = f"timer_p{period}" if period else "timer_baseline"
+        generate_timer_test(name, period)
+        tests.append({"rom": f"{name}.bin", "expect": 1, "max_cycles": 1_000_000, "period": period,
+                      **({} if period else {"requires": []})})
+
+    manifest = {
+        "suite": "interrupts",
+        "wordsize": WORDSIZE,
+        "requires": ["traps", "interrupts", "devices"],
+        "vars": {
+            "count": V_COUNT,
+            "hist": V_HIST,
+            "hist_buckets": HIST_BUCKETS,
+            "hist_shift": HIST_SHIFT,
+            "ts": V_TS,
+            "ts_entries": TS_ENTRIES,
+        },
+        "tests": tests,
+    }
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Interrupt tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
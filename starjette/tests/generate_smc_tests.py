@@ -0,0 +1,267 @@
+"""
+Generate self-modifying and unaligned entry code benchmarks.
+
+Code lives in writable memory and instructions are single bytes with no
+alignment, so a jump may land anywhere, including inside the push/shi run
+of a long immediate, and a store may rewrite the very next instruction.
+An emulator or simulator that predecodes or caches blocks of instructions
+must notice both. Each ROM loops LOOPS times, checks a checksum of what
+the code it ran computed, and exits with tos == 1 like the regular tests:
+
+    smc_imm          rewrites the immediate of a `push` with `sb` right
+                     before executing it
+    smc_op           rewrites a `push imm; op` pair with one `sw` (`sh` on
+                     32-bit builds) from a table of pairs that is itself
+                     read out of the code
+    overlap          calls into a push/shi chain at every byte offset, so
+                     the same bytes are decoded as several overlapping
+                     instruction streams (blocks)
+    overlap_smc      as overlap, also patching a byte shared by every one
+                     of those streams on each iteration
+
+Every ROM has a `_control` twin whose loop runs the same instructions
+without the hazard: the stores go to a scratch byte instead of the code,
+and overlap_control calls separate copies of each suffix of the chain
+instead of entering the shared one. Guest cycles of a pair agree to a few, so
+the difference between their host cycles/sec (run_emulator_tests.py,
+perf_history.py) is what invalidating and re-decoding costs. The manifest
+names each ROM's control.
+
+Usage (from starjette/): python tests/generate_smc_tests.py
+Then `make smc`.
+"""
+
+import json
+import os
+import random
+
+from generate_tests import TESTS_DIR, WORDMASK, WORDSIZE, spell, test_epilogue, write_test
+from starjette_model import OPCODES
+
+SUITE_DIR = f"{TESTS_DIR}/smc"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+LOOPS = 1000
+SEED = 0x5A1C
+
+# Variables, clear of the code bank contents
+LOOP = 0x7F00       # iterations left
+# Where the control ROMs store their patches: unused, a page away from the
+# code, and encoded in as many bytes as the code addresses it stands in for
+DUMMY = 0x04F0
+# Where the overlap ROMs put their chains, so every entry address takes a 2 byte push
+CHAINS = 0x0040
+
+# shi bytes after the push that starts the chain of the overlap ROMs
+CHAIN_SHIS = 7
+
+# (opcode, python) for the rewritten `push imm; op` pairs of smc_op
+PATCH_OPS = [
+    (OPCODES["add"], lambda a, b: a + b),
+    (OPCODES["sub"], lambda a, b: a - b),
+    (OPCODES["xor"], lambda a, b: a ^ b),
+    (OPCODES["or"], lambda a, b: a | b),
+]
+
+
+def push_byte(imm):
+    return 0x40 | (imm & 0x3F)
+
+
+def loop_head(init):
+    return f"""    push {LOOPS}
+    push {LOOP:#06x}
+    sw
+    push {init:#06x}
+
+_loop:
+"""
+
+
+def loop_tail(expected):
+    return f"""
+    push {LOOP:#06x}
+    lw
+    add -1
+    dup
+    push {LOOP:#06x}
+    sw
+    bnez _loop
+
+    {spell(f"push {expected:#06x}")}
+    xor
+    failnez
+
+""" + test_epilogue()
+
+
+def generate_smc_imm(name, control):
+    """A `push imm` whose immediate is the low bits of the loop counter, written just before it runs."""
+    target = f"{DUMMY:#06x}" if control else "_site"
+    total = 0
+    for i in range(LOOPS, 0, -1):
+        total += 1 if control else i & 0x1F
+    code = f"; Self-modifying push immediate{' (control: patches go to a scratch byte)' if control else ''}\n"
+    code += loop_head(0)
+    code += f"""    ; push (i & 0x1f), written over the byte at _site
+    push {LOOP:#06x}
+    lw
+    push 0x1f
+    and
+    add 0x40
+    push {target}
+    sb
+_site:
+    #d8 {push_byte(1):#04x}
+    add
+"""
+    code += loop_tail(total & WORDMASK)
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def generate_smc_op(name, control, rng):
+    """A `push imm; op` pair rewritten with one word store from a table of instruction pairs."""
+    # A pair is two bytes: a word on 16-bit builds, a half on 32-bit ones
+    load, store = ("lw", "sw") if WORDSIZE == 16 else ("lh", "sh")
+    table = [(rng.randrange(32), rng.randrange(len(PATCH_OPS))) for _ in range(16)]
+    site = table[0]
+    acc = 0x1234
+    for i in range(LOOPS, 0, -1):
+        imm, op = site if control else table[i & 15]
+        acc = PATCH_OPS[op][1](acc, imm) & WORDMASK
+    target = f"{DUMMY:#06x}" if control else "_site"
+    code = f"; Self-modifying instruction pair{' (control: patches go to a scratch word)' if control else ''}\n"
+    code += loop_head(0x1234)
+    code += f"""    ; copy pair (i & 15) of _table over _site
+    push {LOOP:#06x}
+    lw
+    push 15
+    and
+    dup
+    add
+    push _table
+    add
+    {load}
+    push {target}
+    {store}
+    jump _site
+
+    ; `push imm; op` pairs, read as data
+#align 16
+_table:
+"""
+    for imm, op in table:
+        code += f"    #d8 {push_byte(imm):#04x}, {PATCH_OPS[op][0]:#04x}\n"
+    code += f"""
+#align 16
+_site:
+    #d8 {push_byte(site[0]):#04x}, {PATCH_OPS[site[1]][0]:#04x}
+"""
+    code += loop_tail(acc)
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def run_chain(chain, entry, tos):
+    """What calling chain at byte offset entry does: (new tos, value pushed or None)."""
+    pushed = None
+    for byte in chain[entry:]:
+        if byte & 0x80:
+            if pushed is None:
+                tos = ((tos << 7) | (byte & 0x7F)) & WORDMASK
+            else:
+                pushed = ((pushed << 7) | (byte & 0x7F)) & WORDMASK
+        else:
+            pushed = (byte & 0x3F) - ((byte & 0x20) << 1) & WORDMASK
+    return tos, pushed
+
+
+def generate_overlap(name, variant, rng):
+    """Call a `push imm; shi ...` chain at every offset; offset 0 pushes, the others extend tos."""
+    chain = [push_byte(rng.randrange(64))] + [0x80 | rng.randrange(128) for _ in range(CHAIN_SHIS)]
+    patch = variant == "smc"
+    entries = list(range(len(chain) - 1, 0, -1))
+
+    acc = 0x0001
+    for i in range(LOOPS, 0, -1):
+        if patch:
+            chain[-1] = 0x80 | (i & 0x7F)
+        for k in entries:
+            acc ^= run_chain(chain, k, acc)[0]
+        acc = (acc + run_chain(chain, 0, acc)[1]) & WORDMASK
+
+    def entry(k):
+        if variant == "control":
+            return f"_s{k}"
+        return f"_chain + {k}" if k else "_chain"
+
+    title = {"": "Overlapping entry into a push/shi chain",
+             "smc": "Overlapping entry into a push/shi chain patched every iteration",
+             "control": "Separate copies of each push/shi chain suffix (control)"}[variant]
+    code = f"; {title}\n    jump _main\n\n#addr {CHAINS:#06x}\n    ; return with `push rx; pop pc`, the bytes after each chain\n"
+    blocks = [(f"_s{k}", chain[k:]) for k in range(len(chain))] if variant == "control" else [("_chain", chain)]
+    for label, data in blocks:
+        code += f"{label}:\n    #d8 {', '.join(f'{b:#04x}' for b in data)}\n    ret rx\n"
+    code += "\n_main:\n" + loop_head(0x0001)
+    code += f"""    ; last shi of the chain becomes shi (i & 0x7f)
+    push {LOOP:#06x}
+    lw
+    push 0x7f
+    and
+    add 0x80
+    push {f'_chain + {len(chain) - 1}' if patch else f'{DUMMY:#06x}'}
+    sb
+"""
+    for k in entries:
+        code += f"""    dup
+    push {entry(k)}
+    callp
+    xor
+"""
+    code += f"""    push {entry(0)}
+    callp
+    add
+"""
+    code += loop_tail(acc)
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+
+
+def main():
+    rng = random.Random(SEED)
+
+    # (name, instructions per iteration at most, control)
+    tests = [("smc_imm", 20, "smc_imm_control"), ("smc_imm_control", 20, None)]
+    generate_smc_imm("smc_imm", False)
+    generate_smc_imm("smc_imm_control", True)
+
+    op_seed = rng.getrandbits(32)
+    tests += [("smc_op", 30, "smc_op_control"), ("smc_op_control", 30, None)]
+    generate_smc_op("smc_op", False, random.Random(op_seed))
+    generate_smc_op("smc_op_control", True, random.Random(op_seed))
+
+    chain_seed = rng.getrandbits(32)
+    per_loop = 40 + CHAIN_SHIS * (CHAIN_SHIS + 8)
+    tests += [("overlap", per_loop, "overlap_control"), ("overlap_smc", per_loop, "overlap_control"),
+              ("overlap_control", per_loop, None)]
+    for name, variant in (("overlap", ""), ("overlap_smc", "smc"), ("overlap_control", "control")):
+        generate_overlap(name, variant, random.Random(chain_seed))
+
+    manifest = {
+        "suite": "smc",
+        "wordsize": WORDSIZE,
+        "requires": [],
+        "tests": [
+            {"rom": f"{name}.bin", "expect": 1, "max_cycles": 2 * LOOPS * per_loop + 10_000,
+             **({"control": f"{control}.bin"} if control else {})}
+            for name, per_loop, control in tests
+        ],
+    }
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("Self-modifying code tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,22 @@
 import os
 
+from starjette_model import KERNEL_HIGH_WATER, OPCODE_NAMES, OPCODES, REGS, Cpu
+
+# Word size the tests are generated for, 16 or 32. Set with STARJETTE_WORDSIZE
+# so every generator importing this module agrees; 32-bit trees go under
+# tests/w32/ and are built with customasm/test_shim32.asm.
+WORDSIZE = int(os.environ.get("STARJETTE_WORDSIZE", "16"))
+if WORDSIZE not in (16, 32):
+    raise ValueError(f"STARJETTE_WORDSIZE must be 16 or 32, not {WORDSIZE}")
+WORDBYTES = WORDSIZE // 8
+WORDMASK = (1 << WORDSIZE) - 1
+TESTS_DIR = "tests" if WORDSIZE == 16 else f"tests/w{WORDSIZE}"
+
+# fp as the test shim leaves it; at both sizes fp-4 is 0xfffc
+FRAME_POINTER = 0 if WORDSIZE == 16 else 0x10000
+
 # Ensure test directory exists once at module load
-os.makedirs("tests", exist_ok=True)
+os.makedirs(TESTS_DIR, exist_ok=True)
 
 
 def write_test(filename, content):
@@ -17,21 +32,308 @@ def test_epilogue():
 """
 
 
+def signed_word(value):
+    value &= WORDMASK
+    return value - ((value >> (WORDSIZE - 1)) << WORDSIZE)
+
+
+def push_chain(value):
+    """(push immediate, [shi immediates]) of the shortest push/shi chain for value."""
+    value = signed_word(value)
+    shis = next(k for k in range(5) if -(1 << (5 + 7 * k)) <= value < 1 << (5 + 7 * k))
+    return value >> 7 * shis, [(value >> 7 * k) & 0x7F for k in reversed(range(shis))]
+
+
+def push_word(value):
+    """
+    Asm that pushes value at WORDSIZE. cpudef.asm reads push immediates as
+    16-bit words (bit 15 set means negative) of at most three bytes, so on
+    32-bit builds the values it would misread are spelled out as push/shi.
+    """
+    if WORDSIZE == 16:
+        return f"push {value}"
+    value = signed_word(value)
+    folded = value if value & 0x8000 == 0 else -((~value & 0xFFFF) + 1)
+    if folded == value and -(1 << 18) <= value < 1 << 18:
+        return f"push {value}"
+    push, shis = push_chain(value)
+    return "\n    ".join([f"push {push}"] + [f"shi {imm:#04x}" for imm in shis])
+
+
+def spell(line):
+    """line, with the immediate of a `push N` spelled by push_word on 32-bit builds."""
+    mnemonic, _, arg = line.partition(" ")
+    if WORDSIZE == 16 or mnemonic != "push" or not arg.lstrip("-")[:1].isdigit():
+        return line
+    return push_word(int(arg, 0))
+
+
+def model_cpu():
+    """Reference model at WORDSIZE with fp where the test shim puts it."""
+    cpu = Cpu(wordsize=WORDSIZE)
+    cpu.fp = FRAME_POINTER
+    return cpu
+
+
+def encode_lines(lines):
+    """
+    Instruction bytes of straight line asm: instructions, `push`/`shi` of a
+    number, `push`/`pop` of a register, `add fp, N` and `llw`/`slw` without
+    an offset.
+    """
+    code = []
+    for line in lines:
+        mnemonic, _, arg = line.replace(",", "").partition(" ")
+        arg = {"ar": "ry", "ra": "rx"}.get(arg, arg)
+        if mnemonic == "push" and arg in REGS:
+            code += [0x40, OPCODES[f"rel {arg}"]]
+        elif mnemonic == "push":
+            push, shis = push_chain(int(arg, 0))
+            code += [0x40 | (push & 0x3F)] + [0x80 | imm for imm in shis]
+        elif mnemonic == "shi":
+            code.append(0x80 | int(arg, 0))
+        elif mnemonic == "add" and arg.startswith("fp "):
+            push, shis = push_chain(int(arg.split()[1], 0))
+            code += [0x40 | (push & 0x3F)] + [0x80 | imm for imm in shis] + [OPCODES["add fp"]]
+        elif mnemonic in ("llw", "slw"):
+            code += [OPCODES["rel fp"], OPCODES["lw" if mnemonic == "llw" else "sw"]]
+        else:
+            code.append(OPCODES[f"{mnemonic} {arg}".strip()])
+    return bytes(code)
+
+
+def model_stack(lines, cpu=None, below=()):
+    """
+    Run lines of straight line asm (as for encode_lines) on the reference
+    model at WORDSIZE and return the stack they leave, bottom first. Pass
+    cpu to keep memory and registers from earlier lines; its stack is
+    emptied first and filled with below.
+    """
+    code = encode_lines(lines)
+    cpu = cpu or model_cpu()
+    cpu.depth = 0
+    for item in below:
+        cpu.push(item)
+    start = 0x0500
+    cpu.mem[start:start + len(code)] = code
+    cpu.pc = start
+    while cpu.pc < start + len(code):
+        cpu.step()
+        if not start <= cpu.pc <= start + len(code):
+            raise ValueError(f"model trapped (ecause {cpu.ecause:#x}) running {lines}")
+    return cpu.stack_items()
+
+
+_spec_ops = None
+
+
+def spec_stack(lines, cpu, below=()):
+    """
+    Run lines (as for encode_lines) through the oracle compiled from the ISA
+    manual (spec_oracle.py), one instruction at a time from cpu's registers,
+    and return the stack they leave, bottom first, and the (fp, rx, ry) they
+    leave. Memory and CSR forms are not compiled and raise ValueError.
+    """
+    # numpy is only needed where the oracle is, not for the 16-bit tests
+    import numpy as np
+    import spec_oracle
+    global _spec_ops
+    if _spec_ops is None:
+        _spec_ops = spec_oracle.load()
+
+    code = encode_lines(lines)
+    start = 0x0500
+    registers = {name: getattr(cpu, name) for name in spec_oracle.REGISTERS}
+    registers["pc"] = start
+    stack = [value & WORDMASK for value in below]
+    while registers["pc"] < start + len(code):
+        byte = code[registers["pc"] - start]
+        op = "shi" if byte & 0x80 else "push" if byte & 0x40 else OPCODE_NAMES[byte]
+        if op not in _spec_ops.OPS:
+            raise ValueError(f"spec oracle does not compile {op}, running {lines}")
+        # The oracle sees the top WINDOW slots; instructions touch at most tos/nos/ros
+        top = stack[::-1]
+        state = {name: np.array([value], dtype=np.int64) for name, value in registers.items()}
+        state.update({slot: np.array([top[i] if i < len(top) else 0], dtype=np.int64)
+                      for i, slot in enumerate(spec_oracle.SLOTS)})
+        state.update(depth=np.array([len(stack)]), halted=np.zeros(1, dtype=np.int64),
+                     imm=np.array([byte & (0x7F if byte & 0x80 else 0x3F)]))
+        out = _spec_ops.OPS[op](state, WORDSIZE)
+        kept = len(stack) - min(len(stack), 3)
+        stack = stack[:kept] + [int(out[slot][0]) for slot in spec_oracle.SLOTS[:int(out["depth"][0]) - kept]][::-1]
+        registers = {name: int(out[name][0]) for name in spec_oracle.REGISTERS}
+        if not start <= registers["pc"] <= start + len(code) or out["halted"][0]:
+            raise ValueError(f"spec oracle trapped (ecause {registers['ecause']:#x}) running {lines}")
+    return stack, (registers["fp"], registers["rx"], registers["ry"])
+
+
+def expected_stack(lines, cpu=None, below=(), expected=None):
+    """
+    The stack lines leave on top of below, bottom first, for a test to check.
+    It comes from the ISA manual oracle (spec_stack), or from expected, the
+    hand-written stack the lines leave on their own, for the memory forms
+    the oracle does not compile. The reference model runs the lines too and
+    must agree, registers included, so a bug in the model fails generation
+    instead of ending up in the tests that check it. Pass cpu as for
+    model_stack.
+    """
+    cpu = cpu or model_cpu()
+    if expected is None:
+        spec, registers = spec_stack(lines, cpu, below)
+    else:
+        spec, registers = [value & WORDMASK for value in list(below) + list(expected)], None
+    model = model_stack(lines, cpu, below)
+    if spec != model or registers not in (None, (cpu.fp, cpu.rx, cpu.ry)):
+        raise ValueError(f"spec and reference model disagree on {lines}: stack {[hex(v) for v in spec[-4:]]} "
+                         f"vs {[hex(v) for v in model[-4:]]}, fp/rx/ry {registers} vs {(cpu.fp, cpu.rx, cpu.ry)}")
+    return spec
+
+
+def generate_model_test(name, title, cases):
+    """
+    Generates a test whose expected results come from expected_stack.
+    cases: list of (comment, asm lines[, expected stack]); every item a case
+    leaves on the stack is checked, top first, so values pushed before the
+    instruction under test also verify that it left the deeper stack alone.
+    Cases run in order on one model, as they do in the ROM.
+    """
+    cpu = model_cpu()
+    code = f"; Test {title}\n"
+    code += f"; Expected values from the ISA manual at {WORDSIZE} bits, checked against the reference model\n\n"
+    for i, (comment, lines, *expected) in enumerate(cases):
+        code += f"    ; Case {i}: {comment}\n"
+        code += "".join(f"    {spell(line)}\n" for line in lines)
+        for value in reversed(expected_stack(lines, cpu, expected=expected[0] if expected else None)):
+            code += f"    {push_word(value)}\n    xor\n    failnez\n"
+        code += "\n"
+    code += test_epilogue()
+    write_test(f"{TESTS_DIR}/{name}.asm", code)
+
+
+# Data stack depths a depth sweep runs every case at: empty, then past the
+# three items the cores keep in registers (TOS/NOS/ROS)
+SWEEP_DEPTHS = range(8)
+# Added to a slot's depth to give the sentinel a depth sweep fills it with
+SWEEP_SENTINEL = 0x5A00
+# Cycles the fill and check loops take per sentinel, and a case block takes
+# for their setup and the result and depth checks, measured on the model
+SWEEP_ITEM_CYCLES = 30
+SWEEP_BLOCK_CYCLES = 20
+
+
+def sweep_sentinels(depth):
+    """The stack below a swept case, bottom first."""
+    return [SWEEP_SENTINEL + slot for slot in range(depth, 0, -1)]
+
+
+def sweep_high_water(lines, results):
+    """
+    Deepest stack lines run on in kernel mode without an overflow trap,
+    leaving room for the checks of their results items and the sentinel
+    loops, which go two items above the stack they start on.
+    """
+    for depth in range(KERNEL_HIGH_WATER - max(2, results + 1), -1, -1):
+        try:
+            model_stack(lines, below=sweep_sentinels(depth))
+        except ValueError:
+            continue
+        return depth
+    raise ValueError(f"{lines} overflow the stack at any depth")
+
+
+def sweep_fill(n, depth):
+    """Asm filling the stack with sweep_sentinels(depth); leaves rx 0."""
+    return f"""    li rx, {depth}
+_sweep{n}_fill:
+    push rx
+    add {SWEEP_SENTINEL:#06x}
+    add rx, -1
+    push rx
+    bnez _sweep{n}_fill
+"""
+
+
+def sweep_check(n, depth):
+    """Asm popping and checking sweep_sentinels(depth), top first; leaves rx depth."""
+    return f"""    li rx, 0
+_sweep{n}_check:
+    add rx, 1
+    push rx
+    add {SWEEP_SENTINEL:#06x}
+    xor
+    failnez
+    push rx
+    push {depth}
+    xor
+    bnez _sweep{n}_check
+"""
+
+
+def generate_depth_sweep(filename, title, cases, depths=SWEEP_DEPTHS):
+    """
+    Generates a test running every case on each of depths stack items and
+    on the deepest stack it fits under the kernel overflow high-water mark.
+    cases: list of (comment, asm lines[, expected stack]) as for
+    generate_model_test. The slots below a case hold distinct sentinels,
+    checked after its results, and the stack must be empty again before the
+    next case. Returns the cycles it should take, for the cycle budget.
+    """
+    cpu = model_cpu()
+    code = f"; {title} at depths {', '.join(map(str, depths))} and near the high-water mark\n"
+    code += f"; Expected values from the ISA manual at {WORDSIZE} bits, checked against the reference model\n"
+    # The cases outgrow the vector bank, so they run from the code bank
+    code += "    jump _sweep\n\n#bank code\n\n_sweep:\n"
+    cycles = 0
+    n = 0
+    for i, (comment, lines, *expected) in enumerate(cases):
+        results = len(model_stack(lines))
+        for depth in list(depths) + [sweep_high_water(lines, results)]:
+            below = sweep_sentinels(depth)
+            if depth:
+                cpu.rx = 0
+            start = cpu.cycles
+            stack = expected_stack(lines, cpu, below, expected[0] if expected else None)
+            cycles += cpu.cycles - start + SWEEP_ITEM_CYCLES * depth + SWEEP_BLOCK_CYCLES
+            if stack[:depth] != below:
+                raise ValueError(f"case {i} ({comment}) changed the stack below it at depth {depth}")
+            code += f"    ; Case {i} at depth {depth}: {comment}\n"
+            if depth:
+                code += sweep_fill(n, depth)
+            code += "".join(f"    {spell(line)}\n" for line in lines)
+            for value in reversed(stack[depth:]):
+                code += f"    {push_word(value)}\n    xor\n    failnez\n"
+            if depth:
+                code += sweep_check(n, depth)
+                cpu.rx = depth
+            code += "    push depth\n    push 1\n    xor\n    failnez\n\n"
+            n += 1
+    code += test_epilogue()
+    write_test(filename, code)
+    return cycles
+
+
+# Values below the operands of the model tests' deep stack cases
+SENTINEL_VALUES = [0x11111111, 0x22222222, 0x33333333]
+SENTINELS = [f"push {value:#x}" for value in SENTINEL_VALUES]
+
+
 def generate_binary_op_test(opcode_name, cases):
     """
     Generates a test file for a binary operation (pops 2, pushes 1).
     cases: list of tuples (a, b, expected_result)
     """
-    filename = f"tests/{opcode_name}.asm"
+    filename = f"{TESTS_DIR}/{opcode_name}.asm"
 
     code = f"; Test {opcode_name} instruction\n"
 
     for i, (a, b, expected) in enumerate(cases):
+        if WORDSIZE != 16:
+            expected = signed_word(expected_stack([f"push {a}", f"push {b}", opcode_name])[-1])
         code += f"    ; Case {i}: {a} {opcode_name} {b} -> {expected}\n"
-        code += f"    push {a}\n"
-        code += f"    push {b}\n"
+        code += f"    {push_word(a)}\n"
+        code += f"    {push_word(b)}\n"
         code += f"    {opcode_name}\n"
-        code += f"    push {expected}\n"
+        code += f"    {push_word(expected)}\n"
         code += "    xor\n"
         code += "    failnez\n\n"
 
@@ -44,15 +346,17 @@ def generate_unary_op_test(opcode_name, cases):
     Generates a test for a unary operation (pops 1, pushes 1).
     cases: list of tuples (input_val, expected_result)
     """
-    filename = f"tests/{opcode_name}.asm"
+    filename = f"{TESTS_DIR}/{opcode_name}.asm"
 
     code = f"; Test {opcode_name} instruction\n"
 
     for i, (inp, expected) in enumerate(cases):
+        if WORDSIZE != 16:
+            expected = signed_word(expected_stack([f"push {inp}", opcode_name])[-1])
         code += f"    ; Case {i}: {opcode_name} {inp} -> {expected}\n"
-        code += f"    push {inp}\n"
+        code += f"    {push_word(inp)}\n"
         code += f"    {opcode_name}\n"
-        code += f"    push {expected}\n"
+        code += f"    {push_word(expected)}\n"
         code += "    xor\n"
         code += "    failnez\n\n"
 
@@ -63,7 +367,7 @@ def generate_unary_op_test(opcode_name, cases):
 
 def generate_control_flow_tests():
     # beqz - comprehensive test
-    write_test("tests/beqz.asm", """; Test beqz instruction
+    write_test(f"{TESTS_DIR}/beqz.asm", """; Test beqz instruction
     ; Tests: forward branch taken, forward branch not taken,
     ;        backward branch taken, backward branch not taken,
     ;        no branch shadow (instruction after branch not executed when taken)
@@ -156,7 +460,7 @@ _deep_beqz_skip:
 """ + test_epilogue())
 
     # bnez - comprehensive test
-    write_test("tests/bnez.asm", """; Test bnez instruction
+    write_test(f"{TESTS_DIR}/bnez.asm", """; Test bnez instruction
     ; Tests: forward branch taken, forward branch not taken,
     ;        backward branch taken, backward branch not taken,
     ;        no branch shadow (instruction after branch not executed when taken)
@@ -256,7 +560,7 @@ _deep_bnez_done:
 
 def generate_stack_manip_tests():
     # dup
-    write_test("tests/dup.asm", """; Test dup
+    write_test(f"{TESTS_DIR}/dup.asm", """; Test dup
     ; dup: push(tos) - duplicates top of stack
 
     ; Test 1: Basic dup
@@ -325,7 +629,7 @@ _fail:
 """)
 
     # drop
-    write_test("tests/drop.asm", """; Test drop
+    write_test(f"{TESTS_DIR}/drop.asm", """; Test drop
     ; drop: tos! - pops and discards top of stack
 
     ; Test 1: Basic drop
@@ -376,7 +680,7 @@ _fail:
 """)
 
     # over
-    write_test("tests/over.asm", """; Test over
+    write_test(f"{TESTS_DIR}/over.asm", """; Test over
     ; over: push(nos) - copies second item to top
 
     ; Test 1: Basic over
@@ -456,7 +760,7 @@ _fail:
 """)
 
     # swap
-    write_test("tests/swap.asm", """; Test swap
+    write_test(f"{TESTS_DIR}/swap.asm", """; Test swap
     ; swap: tos, nos = nos, tos - exchanges top two items
 
     ; Test 1: Basic swap
@@ -535,7 +839,19 @@ _fail:
 
 
 def generate_fsl_test():
-    write_test("tests/fsl.asm", """; Test fsl instruction
+    if WORDSIZE != 16:
+        cases = [(f"{{{ros:#x}, {nos:#x}}} << {shift}", [f"push {ros:#x}", f"push {nos:#x}", f"push {shift}", "fsl"])
+                 for ros, nos, shift in [
+                     (0xAAAAAAAA, 0x55555555, 0), (0xAAAAAAAA, 0x55555555, 32), (0, 0x12345678, 4),
+                     (0, 0xFF000000, 8), (0x80000000, 0, 1), (0, 0x80000000, 1), (1, 0, 31),
+                     (0, 1, 63), (0xAAAAAAAA, 0x55555555, 64), (0xFFFFFFFF, 0xFFFFFFFF, 4),
+                     (0x0000F0F0, 0x0F0F0000, 16), (0, 0xFFFF, 16), (0, 0x00010000, 36), (0, 0x80000000, 28),
+                 ]]
+        cases.append(("deep stack, {0xAAAAAAAA, 0x55555555} << 0",
+                      SENTINELS + ["push 0xAAAAAAAA", "push 0x55555555", "push 0", "fsl"]))
+        generate_model_test("fsl", "fsl instruction: upper word of {ros, nos} << (tos & 63)", cases)
+        return
+    write_test(f"{TESTS_DIR}/fsl.asm", """; Test fsl instruction
     ; fsl: push((({ros, nos} << (tos & 31)) >> 16) & 0xFFFF)
     ; Forms 32-bit value {ros, nos}, shifts left, returns upper 16 bits
     ;
@@ -716,7 +1032,18 @@ _fail:
 
 def generate_mul_test():
     """Generate test for mul instruction which produces TOS=high, NOS=low."""
-    write_test("tests/mul.asm", """; Test mul instruction
+    if WORDSIZE != 16:
+        cases = [(f"{a:#x} * {b:#x}", [f"push {a:#x}", f"push {b:#x}", "mul"])
+                 for a, b in [
+                     (10, 10), (0xFFFF, 0xFFFF), (0x10000, 0x10000), (1000000, 1000000), (12345678, 0),
+                     (12345678, 1), (0xFFFFFFFF, 0xFFFFFFFF), (0x80000000, 2), (0x12345678, 0x100),
+                     (0xFFFFFFFF, 2), (0xDEADBEEF, 0xCAFEBABE),
+                 ]]
+        cases.append(("deep stack, 0x12345678 * 0x9abcdef0",
+                      SENTINELS + ["push 0x12345678", "push 0x9abcdef0", "mul"]))
+        generate_model_test("mul", "mul instruction: TOS=high word, NOS=low word", cases)
+        return
+    write_test(f"{TESTS_DIR}/mul.asm", """; Test mul instruction
     ; mul now produces two results: TOS=high word, NOS=low word
     ; Stack before: [nos, tos] (nos * tos)
     ; Stack after:  [low, high] (high=TOS, low=NOS, same depth)
@@ -829,7 +1156,7 @@ _fail:
 
 
 def generate_rot_test():
-    write_test("tests/rot.asm", """; Test rot
+    write_test(f"{TESTS_DIR}/rot.asm", """; Test rot
     ; Stack top-to-bottom: A(tos), B(nos), C(ros)
     ; Manual: temp = tos; tos = nos; nos = ros; ros = temp
     ; Result top-to-bottom: B(tos), C(nos), A(ros)
@@ -920,8 +1247,12 @@ _fail:
 
 def generate_memory_tests():
     """Generate tests for lw, sw, lb, sb, lh, sh memory operations."""
+    if WORDSIZE != 16:
+        generate_wide_memory_tests()
+
     # lw/sw test
-    write_test("tests/lw_sw.asm", """; Test lw and sw instructions
+    if WORDSIZE == 16:
+        write_test(f"{TESTS_DIR}/lw_sw.asm", """; Test lw and sw instructions
     ; Store a value and load it back
     ;
     ; sw: mem[tos] = nos, pops both
@@ -1021,7 +1352,7 @@ _fail:
 """)
 
     # lb/sb test
-    write_test("tests/lb_sb.asm", """; Test lb and sb instructions
+    write_test(f"{TESTS_DIR}/lb_sb.asm", """; Test lb and sb instructions
     ; Store a byte and load it back
     ;
     ; sb: mem:byte[tos] = nos, pops both
@@ -1147,7 +1478,8 @@ _fail:
 """)
 
     # lh/sh test
-    write_test("tests/lh_sh.asm", """; Test lh and sh instructions
+    if WORDSIZE == 16:
+        write_test(f"{TESTS_DIR}/lh_sh.asm", """; Test lh and sh instructions
     ; For 16-bit machine, lh/sh behave same as lw/sw
     ;
     ; sh: mem:half[tos] = nos, pops both
@@ -1235,10 +1567,46 @@ _fail:
 """)
 
 
+def generate_wide_memory_tests():
+    """
+    lw/sw and lh/sh for 32-bit words, where a half is no longer a word;
+    lb/sb are unchanged. The spec oracle does not compile memory forms, so
+    the expected stacks are written out.
+    """
+    generate_model_test("lw_sw", "lw and sw instructions", [
+        ("store and load 0x12345678 at fp-4",
+         ["push 0x12345678", "push fp", "push -4", "add", "sw", "push fp", "push -4", "add", "lw"], [0x12345678]),
+        ("store 0xabcdef01 at fp-8, fp-4 keeps its value",
+         ["push 0xABCDEF01", "push fp", "push -8", "add", "sw",
+          "push fp", "push -8", "add", "lw", "push fp", "push -4", "add", "lw"], [0xABCDEF01, 0x12345678]),
+        ("deep stack, store 0xcafef00d at fp-12",
+         SENTINELS + ["push 0x44444444", "push 0xCAFEF00D", "push fp", "push -12", "add", "sw",
+                      "push fp", "push -12", "add", "lw"], SENTINEL_VALUES + [0x44444444, 0xCAFEF00D]),
+    ])
+
+    generate_model_test("lh_sh", "lh and sh instructions on 32-bit words", [
+        ("store and load half 0x5678",
+         ["push 0x5678", "push fp", "push -4", "add", "sh", "push fp", "push -4", "add", "lh"], [0x5678]),
+        ("negative half -1234 is sign extended",
+         ["push -1234", "push fp", "push -4", "add", "sh", "push fp", "push -4", "add", "lh"], [-1234]),
+        ("halves of word 0x8765abcd, low half first",
+         ["push 0x8765ABCD", "push fp", "push -8", "add", "sw",
+          "push fp", "push -8", "add", "lh", "push fp", "push -6", "add", "lh"], [0xFFFFABCD, 0xFFFF8765]),
+        ("sh replaces only the upper half of a word",
+         ["push 0x11112222", "push fp", "push -8", "add", "sw",
+          "push 0x7777", "push fp", "push -6", "add", "sh", "push fp", "push -8", "add", "lw"], [0x77772222]),
+        ("sh keeps the low 16 bits of the stored value",
+         ["push 0x12345678", "push fp", "push -4", "add", "sh", "push fp", "push -4", "add", "lw"], [0x5678]),
+        ("deep stack, store half 0x5678 at fp-10",
+         SENTINELS + ["push 0x44444444", "push 0x5678", "push fp", "push -10", "add", "sh",
+                      "push fp", "push -10", "add", "lh"], SENTINEL_VALUES + [0x44444444, 0x5678]),
+    ])
+
+
 def generate_register_tests():
     """Generate tests for push reg, pop reg, add reg operations."""
     # push/pop register tests
-    write_test("tests/push_pop_reg.asm", """; Test push and pop register operations
+    write_test(f"{TESTS_DIR}/push_pop_reg.asm", """; Test push and pop register operations
 
     ; Test push fp / pop fp
     push fp     ; save original fp
@@ -1281,7 +1649,7 @@ _fail:
 """)
 
     # add reg test
-    write_test("tests/add_reg.asm", """; Test add register operation
+    write_test(f"{TESTS_DIR}/add_reg.asm", """; Test add register operation
 
     ; Test add fp
     push fp     ; save original
@@ -1327,7 +1695,7 @@ _fail:
 
 def generate_call_tests():
     """Generate tests for call and ret (pop pc) operations."""
-    write_test("tests/call_ret.asm", """; Test call and ret instructions
+    write_test(f"{TESTS_DIR}/call_ret.asm", """; Test call and ret instructions
 
     ; Simple call and return
     call _test_func
@@ -1347,7 +1715,7 @@ _fail:
 """)
 
     # Test call/ret with deep stack preservation (mimics sieve pattern)
-    write_test("tests/call_deep.asm", """; Test call/ret with deep stack preservation
+    write_test(f"{TESTS_DIR}/call_deep.asm", """; Test call/ret with deep stack preservation
     ; Mimics a corruption pattern where a value pushed before
     ; a call gets corrupted by operations inside the function
 
@@ -1388,7 +1756,7 @@ _wskip:
 """)
 
     # Test callp (call function pointer)
-    write_test("tests/callp.asm", """; Test callp instruction (call function pointer)
+    write_test(f"{TESTS_DIR}/callp.asm", """; Test callp instruction (call function pointer)
 
     push _test_func2
     callp
@@ -1408,7 +1776,20 @@ _fail:
 
 def generate_next_word_tests():
     """Generate tests for lnw and snw (load/store next word via ar) operations."""
-    write_test("tests/lnw_snw.asm", """; Test lnw and snw instructions
+    if WORDSIZE != 16:
+        values = [0x11111111, 0x22222222, 0x33333333, 0x44444444]
+        frame = ["push fp", f"push -{len(values) * WORDBYTES}", "add", "pop ar"]
+        generate_model_test("lnw_snw", f"lnw and snw instructions: ar += {WORDBYTES}", [
+            ("snw four words from fp-16, ar ends at fp",
+             frame + sum([[f"push {v:#x}", "snw"] for v in values], []) + ["push ar", "push fp", "xor"], [0]),
+            ("lnw them back from fp-16, ar ends at fp",
+             frame + ["lnw"] * len(values) + ["push ar", "push fp", "xor"], values + [0]),
+            ("overwrite the first two and read them back",
+             frame + ["push 0xAAAAAAAA", "snw", "push 0xBBBBBBBB", "snw"] + frame + ["lnw", "lnw"],
+             [0xAAAAAAAA, 0xBBBBBBBB]),
+        ])
+        return
+    write_test(f"{TESTS_DIR}/lnw_snw.asm", """; Test lnw and snw instructions
     ; lnw: push(mem[ar]); ar += 2 (for 16-bit)
     ; snw: mem[ar] = tos!; ar += 2 (for 16-bit)
     ; These use the ar register for sequential memory access
@@ -1511,7 +1892,20 @@ _fail:
 
 def generate_shi_tests():
     """Generate tests for shi (shift immediate) instruction."""
-    write_test("tests/shi.asm", """; Test shi instruction
+    if WORDSIZE != 16:
+        generate_model_test("shi", "shi instruction: tos = (tos << 7) | imm", [
+            ("(1 << 7) | 0", ["push 1", "shi 0"]),
+            ("0 shi 0x55", ["push 0", "shi 0x55"]),
+            ("0x1234 from push 0, shi 0x24, shi 0x34", ["push 0", "shi 0x24", "shi 0x34"]),
+            ("0xabcd needs a third shi on 32 bits, push 2 stays positive", ["push 2", "shi 0x57", "shi 0x4D"]),
+            ("0x12345678 from push 1 and four shi", ["push 1", "shi 0x11", "shi 0x45", "shi 0x2C", "shi 0x78"]),
+            ("-2 shi 0 = -256", ["push -2", "shi 0"]),
+            ("-1 and four shi 0x7f stays -1", ["push -1"] + ["shi 0x7F"] * 4),
+            ("bits shifted past bit 31 are lost", ["push 31"] + ["shi 0"] * 5),
+            ("deep stack", SENTINELS + ["push 0x44444444", "push 3", "shi 0x7F"]),
+        ])
+        return
+    write_test(f"{TESTS_DIR}/shi.asm", """; Test shi instruction
     ; shi: tos = (tos << 7) | imm
     ; Shifts tos left by 7 bits and ORs in a 7-bit immediate (0-127)
 
@@ -1604,7 +1998,17 @@ _fail:
 
 def generate_local_tests():
     """Generate tests for llw and slw (local load/store) operations."""
-    write_test("tests/llw_slw.asm", """; Test llw and slw instructions
+    if WORDSIZE != 16:
+        generate_model_test("llw_slw", "llw and slw instructions: fp-relative words", [
+            ("allocate 16 bytes, store at offsets 0 and 4, load them back, free the frame",
+             ["add fp, -16", "push 0x11111111", "push 0", "slw", "push 0x22222222", "push 4", "slw",
+              "push 0", "llw", "push 4", "llw", "push 16", "add fp"], [0x11111111, 0x22222222]),
+            ("deep stack, store 0xbeefcafe at fp-20",
+             SENTINELS + ["push 0x44444444", "push 0xBEEFCAFE", "push -20", "slw", "push -20", "llw"],
+             SENTINEL_VALUES + [0x44444444, 0xBEEFCAFE]),
+        ])
+        return
+    write_test(f"{TESTS_DIR}/llw_slw.asm", """; Test llw and slw instructions
     ; These use fp-relative addressing
 
     ; Allocate some space by adjusting fp
@@ -1679,93 +2083,133 @@ def generate_local_tests():
 """+test_epilogue())
 
 
+# Cases of the generated ALU tests, (a, b, expected) for binary ops and
+# (input, expected) for unary ones
+BINARY_OP_CASES = {
+    "add": [
+        (10, 20, 30),
+        (0, 0, 0),
+        (-10, 5, -5),
+        (32767, 1, -32768),  # Overflow 16-bit signed interpretation
+        (-1, 1, 0),
+    ],
+    "sub": [(20, 10, 10), (10, 20, -10), (0, 0, 0), (-5, -5, 0), (0, 1, -1)],
+    # unsigned less than
+    "ltu": [
+        (10, 20, 1),
+        (20, 10, 0),
+        (10, 10, 0),
+        (-1, 10, 0),  # -1 is MAX_UINT, so MAX > 10 -> FALSE (0)
+        (0, -1, 1),   # 0 < MAX_UINT -> TRUE (1)
+    ],
+    # signed less than
+    "lt": [
+        (10, 20, 1),
+        (20, 10, 0),
+        (10, 10, 0),
+        (-10, 5, 1),
+        (5, -10, 0),
+        (-20, -10, 1),
+    ],
+    "and": [
+        (0b1100, 0b1010, 0b1000),
+        (0, 0xFFFF, 0),
+        (0xFFFF, 0xFFFF, -1),       # 0xFFFF is -1 signed
+        (0xFF00, 0x0FF0, 0x0F00),
+        (0x5555, 0xAAAA, 0),
+        (0x1234, 0xFFFF, 0x1234),
+        (0x8000, 0x8000, 0x8000),
+    ],
+    "or": [
+        (0b1100, 0b1010, 0b1110),
+        (0, 0, 0),
+        (0, 1234, 1234),
+        (0x5555, 0xAAAA, 0xFFFF),
+        (0xFF00, 0x00FF, 0xFFFF),
+        (0x1234, 0, 0x1234),
+        (0x8000, 0x0001, 0x8001),
+    ],
+    "xor": [
+        (0b1100, 0b1010, 0b0110),
+        (12345, 12345, 0),
+        (0, -1, -1),
+        (0xFFFF, 0xFFFF, 0),
+        (0x5555, 0xAAAA, 0xFFFF),
+        (0xFF00, 0x00FF, 0xFFFF),
+        (0x1234, 0xFFFF, 0xEDCB),
+    ],
+    # logical right shift (zero fill)
+    "srl": [
+        (0b1111, 1, 0b0111),
+        (0xFFFF, 4, 0x0FFF),
+        (0x8000, 1, 0x4000),
+        (0x1234, 0, 0x1234),
+        (0xFFFF, 15, 1),
+        (0x1234, 16, 0x1234),  # Shift by 16 = shift by 0 (masked)
+        (0x1234, 20, 0x0123),  # Shift by 20 = shift by 4 (masked)
+    ],
+    # arithmetic right shift (sign extend)
+    "sra": [
+        (0b1111, 1, 0b0111),
+        (-4, 1, -2),
+        (-1, 4, -1),
+        (0x4000, 1, 0x2000),
+        (-32768, 1, -16384),
+        (100, 0, 100),
+        (0x1234, 16, 0x1234),  # Shift by 16 = shift by 0 (masked)
+        (0x1234, 20, 0x0123),  # Shift by 20 = shift by 4 (masked)
+    ],
+    # logical left shift
+    "sll": [
+        (0b0001, 1, 0b0010),
+        (0b0001, 4, 0b00010000),
+        (0x0001, 15, 0x8000),
+        (0xFFFF, 1, 0xFFFE),
+        (0x1234, 0, 0x1234),
+        (0x1234, 16, 0x1234),  # Shift by 16 = shift by 0 (masked)
+        (0x1234, 20, 0x2340),  # Shift by 20 = shift by 4 (masked)
+    ],
+}
+
+UNARY_OP_CASES = {
+    # count leading zeros
+    "clz": [
+        (0x0000, 16),     # All zeros = 16 leading zeros
+        (0x0001, 15),     # Only LSB set
+        (0x0002, 14),     # Bit 1 set
+        (0x0004, 13),     # Bit 2 set
+        (0x0008, 12),     # Bit 3 set
+        (0x0010, 11),     # Bit 4 set
+        (0x0020, 10),     # Bit 5 set
+        (0x0040, 9),      # Bit 6 set
+        (0x0080, 8),      # Bit 7 set
+        (0x0100, 7),      # Bit 8 set
+        (0x0200, 6),      # Bit 9 set
+        (0x0400, 5),      # Bit 10 set
+        (0x0800, 4),      # Bit 11 set
+        (0x1000, 3),      # Bit 12 set
+        (0x2000, 2),      # Bit 13 set
+        (0x4000, 1),      # Bit 14 set
+        (0x8000, 0),      # MSB set = 0 leading zeros
+        (0xFFFF, 0),      # All ones = 0 leading zeros
+        (0x00FF, 8),      # Lower byte all ones
+        (0xFF00, 0),      # Upper byte all ones
+        (0x0F00, 4),      # Upper nibble of lower byte
+        (0x00F0, 8),      # Lower nibble of upper byte of lower byte
+        (0x5555, 1),      # Alternating bits starting with 0
+        (0xAAAA, 0),      # Alternating bits starting with 1
+        (0x0003, 14),     # Two LSBs set
+        (0x7FFF, 1),      # All but MSB set
+    ],
+}
+
+
 def main():
     # --- ALU ops ---
-
-    # add
-    generate_binary_op_test(
-        "add",
-        [
-            (10, 20, 30),
-            (0, 0, 0),
-            (-10, 5, -5),
-            (32767, 1, -32768),  # Overflow 16-bit signed interpretation
-            (-1, 1, 0),
-        ],
-    )
-
-    # sub
-    generate_binary_op_test(
-        "sub",
-        [(20, 10, 10), (10, 20, -10), (0, 0, 0), (-5, -5, 0), (0, 1, -1)],
-    )
-
-    # ltu (unsigned less than)
-    generate_binary_op_test(
-        "ltu",
-        [
-            (10, 20, 1),
-            (20, 10, 0),
-            (10, 10, 0),
-            (-1, 10, 0),  # -1 is MAX_UINT, so MAX > 10 -> FALSE (0)
-            (0, -1, 1),   # 0 < MAX_UINT -> TRUE (1)
-        ],
-    )
-
-    # lt (signed less than)
-    generate_binary_op_test(
-        "lt",
-        [
-            (10, 20, 1),
-            (20, 10, 0),
-            (10, 10, 0),
-            (-10, 5, 1),
-            (5, -10, 0),
-            (-20, -10, 1),
-        ],
-    )
-
-    # and
-    generate_binary_op_test(
-        "and",
-        [
-            (0b1100, 0b1010, 0b1000),
-            (0, 0xFFFF, 0),
-            (0xFFFF, 0xFFFF, -1),       # 0xFFFF is -1 signed
-            (0xFF00, 0x0FF0, 0x0F00),
-            (0x5555, 0xAAAA, 0),
-            (0x1234, 0xFFFF, 0x1234),
-            (0x8000, 0x8000, 0x8000),
-        ],
-    )
-
-    # or
-    generate_binary_op_test(
-        "or",
-        [
-            (0b1100, 0b1010, 0b1110),
-            (0, 0, 0),
-            (0, 1234, 1234),
-            (0x5555, 0xAAAA, 0xFFFF),
-            (0xFF00, 0x00FF, 0xFFFF),
-            (0x1234, 0, 0x1234),
-            (0x8000, 0x0001, 0x8001),
-        ],
-    )
-
-    # xor
-    generate_binary_op_test(
-        "xor",
-        [
-            (0b1100, 0b1010, 0b0110),
-            (12345, 12345, 0),
-            (0, -1, -1),
-            (0xFFFF, 0xFFFF, 0),
-            (0x5555, 0xAAAA, 0xFFFF),
-            (0xFF00, 0x00FF, 0xFFFF),
-            (0x1234, 0xFFFF, 0xEDCB),
-        ],
-    )
+    for name, cases in BINARY_OP_CASES.items():
+        generate_binary_op_test(name, cases)
+    for name, cases in UNARY_OP_CASES.items():
+        generate_unary_op_test(name, cases)
 
     # fsl (funnel shift left)
     generate_fsl_test()
@@ -1781,50 +2225,6 @@ def main():
     # rot
     generate_rot_test()
 
-    # Shifts
-    # srl - logical right shift (zero fill)
-    generate_binary_op_test(
-        "srl",
-        [
-            (0b1111, 1, 0b0111),
-            (0xFFFF, 4, 0x0FFF),
-            (0x8000, 1, 0x4000),
-            (0x1234, 0, 0x1234),
-            (0xFFFF, 15, 1),
-            (0x1234, 16, 0x1234),  # Shift by 16 = shift by 0 (masked)
-            (0x1234, 20, 0x0123),  # Shift by 20 = shift by 4 (masked)
-        ],
-    )
-
-    # sra - arithmetic right shift (sign extend)
-    generate_binary_op_test(
-        "sra",
-        [
-            (0b1111, 1, 0b0111),
-            (-4, 1, -2),
-            (-1, 4, -1),
-            (0x4000, 1, 0x2000),
-            (-32768, 1, -16384),
-            (100, 0, 100),
-            (0x1234, 16, 0x1234),  # Shift by 16 = shift by 0 (masked)
-            (0x1234, 20, 0x0123),  # Shift by 20 = shift by 4 (masked)
-        ],
-    )
-
-    # sll - logical left shift
-    generate_binary_op_test(
-        "sll",
-        [
-            (0b0001, 1, 0b0010),
-            (0b0001, 4, 0b00010000),
-            (0x0001, 15, 0x8000),
-            (0xFFFF, 1, 0xFFFE),
-            (0x1234, 0, 0x1234),
-            (0x1234, 16, 0x1234),  # Shift by 16 = shift by 0 (masked)
-            (0x1234, 20, 0x2340),  # Shift by 20 = shift by 4 (masked)
-        ],
-    )
-
     # Control Flow
     generate_control_flow_tests()
 
@@ -1846,39 +2246,6 @@ def main():
     # Shift immediate
     generate_shi_tests()
 
-    # clz (count leading zeros)
-    generate_unary_op_test(
-        "clz",
-        [
-            (0x0000, 16),     # All zeros = 16 leading zeros
-            (0x0001, 15),     # Only LSB set
-            (0x0002, 14),     # Bit 1 set
-            (0x0004, 13),     # Bit 2 set
-            (0x0008, 12),     # Bit 3 set
-            (0x0010, 11),     # Bit 4 set
-            (0x0020, 10),     # Bit 5 set
-            (0x0040, 9),      # Bit 6 set
-            (0x0080, 8),      # Bit 7 set
-            (0x0100, 7),      # Bit 8 set
-            (0x0200, 6),      # Bit 9 set
-            (0x0400, 5),      # Bit 10 set
-            (0x0800, 4),      # Bit 11 set
-            (0x1000, 3),      # Bit 12 set
-            (0x2000, 2),      # Bit 13 set
-            (0x4000, 1),      # Bit 14 set
-            (0x8000, 0),      # MSB set = 0 leading zeros
-            (0xFFFF, 0),      # All ones = 0 leading zeros
-            (0x00FF, 8),      # Lower byte all ones
-            (0xFF00, 0),      # Upper byte all ones
-            (0x0F00, 4),      # Upper nibble of lower byte
-            (0x00F0, 8),      # Lower nibble of upper byte of lower byte
-            (0x5555, 1),      # Alternating bits starting with 0
-            (0xAAAA, 0),      # Alternating bits starting with 1
-            (0x0003, 14),     # Two LSBs set
-            (0x7FFF, 1),      # All but MSB set
-        ],
-    )
-
     print("Tests generated successfully.")
 
 
@@ -0,0 +1,252 @@
+"""
+Generate UART output throughput benchmarks with golden output files.
+
+Each ROM streams a known byte pattern to the UART transmit register from
+starjette_system.py as fast as it can: fixed blocks of lines (with and without
+polling LSR first), decimal and hex number formatting done in guest code, and
+one very long line. The expected output is written next to each ROM as
+<name>.golden and the byte counts go into manifest.json.
+
+Usage (from starjette/): python tests/generate_uart_tests.py
+Then `make uart` and `python tests/uart_report.py`.
+"""
+
+import json
+import os
+
+from generate_tests import TESTS_DIR, WORDSIZE, spell, test_epilogue, write_test
+from starjette_system import UART_BASE
+
+SUITE_DIR = f"{TESTS_DIR}/uart"
+
+os.makedirs(SUITE_DIR, exist_ok=True)
+
+UART_THR = UART_BASE + 0x00
+UART_LSR = UART_BASE + 0x05
+LSR_THRE = 0x20
+
+
+def rom_prologue(title):
+    return f"""; {title}
+    jump _main
+
+#bank code
+
+_main:
+"""
+
+
+def uart(register):
+    """`push` of a UART register address, which is above 0x8000."""
+    return spell(f"push {register:#06x}")
+
+
+def putc(byte, comment=None):
+    """Write a constant byte to the UART."""
+    note = f"  ; {comment}" if comment else ""
+    return f"    push {byte}{note}\n    {uart(UART_THR)}\n    sb\n"
+
+
+def put_tos(poll):
+    """Write (and drop) the byte on top of the stack, optionally polling LSR first."""
+    code = ""
+    if poll:
+        code += f"""_poll_{put_tos.count}:
+    {uart(UART_LSR)}
+    lb
+    push {LSR_THRE:#04x}
+    and
+    beqz _poll_{put_tos.count}
+"""
+        put_tos.count += 1
+    code += f"    {uart(UART_THR)}\n    sb\n"
+    return code
+
+
+put_tos.count = 0
+
+
+def write_golden(name, data):
+    with open(f"{SUITE_DIR}/{name}.golden", "wb") as f:
+        f.write(data)
+
+
+def generate_block_test(name, lines, width, poll):
+    """lines x width characters, each line rotated by one, newline terminated."""
+    golden = bytearray()
+    for line in range(lines):
+        golden += bytes(0x30 + ((line + col) & 0x3F) for col in range(width))
+        golden += b"\n"
+
+    code = rom_prologue(f"{lines} lines of {width} characters{', polling LSR' if poll else ''}")
+    code += f"""    li rx, 0
+_blk_line:
+    li ry, 0
+_blk_col:
+    push rx
+    rel ry
+    push 0x3f
+    and
+    add 0x30
+"""
+    code += put_tos(poll)
+    code += f"""    add ry, 1
+    push ry
+    push {width}
+    xor
+    bnez _blk_col
+
+    push 10
+"""
+    code += put_tos(poll)
+    code += f"""    add rx, 1
+    push rx
+    push {lines}
+    xor
+    bnez _blk_line
+
+"""
+    code += test_epilogue()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    write_golden(name, bytes(golden))
+    return len(golden)
+
+
+def generate_numbers_test(name, count, step):
+    """printf("n=%05u 0x%04x\\n") with the formatting done in guest code."""
+    golden = bytearray()
+    value = 0
+    for _ in range(count):
+        golden += f"n={value:05d} 0x{value:04x}\n".encode()
+        value = (value + step) & 0xFFFF
+
+    code = rom_prologue(f"{count} lines of n=%05u 0x%04x, stepping by {step}")
+    code += f"""    push 0
+    li ry, {count}
+_num_line:
+"""
+    code += putc(ord("n"), "n") + putc(ord("="), "=")
+    code += "    dup\n    call _putdec\n"
+    code += putc(ord(" "), "space") + putc(ord("0"), "0") + putc(ord("x"), "x")
+    code += "    dup\n    call _puthex\n"
+    code += putc(10, "newline")
+    code += f"    add {step}\n"
+    if WORDSIZE != 16:
+        # The counter wraps at 16 bits on every build, so the output is the same
+        code += f"    {spell('push 0xffff')}\n    and\n"
+    code += f"""    add ry, -1
+    push ry
+    bnez _num_line
+    drop
+
+"""
+    code += test_epilogue()
+
+    # Division free %05u: count how many times each power of ten fits
+    code += "\n_putdec:             ; ( n -- )\n"
+    for power in [10000, 1000, 100, 10]:
+        code += f"""    push 0              ; n digit
+_dec_{power}:
+    over
+    push {power}
+    ltu
+    bnez _dec_{power}_done
+    swap
+    add {-power}
+    swap
+    add 1
+    jump _dec_{power}
+_dec_{power}_done:
+    add 0x30
+    {uart(UART_THR)}
+    sb
+"""
+    code += f"""    add 0x30
+    {uart(UART_THR)}
+    sb
+    ret ra
+
+_puthex:             ; ( n -- )
+"""
+    for shift in [12, 8, 4, 0]:
+        code += f"""    dup
+    push {shift}
+    srl
+    push 0x0f
+    and
+    dup
+    push 10
+    ltu
+    bnez _hex_{shift}
+    add 39              ; 'a' - '0' - 10
+_hex_{shift}:
+    add 0x30
+    {uart(UART_THR)}
+    sb
+"""
+    code += "    drop\n    ret ra\n"
+
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    write_golden(name, bytes(golden))
+    return len(golden)
+
+
+def generate_long_line_test(name, length):
+    """One line of length characters cycling through A-Z."""
+    golden = bytes(ord("A") + i % 26 for i in range(length)) + b"\n"
+
+    code = rom_prologue(f"A single {length} character line")
+    code += f"""    push 0x41           ; 'A'
+    li rx, {length}
+_long:
+    dup
+    {uart(UART_THR)}
+    sb
+    add 1
+    dup
+    push 0x5b           ; 'Z' + 1
+    xor
+    bnez _long_next
+    drop
+    push 0x41
+_long_next:
+    add rx, -1
+    push rx
+    bnez _long
+    drop
+
+"""
+    code += putc(10, "newline")
+    code += test_epilogue()
+    write_test(f"{SUITE_DIR}/{name}.asm", code)
+    write_golden(name, golden)
+    return len(golden)
+
+
+def main():
+    tests = [
+        ("block_64x63", generate_block_test("block_64x63", 64, 63, poll=False)),
+        ("block_64x63_polled", generate_block_test("block_64x63_polled", 64, 63, poll=True)),
+        ("numbers_500", generate_numbers_test("numbers_500", 500, 1237)),
+        ("long_line_8000", generate_long_line_test("long_line_8000", 8000)),
+    ]
+
+    manifest = {
+        "suite": "uart",
+        "wordsize": WORDSIZE,
+        "requires": ["devices"],
+        "tests": [
+            {"rom": f"{name}.bin", "expect": 1, "max_cycles": 2_000_000,
+             "golden": f"{name}.golden", "bytes": size}
+            for name, size in tests
+        ],
+    }
+    with open(f"{SUITE_DIR}/manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    print("UART tests generated successfully.")
+
+
+if __name__ == "__main__":
+    main()
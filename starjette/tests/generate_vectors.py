@@ -0,0 +1,245 @@
+"""
+Generate single-step state transition vectors for every cpudef.asm opcode.
+
+Each opcode gets a directory under tests/vectors/ holding one .npy file per
+state field, so a harness can np.load(..., mmap_mode="r") the columns and
+check millions of isolated instructions without assembling anything.
+
+Row i of every column in a directory describes one vector: the initial state,
+the instruction byte at init_pc, and the state after a single step() of the
+reference model. Memory is sparse: mem_addr lists the physical addresses the
+instruction touched (including its own fetch), init_mem/final_mem their byte
+values, and every other address is assumed to be unchanged. The stack columns
+hold the top STACK_WINDOW items with tos at index 0; items below that are
+zero.
+
+Usage (from starjette/): python tests/generate_vectors.py [--count N]
+"""
+
+import argparse
+import json
+import os
+import random
+import zlib
+
+import numpy as np
+
+from starjette_model import (
+    CSRS,
+    Cpu,
+    KERNEL_HIGH_WATER,
+    MIN_DEPTH,
+    OPCODES,
+    STACK_SIZE,
+    STATUS_IE,
+    STATUS_KM,
+    STATUS_TH,
+    USER_HIGH_WATER,
+    Trap,
+    decode,
+)
+
+OUT_DIR = "tests/vectors"
+STACK_WINDOW = 8
+MEM_SLOTS = 8
+
+REG_FIELDS = ["pc", "kfp", "ufp", "rx", "ry", "status", "estatus", "epc", "ecause", "evec", "depth"]
+
+
+class RecordingCpu(Cpu):
+    """
+    Cpu with sparse memory: unseen bytes are randomized on first access and
+    every physical address touched is remembered in order.
+    """
+
+    def __init__(self, rng, **kwargs):
+        super().__init__(memory_size=0, **kwargs)
+        self.rng = rng
+        self.sparse = {}
+        self.initial = {}
+
+    def _byte(self, phys):
+        if phys not in self.sparse:
+            value = self.rng.randrange(256)
+            self.sparse[phys] = value
+            self.initial[phys] = value
+        return self.sparse[phys]
+
+    def _fetch(self, phys):
+        return self._byte(phys)
+
+    def _load(self, phys, nbytes):
+        return sum(self._byte(phys + i) << (8 * i) for i in range(nbytes))
+
+    def _store(self, phys, nbytes, value):
+        for i in range(nbytes):
+            self._byte(phys + i)
+            self.sparse[phys + i] = (value >> (8 * i)) & 0xFF
+
+
+def interesting_word(rng, cpu):
+    """Random word biased towards the edge cases that break ALUs."""
+    roll = rng.random()
+    if roll < 0.15:
+        return rng.choice([0, 1, 2, cpu.mask, cpu.sign, cpu.sign - 1, cpu.sign + 1])
+    if roll < 0.3:
+        return rng.randrange(-64, 64) & cpu.mask
+    if roll < 0.4:
+        return rng.randrange(0, cpu.wordsize * 2 + 2)
+    return rng.randrange(cpu.mask + 1)
+
+
+def interesting_addr(rng, cpu, align):
+    """Random address, usually aligned to the access size."""
+    addr = interesting_word(rng, cpu)
+    if rng.random() < 0.9:
+        addr &= ~(align - 1)
+    return addr
+
+
+def random_depth(rng, op):
+    roll = rng.random()
+    if roll < 0.05:
+        return rng.randrange(0, max(MIN_DEPTH[op], 1))
+    if roll < 0.15:
+        return rng.choice([USER_HIGH_WATER, KERNEL_HIGH_WATER]) + rng.randrange(-2, 3)
+    if roll < 0.6:
+        return rng.randrange(MIN_DEPTH[op], STACK_WINDOW + 1)
+    return rng.randrange(MIN_DEPTH[op], 65)
+
+
+def random_state(rng, cpu, byte):
+    op = decode(byte)
+    cpu.pc = interesting_word(rng, cpu)
+    cpu.kfp = interesting_addr(rng, cpu, cpu.wordbytes)
+    cpu.ufp = interesting_addr(rng, cpu, cpu.wordbytes)
+    cpu.rx = interesting_word(rng, cpu)
+    cpu.ry = interesting_addr(rng, cpu, cpu.wordbytes)
+    cpu.status = rng.choice([0, STATUS_KM, STATUS_KM, STATUS_KM | STATUS_IE, STATUS_IE])
+    if rng.random() < 0.1:
+        cpu.status |= STATUS_TH
+    cpu.estatus = rng.randrange(8)
+    cpu.epc = interesting_word(rng, cpu)
+    cpu.ecause = rng.randrange(0x60)
+    cpu.evec = interesting_word(rng, cpu)
+    if rng.random() < 0.2:
+        cpu.mmu = [rng.randrange(16) for _ in range(8)]
+    else:
+        cpu.mmu = [0] * 8
+
+    cpu.depth = random_depth(rng, op)
+    for i in range(STACK_SIZE):
+        cpu.stack[i] = 0
+    for n in range(min(cpu.depth, STACK_WINDOW)):
+        cpu.stack[(cpu.depth - 1 - n) % STACK_SIZE] = interesting_word(rng, cpu)
+
+    # Per opcode tweaks so the interesting paths are taken often enough
+    if cpu.depth >= 1 and op in (OPCODES["pushcsr"], OPCODES["popcsr"]):
+        csr = rng.choice(list(CSRS.values()) + [7, 16, rng.randrange(cpu.mask + 1)])
+        cpu.stack[(cpu.depth - 1) % STACK_SIZE] = csr
+    if cpu.depth >= 2 and op in (OPCODES["beqz"], OPCODES["bnez"]) and rng.random() < 0.5:
+        cpu.stack[(cpu.depth - 2) % STACK_SIZE] = 0
+    if cpu.depth >= 1 and op in (OPCODES["lw"], OPCODES["sw"]):
+        cpu.stack[(cpu.depth - 1) % STACK_SIZE] = interesting_addr(rng, cpu, cpu.wordbytes)
+    if cpu.depth >= 1 and op in (OPCODES["lh"], OPCODES["sh"]):
+        cpu.stack[(cpu.depth - 1) % STACK_SIZE] = interesting_addr(rng, cpu, 2)
+
+    cpu.halted = False
+    cpu.sparse = {}
+    cpu.initial = {}
+
+
+def snapshot(cpu):
+    state = {field: getattr(cpu, field) for field in REG_FIELDS}
+    state["mmu"] = list(cpu.mmu)
+    state["stack"] = [cpu.peek(n) if n < cpu.depth else 0 for n in range(STACK_WINDOW)]
+    state["halted"] = int(cpu.halted)
+    return state
+
+
+def opcode_bytes():
+    """Every instruction group: (name, list of bytes to sample from)."""
+    groups = [(name.replace(" ", "_"), [code]) for name, code in OPCODES.items()]
+    groups.append(("push", list(range(0x40, 0x80))))
+    groups.append(("shi", list(range(0x80, 0x100))))
+    return groups
+
+
+def generate_group(name, choices, count, wordsize, seed):
+    rng = random.Random(seed ^ zlib.crc32(name.encode()))
+    cpu = RecordingCpu(rng, wordsize=wordsize)
+    word = np.uint16 if wordsize == 16 else np.uint32
+
+    columns = {"opcode": np.zeros(count, np.uint8)}
+    for prefix in ("init_", "final_"):
+        for field in REG_FIELDS:
+            columns[prefix + field] = np.zeros(count, word)
+        columns[prefix + "mmu"] = np.zeros((count, 8), word)
+        columns[prefix + "stack"] = np.zeros((count, STACK_WINDOW), word)
+        columns[prefix + "halted"] = np.zeros(count, np.uint8)
+        columns[prefix + "mem"] = np.zeros((count, MEM_SLOTS), np.uint8)
+    columns["mem_addr"] = np.zeros((count, MEM_SLOTS), np.uint32)
+    columns["mem_count"] = np.zeros(count, np.uint8)
+
+    for i in range(count):
+        byte = rng.choice(choices)
+        random_state(rng, cpu, byte)
+        # The instruction lives wherever pc points after translation
+        try:
+            fetch_addr = cpu.translate(cpu.pc, program=True)
+            cpu.sparse[fetch_addr] = byte
+            cpu.initial[fetch_addr] = byte
+        except Trap:
+            pass
+
+        before = snapshot(cpu)
+        cpu.step()
+        after = snapshot(cpu)
+
+        columns["opcode"][i] = byte
+        for field, value in before.items():
+            columns["init_" + field][i] = value
+        for field, value in after.items():
+            columns["final_" + field][i] = value
+        addrs = list(cpu.initial)[:MEM_SLOTS]
+        columns["mem_count"][i] = len(addrs)
+        for slot, addr in enumerate(addrs):
+            columns["mem_addr"][i, slot] = addr
+            columns["init_mem"][i, slot] = cpu.initial[addr]
+            columns["final_mem"][i, slot] = cpu.sparse[addr]
+
+    out = os.path.join(OUT_DIR, f"w{wordsize}", name)
+    os.makedirs(out, exist_ok=True)
+    for field, array in columns.items():
+        np.save(os.path.join(out, field + ".npy"), array)
+    return sorted(columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000, help="vectors per opcode")
+    parser.add_argument("--seed", type=int, default=0x57A7, help="base random seed")
+    parser.add_argument("--wordsize", type=int, choices=[16, 32], default=16)
+    args = parser.parse_args()
+
+    index = {
+        "wordsize": args.wordsize,
+        "seed": args.seed,
+        "count": args.count,
+        "stack_window": STACK_WINDOW,
+        "mem_slots": MEM_SLOTS,
+        "opcodes": {},
+    }
+    for name, choices in opcode_bytes():
+        fields = generate_group(name, choices, args.count, args.wordsize, args.seed)
+        index["opcodes"][name] = choices[0] if len(choices) == 1 else [choices[0], choices[-1]]
+    index["fields"] = fields
+
+    with open(os.path.join(OUT_DIR, f"w{args.wordsize}", "index.json"), "w") as f:
+        json.dump(index, f, indent=2)
+
+    print(f"Vectors generated successfully ({len(index['opcodes'])} opcodes x {args.count}).")
+
+
+if __name__ == "__main__":
+    main()
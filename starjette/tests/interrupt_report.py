@@ -0,0 +1,89 @@
+"""
+Run the timer interrupt suite on the reference model and report interrupt
+counts, the guest latency histogram, the spacing of the last timestamps and
+how much the interrupts slowed the compute kernel down, in guest cycles and
+in host time.
+
+Usage (from starjette/): python tests/interrupt_report.py [manifest.json]
+The ROMs must be built first with `make interrupts`.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from starjette_system import System
+
+
+def read_words(cpu, addr, count):
+    size = cpu.wordbytes
+    return [int.from_bytes(cpu.mem[addr + i * size:addr + (i + 1) * size], "little") for i in range(count)]
+
+
+def timestamp_deltas(cpu, layout, count):
+    """Spacing between the most recent handler entries, oldest first."""
+    entries = layout["ts_entries"]
+    ring = read_words(cpu, layout["ts"], entries)
+    recent = [ring[i % entries] for i in range(max(0, count - entries), count)]
+    return [(b - a) & cpu.mask for a, b in zip(recent, recent[1:])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("manifest", nargs="?", default="tests/interrupts/manifest.json")
+    args = parser.parse_args()
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    base = os.path.dirname(args.manifest)
+    layout = manifest["vars"]
+
+    failures = 0
+    baseline_cycles = None
+    for test in manifest["tests"]:
+        rom = os.path.join(base, test["rom"])
+        if not os.path.exists(rom):
+            print(f"{rom}: missing, run `make interrupts` first")
+            failures += 1
+            continue
+
+        cpu = System(wordsize=manifest.get("wordsize", 16))
+        cpu.load_rom(rom)
+        start = time.perf_counter()
+        cpu.run(test["max_cycles"])
+        elapsed = time.perf_counter() - start
+
+        passed = cpu.halted and cpu.depth == 1 and cpu.peek() == test["expect"]
+        failures += not passed
+        if test["period"] == 0:
+            baseline_cycles = cpu.cycles
+
+        count = read_words(cpu, layout["count"], 1)[0]
+        line = (f"{test['rom']}: {'ok' if passed else 'FAIL'}, {cpu.cycles} cycles, "
+                f"{cpu.cycles / elapsed:,.0f} instr/s host")
+        if baseline_cycles and test["period"]:
+            line += f", {cpu.cycles / baseline_cycles:.2f}x baseline cycles"
+        print(line)
+        if not test["period"]:
+            continue
+
+        print(f"    {count} interrupts, period {test['period']}, "
+              f"{1000 * count / cpu.cycles:.2f} per 1000 cycles")
+        hist = read_words(cpu, layout["hist"], layout["hist_buckets"])
+        width = 1 << layout["hist_shift"]
+        for i, n in enumerate(hist):
+            if n:
+                upper = f"{(i + 1) * width - 1}" if i < len(hist) - 1 else "+"
+                print(f"    latency {i * width:4d}-{upper:<4} {n:6d}")
+        deltas = timestamp_deltas(cpu, layout, count)
+        if deltas:
+            print(f"    last {len(deltas)} intervals: min {min(deltas)} "
+                  f"avg {sum(deltas) / len(deltas):.1f} max {max(deltas)} cycles")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
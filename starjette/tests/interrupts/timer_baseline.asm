@@ -0,0 +1,32 @@
+; Baseline: 3000 iteration xorshift kernel with no timer
+    jump _kmain
+
+#bank code
+
+_kmain:
+    ; Compute kernel: xorshift16 from 0xace1
+    push 0xace1
+    li rx, 3000
+_work:
+    dup
+    push 7
+    sll
+    xor
+    dup
+    push 9
+    srl
+    xor
+    dup
+    push 8
+    sll
+    xor
+    add rx, -1
+    push rx
+    bnez _work
+
+    push 0x81c2
+    xor
+    failnez
+    ; All passed
+    push 1
+    halt
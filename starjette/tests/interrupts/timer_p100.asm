@@ -0,0 +1,215 @@
+; Timer interrupt every 100 cycles during a 3000 iteration xorshift kernel
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _irq_handler
+
+    ; First deadline one period from now
+    push 0xff50
+    lw
+    add 100
+    dup
+    push 0x7e02
+    sw
+    push 0xff48
+    sw
+    push 1
+    push 0xff40
+    sw
+
+    ; Kernel mode with interrupts enabled
+    push 3
+    pop status
+
+    ; Compute kernel: xorshift16 from 0xace1
+    push 0xace1
+    li rx, 3000
+_work:
+    dup
+    push 7
+    sll
+    xor
+    dup
+    push 9
+    srl
+    xor
+    dup
+    push 8
+    sll
+    xor
+    add rx, -1
+    push rx
+    bnez _work
+
+    push 0x81c2
+    xor
+    failnez
+
+    ; Interrupts off before checking the bookkeeping
+    push 1
+    pop status
+    push 0xff50
+    lw
+    push 0x7e04
+    sw
+
+    ; At least one interrupt was taken
+    push 0x7e00
+    lw
+    faileqz
+
+    ; Every interrupt landed in exactly one histogram bucket
+    push 0
+    push 0x7e20
+    lw
+    add
+    push 0x7e22
+    lw
+    add
+    push 0x7e24
+    lw
+    add
+    push 0x7e26
+    lw
+    add
+    push 0x7e28
+    lw
+    add
+    push 0x7e2a
+    lw
+    add
+    push 0x7e2c
+    lw
+    add
+    push 0x7e2e
+    lw
+    add
+    push 0x7e30
+    lw
+    add
+    push 0x7e32
+    lw
+    add
+    push 0x7e34
+    lw
+    add
+    push 0x7e36
+    lw
+    add
+    push 0x7e38
+    lw
+    add
+    push 0x7e3a
+    lw
+    add
+    push 0x7e3c
+    lw
+    add
+    push 0x7e3e
+    lw
+    add
+    push 0x7e00
+    lw
+    xor
+    failnez
+
+    ; Every interrupt moved the deadline exactly once
+    push 0xff48
+    lw
+    push 0x7e02
+    lw
+    sub
+    push 0x7e00
+    lw
+    push 100
+    mul
+    drop
+    xor
+    failnez
+
+    ; No deadline missed by a whole period when the kernel finished
+    push 0x7e04
+    lw
+    push 0xff48
+    lw
+    sub
+    push 100
+    lt
+    faileqz
+
+    ; All passed
+    push 1
+    halt
+
+_irq_handler:
+    push ecause
+    push 0x50
+    xor
+    bnez _irq_fatal
+
+    ; Ring buffer timestamp: ts[count % 64] = mtime
+    push 0xff50
+    lw
+    dup
+    push 0x7e00
+    lw
+    push 63
+    and
+    dup
+    add
+    push 0x7e40
+    add
+    sw
+
+    ; Latency histogram bucket = min((mtime - mtimecmp) >> 2, 15)
+    push 0xff48
+    lw
+    sub
+    push 2
+    srl
+    dup
+    push 16
+    ltu
+    bnez _irq_bucket
+    drop
+    push 15
+_irq_bucket:
+    dup
+    add
+    push 0x7e20
+    add
+    dup
+    lw
+    add 1
+    swap
+    sw
+
+    push 0x7e00
+    lw
+    add 1
+    push 0x7e00
+    sw
+
+    ; mtimecmp += 100, carrying into the next word
+    push 0xff48
+    lw
+    add 100
+    dup
+    push 0xff48
+    sw
+    push 100
+    ltu
+    push 0xff4a
+    lw
+    add
+    push 0xff4a
+    sw
+    rets
+
+_irq_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
@@ -0,0 +1,102 @@
+"""
+Run every built test and benchmark ROM through the memory hierarchies in
+starjette_memory.py and report CPI per ROM, then fetch buffer and frame cache
+hit rates, SDRAM row hit rates, average access latency and total cycles per
+hierarchy. --detail prints those figures for every ROM.
+
+Arguments may be .bin files or suite manifest.json files, as for
+pipeline_report.py.
+
+Usage (from starjette/): python tests/memory_report.py [--hierarchy NAME ...] [--detail] [ROM or manifest ...]
+Build the ROMs first with `make tests` and the suite targets.
+"""
+
+import argparse
+import os
+import sys
+
+from pipeline_report import collect_roms
+from starjette_memory import HIERARCHIES, make_hierarchies, traced_run
+from starjette_system import System
+
+
+def rate(hits, total):
+    return f"{hits / total:6.1%}" if total else "     -"
+
+
+def stats(h):
+    """[fetch hit, cache hit, row hit, average latency, cycles] for one hierarchy."""
+    fetch = h.fetch.hits + h.fetch.misses
+    cache = h.cache.hits + h.cache.misses if h.cache else 0
+    return [
+        rate(h.fetch.hits, fetch),
+        rate(h.cache.hits, cache) if h.cache else "     -",
+        rate(h.sdram.row_hits, h.sdram.accesses),
+        f"{h.average_latency:7.3f}",
+        f"{h.cycles:>10}",
+    ]
+
+
+def print_stats(hierarchies, indent=""):
+    print(f"{indent}{'':<26} {'fetch':>6} {'cache':>6} {'row':>6} {'latency':>7} {'cycles':>10}")
+    for h in hierarchies:
+        print(f"{indent}{h.name:<26} " + " ".join(stats(h)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    parser.add_argument("--hierarchy", action="append", choices=sorted(HIERARCHIES),
+                        help="hierarchy preset to model (repeatable, default all)")
+    parser.add_argument("--detail", action="store_true", help="print hit rates and latency per ROM")
+    args = parser.parse_args()
+
+    names = args.hierarchy or list(HIERARCHIES)
+    totals = make_hierarchies(names)
+    for h in totals:
+        print(f"{h.name:<26} {h.describe()}")
+    print()
+
+    roms = collect_roms(args.paths)
+    width = max([len(label) for label, *_ in roms] + [8])
+    print(f"CPI\n{'rom':<{width}} {'instrs':>9} " + " ".join(f"{name:>{len(name)}}" for name in names))
+    skipped = 0
+    for label, path, max_cycles, wordsize in roms:
+        if not os.path.exists(path):
+            skipped += 1
+            continue
+        cpu = System(wordsize=wordsize)
+        cpu.load_rom(path)
+        hierarchies = make_hierarchies(names)
+        count = traced_run(cpu, hierarchies, max_cycles)
+        note = "" if cpu.halted else "  (did not halt)"
+        print(f"{label:<{width}} {count:>9} " + " ".join(f"{h.cpi:>{len(h.name)}.3f}" for h in hierarchies) + note)
+        if args.detail:
+            print_stats(hierarchies, "    ")
+
+        for h, total in zip(hierarchies, totals):
+            total.instructions += h.instructions
+            total.cycles += h.cycles
+            total.fetch_stall += h.fetch_stall
+            total.data_accesses += h.data_accesses
+            total.data_stall += h.data_stall
+            total.io_accesses += h.io_accesses
+            total.fetch.hits += h.fetch.hits
+            total.fetch.misses += h.fetch.misses
+            if h.cache:
+                total.cache.hits += h.cache.hits
+                total.cache.misses += h.cache.misses
+            total.sdram.row_hits += h.sdram.row_hits
+            total.sdram.row_misses += h.sdram.row_misses
+            total.sdram.row_conflicts += h.sdram.row_conflicts
+
+    print(f"{'total':<{width}} {totals[0].instructions:>9} " + " ".join(f"{h.cpi:>{len(h.name)}.3f}" for h in totals))
+    if skipped:
+        print(f"({skipped} ROMs not built, skipped)")
+    print("\nhit rates, cycles per access and total cycles over all ROMs:")
+    print_stats(totals)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+Predict microcoded core cycles for every built test and benchmark ROM from
+a dump of its microcode ROM.
+
+`zig-out/bin/starjay --dump-microcode FILE` writes the table that
+generateMicrocodeRom() builds in src/emulator/starjette/microcoded/cpu.zig,
+one little-endian u64 per MicroOp; the field layout is read from the packed
+struct in that file. The core runs one entry per fetched byte (entries 0x40
+and 0x41 hold push and shi) and runs the syscall entry instead when it takes
+an underflow, overflow, interrupt or halt trap. Every entry is a single
+micro-op taking one cycle, which is the cost the report uses by default;
+--mem, --mul and --redirect add cycles to the micro-ops that access memory,
+use the multiplier or change pc, to price a multi-cycle build of the same
+microcode.
+
+Each ROM runs on the reference system, and every instruction is mapped to
+the entry and case (branch taken or not, trap) the core would run. The
+report gives the cost of each entry, the predicted cycles per ROM, and the
+opcodes taking the largest share of them over all ROMs, flagging those
+above --flag.
+
+Arguments may be .bin files or suite manifest.json files, as for
+pipeline_report.py.
+
+Usage (from starjette/): python tests/microcode_report.py [--microcode FILE] [--mem N] [--mul N] [--redirect N] [ROM or manifest ...]
+`make microcode` dumps the microcode and runs this report.
+"""
+
+import argparse
+import collections
+import os
+import re
+import sys
+
+from pipeline_report import collect_roms
+from starjette_model import ECAUSE_HALT, ECAUSE_INTERRUPT, ECAUSE_OVERFLOW, ECAUSE_UNDERFLOW, OPCODES, OPCODE_NAMES
+from starjette_system import System
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORE = os.path.join(HERE, "..", "..", "src", "emulator", "starjette")
+CPU_ZIG = os.path.join(CORE, "microcoded", "cpu.zig")
+TYPES_ZIG = os.path.join(CORE, "types.zig")
+MICROCODE = os.path.join(HERE, "microcode.ucode")
+
+PUSH_ENTRY = 0x40
+SHI_ENTRY = 0x41
+TRAP_ENTRY = OPCODES["syscall"]
+ENTRY_NAMES = [OPCODE_NAMES.get(i, f"reserved {i:#04x}") for i in range(0x40)] + ["push", "shi"]
+
+# Causes the core takes by running the syscall entry in place of the fetched one
+SUBSTITUTED = {ECAUSE_UNDERFLOW, ECAUSE_OVERFLOW, ECAUSE_HALT}
+
+
+def read_enums(*paths):
+    """{name: (bits, [value names by number])} for the `enum(uN)` types declared in the Zig sources."""
+    enums = {}
+    for path in paths:
+        with open(path) as f:
+            text = re.sub(r"//.*", "", f.read())
+        for match in re.finditer(r"pub const (\w+) = enum\(u(\d+)\) \{", text):
+            body = text[match.end():]
+            body = body[:min(i for i in (body.find("};"), body.find("pub fn")) if i >= 0)]
+            values = {}
+            number = 0
+            for item in filter(None, (item.strip() for item in body.split(","))):
+                name, _, value = (part.strip() for part in item.partition("="))
+                number = int(value, 0) if value else number
+                values[number] = name
+                number += 1
+            enums[match.group(1)] = (int(match.group(2)), [values.get(i) for i in range(max(values) + 1)])
+    return enums
+
+
+def read_layout(path=CPU_ZIG):
+    """[(field, shift, bits, value names or None)] of MicroOp, the first field in the lowest bits."""
+    enums = read_enums(path, TYPES_ZIG)
+    with open(path) as f:
+        text = re.sub(r"//.*", "", f.read())
+    match = re.search(r"pub const MicroOp = packed struct\(u(\d+)\) \{(.*?)\n\};", text, re.S)
+    if not match:
+        raise ValueError(f"no MicroOp packed struct in {path}")
+    layout = []
+    shift = 0
+    for field, kind in re.findall(r"^\s*(\w+): (\w+)", match.group(2), re.M):
+        if kind == "bool":
+            bits, names = 1, None
+        elif re.fullmatch(r"u\d+", kind):
+            bits, names = int(kind[1:]), None
+        else:
+            bits, names = enums[kind]
+        layout.append((field, shift, bits, names))
+        shift += bits
+    if shift != int(match.group(1)):
+        raise ValueError(f"MicroOp fields take {shift} bits, the struct is u{match.group(1)}")
+    return layout
+
+
+def load_microcode(path, layout):
+    """Decode a dumped microcode ROM into a list of {field: value} entries."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) != 8 * len(ENTRY_NAMES):
+        raise ValueError(f"{path}: {len(data)} bytes, expected {len(ENTRY_NAMES)} entries of 8")
+    rom = []
+    for i in range(0, len(data), 8):
+        word = int.from_bytes(data[i:i + 8], "little")
+        uop = {}
+        for field, shift, bits, names in layout:
+            value = (word >> shift) & ((1 << bits) - 1)
+            uop[field] = names[value] if names else bool(value) if bits == 1 else value
+        rom.append(uop)
+    return rom
+
+
+def conditional(uop):
+    return uop["pc_src"] == "rel" and uop["branch_cond"] != "always"
+
+
+def redirects(uop, taken):
+    """Whether the micro-op writes pc with anything but the next address."""
+    if conditional(uop):
+        return taken
+    return uop["pc_src"] not in ("next", "hold")
+
+
+def cycles(uop, taken, costs):
+    """Cycles of one run of a micro-op under the --mem/--mul/--redirect costs."""
+    total = 1
+    if uop["mem_op"] != "none":
+        total += costs.mem
+    if uop["mul_enable"]:
+        total += costs.mul
+    if redirects(uop, taken):
+        total += costs.redirect
+    return total
+
+
+def uses(uop):
+    """Short summary of the datapath an entry drives."""
+    parts = []
+    if uop["result_src"] == "alu":
+        parts.append(f"alu {uop['alu_op'].removesuffix('_op')}")
+    elif uop["result_src"] == "shl7_or":
+        parts.append("shift in imm7")
+    elif uop["result_src"] == "shifter":
+        parts.append(f"shift {uop['shift_mode']}")
+    if uop["mul_enable"]:
+        parts.append("mul")
+    if uop["mem_op"] != "none":
+        parts.append(f"mem {uop['mem_op']} {uop['mem_width']}")
+    if uop["dest"] == "csr" or uop["result_src"] == "csr":
+        parts.append("csr")
+    if uop["stack_mode"] != "hold":
+        parts.append(uop["stack_mode"])
+    if uop["pc_src"] not in ("next", "hold"):
+        parts.append(f"pc {uop['pc_src']}" + (" if taken" if conditional(uop) else ""))
+    if uop["enter_trap"]:
+        parts.append("enter trap")
+    if uop["exit_trap"]:
+        parts.append("exit trap")
+    if uop["halt"]:
+        parts.append("halt")
+    return ", ".join(parts)
+
+
+def entry_of(byte):
+    if byte & 0x80:
+        return SHI_ENTRY
+    if byte & 0xC0 == 0x40:
+        return PUSH_ENTRY
+    return byte & 0x3F
+
+
+def trace(cpu, rom, max_cycles):
+    """Counter of (entry, taken) the core runs until cpu halts or runs max_cycles instructions."""
+    counts = collections.Counter()
+    log = cpu.trap_log = []
+    step = cpu.step
+    branches = {i for i, uop in enumerate(rom) if conditional(uop)}
+    while not cpu.halted and cpu.cycles < max_cycles:
+        pc = cpu.pc
+        logged = len(log)
+        byte = step()
+        if len(log) > logged and log[-1][0] == "enter" and \
+                (log[-1][2] in SUBSTITUTED or log[-1][2] & 0xF0 == ECAUSE_INTERRUPT):
+            counts[TRAP_ENTRY, True] += 1
+            continue
+        entry = entry_of(byte)
+        counts[entry, entry in branches and cpu.pc != (pc + 1) & cpu.mask] += 1
+        if len(log) > 1000:
+            del log[:]
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    parser.add_argument("--microcode", default=MICROCODE, help="microcode ROM dumped by starjay --dump-microcode")
+    parser.add_argument("--mem", type=int, default=0, help="extra cycles for a micro-op accessing memory")
+    parser.add_argument("--mul", type=int, default=0, help="extra cycles for a micro-op using the multiplier")
+    parser.add_argument("--redirect", type=int, default=0, help="extra cycles for a micro-op changing pc")
+    parser.add_argument("--flag", type=float, default=5.0, help="flag opcodes above this percentage of all cycles")
+    parser.add_argument("--top", type=int, default=15, help="opcodes to list")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.microcode):
+        print(f"{args.microcode} not found; dump it with `zig-out/bin/starjay --dump-microcode FILE`")
+        return 1
+    rom = load_microcode(args.microcode, read_layout())
+
+    print(f"microcode {os.path.relpath(args.microcode)}: {len(rom)} entries, one micro-op each; "
+          f"extra cycles mem {args.mem}, mul {args.mul}, redirect {args.redirect}")
+    print(f"{'entry':<6} {'name':<12} {'cycles':>6}  uses")
+    illegal = rom[0x30]
+    for i, uop in enumerate(rom):
+        if 0x30 <= i < 0x40 and uop == illegal:
+            continue
+        cost = str(cycles(uop, False, args))
+        if conditional(uop):
+            cost = f"{cost}/{cycles(uop, True, args)}"
+        print(f"{i:#04x}   {ENTRY_NAMES[i]:<12} {cost:>6}  {uses(uop)}")
+    print(f"0x30-0x3f reserved, as 0x30 ({uses(illegal)}); branch cycles are not taken/taken\n")
+
+    roms = collect_roms(args.paths)
+    width = max([len(label) for label, *_ in roms] + [8])
+    print(f"{'rom':<{width}} {'instrs':>9} {'cycles':>9} {'cpi':>5}  top opcodes")
+    per_entry = collections.Counter()
+    total_instrs = total_cycles = 0
+    skipped = 0
+    for label, path, max_cycles, wordsize in roms:
+        if not os.path.exists(path):
+            skipped += 1
+            continue
+        cpu = System(wordsize=wordsize)
+        cpu.load_rom(path)
+        counts = trace(cpu, rom, max_cycles)
+        spent = collections.Counter()
+        for (entry, taken), n in counts.items():
+            spent[entry] += n * cycles(rom[entry], taken, args)
+        predicted = sum(spent.values())
+        per_entry.update(spent)
+        total_instrs += cpu.cycles
+        total_cycles += predicted
+        top = ", ".join(f"{ENTRY_NAMES[e]} {c / predicted:.0%}" for e, c in spent.most_common(3))
+        note = "" if cpu.halted else "  (did not halt)"
+        print(f"{label:<{width}} {cpu.cycles:>9} {predicted:>9} {predicted / max(cpu.cycles, 1):>5.2f}  {top}{note}")
+    print(f"{'total':<{width}} {total_instrs:>9} {total_cycles:>9} {total_cycles / max(total_instrs, 1):>5.2f}")
+    if skipped:
+        print(f"({skipped} ROMs not built, skipped)")
+
+    if total_cycles:
+        print(f"\nopcodes by share of all predicted cycles (* above {args.flag:g}%)")
+        for entry, spent in per_entry.most_common(args.top):
+            share = 100 * spent / total_cycles
+            print(f"{'*' if share > args.flag else ' '} {ENTRY_NAMES[entry]:<12} {spent:>10} {share:>6.2f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
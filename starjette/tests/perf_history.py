@@ -0,0 +1,244 @@
+"""
+Guest performance history with change-point detection.
+
+`record` runs the benchmark ROMs through the emulator binary on both cores
+(run_emulator_tests.py does the launching) and stores the guest cycle count
+and host cycles/sec of every run in a SQLite database, keyed by git commit
+and core. --repeat N stores N samples per ROM so host noise can be measured.
+
+`report` orders the recorded commits by git history and looks for change
+points in each (ROM, core, metric) series: at every commit the median of a
+window of samples before it is compared with the median of a window from it
+on. A step is flagged when it is at least --threshold relative and larger
+than --sigma times the noise expected for those window sizes. Noise is the
+MAD of samples around their commit median, pooled over the series, so the
+deterministic guest cycle counts flag any real change while host throughput
+needs a step that stands out from run to run jitter. Only the commit with
+the strongest score in a run of flagged commits is reported, which puts a
+clean step at the commit that caused it. More cycles or fewer cycles/sec are
+regressions.
+
+Usage (from starjette/):
+    python tests/perf_history.py record [--repeat N] [--core highlevel|microcoded] [ROM or manifest ...]
+    python tests/perf_history.py report [--threshold PCT] [--window N] [--rom NAME] [--check]
+Default benchmarks: examples/*.bin and every tests/*/manifest.json.
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+from run_emulator_tests import DEFAULT_EMULATOR, DEFAULT_TIMEOUT, collect_tests, run_all
+
+DEFAULT_DB = "tests/perf_history.sqlite"
+CORES = ["highlevel", "microcoded"]
+
+# metric: whether larger values are better
+METRICS = {"cycles": False, "rate": True}
+
+# Consistency constant turning a MAD into a standard deviation estimate
+MAD_SIGMA = 1.4826
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    commit_id TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    core TEXT NOT NULL,
+    host TEXT NOT NULL,
+    recorded REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    rom TEXT NOT NULL,
+    cycles INTEGER NOT NULL,
+    rate REAL
+);
+CREATE INDEX IF NOT EXISTS samples_run ON samples(run_id);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs(commit_id, core);
+"""
+
+
+def git(*args):
+    return subprocess.run(["git"] + list(args), capture_output=True, text=True, check=True).stdout.strip()
+
+
+def current_commit():
+    """(commit id, whether the work tree has uncommitted changes)"""
+    return git("rev-parse", "HEAD"), bool(git("status", "--porcelain", "--untracked-files=no"))
+
+
+def connect(path):
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def record(args):
+    tests = collect_tests(args.paths or sorted(glob.glob("examples/*.bin")) + sorted(glob.glob("tests/*/manifest.json")))
+    commit, dirty = current_commit()
+    db = connect(args.db)
+    for core in args.core or CORES:
+        options = SimpleNamespace(emulator=args.emulator, llemu=core == "microcoded",
+                                  timeout=args.timeout, jobs=args.jobs)
+        stored = skipped = 0
+        for _ in range(args.repeat):
+            results = asyncio.run(run_all(tests, options, lambda result: None))
+            skipped += sum(r["status"] == "skipped" for r in results)
+            with db:
+                run_id = db.execute("INSERT INTO runs (commit_id, dirty, core, host, recorded) VALUES (?, ?, ?, ?, ?)",
+                                    (commit, int(dirty), core, socket.gethostname(), time.time())).lastrowid
+                rows = [(run_id, f"{r['suite']}/{r['rom']}", r["cycles"], r["rate"])
+                        for r in results if r["cycles"] is not None]
+                db.executemany("INSERT INTO samples VALUES (?, ?, ?, ?)", rows)
+            stored += len(rows)
+        missing = len(tests) * args.repeat - stored - skipped
+        note = f", {missing} runs without a cycle report" if missing else ""
+        note += f", {skipped} skipped" if skipped else ""
+        print(f"{commit[:10]}{' (dirty)' if dirty else ''} {core}: {stored} samples{note}")
+    db.close()
+    return 0
+
+
+def history_order():
+    """{commit: position} along the first-parent history of HEAD, oldest first."""
+    commits = git("rev-list", "--first-parent", "--reverse", "HEAD").split()
+    return {commit: i for i, commit in enumerate(commits)}
+
+
+def load_series(db, order, rom_filter, include_dirty):
+    """{(rom, core, metric): [(commit, [samples])]} in history order."""
+    query = """SELECT r.commit_id, r.core, s.rom, s.cycles, s.rate FROM samples s JOIN runs r ON r.id = s.run_id"""
+    if not include_dirty:
+        query += " WHERE r.dirty = 0"
+    grouped = {}
+    for commit, core, rom, cycles, rate in db.execute(query):
+        if commit not in order or (rom_filter and rom_filter not in rom):
+            continue
+        for metric, value in (("cycles", cycles), ("rate", rate)):
+            if value is not None:
+                grouped.setdefault((rom, core, metric), {}).setdefault(commit, []).append(value)
+    return {key: sorted(commits.items(), key=lambda item: order[item[0]]) for key, commits in grouped.items()}
+
+
+def noise(groups):
+    """Robust per-sample standard deviation from the spread within commits."""
+    residuals = []
+    for _, samples in groups:
+        if len(samples) > 1:
+            centre = statistics.median(samples)
+            residuals.extend(abs(s - centre) for s in samples)
+    return MAD_SIGMA * statistics.median(residuals) if residuals else 0.0
+
+
+def spread(samples):
+    """Mean absolute deviation from the median; grows when a window straddles a step."""
+    centre = statistics.median(samples)
+    return sum(abs(s - centre) for s in samples) / len(samples)
+
+
+def change_points(groups, window, threshold, sigma):
+    """[(index, before median, after median, score)] for the flagged steps in one series."""
+    sd = noise(groups)
+    scores = []
+    for i in range(1, len(groups)):
+        before = [s for _, samples in groups[max(0, i - window):i] for s in samples]
+        after = [s for _, samples in groups[i:i + window] for s in samples]
+        m_before = statistics.median(before)
+        m_after = statistics.median(after)
+        step = abs(m_after - m_before)
+        relative = step / abs(m_before) if m_before else float("inf") if step else 0.0
+        expected = sd * (1 / len(before) + 1 / len(after)) ** 0.5
+        if relative >= threshold and step > sigma * expected:
+            # Windows that mix both sides of the step score lower than the step itself
+            score = step / (expected + spread(before) + spread(after) + 1e-9 * abs(m_before) + 1e-12)
+            scores.append((i, m_before, m_after, score))
+        else:
+            scores.append(None)
+
+    # Keep the strongest commit of each run of consecutive flags
+    flagged = []
+    in_run = False
+    for entry in scores:
+        if entry is None:
+            in_run = False
+        elif in_run:
+            if entry[3] > flagged[-1][3]:
+                flagged[-1] = entry
+        else:
+            flagged.append(entry)
+            in_run = True
+    return flagged
+
+
+def report(args):
+    db = connect(args.db)
+    order = history_order()
+    series = load_series(db, order, args.rom, args.dirty)
+    db.close()
+    if not series:
+        print("no recorded samples for commits in this history")
+        return 0
+
+    regressions = 0
+    findings = []
+    for (rom, core, metric), groups in sorted(series.items()):
+        higher_better = METRICS[metric]
+        for i, before, after, score in change_points(groups, args.window, args.threshold / 100, args.sigma):
+            change = (after - before) / before if before else float("inf")
+            worse = change < 0 if higher_better else change > 0
+            regressions += worse
+            findings.append((order[groups[i][0]], groups[i][0], rom, core, metric, before, after, change, worse))
+
+    commits = len({commit for groups in series.values() for commit, _ in groups})
+    print(f"{len(series)} series over {commits} commits, threshold {args.threshold:g}%, window {args.window}")
+    if not findings:
+        print("no change points")
+        return 0
+    width = max(len(f[2]) for f in findings)
+    for _, commit, rom, core, metric, before, after, change, worse in sorted(findings):
+        subject = git("log", "-1", "--format=%s", commit)
+        kind = "REGRESSION " if worse else "improvement"
+        print(f"{kind} {commit[:10]} {rom:<{width}} {core:<10} {metric:<6} "
+              f"{before:>12.6g} -> {after:<12.6g} {change:+7.1%}  {subject}")
+    return 1 if args.check and regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"history database (default {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("record", help="run the benchmarks at HEAD and store the results")
+    p.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    p.add_argument("--core", action="append", choices=CORES, help="core to run (repeatable, default both)")
+    p.add_argument("--repeat", type=int, default=3, help="samples per ROM and core (default 3)")
+    p.add_argument("--emulator", default=DEFAULT_EMULATOR, help=f"emulator binary (default {DEFAULT_EMULATOR})")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="seconds before a ROM is killed")
+    p.add_argument("-j", "--jobs", type=int, default=1,
+                   help="parallel emulator processes (default 1, more makes host throughput noisier)")
+    p = commands.add_parser("report", help="flag change points along the git history")
+    p.add_argument("--threshold", type=float, default=5.0, metavar="PCT", help="smallest relative step (default 5)")
+    p.add_argument("--sigma", type=float, default=4.0, help="steps must exceed this many noise deviations (default 4)")
+    p.add_argument("--window", type=int, default=3, help="commits on each side of a candidate (default 3)")
+    p.add_argument("--rom", help="only ROMs whose name contains this")
+    p.add_argument("--dirty", action="store_true", help="include runs recorded with uncommitted changes")
+    p.add_argument("--check", action="store_true", help="exit 1 when a regression is flagged")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        if not os.path.exists(args.emulator):
+            parser.error(f"{args.emulator} not found; build it with `zig build`")
+        return record(args)
+    return report(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Estimate CPI for every built test and benchmark ROM under the pipeline
+configurations in starjette_timing.py.
+
+Arguments may be .bin files or suite manifest.json files. With none, every
+tests/*.bin and every tests/*/manifest.json suite is used. ROMs that were not
+built are skipped. Suites run at their manifest's word size, and bare .bin
+files under a w32/ tree run at 32 bits.
+
+Usage (from starjette/): python tests/pipeline_report.py [--pipeline NAME ...] [--stalls] [ROM or manifest ...]
+Build the ROMs first with `make tests` and the suite targets.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+from starjette_system import System
+from starjette_timing import PIPELINES, STALL_KINDS, make_pipelines, timed_run
+
+
+def path_wordsize(path):
+    """Word size of a ROM that has no manifest: 32 under a w32/ tree, else 16."""
+    return 32 if "w32" in os.path.normpath(path).split(os.sep) else 16
+
+
+def collect_roms(paths):
+    """[(label, path, max_cycles, wordsize)] for the given .bin and manifest files."""
+    if not paths:
+        paths = sorted(glob.glob("tests/*.bin")) + sorted(glob.glob("tests/*/manifest.json"))
+    roms = []
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path) as f:
+                manifest = json.load(f)
+            base = os.path.dirname(path)
+            for test in manifest["tests"]:
+                rom = os.path.join(base, test["rom"])
+                roms.append((f"{manifest['suite']}/{test['rom']}", rom, test["max_cycles"],
+                             manifest.get("wordsize", path_wordsize(path))))
+        else:
+            roms.append((os.path.basename(path), path, 1_000_000, path_wordsize(path)))
+    return roms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    parser.add_argument("--pipeline", action="append", choices=sorted(PIPELINES),
+                        help="pipeline preset to model (repeatable, default all)")
+    parser.add_argument("--stalls", action="store_true", help="print the stall breakdown per ROM")
+    args = parser.parse_args()
+
+    names = args.pipeline or list(PIPELINES)
+    totals = make_pipelines(names)
+    for pipeline in totals:
+        print(f"{pipeline.name:<18} {pipeline.describe()}")
+    print()
+
+    width = max([len(label) for label, *_ in collect_roms(args.paths)] + [8])
+    print(f"{'rom':<{width}} {'instrs':>9} " + " ".join(f"{name:>17}" for name in names))
+    skipped = 0
+    for label, path, max_cycles, wordsize in collect_roms(args.paths):
+        if not os.path.exists(path):
+            skipped += 1
+            continue
+        cpu = System(wordsize=wordsize)
+        cpu.load_rom(path)
+        pipelines = make_pipelines(names)
+        count = timed_run(cpu, pipelines, max_cycles)
+        note = "" if cpu.halted else "  (did not halt)"
+        print(f"{label:<{width}} {count:>9} " + " ".join(f"{p.cpi:>17.3f}" for p in pipelines) + note)
+
+        for pipeline, total in zip(pipelines, totals):
+            total.instructions += pipeline.instructions
+            total.cycles += pipeline.cycles
+            total.fused += pipeline.fused
+            for kind in STALL_KINDS:
+                total.stalls[kind] += pipeline.stalls[kind]
+            if args.stalls:
+                breakdown = ", ".join(f"{kind} {share:.1%}" for kind, share in pipeline.summary().items())
+                print(f"    {pipeline.name:<18} fused {pipeline.fused:>7}  {breakdown or 'no stalls'}")
+
+    print(f"{'total':<{width}} {totals[0].instructions:>9} " + " ".join(f"{p.cpi:>17.3f}" for p in totals))
+    if skipped:
+        print(f"({skipped} ROMs not built, skipped)")
+
+    print("\nstall cycles per instruction:")
+    print(f"{'':<18} {'fused':>7} " + " ".join(f"{kind:>9}" for kind in STALL_KINDS))
+    for total in totals:
+        n = max(total.instructions, 1)
+        print(f"{total.name:<18} {total.fused / n:>7.3f} "
+              + " ".join(f"{total.stalls[kind] / n:>9.3f}" for kind in STALL_KINDS))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Run built test ROMs through the Zig emulator binary in parallel.
+
+Each ROM is launched as `starjay --rom ROM -q` (add -l with --llemu) through
+a pool of asyncio subprocesses, one per core by default. The emulator prints
+"Execution completed in N cycles" and "errorLevel: TOS" to stderr when the
+CPU halts; a test passes when TOS matches the expected value and the cycle
+count is within max_cycles. ROMs that do not halt are killed after
+--timeout seconds.
+
+Arguments may be .bin files (expected TOS 1, like the regular tests) or
+suite manifest.json files. With none, tests/*.bin and every
+tests/*/manifest.json are run. A manifest lists the features its ROMs need
+under "requires" (a test entry may override it) and the word size they were
+generated for; tests the selected core cannot run, and 32-bit trees, are
+reported as skipped rather than failed. UART golden output is not checked
+here since the emulator binary does not model the UART; use uart_report.py
+for that.
+
+Usage (from starjette/): python tests/run_emulator_tests.py [-j N] [--emulator PATH] [--llemu]
+    [--timeout S] [--junit FILE] [--json FILE] [ROM or manifest ...]
+Build the emulator first with `zig build` and the ROMs with make.
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+DEFAULT_EMULATOR = "../zig-out/bin/starjay"
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_CYCLES = 1_000_000
+
+# The Zig cores are 16-bit only
+EMULATOR_WORDSIZE = 16
+
+# Features beyond the base instruction set that suite manifests may require:
+#   traps       exceptions enter through evec and rets returns (stack
+#               overflow/underflow, syscall, macro vectors, user mode)
+#   high_water  data stack overflow at the high-water marks of the manual
+#   interrupts  pending interrupts are taken when status.ie is set
+#   devices     the CLINT and UART registers are memory mapped
+CORE_FEATURES = {
+    "highlevel": set(),
+    "microcoded": {"traps", "high_water"},
+}
+
+COMPLETED = re.compile(r"Execution completed in (\d+) cycles(?:.*?([\d.]+) cycles/sec)?")
+ERROR_LEVEL = re.compile(r"errorLevel: (\d+)")
+
+# Output kept in reports for failing tests
+OUTPUT_TAIL = 2000
+
+
+def collect_tests(paths):
+    """[{suite, rom, path, expect, max_cycles, wordsize, requires}] for the given .bin and manifest files."""
+    if not paths:
+        paths = sorted(glob.glob("tests/*.bin")) + sorted(glob.glob("tests/*/manifest.json"))
+    tests = []
+    for path in paths:
+        if path.endswith(".json"):
+            with open(path) as f:
+                manifest = json.load(f)
+            base = os.path.dirname(path)
+            for test in manifest["tests"]:
+                tests.append({
+                    "suite": manifest["suite"],
+                    "rom": test["rom"],
+                    "path": os.path.join(base, test["rom"]),
+                    "expect": test["expect"],
+                    "max_cycles": test["max_cycles"],
+                    "wordsize": manifest.get("wordsize", EMULATOR_WORDSIZE),
+                    "requires": test.get("requires", manifest.get("requires", [])),
+                })
+        else:
+            tests.append({
+                "suite": os.path.basename(os.path.dirname(path)) or "tests",
+                "rom": os.path.basename(path),
+                "path": path,
+                "expect": 1,
+                "max_cycles": DEFAULT_MAX_CYCLES,
+                "wordsize": EMULATOR_WORDSIZE,
+                "requires": [],
+            })
+    return tests
+
+
+def unsupported(test, core):
+    """Why core cannot run test, or None."""
+    if test["wordsize"] != EMULATOR_WORDSIZE:
+        return f"{test['wordsize']}-bit ROM, the emulator is {EMULATOR_WORDSIZE}-bit"
+    missing = sorted(set(test["requires"]) - CORE_FEATURES[core])
+    if missing:
+        return f"{core} core lacks {', '.join(missing)}"
+    return None
+
+
+async def run_one(test, args, pool):
+    """Run one ROM and return its result record."""
+    result = dict(test, status="error", value=None, cycles=None, rate=None, seconds=0.0, message="", output="")
+    reason = unsupported(test, "microcoded" if args.llemu else "highlevel")
+    if reason:
+        result["status"] = "skipped"
+        result["message"] = reason
+        return result
+    if not os.path.exists(test["path"]):
+        result["message"] = "ROM not built"
+        return result
+
+    command = [args.emulator, "--rom", test["path"], "-q"] + (["-l"] if args.llemu else [])
+    async with pool:
+        start = time.perf_counter()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+        except OSError as e:
+            result["message"] = f"cannot start {args.emulator}: {e}"
+            return result
+        try:
+            output, _ = await asyncio.wait_for(process.communicate(), args.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            output, _ = await process.communicate()
+            result["status"] = "timeout"
+            result["message"] = f"no halt within {args.timeout:g}s"
+        result["seconds"] = time.perf_counter() - start
+
+    text = output.decode(errors="replace")
+    result["output"] = text[-OUTPUT_TAIL:]
+    if result["status"] == "timeout":
+        return result
+
+    completed = COMPLETED.search(text)
+    level = ERROR_LEVEL.search(text)
+    if completed is None or level is None:
+        result["message"] = f"exit status {process.returncode}, no cycle report"
+        return result
+    result["cycles"] = int(completed.group(1))
+    if completed.group(2):
+        result["rate"] = float(completed.group(2))
+    result["value"] = int(level.group(1))
+
+    # The emulator prints TOS unsigned; manifests may hold negative values
+    expect = test["expect"] & ((1 << test["wordsize"]) - 1)
+    if result["value"] != expect:
+        result["status"] = "failed"
+        result["message"] = f"TOS {result['value']}, expected {expect}"
+    elif result["cycles"] > test["max_cycles"]:
+        result["status"] = "failed"
+        result["message"] = f"{result['cycles']} cycles, budget {test['max_cycles']}"
+    else:
+        result["status"] = "passed"
+    return result
+
+
+async def run_all(tests, args, progress):
+    pool = asyncio.Semaphore(max(1, args.jobs))
+    tasks = [asyncio.ensure_future(run_one(test, args, pool)) for test in tests]
+    for done in asyncio.as_completed(tasks):
+        progress(await done)
+    return [task.result() for task in tasks]
+
+
+def write_junit(results, path, elapsed):
+    """JUnit XML with one testsuite per suite."""
+    root = ET.Element("testsuites", name="starjette emulator", time=f"{elapsed:.3f}")
+    suites = {}
+    for result in results:
+        suite = suites.get(result["suite"])
+        if suite is None:
+            suite = suites[result["suite"]] = ET.SubElement(root, "testsuite", name=result["suite"])
+        case = ET.SubElement(suite, "testcase", classname=result["suite"], name=result["rom"],
+                             time=f"{result['seconds']:.3f}")
+        if result["status"] == "failed":
+            ET.SubElement(case, "failure", message=result["message"]).text = result["output"]
+        elif result["status"] == "skipped":
+            ET.SubElement(case, "skipped", message=result["message"])
+        elif result["status"] != "passed":
+            ET.SubElement(case, "error", message=result["message"], type=result["status"]).text = result["output"]
+    for name, suite in suites.items():
+        cases = [r for r in results if r["suite"] == name]
+        suite.set("tests", str(len(cases)))
+        suite.set("failures", str(sum(r["status"] == "failed" for r in cases)))
+        suite.set("errors", str(sum(r["status"] not in ("passed", "failed", "skipped") for r in cases)))
+        suite.set("skipped", str(sum(r["status"] == "skipped" for r in cases)))
+        suite.set("time", f"{sum(r['seconds'] for r in cases):.3f}")
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def summary(results, args, elapsed):
+    counts = {status: 0 for status in ["passed", "failed", "timeout", "error", "skipped"]}
+    for result in results:
+        counts[result["status"]] += 1
+    return {
+        "emulator": args.emulator,
+        "core": "microcoded" if args.llemu else "highlevel",
+        "jobs": args.jobs,
+        "elapsed": round(elapsed, 3),
+        "total": len(results),
+        **counts,
+        "tests": [{key: value for key, value in result.items() if key != "output"} for result in results],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="parallel emulator processes")
+    parser.add_argument("--emulator", default=DEFAULT_EMULATOR, help=f"emulator binary (default {DEFAULT_EMULATOR})")
+    parser.add_argument("--llemu", action="store_true", help="use the microcoded core")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"seconds before a ROM is killed (default {DEFAULT_TIMEOUT:g})")
+    parser.add_argument("--junit", help="write JUnit XML here")
+    parser.add_argument("--json", help="write a JSON summary here")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every result, not only failures")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.emulator):
+        parser.error(f"{args.emulator} not found; build it with `zig build`")
+    tests = collect_tests(args.paths)
+
+    def progress(result):
+        if args.verbose or result["status"] not in ("passed", "skipped"):
+            cycles = "" if result["cycles"] is None else f" {result['cycles']} cycles"
+            print(f"{result['status']:<8} {result['suite']}/{result['rom']}{cycles} {result['message']}".rstrip())
+
+    start = time.perf_counter()
+    results = asyncio.run(run_all(tests, args, progress))
+    elapsed = time.perf_counter() - start
+
+    report = summary(results, args, elapsed)
+    if args.junit:
+        write_junit(results, args.junit, elapsed)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    print(f"{report['passed']}/{report['total']} passed, {report['failed']} failed, "
+          f"{report['timeout']} timed out, {report['error']} errors, {report['skipped']} skipped "
+          f"in {elapsed:.2f}s with {args.jobs} jobs")
+    return 0 if report["passed"] + report["skipped"] == report["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+; Separate copies of each push/shi chain suffix (control)
+    jump _main
+
+#addr 0x0040
+    ; return with `push rx; pop pc`, the bytes after each chain
+_s0:
+    #d8 0x71, 0x80, 0x95, 0xd5, 0xc8, 0x99, 0x8a, 0xb9
+    ret rx
+_s1:
+    #d8 0x80, 0x95, 0xd5, 0xc8, 0x99, 0x8a, 0xb9
+    ret rx
+_s2:
+    #d8 0x95, 0xd5, 0xc8, 0x99, 0x8a, 0xb9
+    ret rx
+_s3:
+    #d8 0xd5, 0xc8, 0x99, 0x8a, 0xb9
+    ret rx
+_s4:
+    #d8 0xc8, 0x99, 0x8a, 0xb9
+    ret rx
+_s5:
+    #d8 0x99, 0x8a, 0xb9
+    ret rx
+_s6:
+    #d8 0x8a, 0xb9
+    ret rx
+_s7:
+    #d8 0xb9
+    ret rx
+
+_main:
+    push 1000
+    push 0x7f00
+    sw
+    push 0x0001
+
+_loop:
+    ; last shi of the chain becomes shi (i & 0x7f)
+    push 0x7f00
+    lw
+    push 0x7f
+    and
+    add 0x80
+    push 0x04f0
+    sb
+    dup
+    push _s7
+    callp
+    xor
+    dup
+    push _s6
+    callp
+    xor
+    dup
+    push _s5
+    callp
+    xor
+    dup
+    push _s4
+    callp
+    xor
+    dup
+    push _s3
+    callp
+    xor
+    dup
+    push _s2
+    callp
+    xor
+    dup
+    push _s1
+    callp
+    xor
+    push _s0
+    callp
+    add
+
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    push 0x0201
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,34 @@
+; Self-modifying push immediate
+    push 1000
+    push 0x7f00
+    sw
+    push 0x0000
+
+_loop:
+    ; push (i & 0x1f), written over the byte at _site
+    push 0x7f00
+    lw
+    push 0x1f
+    and
+    add 0x40
+    push _site
+    sb
+_site:
+    #d8 0x41
+    add
+
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    push 0x3c34
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
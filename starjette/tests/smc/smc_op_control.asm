@@ -0,0 +1,60 @@
+; Self-modifying instruction pair (control: patches go to a scratch word)
+    push 1000
+    push 0x7f00
+    sw
+    push 0x1234
+
+_loop:
+    ; copy pair (i & 15) of _table over _site
+    push 0x7f00
+    lw
+    push 15
+    and
+    dup
+    add
+    push _table
+    add
+    lw
+    push 0x04f0
+    sw
+    jump _site
+
+    ; `push imm; op` pairs, read as data
+#align 16
+_table:
+    #d8 0x5b, 0x0c
+    #d8 0x58, 0x27
+    #d8 0x48, 0x27
+    #d8 0x45, 0x27
+    #d8 0x47, 0x0c
+    #d8 0x4a, 0x28
+    #d8 0x43, 0x0c
+    #d8 0x44, 0x0c
+    #d8 0x4d, 0x28
+    #d8 0x59, 0x28
+    #d8 0x49, 0x28
+    #d8 0x42, 0x27
+    #d8 0x41, 0x27
+    #d8 0x5b, 0x28
+    #d8 0x56, 0x27
+    #d8 0x4f, 0x0e
+
+#align 16
+_site:
+    #d8 0x5b, 0x0c
+
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    push 0x7bac
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,670 @@
+"""
+Vectorized oracle compiled from the pseudocode in docs/cpu_isa_manual.md.
+
+Every instruction section of the manual ("##### 3.x.y. `name` - Title")
+ends its encoding diagram with a semantics block such as
+
+    push((({ros!, nos!} << (tos! & (2*WORDSIZE - 1))) >> WORDSIZE) & WORDMASK)
+
+compile_manual() parses those blocks with C precedence and emits a Python
+module with one function per instruction operating on NumPy arrays, one lane
+per test case, for either WORDSIZE. The module is cached under
+tests/.spec_cache/ and rebuilt only when the manual (or this compiler)
+changes, so the oracle follows the spec without anyone re-deriving it.
+
+Semantics the compiler gives the notation (section 1.3):
+
+    tos/nos/ros     read the current stack slot; assignments write it
+    x!              the value x had when the instruction started, popped
+    pc              the address of the next instruction, as the hardware
+                    has already advanced it (matching "next_pc = pc + tos!")
+    raise { ... }   a synchronous exception: those assignments happen and
+                    the data stack is left as it was
+    km, ie, th      status bits 0, 1 and 2
+
+Blocks touching memory or CSRs by index (mem[...], csr[...]) are reported as
+not compiled; the scalar model in starjette_model.py covers those. Stack
+underflow/overflow checks are outside the per-instruction pseudocode, so
+callers supply states with enough depth.
+
+State is a dict of int64 arrays: pc, fp, rx, ry, status, estatus, epc,
+ecause, evec, depth, halted, imm (the instruction's immediate field) and
+s0..s3 (tos first). Functions return a new dict with the same keys.
+
+Usage (from starjette/): python tests/spec_oracle.py [--wordsize 16|32] [--check N] [--show OP] [--rebuild]
+--check compares every compiled instruction with starjette_model.Cpu on N
+random states and reports evaluation speed.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+MANUAL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "docs", "cpu_isa_manual.md")
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".spec_cache")
+
+WINDOW = 4
+SLOTS = [f"s{i}" for i in range(WINDOW)]
+STACK_NAMES = {"tos": 0, "nos": 1, "ros": 2}
+REGISTERS = ["pc", "fp", "rx", "ry", "status", "estatus", "epc", "ecause", "evec"]
+STATUS_BITS = {"km": 0, "ie": 1, "th": 2}
+FIELDS = REGISTERS + ["depth", "halted", "imm"] + SLOTS
+
+HEADING = re.compile(r"^#####\s+[\d.]+\s+`([^`]+)`")
+REG_FORMS = ["pc", "fp", "rx", "ry"]
+
+
+class Unsupported(Exception):
+    pass
+
+
+# --- Extraction ----------------------------------------------------------
+
+def extract(text):
+    """{mnemonic: semantics block} in manual order."""
+    blocks = {}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        match = HEADING.match(lines[i])
+        i += 1
+        if match is None:
+            continue
+        name = match.group(1)
+        while i < len(lines) and not lines[i].startswith("```"):
+            i += 1
+        i += 1
+        body = []
+        while i < len(lines) and not lines[i].startswith("```"):
+            body.append(lines[i])
+            i += 1
+        # The semantics follow the last line of the encoding diagram
+        last = max((n for n, line in enumerate(body) if line.strip().startswith("+")), default=-1)
+        semantics = "\n".join(line.strip() for line in body[last + 1:] if line.strip())
+        if semantics:
+            blocks[name] = semantics
+    return blocks
+
+
+def instances(name):
+    """[(instruction name, text substitutions)] for a manual heading."""
+    base = name.split()[0]
+    if "<reg>" in name:
+        return [(f"{base} {reg}", {"<reg>": reg}) for reg in REG_FORMS]
+    return [(base, {"<imm>": "imm"})]
+
+
+# --- Parsing -------------------------------------------------------------
+
+TOKEN = re.compile(r"\s*(?:(0x[0-9a-fA-F]+|\d+)|([A-Za-z_]\w*)|(<<|>>|==|!=|<=|>=|\+=|-=|&&|\|\||[-+*/%&|^~!<>=(){}\[\],;?:])|(\n))")
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = TOKEN.match(text, pos)
+        if match is None:
+            raise Unsupported(f"cannot tokenize {text[pos:pos + 10]!r}")
+        number, name, op, newline = match.groups()
+        if number:
+            tokens.append(("num", int(number, 0)))
+        elif name:
+            tokens.append(("name", name))
+        elif op:
+            tokens.append(("op", op))
+        else:
+            tokens.append(("op", ";"))
+        pos = match.end()
+    return tokens
+
+
+BINARY = [
+    ["||"], ["&&"], ["|"], ["^"], ["&"], ["==", "!="], ["<", "<=", ">", ">="], ["<<", ">>"], ["+", "-"], ["*", "/", "%"],
+]
+
+
+class Parser:
+    """Recursive descent over one semantics block, producing nested tuples."""
+
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else ("end", None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if value is not None and token[1] != value:
+            raise Unsupported(f"expected {value!r}, found {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def at(self, value):
+        return self.peek()[1] == value
+
+    def statements(self, stop=()):
+        body = []
+        while True:
+            while self.at(";"):
+                self.take()
+            if self.peek()[0] == "end" or self.peek()[1] in stop:
+                return body
+            body.append(self.statement(stop))
+
+    def statement(self, stop):
+        kind, value = self.peek()
+        if value == "if":
+            self.take()
+            cond = self.expression()
+            self.take("then")
+            then = self.statements(stop=("else",) + stop)
+            otherwise = []
+            if self.at("else"):
+                self.take()
+                otherwise = self.statements(stop)
+            return ("if", cond, then, otherwise)
+        if value == "raise":
+            self.take()
+            self.take("{")
+            body = self.statements(stop=("}",))
+            self.take("}")
+            return ("raise", body)
+        if value == "halt" and self.peek(1)[1] == "the":
+            while self.peek()[1] not in (";", "end", None) and self.peek()[0] != "end":
+                self.take()
+            return ("halt",)
+        if value == "push" and self.peek(1)[1] == "(":
+            self.take()
+            self.take("(")
+            expr = self.expression()
+            self.take(")")
+            return ("push", expr)
+
+        targets = [self.expression()]
+        while self.at(","):
+            self.take()
+            targets.append(self.expression())
+        if self.at("=") or self.at("+=") or self.at("-="):
+            op = self.take()[1]
+            values = [self.expression()]
+            while self.at(","):
+                self.take()
+                values.append(self.expression())
+            if len(values) != len(targets):
+                raise Unsupported("mismatched assignment")
+            for target in targets:
+                if target[0] != "name":
+                    raise Unsupported(f"cannot assign to {target}")
+            if op != "=":
+                values = [("bin", op[0], target, value) for target, value in zip(targets, values)]
+            return ("assign", [t[1] for t in targets], values)
+        if len(targets) == 1 and targets[0][0] == "pop":
+            return ("expr", targets[0])
+        raise Unsupported("expression statement")
+
+    def expression(self):
+        cond = self.binary(0)
+        if self.at("?"):
+            self.take()
+            yes = self.expression()
+            self.take(":")
+            no = self.expression()
+            return ("where", cond, yes, no)
+        return cond
+
+    def binary(self, level):
+        if level == len(BINARY):
+            return self.unary()
+        left = self.binary(level + 1)
+        while self.peek()[0] == "op" and self.peek()[1] in BINARY[level]:
+            op = self.take()[1]
+            left = ("bin", op, left, self.binary(level + 1))
+        return left
+
+    def unary(self):
+        if self.at("~") or self.at("-"):
+            op = self.take()[1]
+            return ("unary", op, self.unary())
+        return self.postfix()
+
+    def postfix(self):
+        node = self.primary()
+        if self.at("!") and node[0] == "name":
+            self.take()
+            return ("pop", node[1])
+        if self.at("["):
+            raise Unsupported("indexed memory or CSR access")
+        return node
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == "num":
+            return ("num", value)
+        if value == "(":
+            node = self.expression()
+            self.take(")")
+            return node
+        if value == "{":
+            high = self.expression()
+            self.take(",")
+            low = self.expression()
+            self.take("}")
+            return ("concat", high, low)
+        if kind == "name":
+            if self.at("("):
+                self.take()
+                args = [self.expression()]
+                while self.at(","):
+                    self.take()
+                    args.append(self.expression())
+                self.take(")")
+                return ("call", value, args)
+            if self.at(":"):
+                raise Unsupported("sized memory access")
+            return ("name", value)
+        raise Unsupported(f"unexpected {value!r}")
+
+
+# --- Code generation -----------------------------------------------------
+
+class Generator:
+    """Emit Python for one instruction body, using the Run helpers below."""
+
+    def __init__(self):
+        self.lines = []
+        self.locals = set()
+        self.count = 0
+
+    def temp(self):
+        self.count += 1
+        return f"t{self.count}"
+
+    def emit(self, line, depth):
+        self.lines.append("    " * depth + line)
+
+    def expr(self, node, signed=False):
+        kind = node[0]
+        if kind == "num":
+            return str(node[1])
+        if kind == "name":
+            name = node[1]
+            if name in STACK_NAMES:
+                value = f"r.cur[{STACK_NAMES[name]}]"
+            elif name in REGISTERS:
+                value = f"r.reg['{name}']"
+            elif name in STATUS_BITS:
+                value = f"((r.reg['status'] >> {STATUS_BITS[name]}) & 1)"
+            elif name in ("WORDSIZE", "WORDBYTES", "WORDMASK"):
+                return f"r.{name}"
+            elif name == "imm":
+                value = "r.imm"
+            elif name in self.locals:
+                value = name
+            else:
+                raise Unsupported(f"unknown name {name}")
+            return f"r.signed({value})" if signed else value
+        if kind == "pop":
+            if node[1] not in STACK_NAMES:
+                raise Unsupported(f"cannot pop {node[1]}")
+            value = f"r.pop({STACK_NAMES[node[1]]}, m)"
+            return f"r.signed({value})" if signed else value
+        if kind == "concat":
+            return f"(({self.expr(node[1], signed)} << r.WORDSIZE) | {self.expr(node[2])})"
+        if kind == "unary":
+            return f"({node[1]}{self.expr(node[2], signed)})"
+        if kind == "where":
+            return f"np.where({self.expr(node[1], signed)}, {self.expr(node[2], signed)}, {self.expr(node[3], signed)})"
+        if kind == "bin":
+            op, left, right = node[1:]
+            a, b = self.expr(left, signed), self.expr(right, signed)
+            if op == "/":
+                return f"r.div({a}, {b})"
+            if op == "%":
+                return f"r.rem({a}, {b})"
+            if op == "&&":
+                return f"({a} & {b})"
+            if op == "||":
+                return f"({a} | {b})"
+            return f"({a} {op} {b})"
+        if kind == "call":
+            name, args = node[1], node[2]
+            if name == "signed":
+                return self.expr(args[0], True)
+            if name == "unsigned":
+                return self.expr(args[0], False)
+            if name == "sign_extend":
+                return f"r.sign_extend({self.expr(args[0])}, {self.expr(args[1])})"
+            if name == "count_leading_zeros":
+                return f"r.clz({self.expr(args[0])})"
+            raise Unsupported(f"unknown function {name}")
+        raise Unsupported(f"cannot compile {kind}")
+
+    def block(self, body, depth, mask):
+        for stmt in body:
+            self.statement(stmt, depth, mask)
+
+    def statement(self, stmt, depth, mask):
+        kind = stmt[0]
+        if kind == "push":
+            self.emit(f"r.push({self.expr(stmt[1])}, {mask})", depth)
+        elif kind == "expr":
+            self.emit(f"{self.expr(stmt[1])}", depth)
+        elif kind == "halt":
+            self.emit(f"r.halt({mask})", depth)
+        elif kind == "assign":
+            names, values = stmt[1], stmt[2]
+            temps = []
+            for value in values:
+                temp = self.temp()
+                self.emit(f"{temp} = {self.expr(value)}", depth)
+                temps.append(temp)
+            for name, temp in zip(names, temps):
+                if name in STACK_NAMES:
+                    self.emit(f"r.set_slot({STACK_NAMES[name]}, {temp}, {mask})", depth)
+                elif name in REGISTERS:
+                    self.emit(f"r.set_reg('{name}', {temp}, {mask})", depth)
+                elif name in STATUS_BITS:
+                    self.emit(f"r.set_bit({STATUS_BITS[name]}, {temp}, {mask})", depth)
+                elif mask == "m":
+                    self.locals.add(name)
+                    self.emit(f"{name} = {temp}", depth)
+                else:
+                    raise Unsupported(f"conditional assignment to local {name}")
+        elif kind == "if":
+            cond = self.temp()
+            self.emit(f"{cond} = np.asarray({self.expr(stmt[1])}, dtype=bool) & {mask}", depth)
+            self.block(stmt[2], depth, cond)
+            if stmt[3]:
+                other = self.temp()
+                self.emit(f"{other} = ~{cond} & {mask}", depth)
+                self.block(stmt[3], depth, other)
+        elif kind == "raise":
+            self.emit(f"r.trap({mask})", depth)
+            self.block(stmt[1], depth, mask)
+        else:
+            raise Unsupported(kind)
+
+
+def compile_block(name, text):
+    """Python source for one instruction's function."""
+    parser = Parser(text)
+    body = parser.statements()
+    if parser.peek()[0] != "end":
+        raise Unsupported(f"trailing {parser.peek()[1]!r}")
+    gen = Generator()
+    gen.block(body, 1, "m")
+    function = "op_" + name.replace(" ", "_")
+    doc = " ".join(text.split())
+    return "\n".join([f"def {function}(state, wordsize):", f"    # {doc}",
+                      "    r = Run(state, wordsize)", "    m = r.all"] + gen.lines + ["    return r.finish()", ""])
+
+
+def compiler_hash():
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compile_manual(text):
+    """(module source, {instruction: reason} for blocks that did not compile)."""
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    parts = [
+        f"# Generated by tests/spec_oracle.py from docs/cpu_isa_manual.md, do not edit",
+        f"# manual {digest}",
+        f"# compiler {compiler_hash()}",
+        "import numpy as np",
+        "from spec_oracle import Run",
+        "",
+    ]
+    ops = []
+    skipped = {}
+    for heading, block in extract(text).items():
+        for name, subs in instances(heading):
+            source = block
+            for old, new in subs.items():
+                source = source.replace(old, new)
+            try:
+                parts.append(compile_block(name, source))
+                ops.append(name)
+            except Unsupported as e:
+                skipped[name] = str(e)
+    parts.append("OPS = {" + ", ".join(f"{name!r}: op_{name.replace(' ', '_')}" for name in ops) + "}")
+    parts.append(f"SKIPPED = {skipped!r}")
+    return "\n".join(parts) + "\n", skipped
+
+
+def load(manual=MANUAL, rebuild=False):
+    """The compiled module for manual, rebuilt when the manual or compiler changed."""
+    with open(manual) as f:
+        text = f.read()
+    header = f"# manual {hashlib.sha256(text.encode()).hexdigest()}\n# compiler {compiler_hash()}\n"
+    path = os.path.join(CACHE_DIR, "spec_ops.py")
+    current = False
+    if os.path.exists(path) and not rebuild:
+        with open(path) as f:
+            f.readline()
+            current = f.readline() + f.readline() == header
+    if not current:
+        source, _ = compile_manual(text)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            f.write(source)
+        os.replace(path + ".tmp", path)
+    spec = importlib.util.spec_from_file_location("spec_ops", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def apply(module, name, stack, wordsize=16):
+    """
+    Run instruction name of a compiled module on stacks given as columns,
+    tos first, in kernel mode with everything else zero. Returns the output
+    state.
+    """
+    count = len(stack[0])
+    state = {field: np.zeros(count, dtype=np.int64) for field in FIELDS}
+    state["status"][:] = 1
+    state["depth"][:] = WINDOW
+    for slot, column in zip(SLOTS, stack):
+        state[slot] = np.asarray(column, dtype=np.int64) & ((1 << wordsize) - 1)
+    return module.OPS[name](state, wordsize)
+
+
+# --- Runtime used by the generated code ----------------------------------
+
+class Run:
+    """Lane-wise execution of one instruction over a batch of states."""
+
+    def __init__(self, state, wordsize):
+        self.WORDSIZE = wordsize
+        self.WORDBYTES = wordsize // 8
+        self.WORDMASK = (1 << wordsize) - 1
+        self.state = state
+        self.all = np.ones(len(state["pc"]), dtype=bool)
+        self.reg = {name: state[name].copy() for name in REGISTERS}
+        self.reg["pc"] = (self.reg["pc"] + 1) & self.WORDMASK
+        self.imm = state["imm"]
+        self.initial = [state[slot] for slot in SLOTS]
+        self.cur = [state[slot].copy() for slot in SLOTS]
+        self.pops = np.zeros(len(self.all), dtype=np.int64)
+        self.pushes = []
+        self.halted = state["halted"].copy()
+        self.trapped = np.zeros(len(self.all), dtype=bool)
+
+    def signed(self, value):
+        value = np.asarray(value, dtype=np.int64) & self.WORDMASK
+        return value - ((value >> (self.WORDSIZE - 1)) << self.WORDSIZE)
+
+    def div(self, a, b):
+        safe = np.where(b == 0, 1, b)
+        quotient = np.abs(a) // np.abs(safe)
+        return np.where((a < 0) != (safe < 0), -quotient, quotient)
+
+    def rem(self, a, b):
+        return a - self.div(a, b) * np.where(b == 0, 1, b)
+
+    def sign_extend(self, value, bits):
+        value = np.asarray(value, dtype=np.int64) & ((1 << bits) - 1)
+        return value - ((value >> (bits - 1)) << bits)
+
+    def clz(self, value):
+        value = np.asarray(value, dtype=np.int64) & self.WORDMASK
+        bits = np.frexp(value.astype(np.float64))[1]
+        return self.WORDSIZE - np.where(value == 0, 0, bits)
+
+    def pop(self, slot, mask):
+        self.pops = np.maximum(self.pops, np.where(mask, slot + 1, 0))
+        return self.initial[slot]
+
+    def push(self, value, mask):
+        value = np.asarray(value, dtype=np.int64) & self.WORDMASK
+        self.pushes.append((np.broadcast_to(mask, self.all.shape), np.broadcast_to(value, self.all.shape)))
+
+    def set_slot(self, slot, value, mask):
+        self.cur[slot] = np.where(mask, np.asarray(value, dtype=np.int64) & self.WORDMASK, self.cur[slot])
+
+    def set_reg(self, name, value, mask):
+        self.reg[name] = np.where(mask, np.asarray(value, dtype=np.int64) & self.WORDMASK, self.reg[name])
+
+    def set_bit(self, bit, value, mask):
+        status = self.reg["status"]
+        updated = (status & ~(1 << bit)) | ((np.asarray(value, dtype=np.int64) & 1) << bit)
+        self.reg["status"] = np.where(mask, updated, status)
+
+    def halt(self, mask):
+        self.halted = np.where(mask, 1, self.halted)
+
+    def trap(self, mask):
+        self.trapped |= mask
+
+    def finish(self):
+        count = np.zeros(len(self.all), dtype=np.int64)
+        order = []
+        for mask, value in self.pushes:
+            order.append((mask, value, count.copy()))
+            count = count + mask
+        out = {}
+        for j in range(WINDOW):
+            # Below the pushed values are the remaining original slots
+            source = j - count + self.pops
+            slot = np.zeros(len(self.all), dtype=np.int64)
+            for k in range(WINDOW):
+                slot = np.where(source == k, self.cur[k], slot)
+            for mask, value, index in order:
+                slot = np.where(mask & (count - 1 - index == j), value, slot)
+            out[SLOTS[j]] = np.where(self.trapped, self.initial[j], slot)
+        depth = self.state["depth"] - self.pops + count
+        out["depth"] = np.where(self.trapped, self.state["depth"], depth)
+        out.update(self.reg)
+        out["halted"] = self.halted
+        out["imm"] = self.imm
+        return out
+
+
+# --- Cross-check against the scalar model --------------------------------
+
+def random_states(rng, count, wordsize, byte):
+    mask = (1 << wordsize) - 1
+    special = np.array([0, 1, 2, 0x7F, 0x80, mask >> 1, (mask >> 1) + 1, mask - 1, mask], dtype=np.int64)
+
+    def words():
+        values = rng.integers(0, mask + 1, count, dtype=np.int64)
+        pick = rng.random(count) < 0.3
+        return np.where(pick, rng.choice(special, count), values)
+
+    state = {name: words() for name in REGISTERS}
+    state["pc"] = rng.integers(0x1000, 0x8000, count, dtype=np.int64)
+    state["status"] = rng.integers(0, 8, count, dtype=np.int64) | 1     # kernel mode
+    for slot in SLOTS:
+        state[slot] = words()
+    state["depth"] = np.full(count, WINDOW, dtype=np.int64)
+    state["halted"] = np.zeros(count, dtype=np.int64)
+    # push and shi get a random immediate per lane
+    field = 0x7F if byte & 0x80 else 0x3F if byte & 0x40 else 0
+    state["imm"] = rng.integers(0, field + 1, count, dtype=np.int64)
+    return state
+
+
+def model_step(Cpu, state, i, byte, wordsize):
+    cpu = Cpu(wordsize=wordsize, native_ops=range(0x40))
+    cpu.status = int(state["status"][i])
+    for name in ["pc", "rx", "ry", "estatus", "epc", "ecause", "evec"]:
+        setattr(cpu, name, int(state[name][i]))
+    cpu.kfp = int(state["fp"][i])
+    for slot in reversed(SLOTS):
+        cpu.push(int(state[slot][i]))
+    cpu.mem[int(state["pc"][i])] = byte | int(state["imm"][i])
+    cpu.step()
+    result = {name: getattr(cpu, name) for name in ["pc", "rx", "ry", "status", "estatus", "epc", "ecause", "evec"]}
+    result["fp"] = cpu.fp if cpu.status & 1 else cpu.kfp
+    result["depth"] = cpu.depth
+    result["halted"] = int(cpu.halted)
+    for j, slot in enumerate(SLOTS):
+        result[slot] = cpu.peek(j) if j < cpu.depth else None
+    return result
+
+
+def check(module, wordsize, count, seed=1):
+    """Compare every compiled op with the model; returns mismatching op names."""
+    from starjette_model import OPCODES, Cpu
+    rng = np.random.default_rng(seed)
+    bad = []
+    for name, function in module.OPS.items():
+        byte = OPCODES.get(name, 0x40 if name == "push" else 0x80 if name == "shi" else None)
+        if byte is None:
+            print(f"{name:<10} no opcode in starjette_model")
+            continue
+        state = random_states(rng, count, wordsize, byte)
+        start = time.perf_counter()
+        out = function(state, wordsize)
+        rate = count / (time.perf_counter() - start)
+        mismatches = []
+        for i in range(count):
+            expected = model_step(Cpu, state, i, byte, wordsize)
+            for field, value in expected.items():
+                if value is not None and int(out[field][i]) != value:
+                    mismatches.append((i, field, int(out[field][i]), value))
+        note = f"{len(mismatches)} mismatches, e.g. lane {mismatches[0][0]} {mismatches[0][1]}: " \
+               f"spec {mismatches[0][2]:#x} model {mismatches[0][3]:#x}" if mismatches else "ok"
+        print(f"{name:<10} {rate:>14,.0f} lanes/s  {note}")
+        if mismatches:
+            bad.append(name)
+    for name, reason in module.SKIPPED.items():
+        print(f"{name:<10} not compiled: {reason}")
+    return bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--wordsize", type=int, choices=[16, 32], default=16)
+    parser.add_argument("--check", type=int, default=0, metavar="N", help="compare with the model on N states per op")
+    parser.add_argument("--show", metavar="OP", help="print the generated function for OP")
+    parser.add_argument("--rebuild", action="store_true", help="recompile even if the cache is current")
+    parser.add_argument("--manual", default=MANUAL, help="ISA manual to compile")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    module = load(args.manual, args.rebuild)
+    print(f"{len(module.OPS)} instructions compiled, {len(module.SKIPPED)} not compiled "
+          f"({time.perf_counter() - start:.2f}s, cache {os.path.relpath(CACHE_DIR)})")
+    if args.show:
+        import inspect
+        function = module.OPS.get(args.show)
+        print(inspect.getsource(function) if function else f"{args.show}: {module.SKIPPED.get(args.show, 'unknown')}")
+    if args.check:
+        return 1 if check(module, args.wordsize, args.check) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Branch prediction models replayed over reference model execution.
+
+Conditional branches are `push_pcrel label; beqz/bnez`, so the offset is in
+tos when the branch executes and the target is known at decode. Calls are
+`callp` (the return address goes to rx/ra) and returns are the
+`push ra; pop pc` idiom, which a return address stack can predict.
+
+Direction predictors:
+
+    not_taken       always falls through, the baseline for a pipeline with
+                    no predictor (see starjette_timing.py)
+    backward_taken  static: backward branches taken, forward not taken
+    bimodal         table of 2-bit counters indexed by pc
+    gshare          2-bit counters indexed by pc xor global history
+
+ReturnStack models a return address stack of a given depth for `pop pc`.
+"""
+
+from starjette_model import OPCODES, decode
+
+BEQZ = OPCODES["beqz"]
+BNEZ = OPCODES["bnez"]
+CALLP = OPCODES["callp"]
+POP_PC = OPCODES["pop pc"]
+
+
+class Predictor:
+    """Counts predictions and mispredictions; subclasses decide direction."""
+
+    name = "predictor"
+
+    def __init__(self):
+        self.predictions = 0
+        self.misses = 0
+
+    def predict(self, pc, backward):
+        raise NotImplementedError
+
+    def update(self, pc, taken):
+        pass
+
+    def branch(self, pc, backward, taken):
+        """Predict then train on one conditional branch. Returns True on a miss."""
+        miss = self.predict(pc, backward) != taken
+        self.predictions += 1
+        self.misses += miss
+        self.update(pc, taken)
+        return miss
+
+    @property
+    def miss_rate(self):
+        return self.misses / self.predictions if self.predictions else 0.0
+
+
+class NotTaken(Predictor):
+    name = "not_taken"
+
+    def predict(self, pc, backward):
+        return False
+
+
+class BackwardTaken(Predictor):
+    name = "backward_taken"
+
+    def predict(self, pc, backward):
+        return backward
+
+
+class Bimodal(Predictor):
+    """2-bit saturating counters, initialised weakly not taken."""
+
+    def __init__(self, entries=256):
+        super().__init__()
+        if entries & (entries - 1):
+            raise ValueError("entries must be a power of two")
+        self.name = f"bimodal{entries}"
+        self.mask = entries - 1
+        self.counters = [1] * entries
+
+    def _index(self, pc):
+        return pc & self.mask
+
+    def predict(self, pc, backward):
+        return self.counters[self._index(pc)] >= 2
+
+    def update(self, pc, taken):
+        i = self._index(pc)
+        if taken:
+            self.counters[i] = min(self.counters[i] + 1, 3)
+        else:
+            self.counters[i] = max(self.counters[i] - 1, 0)
+
+
+class Gshare(Bimodal):
+    """Bimodal counters indexed by pc xor the last history_bits outcomes."""
+
+    def __init__(self, entries=256, history_bits=8):
+        super().__init__(entries)
+        self.name = f"gshare{entries}h{history_bits}"
+        self.history_mask = (1 << history_bits) - 1
+        self.history = 0
+
+    def _index(self, pc):
+        return (pc ^ self.history) & self.mask
+
+    def update(self, pc, taken):
+        super().update(pc, taken)
+        self.history = ((self.history << 1) | taken) & self.history_mask
+
+
+class ReturnStack:
+    """Circular return address stack; the oldest entry is lost on overflow."""
+
+    def __init__(self, depth=8):
+        self.name = f"ras{depth}"
+        self.depth = depth
+        self.entries = [None] * depth
+        self.top = 0
+        self.count = 0
+        self.predictions = 0
+        self.misses = 0
+
+    def call(self, return_pc):
+        self.entries[self.top] = return_pc
+        self.top = (self.top + 1) % self.depth
+        self.count = min(self.count + 1, self.depth)
+
+    def ret(self, target):
+        """Predict and pop for one `pop pc`. Returns True on a miss."""
+        if self.count:
+            self.top = (self.top - 1) % self.depth
+            self.count -= 1
+            predicted = self.entries[self.top]
+        else:
+            predicted = None
+        miss = predicted != target
+        self.predictions += 1
+        self.misses += miss
+        return miss
+
+    @property
+    def miss_rate(self):
+        return self.misses / self.predictions if self.predictions else 0.0
+
+
+PREDICTORS = {
+    "not_taken": NotTaken,
+    "backward_taken": BackwardTaken,
+    "bimodal64": lambda: Bimodal(64),
+    "bimodal256": lambda: Bimodal(256),
+    "gshare256": lambda: Gshare(256, 8),
+    "gshare1024": lambda: Gshare(1024, 10),
+}
+
+RETURN_STACK_DEPTHS = [2, 4, 8, 16]
+
+
+def trace_branches(cpu, max_cycles):
+    """
+    Run cpu until it halts or executes max_cycles instructions, yielding
+    ("branch", pc, backward, taken), ("call", pc, return_pc) and
+    ("return", pc, target) events. Instructions that trapped are skipped.
+    """
+    if cpu.trap_log is None:
+        cpu.trap_log = []
+    log = cpu.trap_log
+    mask = cpu.mask
+    sign = cpu.sign
+    start = cpu.cycles
+    step = cpu.step
+    while not cpu.halted and cpu.cycles - start < max_cycles:
+        pc = cpu.pc
+        offset = cpu.peek() if cpu.depth else 0
+        logged = len(log)
+        op = decode(step())
+        if len(log) != logged and log[-1][0] == "enter":
+            continue
+        next_pc = cpu.pc
+        if op == BEQZ or op == BNEZ:
+            yield "branch", pc, bool(offset & sign), next_pc != (pc + 1) & mask
+        elif op == CALLP:
+            yield "call", pc, (pc + 1) & mask
+        elif op == POP_PC:
+            yield "return", pc, next_pc
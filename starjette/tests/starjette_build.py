@@ -0,0 +1,230 @@
+"""
+Content-addressed build driver for the assembled test and example artifacts.
+
+Builds the same .bin, .hex and _listing.txt files as the Makefile rules, but
+keys each output on a hash of what customasm actually reads: the customasm
+version, the output format and the bytes of every input (cpudef.asm, the
+kernel, the source and anything they #include). Outputs are kept in a local
+cache directory; a hit is restored by hardlink (copy across filesystems)
+without running customasm, so a branch switch or clean checkout rebuilds
+only what really changed. Misses are assembled through a parallel job pool.
+
+The cache is trimmed to --max-size, least recently used first (hits refresh
+an object's mtime). Cached objects are read-only so that a tool rewriting an
+output in place cannot corrupt them through the hardlink; the driver always
+unlinks an output before restoring it.
+
+Generated suites are not regenerated here; run their generators (or make)
+first.
+
+Usage (from starjette/): python tests/starjette_build.py [-j N] [--cache DIR] [--max-size MB] [--stats] [SRC.asm ...]
+With no sources it builds everything `make all`, the suite targets and
+`make w32` build.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ISA = "customasm/cpudef.asm"
+KERNEL = "customasm/test_shim.asm"
+KERNEL32 = "customasm/test_shim32.asm"
+CUSTOMASM = os.environ.get("CUSTOMASM", "customasm")
+
+DEFAULT_CACHE = ".build_cache"
+DEFAULT_MAX_MB = 256
+
+# (suffix, customasm format), as in the Makefile
+FORMATS = [
+    (".bin", "binary"),
+    (".hex", "intelhex,addr_unit:8"),
+    ("_listing.txt", "annotated,base:16,group:2,addr_base:16,labels:true"),
+]
+
+SUITES = ["exceptions", "interrupts", "uart", "context_switch", "dags", "decode", "smc", "encoding", "depths"]
+
+INCLUDE = re.compile(rb'^\s*#include\s+"([^"]+)"', re.M)
+
+
+def inputs_for(source):
+    """customasm inputs for a source, in command line order, as the Makefile builds it."""
+    parts = os.path.normpath(source).split(os.sep)
+    if parts[0] == "examples":
+        return [source]
+    if parts[:2] == ["tests", "bootstrap"]:
+        return [ISA, source]
+    if parts[:2] == ["tests", "w32"]:
+        return [ISA, KERNEL32, source]
+    return [ISA, KERNEL, source]
+
+
+def default_sources():
+    sources = sorted(glob.glob("tests/bootstrap/*.asm")) + sorted(glob.glob("tests/*.asm"))
+    for suite in SUITES:
+        sources += sorted(glob.glob(f"tests/{suite}/*.asm"))
+    sources += sorted(glob.glob("tests/w32/*.asm")) + sorted(glob.glob("tests/w32/*/*.asm"))
+    return sources + sorted(glob.glob("examples/*.asm"))
+
+
+def customasm_version():
+    try:
+        result = subprocess.run([CUSTOMASM, "--version"], capture_output=True, check=False)
+    except FileNotFoundError:
+        sys.exit(f"{CUSTOMASM} not found (set CUSTOMASM to its path)")
+    return result.stdout + result.stderr
+
+
+def hash_inputs(paths, base):
+    """Hash of the input files and everything they #include, in read order."""
+    digest = hashlib.sha256(base)
+    seen = set()
+
+    def add(path):
+        path = os.path.normpath(path)
+        if path in seen:
+            return
+        seen.add(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        digest.update(b"%d:" % len(data) + data)
+        for name in INCLUDE.findall(data):
+            add(os.path.join(os.path.dirname(path), name.decode()))
+
+    for path in paths:
+        digest.update(b"\0input\0")
+        add(path)
+    return digest
+
+
+class Cache:
+    """Directory of read-only objects named by key, evicted by mtime."""
+
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def restore(self, key, out):
+        """Link the cached object for key to out. False on a miss."""
+        obj = self.path(key)
+        if not os.path.exists(obj):
+            return False
+        os.utime(obj)
+        place(obj, out)
+        return True
+
+    def store(self, key, built):
+        """Move a freshly built file into the cache; returns the object path."""
+        obj = self.path(key)
+        os.makedirs(os.path.dirname(obj), exist_ok=True)
+        os.chmod(built, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(built, obj)
+        return obj
+
+    def objects(self):
+        for path in glob.glob(os.path.join(self.root, "??", "*")):
+            if not path.endswith(".tmp"):
+                yield path, os.stat(path)
+
+    def trim(self):
+        """Evict least recently used objects until the cache fits. Returns the count removed."""
+        objects = sorted(self.objects(), key=lambda item: item[1].st_mtime)
+        total = sum(st.st_size for _, st in objects)
+        removed = 0
+        for path, st in objects:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= st.st_size
+            removed += 1
+        return removed
+
+
+def place(obj, out):
+    """Replace out with a hardlink to obj, or a copy when linking is not possible."""
+    if os.path.lexists(out):
+        os.remove(out)
+    try:
+        os.link(obj, out)
+    except OSError:
+        shutil.copyfile(obj, out)
+        os.chmod(out, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+
+
+def assemble(cache, key, fmt, inputs, out):
+    """Run customasm into the cache, then link the result to out."""
+    os.makedirs(os.path.join(cache.root, key[:2]), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.join(cache.root, key[:2]))
+    os.close(fd)
+    try:
+        result = subprocess.run([CUSTOMASM, "-q", "-f", fmt, "-o", tmp] + inputs,
+                                capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            return f"{out}: customasm failed\n{result.stderr.strip()}"
+        place(cache.store(key, tmp), out)
+        return None
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sources", nargs="*", help=".asm sources (default all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="parallel customasm runs")
+    parser.add_argument("--cache", default=os.environ.get("STARJETTE_CACHE", DEFAULT_CACHE),
+                        help=f"cache directory (default $STARJETTE_CACHE or {DEFAULT_CACHE})")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_MB, metavar="MB",
+                        help=f"cache size limit (default {DEFAULT_MAX_MB})")
+    parser.add_argument("--stats", action="store_true", help="print hit/miss counts and timing")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cache = Cache(args.cache, args.max_size << 20)
+    version = customasm_version()
+    jobs = []
+    for source in args.sources or default_sources():
+        inputs = inputs_for(source)
+        digest = hash_inputs(inputs, version)
+        stem = source[:-len(".asm")]
+        for suffix, fmt in FORMATS:
+            key = digest.copy()
+            key.update(b"\0format\0" + fmt.encode())
+            key = key.hexdigest()
+            out = stem + suffix
+            if cache.restore(key, out):
+                cache.hits += 1
+            else:
+                cache.misses += 1
+                jobs.append((key, fmt, inputs, out))
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for error in pool.map(lambda job: assemble(cache, *job), jobs):
+            if error:
+                errors.append(error)
+    evicted = cache.trim()
+
+    for error in errors:
+        print(error, file=sys.stderr)
+    if args.stats:
+        print(f"{cache.hits} cached, {cache.misses} assembled ({len(errors)} failed), "
+              f"{evicted} evicted, {time.perf_counter() - start:.2f}s")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
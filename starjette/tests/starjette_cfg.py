@@ -0,0 +1,548 @@
+"""
+Static control flow graph and loop analysis for ROM images.
+
+Code is discovered by recursive descent from the reset vector, the macro
+instruction vectors and any exception handler installed with
+`li evec, label`. Within a run of straight line code a small value set
+analysis tracks what is on the data stack, which resolves:
+
+    push_pcrel + beqz/bnez/add pc   branches and jumps
+    push_pcrel + rel pc; callp      calls (callp starts a new function)
+    push imm; pop pc                absolute jumps
+    push ecause; and 0xF0; add pc   jump tables, including the other
+                                    ecause dispatch forms in manual 2.6
+
+`pop pc` with an unknown value is treated as a return, and `add pc` with an
+unknown value as an unresolved indirect jump.
+
+Natural loops are found per function from dominators. Every loop is assumed
+to iterate --trip times and a function's frequency is the sum over its call
+sites, so the estimated cycles per loop (static cycles per iteration from a
+starjette_timing.py preset) point at the hot loops without running anything.
+
+Usage (from starjette/): python tests/starjette_cfg.py ROM.bin [--listing FILE] [--top N] [--trip N]
+                             [--pipeline NAME] [--dot FILE]
+       python tests/starjette_cfg.py --check
+The listing defaults to ROM_listing.txt next to the ROM when it exists.
+--check compares the tracked stack effects with starjette_model.py and runs
+a few small hand-made images through the discovery.
+"""
+
+import argparse
+import os
+import sys
+
+import starjette_model
+from starjette_disasm import CODE_END, DECODE
+from starjette_listing import read_symbols
+from starjette_model import CSRS, MACRO_VECTOR_BASE, OPCODES, OPCODE_NAMES
+from starjette_timing import MEMORY_OPS, PIPELINES, Pipeline
+
+MASK = 0xFFFF
+
+# Largest value set tracked before giving up on a stack slot
+MAX_VALUES = 256
+
+ECAUSES = frozenset(
+    [value for name, value in vars(starjette_model).items() if name.startswith("ECAUSE_")]
+    + [starjette_model.ECAUSE_INTERRUPT | irq for irq in range(16)]
+)
+
+# (pops, pushes) for the instructions whose results are not tracked
+STACK_EFFECTS = {
+    "halt": (0, 0), "rets": (0, 0), "syscall": (0, 0), "fsl": (3, 1),
+    "lw": (1, 1), "sw": (2, 0), "lb": (1, 1), "sb": (2, 0), "lh": (1, 1),
+    "sh": (2, 0), "lnw": (0, 1), "snw": (1, 0), "clz": (1, 1), "ltu": (2, 1),
+    "lt": (2, 1), "div": (2, 2), "divu": (2, 2), "sra": (2, 1),
+    "pop fp": (1, 0), "pop rx": (1, 0), "pop ry": (1, 0),
+    "add fp": (1, 0), "add rx": (1, 0), "add ry": (1, 0),
+    "rel fp": (1, 1), "rel rx": (1, 1), "rel ry": (1, 1),
+}
+
+BINARY = {
+    "add": lambda a, b: a + b,
+    "and": lambda a, b: a & b,
+    "xor": lambda a, b: a ^ b,
+    "or": lambda a, b: a | b,
+    "sub": lambda a, b: a - b,
+    "sll": lambda a, b: a << (b & 0xF),
+    "srl": lambda a, b: a >> (b & 0xF),
+}
+
+
+class Instruction:
+    __slots__ = ("addr", "byte", "succs", "calls")
+
+    def __init__(self, addr, byte):
+        self.addr = addr
+        self.byte = byte
+        # [(target, kind)]: kind is "fall", "branch", "jump" or "table"
+        self.succs = []
+        self.calls = []
+
+
+class Block:
+    def __init__(self, addr):
+        self.addr = addr
+        self.instructions = []
+        self.succs = []
+        self.preds = []
+        self.calls = []
+        self.depth = 0
+        self.freq = 0.0
+
+
+class Loop:
+    def __init__(self, function, header, body):
+        self.function = function
+        self.header = header
+        self.body = body
+        self.depth = 0
+
+
+def binary(op, a, b):
+    if a is None or b is None or len(a) * len(b) > MAX_VALUES:
+        return None
+    return frozenset(op(x, y) & MASK for x in a for y in b)
+
+
+class Cfg:
+    """Instructions, blocks, functions and loops of one ROM image."""
+
+    def __init__(self, buf, symbols=None):
+        self.buf = buf
+        self.end = min(len(buf), CODE_END)
+        self.symbols = symbols or {}
+        self.instructions = {}
+        self.functions = {}     # entry -> kind ("reset", "vector", "handler", "call")
+        self.unresolved = []    # addresses of indirect jumps and calls
+        self.blocks = {}
+        self.function_blocks = {}
+        self.loops = []
+        self._discover()
+        self._build_blocks()
+        self._find_loops()
+
+    # --- Discovery -----------------------------------------------------
+
+    def _roots(self):
+        yield 0, "reset"
+        for op in range(0x20, 0x40):
+            addr = MACRO_VECTOR_BASE + (op & 0x1F) * 8
+            if addr + 8 <= self.end and any(self.buf[addr:addr + 8]):
+                yield addr, "vector"
+
+    def _discover(self):
+        work = []
+        for addr, kind in self._roots():
+            self.functions.setdefault(addr, kind)
+            work.append(addr)
+        while work:
+            addr = work.pop()
+            stack = []
+            while 0 <= addr < self.end and addr not in self.instructions:
+                ins, done = self._execute(addr, stack)
+                self.instructions[addr] = ins
+                for target, kind in ins.succs:
+                    if kind != "fall":
+                        work.append(target)
+                for target, kind in ins.calls:
+                    self.functions.setdefault(target, kind)
+                    work.append(target)
+                if done:
+                    break
+                addr += 1
+
+    def _target(self, value):
+        return value & MASK if 0 <= value & MASK < self.end else None
+
+    def _execute(self, addr, stack):
+        """Decode one instruction and update the abstract stack. Returns (ins, ends run)."""
+        byte = self.buf[addr]
+        ins = Instruction(addr, byte)
+        next_pc = addr + 1
+        kind, value, _ = DECODE[byte]
+
+        def pop():
+            return stack.pop() if stack else None
+
+        if kind == "push":
+            stack.append(frozenset([value & MASK]))
+        elif kind == "shi":
+            top = pop()
+            stack.append(None if top is None else frozenset(((v << 7) | value) & MASK for v in top))
+        elif kind == "data":
+            return ins, True
+        else:
+            name = OPCODE_NAMES[byte]
+            if name in ("halt", "rets"):
+                return ins, True
+            if name in ("beqz", "bnez"):
+                offset = pop()
+                pop()
+                if offset is not None and len(offset) == 1:
+                    target = self._target(next_pc + next(iter(offset)))
+                    if target is not None:
+                        ins.succs.append((target, "branch"))
+                stack.clear()
+            elif name == "add pc":
+                offset = pop()
+                targets = [] if offset is None else sorted(
+                    t for t in (self._target(next_pc + v) for v in offset) if t is not None)
+                if not targets:
+                    self.unresolved.append(addr)
+                kind = "jump" if len(targets) == 1 else "table"
+                ins.succs.extend((target, kind) for target in targets)
+                return ins, True
+            elif name == "pop pc":
+                value = pop()
+                if value is not None:
+                    ins.succs.extend((t, "jump") for t in sorted(value) if self._target(t) is not None)
+                return ins, True
+            elif name == "callp":
+                value = pop()
+                if value is None:
+                    self.unresolved.append(addr)
+                else:
+                    ins.calls.extend((t, "call") for t in sorted(value) if self._target(t) is not None)
+                stack.clear()
+            elif name == "rel pc":
+                top = pop()
+                stack.append(None if top is None else frozenset((v + next_pc) & MASK for v in top))
+            elif name == "pushcsr":
+                index = pop()
+                stack.append(ECAUSES if index == frozenset([CSRS["ecause"]]) else None)
+            elif name == "popcsr":
+                index = pop()
+                value = pop()
+                if index == frozenset([CSRS["evec"]]) and value is not None:
+                    ins.calls.extend((t, "handler") for t in sorted(value) if self._target(t) is not None)
+            elif name == "dup":
+                top = pop()
+                stack.extend([top, top])
+            elif name == "drop":
+                pop()
+            elif name == "swap":
+                a, b = pop(), pop()
+                stack.extend([a, b])
+            elif name == "over":
+                a, b = pop(), pop()
+                stack.extend([b, a, b])
+            elif name == "rot":
+                a, b, c = pop(), pop(), pop()
+                stack.extend([a, c, b])
+            elif name == "mul":
+                b, a = pop(), pop()
+                stack.append(binary(lambda x, y: x * y, a, b))
+                stack.append(binary(lambda x, y: x * y >> 16, a, b))
+            elif name in BINARY:
+                b, a = pop(), pop()
+                stack.append(binary(BINARY[name], a, b))
+            else:
+                pops, pushes = STACK_EFFECTS[name]
+                for _ in range(pops):
+                    pop()
+                stack.extend([None] * pushes)
+
+        if next_pc < self.end:
+            ins.succs.append((next_pc, "fall"))
+        return ins, False
+
+    # --- Blocks, functions and loops -----------------------------------
+
+    def _build_blocks(self):
+        instructions = self.instructions
+        leaders = set(self.functions)
+        for ins in instructions.values():
+            if ins.calls or any(kind != "fall" for _, kind in ins.succs):
+                leaders.update(target for target, _ in ins.succs)
+        leaders &= set(instructions)
+
+        for leader in sorted(leaders):
+            block = Block(leader)
+            addr = leader
+            while True:
+                ins = instructions[addr]
+                block.instructions.append(ins)
+                block.calls.extend(target for target, _ in ins.calls)
+                falls = [t for t, kind in ins.succs if kind == "fall"]
+                if ins.calls or len(ins.succs) != len(falls) or not falls or falls[0] in leaders:
+                    block.succs = [t for t, _ in ins.succs if t in instructions]
+                    break
+                addr = falls[0]
+            self.blocks[leader] = block
+        for block in self.blocks.values():
+            for succ in block.succs:
+                self.blocks[succ].preds.append(block.addr)
+
+        for entry in self.functions:
+            if entry not in self.blocks:
+                continue
+            seen = {entry}
+            order = [entry]
+            for addr in order:
+                for succ in self.blocks[addr].succs:
+                    if succ not in seen:
+                        seen.add(succ)
+                        order.append(succ)
+            self.function_blocks[entry] = order
+
+    def _dominators(self, blocks):
+        entry = blocks[0]
+        members = set(blocks)
+        dom = {b: set(blocks) for b in blocks}
+        dom[entry] = {entry}
+        changed = True
+        while changed:
+            changed = False
+            for b in blocks[1:]:
+                preds = [p for p in self.blocks[b].preds if p in members]
+                new = set.intersection(*(dom[p] for p in preds)) if preds else set()
+                new = new | {b}
+                if new != dom[b]:
+                    dom[b] = new
+                    changed = True
+        return dom
+
+    def _find_loops(self):
+        for entry, blocks in self.function_blocks.items():
+            dom = self._dominators(blocks)
+            members = set(blocks)
+            bodies = {}
+            for b in blocks:
+                for succ in self.blocks[b].succs:
+                    if succ in members and succ in dom[b]:
+                        body = bodies.setdefault(succ, {succ})
+                        work = [b]
+                        while work:
+                            node = work.pop()
+                            if node not in body:
+                                body.add(node)
+                                work.extend(p for p in self.blocks[node].preds if p in members)
+            loops = [Loop(entry, header, body) for header, body in bodies.items()]
+            for loop in loops:
+                loop.depth = sum(1 for other in loops if loop.header in other.body)
+            self.loops.extend(loops)
+
+    # --- Static cost estimate ------------------------------------------
+
+    def estimate(self, trip, pipeline):
+        """Block frequencies assuming trip iterations per loop; returns cycles per block."""
+        depth = {}
+        for loop in self.loops:
+            for addr in loop.body:
+                depth[(loop.function, addr)] = depth.get((loop.function, addr), 0) + 1
+
+        # Function frequency: roots run once, callees once per call site execution
+        freq = {entry: 0.0 for entry in self.function_blocks}
+        for entry, kind in self.functions.items():
+            if kind != "call" and entry in freq:
+                freq[entry] = 1.0
+        for entry in self._call_order():
+            for addr in self.function_blocks[entry]:
+                block_freq = freq[entry] * trip ** depth.get((entry, addr), 0)
+                for callee in self.blocks[addr].calls:
+                    if callee in freq and callee != entry:
+                        freq[callee] += block_freq
+
+        cost = {}
+        for entry, blocks in self.function_blocks.items():
+            for addr in blocks:
+                block = self.blocks[addr]
+                block.depth = max(block.depth, depth.get((entry, addr), 0))
+                block.freq += freq[entry] * trip ** depth.get((entry, addr), 0)
+        for addr, block in self.blocks.items():
+            cost[addr] = block.freq * self.block_cycles(block, pipeline)
+        return cost
+
+    def block_cycles(self, block, pipeline):
+        """Cycles for one pass through a block, taken branch included."""
+        port = (1 if pipeline.shared_port else 0) + pipeline.mem_latency
+        cycles = 0
+        for ins in block.instructions:
+            cycles += 1
+            if ins.byte < 0x40 and ins.byte in MEMORY_OPS:
+                cycles += port
+        last = block.instructions[-1]
+        if any(kind != "fall" for _, kind in last.succs) or last.calls:
+            cycles += pipeline.branch_penalty
+        return cycles
+
+    def _call_order(self):
+        """Functions callers first, ignoring recursive back edges."""
+        order = []
+        state = {}
+
+        def visit(entry):
+            state[entry] = "open"
+            for addr in self.function_blocks[entry]:
+                for callee in self.blocks[addr].calls:
+                    if callee in self.function_blocks and callee not in state:
+                        visit(callee)
+            state[entry] = "done"
+            order.append(entry)
+
+        for entry in self.function_blocks:
+            if entry not in state:
+                visit(entry)
+        return order[::-1]
+
+    # --- Naming and output ---------------------------------------------
+
+    def name(self, addr):
+        if addr in self.symbols:
+            return self.symbols[addr]
+        return f"sub_{addr:04x}" if addr in self.functions else f"L_{addr:04x}"
+
+    def write_dot(self, out):
+        out.write("digraph cfg {\n  node [shape=box fontname=monospace];\n")
+        for addr, block in sorted(self.blocks.items()):
+            out.write(f'  b{addr:x} [label="{self.name(addr)}\\n{addr:04x}: '
+                      f'{len(block.instructions)} instrs"];\n')
+            for succ in block.succs:
+                out.write(f"  b{addr:x} -> b{succ:x};\n")
+            for callee in block.calls:
+                if callee in self.blocks:
+                    out.write(f"  b{addr:x} -> b{callee:x} [style=dashed];\n")
+        out.write("}\n")
+
+
+# --- Self check ----------------------------------------------------------
+
+# Ops whose abstract stack effect --check compares with the model
+CHECKED_OPS = ["dup", "drop", "swap", "over", "rot", "mul", "div", "divu",
+               "clz", "ltu", "lt", "sra", "fsl"] + list(BINARY)
+
+# Concrete stacks, bottom first; no zero divisors
+CHECK_STACKS = [
+    [0x1234, 0x8765, 7, 3],
+    [0xFFFF, 0x8000, 0xFFF9, 0x0003],
+    [0x00A0, 0x0005, 0x7FFF, 0xFFFE],
+]
+
+
+def image(*items):
+    """Op names and 6-bit push constants as bytes, padded with halt."""
+    code = bytes(0x40 | (item & 0x3F) if isinstance(item, int) else OPCODES[item] for item in items)
+    return code + bytes(0x20 - len(code))
+
+
+# (what, image, address of its pop pc, expected jump target)
+CHECK_JUMPS = [
+    ("rot", image(0x10, 1, 2, "rot", "drop", "drop", "pop pc"), 6, 2),
+    ("mul low", image(3, 5, "mul", "drop", "pop pc"), 4, 15),
+    ("mul high", image(-1, 4, "mul", "pop pc"), 3, 3),
+    ("div", image(3, 7, 2, "div", "drop", "drop", "pop pc"), 6, 3),
+    ("divu", image(3, 7, 2, "divu", "drop", "drop", "pop pc"), 6, 3),
+]
+
+
+def check():
+    """Compare the value set tracking with starjette_model.py; returns what failed."""
+    bad = []
+    for name in CHECKED_OPS:
+        byte = OPCODES[name]
+        mismatches = []
+        for values in CHECK_STACKS:
+            cpu = starjette_model.Cpu(native_ops=range(0x40))
+            for value in values:
+                cpu.push(value)
+            cpu.pc = 0x1000
+            cpu.mem[cpu.pc] = byte
+            cpu.step()
+            expected = [cpu.peek(i) for i in reversed(range(cpu.depth))]
+            stack = [frozenset([value]) for value in values]
+            Cfg(bytes([byte]))._execute(0, stack)
+            if len(stack) != len(expected) or any(
+                    tracked is not None and tracked != frozenset([value])
+                    for tracked, value in zip(stack, expected)):
+                mismatches.append((values, stack, expected))
+        if mismatches:
+            values, stack, expected = mismatches[0]
+            tracked = [None if t is None else f"{next(iter(t)):#x}" for t in stack]
+            print(f"{name:<10} {len(mismatches)} mismatches, e.g. {[hex(v) for v in values]}: "
+                  f"cfg {tracked} model {[hex(v) for v in expected]}")
+            bad.append(name)
+        else:
+            print(f"{name:<10} ok")
+
+    for what, buf, addr, target in CHECK_JUMPS:
+        succs = Cfg(buf).instructions[addr].succs
+        ok = succs == [(target, "jump")]
+        print(f"{what:<10} {'ok' if ok else f'FAIL: pop pc goes to {succs}, not {target:#x}'}")
+        if not ok:
+            bad.append(what)
+
+    buf = bytearray(MACRO_VECTOR_BASE + 0x100)
+    vectors = [MACRO_VECTOR_BASE + i * 8 for i in range(0x20)]
+    for addr in vectors:
+        buf[addr] = OPCODES["rets"]
+    found = [addr for addr in vectors if Cfg(bytes(buf)).functions.get(addr) == "vector"]
+    ok = found == vectors
+    print(f"{'vectors':<10} {'ok' if ok else f'FAIL: {len(found)} of {len(vectors)} macro vectors found'}")
+    if not ok:
+        bad.append("vectors")
+    return bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("rom", nargs="?", help="binary image (.bin)")
+    parser.add_argument("--listing", help="customasm annotated listing for symbol names")
+    parser.add_argument("--top", type=int, default=10, help="number of loops to show")
+    parser.add_argument("--trip", type=float, default=10, help="assumed iterations per loop")
+    parser.add_argument("--pipeline", default="3stage", choices=sorted(PIPELINES),
+                        help="starjette_timing.py preset for the cycle estimate")
+    parser.add_argument("--dot", help="write the CFG as Graphviz to this file")
+    parser.add_argument("--check", action="store_true", help="check the stack tracking against the model")
+    args = parser.parse_args()
+
+    if args.check:
+        return 1 if check() else 0
+    if not args.rom:
+        parser.error("a ROM is required unless --check is given")
+
+    listing = args.listing or os.path.splitext(args.rom)[0] + "_listing.txt"
+    symbols = read_symbols(listing) if os.path.exists(listing) else {}
+    with open(args.rom, "rb") as f:
+        buf = f.read()
+    cfg = Cfg(buf, symbols)
+    pipeline = Pipeline(args.pipeline, **PIPELINES[args.pipeline])
+
+    tables = sum(1 for ins in cfg.instructions.values() if any(kind == "table" for _, kind in ins.succs))
+    print(f"{args.rom}: {len(cfg.instructions)} instructions, {len(cfg.blocks)} blocks, "
+          f"{len(cfg.function_blocks)} functions, {len(cfg.loops)} loops, {tables} jump tables, "
+          f"{len(cfg.unresolved)} unresolved indirect jumps/calls")
+
+    cost = cfg.estimate(args.trip, pipeline)
+    total = sum(cost.values()) or 1.0
+
+    print(f"\nfunctions (estimated cycles, {args.trip:g} iterations per loop, {pipeline.name}):")
+    for entry, blocks in sorted(cfg.function_blocks.items(), key=lambda item: -sum(cost[b] for b in item[1])):
+        instrs = sum(len(cfg.blocks[b].instructions) for b in blocks)
+        cycles = sum(cost[b] for b in blocks if entry == b or b not in cfg.functions)
+        print(f"    {entry:04x} {cfg.name(entry):<24} {cfg.functions[entry]:<8} "
+              f"{len(blocks):4d} blocks {instrs:5d} instrs  {cycles:12.0f} {cycles / total:6.1%}")
+
+    print("\nhot loops:")
+    print(f"    {'header':<30} {'function':<20} {'depth':>5} {'instrs':>6} {'cyc/iter':>8} {'est cycles':>12} {'share':>6}")
+    loops = []
+    for loop in cfg.loops:
+        instrs = sum(len(cfg.blocks[b].instructions) for b in loop.body)
+        per_iter = sum(cfg.block_cycles(cfg.blocks[b], pipeline) for b in loop.body)
+        est = sum(cost[b] for b in loop.body)
+        loops.append((est, loop, instrs, per_iter))
+    for est, loop, instrs, per_iter in sorted(loops, key=lambda item: -item[0])[:args.top]:
+        print(f"    {loop.header:04x} {cfg.name(loop.header):<25} {cfg.name(loop.function):<20} "
+              f"{loop.depth:>5} {instrs:>6} {per_iter:>8} {est:>12.0f} {est / total:>6.1%}")
+
+    if cfg.unresolved:
+        print("\nunresolved: " + " ".join(f"{addr:04x}" for addr in sorted(cfg.unresolved)))
+    if args.dot:
+        with open(args.dot, "w") as f:
+            cfg.write_dot(f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
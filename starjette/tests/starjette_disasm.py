@@ -0,0 +1,289 @@
+"""
+Disassembler for StarJette ROM images.
+
+Decoding is driven by a 256 entry table (DECODE). Pseudo-ops from
+customasm/cpudef.asm are folded back where the bytes are exactly what the
+assembler would emit for them:
+
+    push/shi chains           push imm (1-3 bytes, shortest encoding only)
+    push_pcrel + add pc       jump label
+    push_pcrel + beqz/bnez    beqz/bnez label
+    push_pcrel + rel pc; callp  call label
+    beqz $+4; push 0; halt    failnez (and faileqz for bnez)
+    push csr; pushcsr/popcsr  push/pop csr
+    push 0; rel reg           push reg
+    push imm; rel fp; lw/sw   llw/slw imm
+    push imm; pop reg         li reg, imm
+
+Branch targets that land on the start of a decoded line get an L_xxxx label;
+anything else stays as the raw push and branch, so the output re-assembles
+to the same bytes with
+
+    customasm -f binary -o out.bin customasm/cpudef.asm out.asm
+
+ROM images use the vector/code/data banks from cpudef.asm (data at file
+offset 0x10000). --flat ORG treats the whole file as code at ORG instead.
+The file is read through mmap in two streaming passes, so memory use does
+not grow with the image size beyond a one bit per byte boundary map.
+
+Usage (from starjette/): python tests/starjette_disasm.py ROM.bin [-o OUT.asm] [--flat ORG] [--no-fold]
+"""
+
+import argparse
+import mmap
+import sys
+
+from starjette_model import CSR_NAMES, OPCODE_NAMES, OPCODES, REGS, sign_extend
+
+# (kind, value, text) for every byte
+DECODE = []
+for _byte in range(256):
+    if _byte & 0x80:
+        DECODE.append(("shi", _byte & 0x7F, f"shi {_byte & 0x7F}"))
+    elif _byte & 0x40:
+        _value = sign_extend(_byte & 0x3F, 6)
+        DECODE.append(("push", _value, f"push {_value}"))
+    elif _byte in OPCODE_NAMES:
+        DECODE.append(("op", _byte, OPCODE_NAMES[_byte]))
+    else:
+        DECODE.append(("data", _byte, f"#d8 {_byte:#04x}"))
+
+BRANCHES = {OPCODES["beqz"]: "beqz", OPCODES["bnez"]: "bnez", OPCODES["add pc"]: "jump"}
+FAILS = {OPCODES["beqz"]: "failnez", OPCODES["bnez"]: "faileqz"}
+REL_PC = OPCODES["rel pc"]
+REL_FP = OPCODES["rel fp"]
+CALLP = OPCODES["callp"]
+LOCALS = {OPCODES["lw"]: "llw", OPCODES["sw"]: "slw"}
+LOADABLE = {OPCODES["pop fp"]: "fp", OPCODES["pop rx"]: "rx", OPCODES["pop ry"]: "ry"}
+CSR_OPS = {OPCODES["pushcsr"]: "push", OPCODES["popcsr"]: "pop"}
+
+VECTOR_END = 0x500
+CODE_END = 0x10000
+DATA_ADDR = 0x8000
+DATA_BYTES_PER_LINE = 16
+
+# Zero runs at least this long become #addr gaps
+ZERO_RUN = 16
+
+
+def fits(value, size):
+    """Whether a size byte push/shi chain can hold value."""
+    limit = 1 << (5 + 7 * (size - 1))
+    return -limit <= value < limit
+
+
+def assembler_value(value):
+    """cpudef.asm's reinterpretation of an immediate with bit 15 set."""
+    return value if (value & 0x8000) == 0 else -((~value & 0xFFFF) + 1)
+
+
+def push_ok(value, size):
+    """`push value` assembles to exactly size bytes."""
+    if assembler_value(value) != value or not fits(value, size):
+        return False
+    return not any(fits(value, shorter) for shorter in range(1, size))
+
+
+def pcrel_ok(value, size):
+    """`push_pcrel` assembles to size bytes with this encoded offset."""
+    if assembler_value(value) != value or not fits(value, size):
+        return False
+    # A shorter encoding sits closer to the label, so its offset is larger
+    return not any(fits(assembler_value(value + size - shorter), shorter) for shorter in range(1, size))
+
+
+def chain(buf, i, end):
+    """(size, value) of the push/shi chain starting at i, at most 3 bytes."""
+    value = DECODE[buf[i]][1]
+    size = 1
+    while size < 3 and i + size < end and buf[i + size] & 0x80:
+        value = (value << 7) | (buf[i + size] & 0x7F)
+        size += 1
+    return size, value
+
+
+def decode_groups(buf, start, end, fold=True, is_target=None, file_end=None):
+    """
+    Yield (addr, size, kind, args) for each line from start to end.
+
+    kind is one of "raw" (args: text), "push" (value), "pcrel" (text, target),
+    "text" (text) or "gap". is_target(addr) says whether a branch target can
+    be labelled; None accepts any address in the code banks (first pass).
+    """
+    file_end = end if file_end is None else file_end
+    i = start
+    while i < end:
+        byte = buf[i]
+        if byte == 0:
+            run = 1
+            while i + run < end and buf[i + run] == 0:
+                run += 1
+            if i + run == file_end:
+                run -= 1        # keep the last byte so the file length survives
+            if run >= ZERO_RUN:
+                if i + run == end and end != file_end:
+                    return      # the next bank starts at its own offset
+                yield i, run, "gap", None
+                i += run
+                continue
+
+        kind, value, text = DECODE[byte]
+        if not fold or kind != "push":
+            yield i, 1, "raw", text
+            i += 1
+            continue
+
+        size, value = chain(buf, i, end)
+        after = i + size
+        nxt = buf[after] if after < end else None
+        nxt2 = buf[after + 1] if after + 1 < end else None
+
+        if size == 1 and value == 2 and nxt in FAILS and after + 3 <= end \
+                and buf[after + 1] == 0x40 and buf[after + 2] == 0x00:
+            yield i, 4, "text", FAILS[nxt]
+            i += 4
+            continue
+
+        if nxt in BRANCHES or (nxt == REL_PC and nxt2 == CALLP):
+            target = after + 1 + value
+            length = size + (2 if nxt == REL_PC else 1)
+            valid = 0 <= target < CODE_END and target < file_end
+            if valid and pcrel_ok(value, size) and (is_target is None or is_target(target)):
+                name = "call" if nxt == REL_PC else BRANCHES[nxt]
+                yield i, length, "pcrel", (name, target)
+                i += length
+                continue
+
+        if size == 1 and value == 0 and nxt is not None and REL_PC <= nxt <= REL_PC + 3:
+            yield i, 2, "text", f"push {REGS[nxt & 3]}"
+            i += 2
+        elif size == 1 and value in CSR_NAMES and nxt in CSR_OPS:
+            yield i, 2, "text", f"{CSR_OPS[nxt]} {CSR_NAMES[value]}"
+            i += 2
+        elif not push_ok(value, size):
+            yield i, 1, "raw", DECODE[byte][2]
+            i += 1
+        elif nxt == REL_FP and nxt2 in LOCALS:
+            yield i, size + 2, "text", f"{LOCALS[nxt2]} {value}"
+            i += size + 2
+        elif nxt in LOADABLE:
+            yield i, size + 1, "text", f"li {LOADABLE[nxt]}, {value}"
+            i += size + 1
+        else:
+            yield i, size, "push", value
+            i += size
+
+
+class BoundaryMap:
+    """One bit per byte, set where a line starts."""
+
+    def __init__(self, size):
+        self.bits = bytearray((size + 7) // 8)
+
+    def add(self, addr):
+        self.bits[addr >> 3] |= 1 << (addr & 7)
+
+    def __contains__(self, addr):
+        return 0 <= addr < len(self.bits) * 8 and bool(self.bits[addr >> 3] & (1 << (addr & 7)))
+
+
+def label(addr):
+    return f"L_{addr:04x}"
+
+
+def code_regions(size, flat):
+    """(bank, start, end) of the code regions in an image of size bytes."""
+    if flat is not None:
+        return [("flat", 0, size)]
+    regions = [("vector", 0, min(size, VECTOR_END))]
+    if size > VECTOR_END:
+        regions.append(("code", VECTOR_END, min(size, CODE_END)))
+    return regions
+
+
+def write_data(out, buf, start, end):
+    """The data bank as #d8 lines, skipping long zero runs."""
+    i = start
+    while i < end:
+        run = 0
+        while i + run < end and buf[i + run] == 0:
+            run += 1
+        if run >= ZERO_RUN and i + run < end:
+            i += run
+            out.write(f"#addr {DATA_ADDR + i - CODE_END:#06x}\n")
+            continue
+        line = bytes(buf[i:min(i + DATA_BYTES_PER_LINE, end)])
+        out.write("#d8 " + ", ".join(f"{b:#04x}" for b in line)
+                  + f"  ; {DATA_ADDR + i - CODE_END:04x}\n")
+        i += len(line)
+
+
+def disassemble(buf, out, name="rom", flat=None, fold=True):
+    """Write re-assemblable source for the image in buf to out."""
+    size = len(buf)
+    regions = code_regions(size, flat)
+
+    # Pass 1: line starts and branch targets
+    starts = BoundaryMap(size)
+    targets = set()
+    for _, start, end in regions:
+        for addr, length, kind, args in decode_groups(buf, start, end, fold, file_end=size):
+            starts.add(addr)
+            if kind == "pcrel":
+                targets.add(args[1])
+    labels = {t for t in targets if t in starts}
+
+    out.write(f"; Disassembly of {name} ({size} bytes)\n")
+    out.write("; customasm -f binary -o out.bin customasm/cpudef.asm this.asm\n")
+    if flat is not None:
+        out.write(f"\n#bankdef flat\n{{\n  #bits 8\n  #addr {flat:#06x}\n  #size {size:#x}\n  #outp 0\n}}\n")
+
+    # Pass 2: emit, labelling only targets that start a line
+    for bank, start, end in regions:
+        out.write(f"\n#bank {bank}\n")
+        base = flat or 0
+        for addr, length, kind, args in decode_groups(buf, start, end, fold, labels.__contains__, size):
+            if addr in labels:
+                out.write(f"{label(addr)}:\n")
+            if kind == "gap":
+                out.write(f"#addr {base + addr + length:#06x}\n")
+                continue
+            if kind == "raw" or kind == "text":
+                text = args
+            elif kind == "push":
+                text = f"push {args}"
+            else:
+                text = f"{args[0]} {label(args[1])}"
+            raw = " ".join(f"{b:02x}" for b in buf[addr:addr + length])
+            out.write(f"    {text:<24} ; {base + addr:04x}: {raw}\n")
+
+    if flat is None and size > CODE_END:
+        out.write("\n#bank data\n")
+        write_data(out, buf, CODE_END, size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("rom", help="binary image (.bin)")
+    parser.add_argument("-o", "--output", help="output .asm file (default stdout)")
+    parser.add_argument("--flat", type=lambda s: int(s, 0), metavar="ORG",
+                        help="treat the whole file as code at address ORG")
+    parser.add_argument("--no-fold", action="store_true", help="one instruction per byte")
+    args = parser.parse_args()
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        with open(args.rom, "rb") as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                buf = b""       # empty file
+            disassemble(buf, out, args.rom, args.flat, not args.no_fold)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
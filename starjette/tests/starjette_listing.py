@@ -0,0 +1,52 @@
+"""
+Reader for customasm annotated listings (the tests/*_listing.txt files built
+by the Makefile with `-f annotated,base:16,group:2,addr_base:16,labels:true`).
+
+Each listing line has the form
+
+     outp:bit | addr | data ; source
+
+Label lines have no data. Local labels (`.loop`) are named after the
+preceding global label, as customasm does (`main.loop`).
+"""
+
+import re
+
+LINE = re.compile(r"^\s*([0-9a-fA-F]+):([0-7])\s*\|\s*([0-9a-fA-F]+)\s*\|\s*([0-9a-fA-F ]*?)\s*;\s?(.*)$")
+LABEL = re.compile(r"^\s*(\.?[A-Za-z_][\w.]*):")
+
+
+def read_listing(path):
+    """[(outp, addr, data, source)] with outp and addr in bytes."""
+    lines = []
+    with open(path) as f:
+        for text in f:
+            match = LINE.match(text)
+            if match is None:
+                continue
+            outp, _, addr, data, source = match.groups()
+            lines.append((int(outp, 16), int(addr, 16), bytes.fromhex(data), source.strip()))
+    return lines
+
+
+def read_symbols(path, program=True):
+    """
+    {addr: name} for the labels in a listing, first label wins.
+
+    program: only labels in banks emitted at their own address (vector and
+    code), i.e. the ones a pc can point at; otherwise data labels only.
+    """
+    symbols = {}
+    parent = ""
+    for outp, addr, _, source in read_listing(path):
+        match = LABEL.match(source)
+        if match is None:
+            continue
+        name = match.group(1)
+        if name.startswith("."):
+            name = parent + name
+        else:
+            parent = name
+        if (outp == addr) == program:
+            symbols.setdefault(addr, name)
+    return symbols
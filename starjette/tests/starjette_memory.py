@@ -0,0 +1,293 @@
+"""
+Memory hierarchy model driven by reference model execution.
+
+Every instruction fetch and data access the reference model makes is passed
+through a Hierarchy:
+
+    FetchBuffer     lines of `width` aligned bytes holding the byte wide
+                    instruction stream, refilled from SDRAM on a miss
+    Cache           set associative, write back and write allocate; by
+                    default it only sees the fp relative `llw`/`slw` traffic
+                    (`rel fp` followed by `lw`/`sw`), as suggested in section 1
+                    of the manual, or all data accesses with scope="data"
+    Sdram           per bank open row state with the timings from
+                    docs/sdram_wavedrom.json: tRCD 2, CAS 2, tRP 2, tRC 8 and
+                    tWR 2 cycles, and 2 beats of the 16 bit bus per word
+
+The CPU blocks on every miss, so total cycles are one per instruction plus
+the time spent waiting on SDRAM. Device registers (starjette_system.py) cost
+one cycle and bypass the caches.
+"""
+
+from starjette_model import OPCODES, decode
+
+REL_FP = OPCODES["rel fp"]
+LW = OPCODES["lw"]
+SW = OPCODES["sw"]
+
+
+class Sdram:
+    """SDRAM banks with row buffers. Times are in CPU cycles."""
+
+    def __init__(self, t_rcd=2, t_cas=2, t_rp=2, t_rc=8, t_wr=2, bus_bytes=2,
+                 banks=4, row_bytes=1024, open_page=True):
+        self.t_rcd = t_rcd
+        self.t_cas = t_cas
+        self.t_rp = t_rp
+        self.t_rc = t_rc
+        self.t_wr = t_wr
+        self.bus_bytes = bus_bytes
+        self.banks = banks
+        self.row_bytes = row_bytes
+        self.open_page = open_page
+        self.open_row = [None] * banks
+        self.ready = [0] * banks
+        self.last_activate = [-t_rc] * banks
+        self.row_hits = 0
+        self.row_misses = 0
+        self.row_conflicts = 0
+
+    @property
+    def accesses(self):
+        return self.row_hits + self.row_misses + self.row_conflicts
+
+    def access(self, addr, nbytes, write, now):
+        """Start an access at cycle now. Returns the cycles until it completes."""
+        bank = (addr // self.row_bytes) % self.banks
+        row = addr // (self.row_bytes * self.banks)
+        t = max(now, self.ready[bank])
+        if self.open_row[bank] == row:
+            self.row_hits += 1
+        else:
+            if self.open_row[bank] is None:
+                self.row_misses += 1
+            else:
+                self.row_conflicts += 1
+                t += self.t_rp
+            t = max(t, self.last_activate[bank] + self.t_rc)
+            self.last_activate[bank] = t
+            t += self.t_rcd
+            self.open_row[bank] = row
+
+        beats = -(-nbytes // self.bus_bytes)
+        if write:
+            t += beats
+            ready = t + self.t_wr
+        else:
+            t += self.t_cas + beats
+            ready = t
+        if not self.open_page:
+            # Auto precharge: the bank is closed again before the next access
+            ready += self.t_rp
+            self.open_row[bank] = None
+        self.ready[bank] = ready
+        return t - now
+
+
+class FetchBuffer:
+    """`lines` fully associative, LRU lines of `width` aligned bytes."""
+
+    def __init__(self, width=4, lines=1):
+        if width & (width - 1):
+            raise ValueError("width must be a power of two")
+        self.width = width
+        self.lines = lines
+        self.blocks = []
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, addr):
+        """Returns None on a hit, else the block address to fill."""
+        block = addr & ~(self.width - 1)
+        blocks = self.blocks
+        if block in blocks:
+            self.hits += 1
+            if blocks[-1] != block:
+                blocks.remove(block)
+                blocks.append(block)
+            return None
+        self.misses += 1
+        blocks.append(block)
+        if len(blocks) > self.lines:
+            del blocks[0]
+        return block
+
+
+class Cache:
+    """Set associative, LRU, write back, write allocate."""
+
+    def __init__(self, size=256, line=4, ways=1):
+        if size % (line * ways):
+            raise ValueError("size must be a multiple of line * ways")
+        self.size = size
+        self.line = line
+        self.ways = ways
+        self.nsets = size // (line * ways)
+        # Per set: [tag, dirty] pairs, most recently used last
+        self.sets = [[] for _ in range(self.nsets)]
+        self.hits = 0
+        self.misses = 0
+        self.writebacks = 0
+
+    def access(self, addr, write):
+        """Returns (hit, address of a dirty line to write back or None)."""
+        block = addr // self.line
+        lines = self.sets[block % self.nsets]
+        for entry in lines:
+            if entry[0] == block:
+                self.hits += 1
+                entry[1] |= write
+                if lines[-1] is not entry:
+                    lines.remove(entry)
+                    lines.append(entry)
+                return True, None
+        self.misses += 1
+        victim = None
+        if len(lines) == self.ways:
+            tag, dirty = lines.pop(0)
+            if dirty:
+                self.writebacks += 1
+                victim = tag * self.line
+        lines.append([block, write])
+        return False, victim
+
+
+class Hierarchy:
+    """One fetch buffer, optional data cache and SDRAM, with cycle accounting."""
+
+    def __init__(self, name, fetch_width=4, fetch_lines=1, cache_size=0, cache_line=4,
+                 cache_ways=1, scope="frame", open_page=True):
+        if scope not in ("frame", "data"):
+            raise ValueError(f"unknown cache scope {scope!r}")
+        self.name = name
+        self.fetch = FetchBuffer(fetch_width, fetch_lines)
+        self.cache = Cache(cache_size, cache_line, cache_ways) if cache_size else None
+        self.scope = scope
+        self.sdram = Sdram(open_page=open_page)
+        self.cycles = 0
+        self.instructions = 0
+        self.fetch_stall = 0
+        self.data_accesses = 0
+        self.data_stall = 0
+        self.io_accesses = 0
+
+    def describe(self):
+        parts = [f"fetch {self.fetch.lines}x{self.fetch.width}B"]
+        if self.cache:
+            parts.append(f"{self.scope} cache {self.cache.size}B {self.cache.ways}-way "
+                         f"{self.cache.line}B lines")
+        parts.append("open page" if self.sdram.open_page else "closed page")
+        return ", ".join(parts)
+
+    def _data(self, addr, nbytes, write, cached):
+        now = self.cycles
+        if not cached:
+            return self.sdram.access(addr, nbytes, write, now)
+        hit, victim = self.cache.access(addr, write)
+        if hit:
+            return 0
+        stall = 0
+        if victim is not None:
+            stall += self.sdram.access(victim, self.cache.line, True, now)
+        line = addr & ~(self.cache.line - 1)
+        return stall + self.sdram.access(line, self.cache.line, False, now + stall)
+
+    def instruction(self, fetch_addr, accesses, frame):
+        """
+        Account for one instruction.
+
+        fetch_addr: physical fetch address, None when the fetch faulted
+        accesses: [(phys, nbytes, write, io)] data accesses it made
+        frame: it was the `lw`/`sw` of an `llw`/`slw`
+        """
+        self.instructions += 1
+        self.cycles += 1
+        if fetch_addr is not None:
+            block = self.fetch.lookup(fetch_addr)
+            if block is not None:
+                stall = self.sdram.access(block, self.fetch.width, False, self.cycles)
+                self.fetch_stall += stall
+                self.cycles += stall
+        cached = self.cache is not None and (frame or self.scope == "data")
+        for addr, nbytes, write, io in accesses:
+            if io:
+                self.io_accesses += 1
+                self.data_stall += 1
+                self.cycles += 1
+                continue
+            self.data_accesses += 1
+            stall = self._data(addr, nbytes, write, cached)
+            self.data_stall += stall
+            self.cycles += stall
+
+    @property
+    def cpi(self):
+        return self.cycles / self.instructions if self.instructions else 0.0
+
+    @property
+    def average_latency(self):
+        """Cycles per fetch or data access, counting a hit as one cycle."""
+        accesses = self.instructions + self.data_accesses + self.io_accesses
+        stall = self.fetch_stall + self.data_stall
+        return (accesses + stall) / accesses if accesses else 0.0
+
+
+HIERARCHIES = {
+    "fetch2": dict(fetch_width=2),
+    "fetch4": dict(fetch_width=4),
+    "fetch8x2": dict(fetch_width=8, fetch_lines=2),
+    "fetch16x2": dict(fetch_width=16, fetch_lines=2),
+    "fetch8x2_frame64": dict(fetch_width=8, fetch_lines=2, cache_size=64),
+    "fetch8x2_frame256": dict(fetch_width=8, fetch_lines=2, cache_size=256),
+    "fetch8x2_frame1k_2way": dict(fetch_width=8, fetch_lines=2, cache_size=1024, cache_ways=2),
+    "fetch8x2_data1k_2way": dict(fetch_width=8, fetch_lines=2, cache_size=1024, cache_ways=2, scope="data"),
+    "fetch8x2_frame256_closed": dict(fetch_width=8, fetch_lines=2, cache_size=256, open_page=False),
+}
+
+
+def make_hierarchies(names=None):
+    """Hierarchy instances for the named presets, all of them by default."""
+    return [Hierarchy(name, **HIERARCHIES[name]) for name in (names or HIERARCHIES)]
+
+
+def traced_run(cpu, hierarchies, max_cycles):
+    """
+    Run cpu until it halts or executes max_cycles instructions, feeding each
+    instruction's memory traffic to every hierarchy. Returns instructions run.
+    """
+    fetches = []
+    accesses = []
+    load, store, fetch = cpu._load, cpu._store, cpu._fetch
+    device = getattr(cpu, "_device", None)
+
+    def is_io(phys):
+        return device is not None and device(phys)[0] is not None
+
+    def traced_load(phys, nbytes):
+        accesses.append((phys, nbytes, False, is_io(phys)))
+        return load(phys, nbytes)
+
+    def traced_store(phys, nbytes, value):
+        accesses.append((phys, nbytes, True, is_io(phys)))
+        store(phys, nbytes, value)
+
+    def traced_fetch(phys):
+        fetches.append(phys)
+        return fetch(phys)
+
+    cpu._load, cpu._store, cpu._fetch = traced_load, traced_store, traced_fetch
+    start = cpu.cycles
+    previous = None
+    try:
+        while not cpu.halted and cpu.cycles - start < max_cycles:
+            op = decode(cpu.step())
+            fetch_addr = fetches[0] if fetches else None
+            frame = previous == REL_FP and op in (LW, SW)
+            for hierarchy in hierarchies:
+                hierarchy.instruction(fetch_addr, accesses, frame)
+            previous = op
+            fetches.clear()
+            accesses.clear()
+    finally:
+        del cpu._load, cpu._store, cpu._fetch
+    return cpu.cycles - start
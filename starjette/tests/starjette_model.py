@@ -0,0 +1,663 @@
+"""
+Reference model of the StarJette CPU.
+
+Follows docs/cpu_isa_manual.md: one instruction per cycle like the Zig
+emulators, the unified exception sequence (ecause/evec), macro instruction
+vectors for extended opcodes that are not implemented in hardware, the data
+stack high water marks, and the MMU mask/set CSRs.
+
+The test generators use this model to compute expected results, so it is kept
+free of dependencies beyond the standard library.
+"""
+
+import starjette_rom
+
+STACK_SIZE = 1024
+STACK_MASK = STACK_SIZE - 1
+USER_HIGH_WATER = STACK_SIZE - 8
+KERNEL_HIGH_WATER = STACK_SIZE - 4
+
+# Same size as the 128K word memory the Zig cores allocate
+MEMORY_SIZE = 256 * 1024
+
+MACRO_VECTOR_BASE = 0x100
+
+STATUS_KM = 0b001
+STATUS_IE = 0b010
+STATUS_TH = 0b100
+
+ECAUSE_SYSCALL = 0x00
+ECAUSE_ILLEGAL = 0x10
+ECAUSE_PRIVILEGED = 0x11
+ECAUSE_HALT = 0x12
+ECAUSE_UNALIGNED = 0x20
+ECAUSE_ACCESS_FAULT = 0x21
+ECAUSE_PROTECTION = 0x22
+ECAUSE_UNDERFLOW = 0x30
+ECAUSE_OVERFLOW = 0x31
+ECAUSE_DIV_ZERO = 0x40
+ECAUSE_INTERRUPT = 0x50
+
+# O format opcodes, numbered as in customasm/cpudef.asm
+OPCODES = {
+    "halt": 0x00,
+    "rets": 0x01,
+    "syscall": 0x02,
+    "callp": 0x03,
+    "beqz": 0x04,
+    "bnez": 0x05,
+    "swap": 0x06,
+    "over": 0x07,
+    "drop": 0x08,
+    "dup": 0x09,
+    "ltu": 0x0A,
+    "lt": 0x0B,
+    "add": 0x0C,
+    "and": 0x0D,
+    "xor": 0x0E,
+    "fsl": 0x0F,
+    "rel pc": 0x10,
+    "rel fp": 0x11,
+    "rel rx": 0x12,
+    "rel ry": 0x13,
+    "pop pc": 0x14,
+    "pop fp": 0x15,
+    "pop rx": 0x16,
+    "pop ry": 0x17,
+    "add pc": 0x18,
+    "add fp": 0x19,
+    "add rx": 0x1A,
+    "add ry": 0x1B,
+    "pushcsr": 0x1C,
+    "popcsr": 0x1D,
+    "lw": 0x1E,
+    "sw": 0x1F,
+    "div": 0x20,
+    "divu": 0x21,
+    "mul": 0x22,
+    "rot": 0x23,
+    "srl": 0x24,
+    "sra": 0x25,
+    "sll": 0x26,
+    "or": 0x27,
+    "sub": 0x28,
+    "clz": 0x29,
+    "lb": 0x2A,
+    "sb": 0x2B,
+    "lh": 0x2C,
+    "sh": 0x2D,
+    "lnw": 0x2E,
+    "snw": 0x2F,
+}
+
+OPCODE_NAMES = {value: name for name, value in OPCODES.items()}
+
+REGS = ["pc", "fp", "rx", "ry"]
+
+CSRS = {
+    "status": 0x0,
+    "estatus": 0x1,
+    "epc": 0x2,
+    "afp": 0x3,
+    "depth": 0x4,
+    "ecause": 0x5,
+    "evec": 0x6,
+    "udmask": 0x8,
+    "udset": 0x9,
+    "upmask": 0xA,
+    "upset": 0xB,
+    "kdmask": 0xC,
+    "kdset": 0xD,
+    "kpmask": 0xE,
+    "kpset": 0xF,
+}
+
+CSR_NAMES = {value: name for name, value in CSRS.items()}
+
+BASIC_OPS = frozenset(range(0x00, 0x20))
+EXTENDED_OPS = frozenset(range(0x20, 0x30))
+
+# Division is always a macro instruction (manual 3.5.1), which is also what
+# the microcoded core does; every other extended op is in hardware.
+DEFAULT_NATIVE_OPS = BASIC_OPS | (EXTENDED_OPS - {OPCODES["div"], OPCODES["divu"]})
+
+# Number of stack items an instruction reads; fewer raises an underflow.
+MIN_DEPTH = [0] * 0x42
+for _name, _depth in [
+    ("callp", 1), ("beqz", 2), ("bnez", 2), ("swap", 2), ("over", 2),
+    ("drop", 1), ("dup", 1), ("ltu", 2), ("lt", 2), ("add", 2), ("and", 2),
+    ("xor", 2), ("fsl", 3), ("rel pc", 1), ("rel fp", 1), ("rel rx", 1),
+    ("rel ry", 1), ("pop pc", 1), ("pop fp", 1), ("pop rx", 1),
+    ("pop ry", 1), ("add pc", 1), ("add fp", 1), ("add rx", 1),
+    ("add ry", 1), ("pushcsr", 1), ("popcsr", 2), ("lw", 1), ("sw", 2),
+    ("div", 2), ("divu", 2), ("mul", 2), ("rot", 3), ("srl", 2), ("sra", 2),
+    ("sll", 2), ("or", 2), ("sub", 2), ("clz", 1), ("lb", 1), ("sb", 2),
+    ("lh", 1), ("sh", 2), ("snw", 1),
+]:
+    MIN_DEPTH[OPCODES[_name]] = _depth
+MIN_DEPTH[0x41] = 1  # shi
+
+
+def decode(byte):
+    """
+    Map an instruction byte to its micro-opcode index.
+    0x00-0x3F are O format opcodes, 0x40 is push and 0x41 is shi.
+    """
+    if byte & 0x80:
+        return 0x41
+    if byte & 0x40:
+        return 0x40
+    return byte
+
+
+def mnemonic(byte):
+    """Return the assembler text for a single instruction byte."""
+    if byte & 0x80:
+        return f"shi 0x{byte & 0x7F:02x}"
+    if byte & 0x40:
+        return f"push {sign_extend(byte & 0x3F, 6)}"
+    if byte in OPCODE_NAMES:
+        return OPCODE_NAMES[byte]
+    return f"#d8 0x{byte:02x}"
+
+
+def sign_extend(value, bits):
+    sign = 1 << (bits - 1)
+    return (value & (sign - 1)) - (value & sign)
+
+
+class Trap(Exception):
+    """Raised by an instruction before it changes any state."""
+
+    def __init__(self, cause):
+        super().__init__(f"trap 0x{cause:02x}")
+        self.cause = cause
+
+
+class Cpu:
+    """
+    StarJette CPU state plus an interpreter.
+
+    wordsize: 16 or 32
+    native_ops: opcodes (0x00-0x3F) executed in hardware, the rest of the
+        0b001xxxxx range vectors to MACRO_VECTOR_BASE + (op & 0x1F) * 8
+    """
+
+    def __init__(self, wordsize=16, memory_size=MEMORY_SIZE, native_ops=DEFAULT_NATIVE_OPS):
+        if wordsize not in (16, 32):
+            raise ValueError(f"unsupported word size {wordsize}")
+        self.wordsize = wordsize
+        self.wordbytes = wordsize // 8
+        self.mask = (1 << wordsize) - 1
+        self.sign = 1 << (wordsize - 1)
+        self.native_ops = frozenset(native_ops)
+        self.mem = bytearray(memory_size)
+        self.stack = [0] * STACK_SIZE
+        self.irq_lines = 0
+        # Set to a list to record ("enter", cycle, cause, depth) for traps,
+        # ("macro", cycle, opcode, depth) for macro vectors and
+        # ("exit", cycle, epc, depth) for rets
+        self.trap_log = None
+        self._dispatch = self._build_dispatch()
+        self.reset()
+
+    def reset(self):
+        """Apply the boot values from manual section 2.2."""
+        self.pc = 0
+        self.kfp = 0
+        self.ufp = 0
+        self.rx = 0
+        self.ry = 0
+        self.depth = 0
+        self.status = STATUS_KM
+        self.estatus = 0
+        self.epc = 0
+        self.ecause = 0
+        self.evec = 0
+        self.mmu = [0] * 8  # udmask .. kpset
+        self.halted = False
+        self.cycles = 0
+        for i in range(STACK_SIZE):
+            self.stack[i] = 0
+
+    def load_rom(self, rom):
+        """
+        Load a flat .bin image (path or bytes) at physical address 0, or the
+        segments of a .sjrom container (see starjette_rom.py).
+        """
+        if not isinstance(rom, (bytes, bytearray, memoryview)):
+            with open(rom, "rb") as f:
+                rom = f.read()
+        if starjette_rom.is_segmented(rom):
+            starjette_rom.load(self.mem, rom)
+            return
+        rom = rom[:len(self.mem)]
+        self.mem[:] = bytes(len(self.mem))
+        self.mem[:len(rom)] = rom
+
+    # --- Registers -----------------------------------------------------
+
+    @property
+    def km(self):
+        return self.status & STATUS_KM != 0
+
+    @property
+    def fp(self):
+        return self.kfp if self.status & STATUS_KM else self.ufp
+
+    @fp.setter
+    def fp(self, value):
+        if self.status & STATUS_KM:
+            self.kfp = value & self.mask
+        else:
+            self.ufp = value & self.mask
+
+    @property
+    def afp(self):
+        return self.ufp if self.status & STATUS_KM else self.kfp
+
+    @afp.setter
+    def afp(self, value):
+        if self.status & STATUS_KM:
+            self.ufp = value & self.mask
+        else:
+            self.kfp = value & self.mask
+
+    def read_reg(self, index):
+        if index == 0:
+            return self.pc
+        if index == 1:
+            return self.fp
+        if index == 2:
+            return self.rx
+        return self.ry
+
+    def write_reg(self, index, value):
+        value &= self.mask
+        if index == 0:
+            self.pc = value
+        elif index == 1:
+            self.fp = value
+        elif index == 2:
+            self.rx = value
+        else:
+            self.ry = value
+
+    def read_csr(self, index):
+        if index == 0x0:
+            return self.status
+        if index == 0x1:
+            return self.estatus
+        if index == 0x2:
+            return self.epc
+        if index == 0x3:
+            return self.afp
+        if index == 0x4:
+            return self.depth
+        if index == 0x5:
+            return self.ecause
+        if index == 0x6:
+            return self.evec
+        return self.mmu[index - 8]
+
+    def write_csr(self, index, value):
+        value &= self.mask
+        if index == 0x0:
+            self.status = value
+        elif index == 0x1:
+            self.estatus = value
+        elif index == 0x2:
+            self.epc = value
+        elif index == 0x3:
+            self.afp = value
+        elif index == 0x4:
+            self.depth = 0  # the stack only supports being reset
+        elif index == 0x5:
+            self.ecause = value
+        elif index == 0x6:
+            self.evec = value
+        else:
+            self.mmu[index - 8] = value
+
+    def _check_csr(self, index):
+        if index == 7 or index > 15:
+            raise Trap(ECAUSE_ILLEGAL)
+
+    # --- Data stack ----------------------------------------------------
+
+    def peek(self, n=0):
+        """Return the stack item n below the top (0 is tos)."""
+        return self.stack[(self.depth - 1 - n) & STACK_MASK]
+
+    def push(self, value):
+        self.stack[self.depth & STACK_MASK] = value & self.mask
+        self.depth += 1
+
+    def pop(self):
+        self.depth -= 1
+        return self.stack[self.depth & STACK_MASK]
+
+    def replace(self, value):
+        self.stack[(self.depth - 1) & STACK_MASK] = value & self.mask
+
+    def stack_items(self):
+        """Return the data stack bottom to top."""
+        return [self.stack[i & STACK_MASK] for i in range(self.depth)]
+
+    # --- Memory --------------------------------------------------------
+
+    def translate(self, vaddr, program=False):
+        """Apply the MMU mask/set registers (manual section 6)."""
+        index = (4 if self.status & STATUS_KM else 0) + (2 if program else 0)
+        mask = self.mmu[index]
+        setbits = self.mmu[index + 1]
+        if self.wordsize == 16:
+            mask <<= 12
+            setbits <<= 12
+        if vaddr & mask:
+            raise Trap(ECAUSE_PROTECTION)
+        return (vaddr & ~mask) | setbits
+
+    def _load(self, phys, nbytes):
+        if phys + nbytes > len(self.mem):
+            return 0
+        return int.from_bytes(self.mem[phys:phys + nbytes], "little")
+
+    def _store(self, phys, nbytes, value):
+        if phys + nbytes <= len(self.mem):
+            self.mem[phys:phys + nbytes] = (value & ((1 << (8 * nbytes)) - 1)).to_bytes(nbytes, "little")
+
+    def _fetch(self, phys):
+        if phys < len(self.mem):
+            return self.mem[phys]
+        return 0
+
+    def read(self, vaddr, nbytes):
+        if vaddr & (nbytes - 1):
+            raise Trap(ECAUSE_UNALIGNED)
+        return self._load(self.translate(vaddr), nbytes)
+
+    def write(self, vaddr, nbytes, value):
+        if vaddr & (nbytes - 1):
+            raise Trap(ECAUSE_UNALIGNED)
+        self._store(self.translate(vaddr), nbytes, value)
+
+    # --- Execution -----------------------------------------------------
+
+    def enter_trap(self, cause, epc=None):
+        """The exception sequence from manual section 5.2."""
+        self.estatus = self.status
+        self.status = (self.status | STATUS_KM) & ~STATUS_IE
+        self.epc = self.pc if epc is None else epc
+        self.ecause = cause
+        self.pc = self.evec
+        if self.trap_log is not None:
+            self.trap_log.append(("enter", self.cycles, cause, self.depth))
+
+    def high_water(self, km):
+        return KERNEL_HIGH_WATER if km else USER_HIGH_WATER
+
+    def step(self):
+        """Execute one instruction. Returns the instruction byte."""
+        pc = self.pc
+        self.pc = (pc + 1) & self.mask
+        try:
+            byte = self._fetch(self.translate(pc, program=True))
+        except Trap as trap:
+            self.enter_trap(trap.cause)
+            self.cycles += 1
+            return 0
+
+        op = decode(byte)
+        exit_km = self.estatus & STATUS_KM if op == 0x01 else self.status & STATUS_KM
+        if self.depth < MIN_DEPTH[op]:
+            self.enter_trap(ECAUSE_UNDERFLOW)
+        elif self.depth > self.high_water(exit_km):
+            self.enter_trap(ECAUSE_OVERFLOW)
+        elif self.irq_lines and self.status & STATUS_IE:
+            # Nothing ran, so resuming at epc re-executes the instruction
+            irq = (self.irq_lines & -self.irq_lines).bit_length() - 1
+            self.enter_trap(ECAUSE_INTERRUPT | (irq & 0xF), epc=pc)
+        elif 0x20 <= op < 0x40 and op not in self.native_ops:
+            self.estatus = self.status
+            self.status = (self.status | STATUS_KM) & ~STATUS_IE
+            self.epc = self.pc
+            self.pc = MACRO_VECTOR_BASE + (op & 0x1F) * 8
+            if self.trap_log is not None:
+                self.trap_log.append(("macro", self.cycles, op, self.depth))
+        else:
+            try:
+                self._dispatch[op](byte)
+            except Trap as trap:
+                self.pc = (pc + 1) & self.mask
+                self.enter_trap(trap.cause)
+        self.cycles += 1
+        return byte
+
+    def run(self, max_cycles):
+        """Run until halted or max_cycles instructions. Returns cycles run."""
+        start = self.cycles
+        step = self.step
+        while not self.halted and self.cycles - start < max_cycles:
+            step()
+        return self.cycles - start
+
+    def _build_dispatch(self):
+        table = [self._op_illegal] * 0x42
+        for name, code in OPCODES.items():
+            table[code] = getattr(self, "_op_" + name.replace(" ", "_"))
+        table[0x40] = self._op_push_imm
+        table[0x41] = self._op_shi
+        return table
+
+    # --- Instructions --------------------------------------------------
+
+    def _op_illegal(self, byte):
+        raise Trap(ECAUSE_ILLEGAL)
+
+    def _op_push_imm(self, byte):
+        self.push(sign_extend(byte & 0x3F, 6))
+
+    def _op_shi(self, byte):
+        self.replace((self.peek() << 7) | (byte & 0x7F))
+
+    def _op_halt(self, byte):
+        if self.status & STATUS_TH:
+            raise Trap(ECAUSE_HALT)
+        self.halted = True
+
+    def _op_rets(self, byte):
+        self.pc = self.epc
+        self.status = self.estatus
+        if self.trap_log is not None:
+            self.trap_log.append(("exit", self.cycles, self.epc, self.depth))
+
+    def _op_syscall(self, byte):
+        raise Trap(ECAUSE_SYSCALL)
+
+    def _op_callp(self, byte):
+        self.rx = self.pc
+        self.pc = self.pop()
+
+    def _op_beqz(self, byte):
+        offset = self.pop()
+        if self.pop() == 0:
+            self.pc = (self.pc + offset) & self.mask
+
+    def _op_bnez(self, byte):
+        offset = self.pop()
+        if self.pop() != 0:
+            self.pc = (self.pc + offset) & self.mask
+
+    def _op_swap(self, byte):
+        tos = self.pop()
+        nos = self.pop()
+        self.push(tos)
+        self.push(nos)
+
+    def _op_over(self, byte):
+        self.push(self.peek(1))
+
+    def _op_drop(self, byte):
+        self.pop()
+
+    def _op_dup(self, byte):
+        self.push(self.peek())
+
+    def _op_ltu(self, byte):
+        tos = self.pop()
+        self.replace(1 if self.peek() < tos else 0)
+
+    def _op_lt(self, byte):
+        tos = self.pop()
+        nos = self.peek()
+        self.replace(1 if (nos ^ self.sign) < (tos ^ self.sign) else 0)
+
+    def _op_add(self, byte):
+        tos = self.pop()
+        self.replace(self.peek() + tos)
+
+    def _op_and(self, byte):
+        tos = self.pop()
+        self.replace(self.peek() & tos)
+
+    def _op_xor(self, byte):
+        tos = self.pop()
+        self.replace(self.peek() ^ tos)
+
+    def _op_fsl(self, byte):
+        shift = self.pop() & (2 * self.wordsize - 1)
+        low = self.pop()
+        value = (self.peek() << self.wordsize) | low
+        self.replace((value << shift) >> self.wordsize)
+
+    def _op_rel(self, byte):
+        self.replace(self.peek() + self.read_reg(byte & 3))
+
+    _op_rel_pc = _op_rel_fp = _op_rel_rx = _op_rel_ry = _op_rel
+
+    def _op_pop_reg(self, byte):
+        self.write_reg(byte & 3, self.pop())
+
+    _op_pop_pc = _op_pop_fp = _op_pop_rx = _op_pop_ry = _op_pop_reg
+
+    def _op_add_reg(self, byte):
+        index = byte & 3
+        self.write_reg(index, self.read_reg(index) + self.pop())
+
+    _op_add_pc = _op_add_fp = _op_add_rx = _op_add_ry = _op_add_reg
+
+    def _op_pushcsr(self, byte):
+        index = self.peek()
+        self._check_csr(index)
+        if not self.status & STATUS_KM and index != CSRS["depth"]:
+            raise Trap(ECAUSE_PRIVILEGED)
+        self.replace(self.read_csr(index))
+
+    def _op_popcsr(self, byte):
+        index = self.peek()
+        self._check_csr(index)
+        if not self.status & STATUS_KM:
+            raise Trap(ECAUSE_PRIVILEGED)
+        self.pop()
+        self.write_csr(index, self.pop())
+
+    def _op_lw(self, byte):
+        self.replace(self.read(self.peek(), self.wordbytes))
+
+    def _op_sw(self, byte):
+        self.write(self.peek(), self.wordbytes, self.peek(1))
+        self.depth -= 2
+
+    def _signed(self, value):
+        return value - (value << 1 & (self.sign << 1))
+
+    def _op_div(self, byte):
+        divisor = self._signed(self.peek())
+        dividend = self._signed(self.peek(1))
+        if divisor == 0:
+            raise Trap(ECAUSE_DIV_ZERO)
+        quotient = abs(dividend) // abs(divisor)
+        if (dividend < 0) != (divisor < 0):
+            quotient = -quotient
+        self.depth -= 2
+        self.push(quotient)
+        self.push(dividend - quotient * divisor)
+
+    def _op_divu(self, byte):
+        divisor = self.peek()
+        dividend = self.peek(1)
+        if divisor == 0:
+            raise Trap(ECAUSE_DIV_ZERO)
+        self.depth -= 2
+        self.push(dividend // divisor)
+        self.push(dividend % divisor)
+
+    def _op_mul(self, byte):
+        tos = self.pop()
+        product = self.pop() * tos
+        self.push(product)
+        self.push(product >> self.wordsize)
+
+    def _op_rot(self, byte):
+        tos = self.pop()
+        nos = self.pop()
+        ros = self.pop()
+        self.push(tos)
+        self.push(ros)
+        self.push(nos)
+
+    def _op_srl(self, byte):
+        shift = self.pop() & (self.wordsize - 1)
+        self.replace(self.peek() >> shift)
+
+    def _op_sra(self, byte):
+        shift = self.pop() & (self.wordsize - 1)
+        self.replace(self._signed(self.peek()) >> shift)
+
+    def _op_sll(self, byte):
+        shift = self.pop() & (self.wordsize - 1)
+        self.replace(self.peek() << shift)
+
+    def _op_or(self, byte):
+        tos = self.pop()
+        self.replace(self.peek() | tos)
+
+    def _op_sub(self, byte):
+        tos = self.pop()
+        self.replace(self.peek() - tos)
+
+    def _op_clz(self, byte):
+        self.replace(self.wordsize - self.peek().bit_length())
+
+    def _op_lb(self, byte):
+        self.replace(sign_extend(self.read(self.peek(), 1), 8))
+
+    def _op_sb(self, byte):
+        self.write(self.peek(), 1, self.peek(1))
+        self.depth -= 2
+
+    def _op_lh(self, byte):
+        self.replace(sign_extend(self.read(self.peek(), 2), 16))
+
+    def _op_sh(self, byte):
+        self.write(self.peek(), 2, self.peek(1))
+        self.depth -= 2
+
+    def _op_lnw(self, byte):
+        value = self.read(self.ry, self.wordbytes)
+        self.ry = (self.ry + self.wordbytes) & self.mask
+        self.push(value)
+
+    def _op_snw(self, byte):
+        self.write(self.ry, self.wordbytes, self.peek())
+        self.ry = (self.ry + self.wordbytes) & self.mask
+        self.depth -= 1
+
+
+def run_rom(path, max_cycles=1_000_000, **kwargs):
+    """Load and run a ROM, returning the halted Cpu."""
+    cpu = Cpu(**kwargs)
+    cpu.load_rom(path)
+    cpu.run(max_cycles)
+    return cpu
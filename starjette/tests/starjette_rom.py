@@ -0,0 +1,204 @@
+"""
+Segmented ROM container (.sjrom).
+
+cpudef.asm emits the data bank at file offset 0x10000, so any flat .bin with
+initialized data is a mostly zero file of 64 KiB or more. A .sjrom keeps only
+the non-zero runs: memory is zeroed before loading, so the gaps need not be
+stored and loading is proportional to the real content.
+
+Layout, little endian:
+
+    header    magic "SJRM", version u8, flags u8, segment count u16
+    segments  load address u32, length u32, then length bytes, repeated
+    trailer   CRC-32 (zlib) of everything before it, when flags & FLAG_CRC
+
+Load addresses are physical, matching the flat image's file offsets.
+Cpu.load_rom() accepts .sjrom files and bytes directly.
+
+Usage (from starjette/): python tests/starjette_rom.py IN.bin|IN.hex ... [-o OUT.sjrom] [--gap N] [--no-crc]
+Without -o each input is written next to itself as .sjrom.
+"""
+
+import argparse
+import os
+import struct
+import sys
+import zlib
+
+MAGIC = b"SJRM"
+VERSION = 1
+FLAG_CRC = 0x01
+HEADER = struct.Struct("<4sBBH")
+SEGMENT = struct.Struct("<II")
+CRC = struct.Struct("<I")
+
+# Zero runs shorter than this stay inside a segment; each split costs a
+# SEGMENT header
+DEFAULT_GAP = 16
+
+
+class RomFormatError(ValueError):
+    pass
+
+
+def is_segmented(data):
+    return bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def segments_of(image, gap=DEFAULT_GAP):
+    """[(addr, bytes)] covering the non-zero bytes of a flat image."""
+    segments = []
+    size = len(image)
+    i = 0
+    while i < size:
+        # skip zeros
+        while i < size and image[i] == 0:
+            i += 1
+        if i == size:
+            break
+        start = i
+        end = i
+        while i < size:
+            if image[i]:
+                i += 1
+                end = i
+                continue
+            run = i
+            while run < size and image[run] == 0:
+                run += 1
+            if run - i >= gap or run == size:
+                break
+            i = run
+        segments.append((start, bytes(image[start:end])))
+        i = end
+    return segments
+
+
+def encode(segments, crc=True):
+    """.sjrom bytes for [(addr, data)] segments."""
+    if len(segments) > 0xFFFF:
+        raise RomFormatError(f"{len(segments)} segments, at most 65535 fit")
+    out = bytearray(HEADER.pack(MAGIC, VERSION, FLAG_CRC if crc else 0, len(segments)))
+    for addr, data in segments:
+        out += SEGMENT.pack(addr, len(data))
+        out += data
+    if crc:
+        out += CRC.pack(zlib.crc32(out))
+    return bytes(out)
+
+
+def decode(data):
+    """[(addr, memoryview)] from .sjrom bytes, checking the CRC if present."""
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise RomFormatError("truncated header")
+    magic, version, flags, count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise RomFormatError("not a segmented ROM")
+    if version != VERSION:
+        raise RomFormatError(f"unsupported version {version}")
+    end = len(view)
+    if flags & FLAG_CRC:
+        end -= CRC.size
+        if end < HEADER.size:
+            raise RomFormatError("truncated CRC")
+        (expected,) = CRC.unpack_from(view, end)
+        if zlib.crc32(view[:end]) != expected:
+            raise RomFormatError("CRC mismatch")
+    segments = []
+    offset = HEADER.size
+    for _ in range(count):
+        if offset + SEGMENT.size > end:
+            raise RomFormatError("truncated segment header")
+        addr, length = SEGMENT.unpack_from(view, offset)
+        offset += SEGMENT.size
+        if offset + length > end:
+            raise RomFormatError(f"segment at {addr:#x} runs past the end")
+        segments.append((addr, view[offset:offset + length]))
+        offset += length
+    if offset != end:
+        raise RomFormatError(f"{end - offset} trailing bytes")
+    return segments
+
+
+def read_hex(path):
+    """Flat image from an Intel HEX file (as customasm -f intelhex writes)."""
+    image = bytearray()
+    base = 0
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith(":"):
+                raise RomFormatError(f"{path}:{number}: expected ':'")
+            record = bytes.fromhex(line[1:])
+            if len(record) < 5 or len(record) != record[0] + 5:
+                raise RomFormatError(f"{path}:{number}: bad record length")
+            if sum(record) & 0xFF:
+                raise RomFormatError(f"{path}:{number}: bad checksum")
+            length, kind = record[0], record[3]
+            payload = record[4:4 + length]
+            if kind == 0x00:
+                addr = base + (record[1] << 8 | record[2])
+                if len(image) < addr + length:
+                    image.extend(bytes(addr + length - len(image)))
+                image[addr:addr + length] = payload
+            elif kind == 0x01:
+                break
+            elif kind == 0x02:
+                base = int.from_bytes(payload, "big") << 4
+            elif kind == 0x04:
+                base = int.from_bytes(payload, "big") << 16
+            # 0x03/0x05 start addresses: the CPU always resets to 0
+    return image
+
+
+def read_image(path):
+    """Flat image from a .bin, .hex or .sjrom file."""
+    if path.endswith(".hex"):
+        return read_hex(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    if not is_segmented(data):
+        return bytearray(data)
+    segments = decode(data)
+    image = bytearray(max((addr + len(seg) for addr, seg in segments), default=0))
+    for addr, seg in segments:
+        image[addr:addr + len(seg)] = seg
+    return image
+
+
+def load(mem, data):
+    """Zero mem and copy the segments of .sjrom bytes into it."""
+    segments = decode(data)
+    mem[:] = bytes(len(mem))
+    for addr, seg in segments:
+        if addr + len(seg) > len(mem):
+            raise RomFormatError(f"segment at {addr:#x}+{len(seg):#x} is outside memory")
+        mem[addr:addr + len(seg)] = seg
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help=".bin or .hex images")
+    parser.add_argument("-o", "--output", help="output file (single input only)")
+    parser.add_argument("--gap", type=int, default=DEFAULT_GAP,
+                        help=f"shortest zero run that splits a segment (default {DEFAULT_GAP})")
+    parser.add_argument("--no-crc", action="store_true", help="omit the CRC-32 trailer")
+    args = parser.parse_args()
+    if args.output and len(args.inputs) > 1:
+        parser.error("-o needs a single input")
+
+    for path in args.inputs:
+        image = read_image(path)
+        data = encode(segments_of(image, args.gap), crc=not args.no_crc)
+        out = args.output or os.path.splitext(path)[0] + ".sjrom"
+        with open(out, "wb") as f:
+            f.write(data)
+        print(f"{path}: {len(image)} -> {len(data)} bytes, {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
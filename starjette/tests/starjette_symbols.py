@@ -0,0 +1,345 @@
+"""
+Compact symbol and source map built from customasm annotated listings.
+
+`build` parses a listing once and writes a .sjidx file next to the ROM
+(tests/foo_listing.txt -> tests/foo.sjidx). The index holds, sorted by
+address, the source file, line and enclosing label of every instruction, and
+the labels sorted by name. SymbolMap reads it through mmap and answers both
+lookups with a binary search, without parsing any text (big endian hosts
+read a byteswapped copy of each section instead).
+
+Listings only carry source excerpts, so each excerpt is matched back to a line
+of the sources given (default: the .asm next to the listing, plus
+customasm/test_shim.asm for the regular tests or customasm/test_shim32.asm
+under tests/w32/, following #include). Lines that cannot be matched point at
+the listing itself.
+
+File layout, little endian, sections 4 byte aligned:
+
+    header    magic "SJIX", version u16, pad u16, then u32 counts:
+              records, labels, files, and the string table size
+    records   addr u32[n], file u16[n], line u32[n], label u32[n]
+              (label is an index into the label table, NO_LABEL for none)
+    labels    name offset u32[m], name length u32[m], addr u32[m], by name
+    files     path offset u32[k], path length u32[k]
+    strings   UTF-8
+
+Usage (from starjette/):
+    python tests/starjette_symbols.py build LISTING... [--source FILE ...]
+    python tests/starjette_symbols.py lookup INDEX ADDR...
+    python tests/starjette_symbols.py label INDEX NAME...
+    python tests/starjette_symbols.py bench INDEX
+"""
+
+import argparse
+import bisect
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+
+from starjette_listing import LABEL, LINE, read_listing
+
+MAGIC = b"SJIX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+NO_LABEL = 0xFFFFFFFF
+
+INCLUDE = re.compile(r'^\s*#include\s+"([^"]+)"')
+
+
+def normalize(text):
+    """Source text without comments or repeated whitespace."""
+    return " ".join(text.split(";", 1)[0].split())
+
+
+def index_path(listing):
+    """tests/foo_listing.txt -> tests/foo.sjidx"""
+    base = listing[:-len("_listing.txt")] if listing.endswith("_listing.txt") else os.path.splitext(listing)[0]
+    return base + ".sjidx"
+
+
+def default_sources(listing):
+    """The sources the Makefile assembles for a listing."""
+    base = listing[:-len("_listing.txt")] if listing.endswith("_listing.txt") else os.path.splitext(listing)[0]
+    sources = []
+    parts = os.path.normpath(base).split(os.sep)
+    if "tests" in parts and "bootstrap" not in parts:
+        root = os.path.join(*parts[:parts.index("tests")]) if parts.index("tests") else "."
+        kernel = "test_shim32.asm" if "w32" in parts else "test_shim.asm"
+        sources.append(os.path.join(root, "customasm", kernel))
+    sources.append(base + ".asm")
+    return [path for path in sources if os.path.exists(path)]
+
+
+def source_lines(paths):
+    """[(path, line number, normalized text)] in assembly order, following #include."""
+    lines = []
+    seen = set()
+
+    def read(path):
+        path = os.path.normpath(path)
+        if path in seen or not os.path.exists(path):
+            return
+        seen.add(path)
+        with open(path) as f:
+            for number, text in enumerate(f, 1):
+                match = INCLUDE.match(text)
+                if match:
+                    read(os.path.join(os.path.dirname(path), match.group(1)))
+                    continue
+                lines.append((path, number, normalize(text)))
+
+    for path in paths:
+        read(path)
+    return lines
+
+
+def build(listing, out=None, sources=None):
+    """Parse listing and write its index. Returns the index path."""
+    out = out or index_path(listing)
+    sources = default_sources(listing) if sources is None else sources
+
+    # Candidate source positions for each normalized line of text
+    files = [listing]
+    file_ids = {listing: 0}
+    candidates = {}
+    for path, number, text in source_lines(sources):
+        if text:
+            fid = file_ids.setdefault(path, len(files))
+            if fid == len(files):
+                files.append(path)
+            candidates.setdefault(text, []).append((fid, number))
+    used = set()
+    last = {}
+
+    def match(text):
+        options = candidates.get(normalize(text))
+        if not options:
+            return None
+        unused = [option for option in options if option not in used]
+        after = [(fid, n) for fid, n in unused if n > last.get(fid, 0)]
+        choice = (after or unused or options)[0]
+        used.add(choice)
+        last[choice[0]] = choice[1]
+        return choice
+
+    records = {}
+    labels = {}
+    parent = ""
+    for (outp, addr, data, text), listing_line in zip(read_listing(listing), _listing_lines(listing)):
+        if outp != addr:
+            continue    # data bank
+        label = LABEL.match(text)
+        if label:
+            name = label.group(1)
+            if name.startswith("."):
+                name = parent + name
+            else:
+                parent = name
+            labels.setdefault(name, addr)
+            continue
+        if not data:
+            continue
+        position = match(text)
+        if addr not in records or (records[addr][0] == 0 and position):
+            records[addr] = position or (0, listing_line)
+
+    names = sorted(labels)
+    label_index = {name: i for i, name in enumerate(names)}
+    by_addr = sorted((addr, name) for name, addr in labels.items())
+    label_addrs = [addr for addr, _ in by_addr]
+
+    strings = bytearray()
+
+    def intern(text):
+        offset = len(strings)
+        strings.extend(text.encode())
+        return offset, len(strings) - offset
+
+    name_refs = [intern(name) for name in names]
+    file_refs = [intern(path) for path in files]
+
+    addrs = sorted(records)
+    enclosing = []
+    for addr in addrs:
+        i = bisect.bisect_right(label_addrs, addr) - 1
+        enclosing.append(label_index[by_addr[i][1]] if i >= 0 else NO_LABEL)
+
+    sections = [
+        array("I", addrs),
+        array("H", [records[a][0] for a in addrs]),
+        array("I", [records[a][1] for a in addrs]),
+        array("I", enclosing),
+        array("I", [offset for offset, _ in name_refs]),
+        array("I", [length for _, length in name_refs]),
+        array("I", [labels[name] for name in names]),
+        array("I", [offset for offset, _ in file_refs]),
+        array("I", [length for _, length in file_refs]),
+    ]
+    with open(out, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(addrs), len(names), len(files), len(strings)))
+        for section in sections:
+            if sys.byteorder != "little":
+                section.byteswap()
+            data = section.tobytes()
+            f.write(data + bytes(-len(data) % 4))
+        f.write(strings)
+    return out
+
+
+def _listing_lines(listing):
+    """Line numbers in the listing file of the entries read_listing returns."""
+    with open(listing) as f:
+        return [n for n, text in enumerate(f, 1) if LINE.match(text)]
+
+
+class SymbolMap:
+    """mmap backed view of a .sjidx file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, n, m, k, size = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} symbol index")
+        view = memoryview(self._map)
+        offset = HEADER.size
+
+        def section(code, count):
+            nonlocal offset
+            width = struct.calcsize(code)
+            data = view[offset:offset + width * count]
+            offset += width * count
+            offset += -offset % 4
+            if sys.byteorder != "little":
+                # The file is little endian: swap a copy, the map is read only
+                swapped = array(code)
+                swapped.frombytes(data)
+                data.release()
+                swapped.byteswap()
+                return memoryview(swapped)
+            return data.cast(code)
+
+        self.addrs = section("I", n)
+        self.files = section("H", n)
+        self.lines = section("I", n)
+        self.labels = section("I", n)
+        self.name_offsets = section("I", m)
+        self.name_lengths = section("I", m)
+        self.label_addrs = section("I", m)
+        self.file_offsets = section("I", k)
+        self.file_lengths = section("I", k)
+        self.strings = offset
+        self._file_names = [self._string(o, l) for o, l in zip(self.file_offsets, self.file_lengths)]
+
+    def close(self):
+        for name in ["addrs", "files", "lines", "labels", "name_offsets", "name_lengths",
+                     "label_addrs", "file_offsets", "file_lengths"]:
+            getattr(self, name).release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _string(self, offset, length):
+        start = self.strings + offset
+        return self._map[start:start + length].decode()
+
+    def label_name(self, index):
+        return self._string(self.name_offsets[index], self.name_lengths[index])
+
+    def lookup(self, addr):
+        """(file, line, label, label address) of the instruction at or before addr, or None."""
+        i = bisect.bisect_right(self.addrs, addr) - 1
+        if i < 0:
+            return None
+        label = self.labels[i]
+        if label == NO_LABEL:
+            return self._file_names[self.files[i]], self.lines[i], None, None
+        return self._file_names[self.files[i]], self.lines[i], self.label_name(label), self.label_addrs[label]
+
+    def address(self, name):
+        """Address of a label, or None."""
+        key = name.encode()
+        lo, hi = 0, len(self.name_offsets)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self.strings + self.name_offsets[mid]
+            if self._map[start:start + self.name_lengths[mid]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.name_offsets) and self.label_name(lo) == name:
+            return self.label_addrs[lo]
+        return None
+
+    def symbolize(self, addr):
+        """label+offset (file:line) for display."""
+        found = self.lookup(addr)
+        if found is None:
+            return f"{addr:#06x}"
+        path, line, label, base = found
+        where = f"{label}+{addr - base:#x}" if label is not None else f"{addr:#06x}"
+        return f"{where} ({path}:{line})"
+
+
+def open_for_rom(rom):
+    """SymbolMap for ROM.bin when ROM.sjidx exists, else None."""
+    path = os.path.splitext(rom)[0] + ".sjidx"
+    return SymbolMap(path) if os.path.exists(path) else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("build", help="index one or more listings")
+    p.add_argument("listings", nargs="+")
+    p.add_argument("--source", action="append", help="source files (default: from the listing name)")
+    p = commands.add_parser("lookup", help="address to label and source line")
+    p.add_argument("index")
+    p.add_argument("addrs", nargs="+", type=lambda s: int(s, 0))
+    p = commands.add_parser("label", help="label to address")
+    p.add_argument("index")
+    p.add_argument("names", nargs="+")
+    p = commands.add_parser("bench", help="measure lookups per second")
+    p.add_argument("index")
+    p.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        for listing in args.listings:
+            out = build(listing, sources=args.source)
+            print(f"{listing} -> {out}")
+        return 0
+
+    with SymbolMap(args.index) as symbols:
+        if args.command == "lookup":
+            for addr in args.addrs:
+                print(f"{addr:#06x} {symbols.symbolize(addr)}")
+        elif args.command == "label":
+            missing = 0
+            for name in args.names:
+                addr = symbols.address(name)
+                missing += addr is None
+                print(f"{name} {'not found' if addr is None else f'{addr:#06x}'}")
+            return 1 if missing else 0
+        else:
+            top = symbols.addrs[len(symbols.addrs) - 1] + 1 if len(symbols.addrs) else 1
+            lookup = symbols.lookup
+            start = time.perf_counter()
+            for i in range(args.count):
+                lookup((i * 2654435761) % top)
+            elapsed = time.perf_counter() - start
+            print(f"{args.count} lookups in {elapsed:.2f}s, {args.count / elapsed:,.0f}/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
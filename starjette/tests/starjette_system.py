@@ -0,0 +1,118 @@
+"""
+StarJette reference model with memory mapped devices.
+
+The Zig StarJette cores do not attach any devices yet; the CLINT and UART
+only exist on the RISC-V System (src/emulator/System.zig). This module gives
+the generated device benchmarks a fixed map at the top of the 64 KiB data
+space, mirroring the register layout of src/emulator/device/Clint.zig and
+Uart.zig:
+
+    UART_BASE  + 0x00  THR (write a byte) / RBR (read, 0xFF when empty)
+    UART_BASE  + 0x05  LSR (0x60: transmitter empty)
+    CLINT_BASE + 0x00  msip, enables the timer interrupt when non-zero
+    CLINT_BASE + 0x08  mtimecmp, 64-bit little endian
+    CLINT_BASE + 0x10  mtime, 64-bit little endian, read only
+
+mtime counts instructions divided by the clint divisor. The timer raises
+interrupt 0 (ecause 0x50) while msip != 0 and mtime >= mtimecmp.
+"""
+
+from starjette_model import Cpu
+
+UART_BASE = 0xFF00
+UART_SIZE = 0x20
+CLINT_BASE = 0xFF40
+CLINT_SIZE = 0x20
+
+IRQ_TIMER = 0
+
+
+class Uart:
+    """Transmit-only console that collects everything written to THR."""
+
+    def __init__(self):
+        self.output = bytearray()
+
+    def read(self, offset):
+        if offset == 0:
+            return 0xFF
+        if offset == 5:
+            return 0x60
+        return 0
+
+    def write(self, offset, value):
+        if offset == 0:
+            self.output.append(value & 0xFF)
+
+
+class Clint:
+    """Timer with byte addressable msip, mtimecmp and mtime registers."""
+
+    def __init__(self, divisor=1):
+        self.divisor = divisor
+        self.msip = 0
+        self.mtimecmp = 0
+        self.mtime = 0
+
+    def read(self, offset):
+        if offset < 0x04:
+            return (self.msip >> (8 * offset)) & 0xFF
+        if 0x08 <= offset < 0x10:
+            return (self.mtimecmp >> (8 * (offset - 0x08))) & 0xFF
+        if 0x10 <= offset < 0x18:
+            return (self.mtime >> (8 * (offset - 0x10))) & 0xFF
+        return 0
+
+    def write(self, offset, value):
+        if offset < 0x04:
+            shift = 8 * offset
+            self.msip = (self.msip & ~(0xFF << shift)) | ((value & 0xFF) << shift)
+        elif 0x08 <= offset < 0x10:
+            shift = 8 * (offset - 0x08)
+            self.mtimecmp = (self.mtimecmp & ~(0xFF << shift)) | ((value & 0xFF) << shift)
+
+    def pending(self):
+        return self.msip != 0 and self.mtime >= self.mtimecmp
+
+
+class System(Cpu):
+    """Cpu plus a Uart and a Clint on the data bus."""
+
+    def __init__(self, clint_divisor=1, **kwargs):
+        super().__init__(**kwargs)
+        self.uart = Uart()
+        self.clint = Clint(clint_divisor)
+        self.devices = [
+            (UART_BASE, UART_BASE + UART_SIZE, self.uart),
+            (CLINT_BASE, CLINT_BASE + CLINT_SIZE, self.clint),
+        ]
+
+    def _device(self, phys):
+        for start, end, device in self.devices:
+            if start <= phys < end:
+                return device, phys - start
+        return None, 0
+
+    def _load(self, phys, nbytes):
+        device, offset = self._device(phys)
+        if device is None:
+            return super()._load(phys, nbytes)
+        self.clint.mtime = self.cycles // self.clint.divisor
+        return sum(device.read(offset + i) << (8 * i) for i in range(nbytes))
+
+    def _store(self, phys, nbytes, value):
+        device, offset = self._device(phys)
+        if device is None:
+            super()._store(phys, nbytes, value)
+            return
+        for i in range(nbytes):
+            device.write(offset + i, value >> (8 * i))
+
+    def step(self):
+        clint = self.clint
+        clint.mtime = self.cycles // clint.divisor
+        if clint.pending():
+            self.irq_lines |= 1 << IRQ_TIMER
+        else:
+            self.irq_lines &= ~(1 << IRQ_TIMER)
+        return super().step()
@@ -0,0 +1,228 @@
+"""
+Pipeline timing model layered on the reference model.
+
+The functional model (starjette_model.py) executes one instruction per step.
+A Pipeline watches that instruction stream and charges the cycles a given
+microarchitecture would spend on it, so CPI can be compared between
+pipeline depths, forwarding and the fusion rules from the manual (sections 1,
+3.2.1 and 3.4.2) before any of them are built:
+
+    stages          1-5. Taken control transfers are resolved in execute and
+                    flush the stages in front of it.
+    forward_tos     Whether a result in tos is forwarded to the next
+                    instruction. Without it a dependent instruction waits for
+                    writeback (stages - 2 cycles).
+    load_use        Cycles an instruction reading tos waits behind a load,
+                    for pipelines with a memory stage after execute.
+    shared_port     Instruction fetch and data access share one memory
+                    port, so every data access steals a fetch cycle.
+    mem_latency     Extra cycles for each data access.
+    fuse            Any of "imm" (push + shi chains), "local" (push imm;
+                    rel fp; lw/sw, i.e. llw/slw) and "alu" (push imm into
+                    the following instruction that consumes it).
+    frame_cache     Fused local loads and stores hit a frame cache: no load
+                    use stall and no memory port.
+
+The model is trace driven and in order: every instruction that is not fused
+away issues in one cycle plus its stalls.
+"""
+
+from starjette_model import OPCODES, MIN_DEPTH, decode
+
+PUSH_IMM = 0x40
+SHI = 0x41
+
+BRANCH_OPS = frozenset([OPCODES["beqz"], OPCODES["bnez"]])
+JUMP_OPS = frozenset([OPCODES["add pc"], OPCODES["pop pc"]])
+CALL_OPS = frozenset([OPCODES["callp"], OPCODES["rets"]])
+
+LOAD_OPS = frozenset(OPCODES[name] for name in ["lw", "lb", "lh", "lnw"])
+STORE_OPS = frozenset(OPCODES[name] for name in ["sw", "sb", "sh", "snw"])
+MEMORY_OPS = LOAD_OPS | STORE_OPS
+LOCAL_OPS = frozenset([OPCODES["lw"], OPCODES["sw"]])
+
+# Instructions that leave nothing new in tos
+NO_RESULT_OPS = frozenset(OPCODES[name] for name in [
+    "halt", "rets", "syscall", "callp", "beqz", "bnez", "drop",
+    "pop pc", "pop fp", "pop rx", "pop ry", "add pc", "add fp", "add rx",
+    "add ry", "popcsr",
+]) | STORE_OPS
+
+STALL_KINDS = ["branch", "jump", "call", "trap", "load_use", "tos", "memory"]
+
+# Push immediate flavours of fusion
+FUSE_KINDS = frozenset(["imm", "local", "alu"])
+
+
+class Pipeline:
+    """Cycle accounting for one pipeline configuration."""
+
+    def __init__(self, name, stages=3, forward_tos=True, load_use=None,
+                 branch_penalty=None, shared_port=False, mem_latency=0,
+                 fuse=(), frame_cache=False):
+        if not 1 <= stages <= 5:
+            raise ValueError(f"unsupported pipeline depth {stages}")
+        if not FUSE_KINDS.issuperset(fuse):
+            raise ValueError(f"unknown fusion rules {sorted(set(fuse) - FUSE_KINDS)}")
+        self.name = name
+        self.stages = stages
+        self.forward_tos = forward_tos
+        self.load_use = (1 if stages >= 4 else 0) if load_use is None else load_use
+        self.branch_penalty = stages - 1 if branch_penalty is None else branch_penalty
+        self.tos_penalty = 0 if forward_tos else max(stages - 2, 0)
+        self.shared_port = shared_port
+        self.mem_latency = mem_latency
+        self.fuse = frozenset(fuse)
+        self.frame_cache = frame_cache
+        self.reset()
+
+    def reset(self):
+        self.instructions = 0
+        self.cycles = 0
+        self.fused = 0
+        self.stalls = dict.fromkeys(STALL_KINDS, 0)
+        # Open fusion group: None, "imm" (push/shi chain) or "local"
+        # (push imm; rel fp), plus what the instruction before it produced
+        self._group = None
+        self._last = None
+        self._prior = None
+
+    @property
+    def cpi(self):
+        return self.cycles / self.instructions if self.instructions else 0.0
+
+    def describe(self):
+        parts = [f"{self.stages} stage"]
+        parts.append("tos forwarding" if self.forward_tos else "no forwarding")
+        if self.shared_port:
+            parts.append("shared memory port")
+        if self.mem_latency:
+            parts.append(f"+{self.mem_latency} memory latency")
+        if self.fuse:
+            parts.append("fuse " + "/".join(sorted(self.fuse)))
+        if self.frame_cache:
+            parts.append("frame cache")
+        return ", ".join(parts)
+
+    def _fuses(self, op):
+        """Whether op joins the open push immediate group."""
+        group = self._group
+        if group == "imm":
+            if op == SHI:
+                return "imm" in self.fuse
+            if op == OPCODES["rel fp"]:
+                return "local" in self.fuse
+            return "alu" in self.fuse and op < PUSH_IMM and MIN_DEPTH[op] >= 1
+        if group == "local":
+            return op in LOCAL_OPS
+        return False
+
+    def _data_stall(self, op, producer):
+        if not MIN_DEPTH[op] or op == SHI:
+            return None, 0
+        if producer == "load" and self.load_use:
+            return "load_use", self.load_use
+        if producer in ("load", "result") and self.tos_penalty:
+            return "tos", self.tos_penalty
+        return None, 0
+
+    def observe(self, pc, byte, next_pc, sequential):
+        """
+        Account for one executed instruction.
+
+        sequential: next_pc is pc + 1, i.e. no branch, jump, call or trap.
+        """
+        self.instructions += 1
+        op = decode(byte)
+        stalls = self.stalls
+        cycles = 0
+
+        if self._fuses(op):
+            self.fused += 1
+            # The fused instruction reads what was in tos before the group
+            producer = self._prior
+            local = self._group == "local"
+            self._group = "imm" if op == SHI else ("local" if op == OPCODES["rel fp"] else None)
+        else:
+            cycles += 1
+            producer = self._last
+            self._prior = self._last
+            local = False
+            self._group = "imm" if op == PUSH_IMM and self.fuse else None
+
+        kind, stall = self._data_stall(op, producer)
+        if kind:
+            stalls[kind] += stall
+            cycles += stall
+            # Only the first instruction in a group waits
+            self._prior = None
+
+        if op in MEMORY_OPS:
+            if local and self.frame_cache:
+                self._last = "result"
+            else:
+                port = (1 if self.shared_port else 0) + self.mem_latency
+                stalls["memory"] += port
+                cycles += port
+                self._last = "load" if op in LOAD_OPS else None
+        elif op in NO_RESULT_OPS:
+            self._last = None
+        else:
+            self._last = "result"
+
+        if not sequential:
+            if op in BRANCH_OPS:
+                kind = "branch"
+            elif op in JUMP_OPS:
+                kind = "jump"
+            elif op in CALL_OPS:
+                kind = "call"
+            else:
+                kind = "trap"
+            stalls[kind] += self.branch_penalty
+            cycles += self.branch_penalty
+            self._group = None
+            self._last = None
+            self._prior = None
+
+        self.cycles += cycles
+
+    def summary(self):
+        """Stall cycles per kind as a fraction of all cycles."""
+        return {kind: count / self.cycles for kind, count in self.stalls.items() if count} if self.cycles else {}
+
+
+PIPELINES = {
+    "1stage": dict(stages=1),
+    "1stage_shared": dict(stages=1, shared_port=True),
+    "2stage": dict(stages=2),
+    "3stage": dict(stages=3),
+    "3stage_noforward": dict(stages=3, forward_tos=False),
+    "3stage_fused": dict(stages=3, fuse=["imm", "local", "alu"]),
+    "4stage_fused": dict(stages=4, fuse=["imm", "local", "alu"]),
+    "5stage_frame": dict(stages=5, fuse=["imm", "local", "alu"], frame_cache=True),
+}
+
+
+def make_pipelines(names=None):
+    """Pipeline instances for the named presets, all of them by default."""
+    return [Pipeline(name, **PIPELINES[name]) for name in (names or PIPELINES)]
+
+
+def timed_run(cpu, pipelines, max_cycles):
+    """
+    Run cpu until it halts or executes max_cycles instructions, feeding every
+    instruction to each pipeline. Returns the number of instructions run.
+    """
+    observers = [p.observe for p in pipelines]
+    mask = cpu.mask
+    start = cpu.cycles
+    step = cpu.step
+    while not cpu.halted and cpu.cycles - start < max_cycles:
+        pc = cpu.pc
+        byte = step()
+        next_pc = cpu.pc
+        sequential = next_pc == (pc + 1) & mask
+        for observe in observers:
+            observe(pc, byte, next_pc, sequential)
+    return cpu.cycles - start
@@ -0,0 +1,378 @@
+"""
+Superoptimizer for the stack pseudo-ops in customasm/cpudef.asm and for hot
+instruction sequences in the benchmarks.
+
+Sequences of pure stack instructions (no memory, registers, CSRs or control
+flow) plus a few one byte constants are enumerated breadth first, shortest
+first, with the semantics of every instruction taken from the oracle
+compiled from the ISA manual (spec_oracle.py). All sequences of a length
+run at once as one vectorized batch over a set of random and edge case
+stacks; a sequence whose resulting stacks match one already seen is pruned,
+since any continuation of it is matched by the same continuation of the
+earlier one. A sequence matching a target on the batch is then checked on
+edge case and random stacks at 16 and 32 bits and, for one or two inputs,
+over every input stack at a narrow word size (16 bits for one input, 8 for
+two). Three inputs have no exhaustive pass: 24 bits of inputs at the
+narrowest power of two word size is too many lanes.
+
+Two instruction sets are searched, so cores without the extended
+instructions get their own answer:
+
+    basic       swap over drop dup ltu lt add and xor fsl
+    extended    the above plus mul rot srl sra sll or sub clz
+
+Targets are every cpudef.asm pseudo-op without operands that expands to pure
+stack code (forms with an immediate are `push imm` and one of these), and
+with --ngrams the sequences executed most often by the given ROMs. Only
+sequences reading at most three stack items are searched.
+
+Usage (from starjette/): python tests/superopt.py [--max-length N] [--ngrams [ROM or manifest ...]] [--top K]
+Needs numpy.
+"""
+
+import argparse
+import collections
+import itertools
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+import spec_oracle
+from starjette_model import MIN_DEPTH, OPCODE_NAMES, OPCODES, decode
+
+CPUDEF = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "customasm", "cpudef.asm")
+
+BASIC = ["swap", "over", "drop", "dup", "ltu", "lt", "add", "and", "xor", "fsl"]
+EXTENDED = BASIC + ["mul", "rot", "srl", "sra", "sll", "or", "sub", "clz"]
+CONSTANTS = [0, 1, -1, 2]
+
+MAX_INPUTS = 3
+# Stack items a sequence may hold above its inputs while it runs
+MAX_GROWTH = 2
+SEARCH_RANDOM = 64
+VERIFY_RANDOM = 20_000
+# Lanes per oracle call, to bound memory
+CHUNK = 1 << 16
+SEED = 0x50F7
+
+
+def push(value):
+    return f"push {value}"
+
+
+def reads(op):
+    """Stack items an instruction reads."""
+    return 0 if op.startswith("push ") else MIN_DEPTH[OPCODES[op]]
+
+
+def needed(seq):
+    """Stack items a sequence reads from below its own pushes."""
+    need = depth = 0
+    for op in seq:
+        depth -= reads(op)
+        need = max(need, -depth)
+        depth += RESULTS[op] if op in RESULTS else 1
+    return need
+
+
+# Items each instruction leaves in place of the ones it reads, filled in by stack_effects()
+RESULTS = {}
+
+
+def stack_effects(module):
+    for op in EXTENDED:
+        columns = [np.zeros(1, dtype=np.int64)] * spec_oracle.WINDOW
+        out = spec_oracle.apply(module, op, columns)
+        RESULTS[op] = reads(op) + int(out["depth"][0]) - spec_oracle.WINDOW
+
+
+def step(module, op, stacks, wordsize, lanes):
+    """
+    Apply op to a stack (a list of columns, top first, possibly empty) for
+    lanes lanes at once. Returns the new stack.
+    """
+    if op.startswith("push "):
+        value = int(op.split()[1]) & ((1 << wordsize) - 1)
+        return [np.full(lanes, value, dtype=np.int64)] + stacks
+    k = reads(op)
+    top = stacks[:spec_oracle.WINDOW]
+    top = top + [np.zeros(lanes, dtype=np.int64)] * (spec_oracle.WINDOW - len(top))
+    outputs = [[] for _ in range(RESULTS[op])]
+    for start in range(0, lanes, CHUNK):
+        out = spec_oracle.apply(module, op, [column[start:start + CHUNK] for column in top], wordsize)
+        for j, part in enumerate(outputs):
+            part.append(out[spec_oracle.SLOTS[j]])
+    return [np.concatenate(part) for part in outputs] + stacks[k:]
+
+
+def run(module, seq, stacks, wordsize):
+    lanes = len(stacks[0])
+    for op in seq:
+        stacks = step(module, op, stacks, wordsize, lanes)
+    return stacks
+
+
+# --- Targets ---------------------------------------------------------------
+
+def pseudo_ops(path=CPUDEF):
+    """{name: expansion} for the cpudef.asm rules without operands, expanded to instructions."""
+    with open(path) as f:
+        text = f.read()
+    rules = {}
+    for match in re.finditer(r"^\s*([a-z][\w ]*?)\s*=>\s*asm\s*\{(.*?)\}", text, re.M | re.S):
+        body = [line.split(";")[0].strip() for line in match.group(2).splitlines()]
+        rules[match.group(1)] = [line for line in body if line]
+
+    def expand(line):
+        if line in rules:
+            return [op for inner in rules[line] for op in expand(inner)]
+        return [line]
+
+    return {name: expand(name) for name in rules}
+
+
+def pure(seq):
+    """Whether every instruction of seq is in the search alphabet or a one byte push."""
+    for op in seq:
+        if op.startswith("push "):
+            try:
+                value = int(op.split()[1], 0)
+            except ValueError:
+                return False
+            if not -32 <= value < 32:
+                return False
+        elif op not in EXTENDED:
+            return False
+    return True
+
+
+def normalize(seq):
+    return [push(int(op.split()[1], 0)) if op.startswith("push ") else op for op in seq]
+
+
+def hot_ngrams(paths, lengths, top):
+    """The top executed pure sequences of the given ROMs, by instructions executed in them."""
+    from pipeline_report import collect_roms
+    from starjette_system import System
+
+    counts = collections.Counter()
+    for label, path, max_cycles, wordsize in collect_roms(paths):
+        if not os.path.exists(path):
+            continue
+        cpu = System(wordsize=wordsize)
+        cpu.load_rom(path)
+        run_ops = []
+
+        def flush():
+            for n in lengths:
+                for i in range(len(run_ops) - n + 1):
+                    counts[tuple(run_ops[i:i + n])] += 1
+            run_ops.clear()
+
+        while not cpu.halted and cpu.cycles < max_cycles:
+            pc = cpu.pc
+            byte = cpu.step()
+            if byte & 0x80:
+                # shi extends the push before it, which is then not a one byte push
+                if run_ops and run_ops[-1].startswith("push "):
+                    run_ops.pop()
+                flush()
+                continue
+            if byte & 0x40:
+                run_ops.append(push((byte & 0x3F) - ((byte & 0x20) << 1)))
+            else:
+                name = OPCODE_NAMES.get(decode(byte))
+                if name in EXTENDED and cpu.pc == (pc + 1) & cpu.mask:
+                    run_ops.append(name)
+                else:
+                    flush()
+        flush()
+    ranked = sorted(counts.items(), key=lambda item: -item[1] * len(item[0]))
+    return [(list(seq), count) for seq, count in ranked if needed(seq) <= MAX_INPUTS][:top]
+
+
+# --- Search ----------------------------------------------------------------
+
+def edge_values(wordsize):
+    mask = (1 << wordsize) - 1
+    return [0, 1, 2, mask, mask - 1, mask >> 1, (mask >> 1) + 1, wordsize - 1, wordsize, 0x5A5A & mask]
+
+
+def sample_stacks(rng, inputs, wordsize, random_lanes):
+    """Columns for inputs stack items: edge value combinations plus random words."""
+    mask = (1 << wordsize) - 1
+    combos = np.array(list(itertools.product(edge_values(wordsize), repeat=inputs)), dtype=np.int64)
+    if len(combos) > 256:
+        combos = combos[rng.choice(len(combos), 256, replace=False)]
+    columns = []
+    for i in range(inputs):
+        columns.append(np.concatenate([combos[:, i], rng.integers(0, mask + 1, random_lanes, dtype=np.int64)]))
+    return columns
+
+
+def exhaustive_stacks(inputs):
+    """(wordsize, columns) covering every input stack at a narrow word size, None for three inputs."""
+    wordsize = {1: 16, 2: 8}.get(inputs)
+    if wordsize is None:
+        return None
+    grid = np.indices((1 << wordsize,) * inputs).reshape(inputs, -1)
+    return wordsize, [grid[i].astype(np.int64) for i in range(inputs)]
+
+
+def same(a, b):
+    return len(a) == len(b) and all(np.array_equal(x, y) for x, y in zip(a, b))
+
+
+def verify(module, seq, target, inputs, rng):
+    """Whether seq computes what target does on edge case and random words, and exhaustively where feasible."""
+    checks = [check for check in [exhaustive_stacks(inputs)] if check]
+    for wordsize in (16, 32):
+        checks.append((wordsize, sample_stacks(rng, inputs, wordsize, VERIFY_RANDOM)))
+    return all(same(run(module, seq, stacks, wordsize), run(module, target, stacks, wordsize))
+               for wordsize, stacks in checks)
+
+
+def fingerprint(stack, lane_range):
+    return len(stack), b"".join(column[lane_range].tobytes() for column in stack)
+
+
+def search(module, targets, inputs, alphabet, max_length, wordsize=16, seed=SEED):
+    """
+    Shortest sequences over alphabet equal to each target (name: sequence)
+    reading inputs stack items. Returns {name: [candidates]} in the order
+    found, shortest first.
+    """
+    rng = np.random.default_rng(seed)
+    stacks = sample_stacks(rng, inputs, wordsize, SEARCH_RANDOM)
+    lanes = len(stacks[0])
+    wanted = collections.defaultdict(list)
+    for name, target in targets.items():
+        wanted[fingerprint(run(module, target, stacks, wordsize), slice(None))].append(name)
+
+    found = collections.defaultdict(list)
+    seen = {fingerprint(stacks, slice(None))}
+    frontier = [((), stacks)]
+    for length in range(1, max_length + 1):
+        by_depth = collections.defaultdict(list)
+        for seq, stack in frontier:
+            by_depth[len(stack)].append((seq, stack))
+        frontier = []
+        for depth, nodes in by_depth.items():
+            for op in alphabet:
+                k = reads(op)
+                grow = RESULTS.get(op, k + 1) - k
+                if k > depth or depth + grow > inputs + MAX_GROWTH:
+                    continue
+                # Every node of this depth in one batch
+                batch = [np.concatenate([stack[j] for _, stack in nodes]) for j in range(depth)]
+                out = step(module, op, batch, wordsize, lanes * len(nodes))
+                for i, (seq, _) in enumerate(nodes):
+                    lane_range = slice(i * lanes, (i + 1) * lanes)
+                    key = fingerprint(out, lane_range)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    new_seq = seq + (op,)
+                    for name in wanted.get(key, ()):
+                        found[name].append(list(new_seq))
+                    frontier.append((new_seq, [column[lane_range] for column in out]))
+    return found
+
+
+def best(module, targets, inputs, alphabet, max_length, rng):
+    """{name: (sequence or None, verified)} for targets, keeping the first confirmed candidate."""
+    found = search(module, targets, inputs, alphabet, max_length)
+    results = {}
+    for name, target in targets.items():
+        results[name] = (None, False)
+        for candidate in found.get(name, []):
+            if verify(module, candidate, target, inputs, rng):
+                results[name] = (candidate, True)
+                break
+            results[name] = (candidate, False)
+    return results
+
+
+def describe(seq):
+    return "; ".join(seq) if seq else "-"
+
+
+def optimize(module, targets, max_length, rng):
+    """Print a table of the best basic and extended sequences for each target."""
+    groups = collections.defaultdict(dict)
+    for name, seq in targets.items():
+        # A sequence reading nothing is searched over one item it must leave alone
+        groups[max(needed(seq), 1)][name] = seq
+    answers = {}
+    for inputs, group in sorted(groups.items()):
+        constants = sorted({int(op.split()[1]) for seq in group.values() for op in seq if op.startswith("push ")}
+                           | set(CONSTANTS))
+        pushes = [push(value) for value in constants]
+        for label, alphabet in (("basic", BASIC), ("extended", EXTENDED)):
+            for name, result in best(module, group, inputs, alphabet + pushes, max_length, rng).items():
+                answers[name, label] = result
+
+    width = max(len(name) for name in targets) + 2
+    print(f"{'target':<{width}} {'inputs':>6}  {'length':>6}  {'sequence'}")
+    for name, seq in targets.items():
+        print(f"{name:<{width}} {needed(seq):>6}  {len(seq):>6}  {describe(seq)}")
+        for label in ("basic", "extended"):
+            candidate, verified = answers[name, label]
+            if candidate is None:
+                note = f"nothing up to {max_length} instructions"
+            else:
+                note = "shorter" if len(candidate) < len(seq) else \
+                    "longer, but basic only" if len(candidate) > len(seq) else "nothing shorter"
+                if not verified:
+                    note += ", NOT CONFIRMED"
+            print(f"{'':<{width}} {label:>14}  {len(candidate) if candidate else '':>2}  {describe(candidate)}"
+                  f"  ({note})")
+    return answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-length", type=int, default=4, help="longest sequence searched (default 4)")
+    parser.add_argument("--ngrams", nargs="*", metavar="ROM", help="also optimize the hottest sequences of these "
+                        ".bin or manifest.json files (all built ROMs if none are given)")
+    parser.add_argument("--top", type=int, default=20, help="hot sequences to optimize (default 20)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    module = spec_oracle.load()
+    stack_effects(module)
+    rng = np.random.default_rng(SEED)
+
+    targets, skipped = {}, []
+    for name, seq in pseudo_ops().items():
+        seq = normalize(seq) if pure(seq) else seq
+        if pure(seq) and needed(seq) <= MAX_INPUTS:
+            targets[name] = seq
+        else:
+            skipped.append(name)
+    print(f"pseudo-ops from {os.path.relpath(CPUDEF)} (not pure stack code: {', '.join(skipped)})\n")
+    optimize(module, targets, args.max_length, rng)
+
+    if args.ngrams is not None:
+        hot = hot_ngrams(args.ngrams, range(2, args.max_length + 2), args.top)
+        print("\nhottest executed sequences, by instructions spent in them")
+        grams = {describe(seq): seq for seq, _ in hot}
+        for seq, count in hot:
+            print(f"    {count:>9}x  {describe(seq)}")
+        print()
+        answers = optimize(module, grams, args.max_length, rng)
+        saved = 0
+        for seq, count in hot:
+            candidate, verified = answers[describe(seq), "extended"]
+            if verified:
+                saved += count * (len(seq) - len(candidate))
+        print(f"\ninstructions the confirmed extended replacements above would have saved: {saved}")
+    print(f"\n({time.perf_counter() - start:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
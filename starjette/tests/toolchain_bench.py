@@ -0,0 +1,333 @@
+"""
+Benchmarks for the Python test toolchain itself, tracked per commit.
+
+Like asv, every benchmark (see benchmarks()) measures a rate, and results
+are stored per machine and commit as JSON
+(tests/bench_results/MACHINE/COMMIT.json) so two commits can be compared
+offline. Each benchmark runs --repeat times and the median rate is kept.
+
+    generate/NAME     .asm files written per second by each generate_*.py
+                      (run in a scratch directory, the tree is not touched)
+    vectors           single-step vectors per second (generate_vectors.py,
+                      needs numpy)
+    model/OP          reference model steps per second for each opcode from
+                      randomized states
+    spec_oracle/OP    lanes per second through each instruction compiled by
+                      spec_oracle.py, on the states its --check uses (needs
+                      numpy)
+    assemble/ROM      customasm runs per second for a sample of ROMs (needs
+                      customasm)
+    simulate/sieve    reference simulator instructions per second on
+                      examples/sieve.bin (needs the built ROM)
+
+Benchmarks whose requirements are missing are reported as skipped.
+`compare` flags every benchmark whose rate dropped by more than --factor.
+
+Usage (from starjette/):
+    python tests/toolchain_bench.py run [-b REGEX] [--repeat N] [--quick]
+    python tests/toolchain_bench.py compare [BASE [HEAD]] [--factor F]
+BASE and HEAD are commits (default: the last two recorded along HEAD's history).
+"""
+
+import argparse
+import contextlib
+import glob
+import importlib
+import io
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if TESTS_DIR not in sys.path:
+    sys.path.insert(0, TESTS_DIR)
+
+from starjette_model import OPCODES, Cpu  # noqa: E402
+
+RESULTS_DIR = "tests/bench_results"
+GENERATORS = ["generate_tests", "generate_exception_tests", "generate_interrupt_tests",
+              "generate_uart_tests", "generate_context_switch_tests", "generate_dag_tests",
+              "generate_decode_tests", "generate_smc_tests", "generate_encoding_tests",
+              "generate_depth_tests"]
+ASSEMBLE_SAMPLE = ["tests/add.asm", "tests/call_deep.asm", "tests/exceptions/churn_k4_f16.asm", "examples/sieve.asm"]
+
+# Minimum wall time per repeat, so fast benchmarks still get stable rates
+MIN_TIME = 0.2
+
+# States per spec_oracle call
+SPEC_LANES = 4096
+
+
+class Skip(Exception):
+    pass
+
+
+def git(*args):
+    return subprocess.run(["git"] + list(args), capture_output=True, text=True, check=True).stdout.strip()
+
+
+def timed(work):
+    """Rate of work() (which returns units done) over at least MIN_TIME seconds."""
+    units = 0
+    start = time.perf_counter()
+    while True:
+        units += work()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_TIME:
+            return units / elapsed
+
+
+@contextlib.contextmanager
+def scratch_dir():
+    """Work in an empty temporary directory, so generators do not touch the tree."""
+    cwd = os.getcwd()
+    path = tempfile.mkdtemp(prefix="sjbench")
+    try:
+        os.chdir(path)
+        yield path
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(path)
+
+
+def bench_generator(name):
+    def run():
+        with scratch_dir() as path, contextlib.redirect_stdout(io.StringIO()):
+            module = importlib.import_module(name)
+            suite_dir = getattr(module, "SUITE_DIR", "tests")
+            os.makedirs(suite_dir, exist_ok=True)
+
+            def work():
+                module.main()
+                return len(glob.glob(os.path.join(path, suite_dir, "*.asm")))
+
+            return timed(work)
+    return run, "files/s"
+
+
+def bench_vectors():
+    def run():
+        try:
+            generate_vectors = importlib.import_module("generate_vectors")
+        except ImportError as e:
+            raise Skip(str(e))
+        groups = generate_vectors.opcode_bytes()
+        with scratch_dir():
+            def work():
+                count = 20
+                for name, choices in groups:
+                    generate_vectors.generate_group(name, choices, count, 16, 0x57A7)
+                return count * len(groups)
+            return timed(work)
+    return run, "vectors/s"
+
+
+def random_cpu(rng, byte):
+    """A kernel mode Cpu about to execute byte with four random stack items."""
+    cpu = Cpu()
+    cpu.pc = 0x1000
+    cpu.mem[0x1000] = byte
+    cpu.rx = rng.randrange(0x2000, 0x3000) & ~1
+    cpu.ry = rng.randrange(0x3000, 0x4000) & ~1
+    for _ in range(4):
+        cpu.push(rng.choice([0, 1, 2, 0x7FFF, 0x8000, 0xFFFF, rng.getrandbits(16)]))
+    return cpu
+
+
+def bench_model(byte):
+    def run():
+        rng = random.Random(byte)
+        states = [random_cpu(rng, byte) for _ in range(16)]
+        saved = [(cpu.pc, cpu.rx, cpu.ry, cpu.depth, list(cpu.stack[:8])) for cpu in states]
+
+        def work():
+            for cpu, (pc, rx, ry, depth, stack) in zip(states, saved):
+                cpu.pc, cpu.rx, cpu.ry, cpu.depth = pc, rx, ry, depth
+                cpu.stack[:8] = stack
+                cpu.mem[0x1000] = byte
+                cpu.status, cpu.halted = 1, False
+                cpu.step()
+            return len(states)
+        return timed(work)
+    return run, "steps/s"
+
+
+_spec_module = []
+
+
+def bench_spec_oracle(name, byte):
+    def run():
+        try:
+            import numpy as np
+            import spec_oracle
+        except ImportError as e:
+            raise Skip(str(e))
+        if not _spec_module:
+            _spec_module.append(spec_oracle.load())
+        module = _spec_module[0]
+        if name not in module.OPS:
+            raise Skip(f"not compiled ({module.SKIPPED[name]})" if name in module.SKIPPED else "not compiled")
+        function = module.OPS[name]
+        state = spec_oracle.random_states(np.random.default_rng(byte), SPEC_LANES, 16, byte)
+
+        def work():
+            function(state, 16)
+            return SPEC_LANES
+        return timed(work)
+    return run, "lanes/s"
+
+
+def bench_assemble(source):
+    def run():
+        if shutil.which("customasm") is None:
+            raise Skip("customasm not found")
+        if not os.path.exists(source):
+            raise Skip(f"{source} not generated")
+        inputs = [source] if source.startswith("examples/") else \
+            ["customasm/cpudef.asm"] + ([] if "/bootstrap/" in source else ["customasm/test_shim.asm"]) + [source]
+        with tempfile.TemporaryDirectory() as path:
+            def work():
+                subprocess.run(["customasm", "-q", "-f", "binary", "-o", os.path.join(path, "out.bin")] + inputs,
+                               check=True, capture_output=True)
+                return 1
+            return timed(work)
+    return run, "roms/s"
+
+
+def bench_sieve():
+    def run():
+        if not os.path.exists("examples/sieve.bin"):
+            raise Skip("examples/sieve.bin not built")
+        cpu = Cpu()
+
+        def work():
+            cpu.reset()
+            cpu.load_rom("examples/sieve.bin")
+            return cpu.run(10_000_000)
+        return timed(work)
+    return run, "instrs/s"
+
+
+def benchmarks(quick=False):
+    """{name: (run, unit)}, in report order."""
+    found = {}
+    for name in GENERATORS:
+        found[f"generate/{name[len('generate_'):]}"] = bench_generator(name)
+    found["vectors"] = bench_vectors()
+    ops = sorted(OPCODES.items(), key=lambda item: item[1])
+    if quick:
+        ops = [item for item in ops if item[0] in ("add", "beqz", "lw", "callp", "pop pc", "mul")]
+    ops += [("push", 0x45), ("shi", 0x85)]
+    for name, code in ops:
+        found[f"model/{name.replace(' ', '_')}"] = bench_model(code)
+    for name, code in ops:
+        found[f"spec_oracle/{name.replace(' ', '_')}"] = bench_spec_oracle(name, code)
+    for source in ASSEMBLE_SAMPLE:
+        found[f"assemble/{os.path.basename(source)[:-4]}"] = bench_assemble(source)
+    found["simulate/sieve"] = bench_sieve()
+    return found
+
+
+def machine():
+    return re.sub(r"[^\w.-]", "_", platform.node() or "unknown")
+
+
+def run(args):
+    commit = git("rev-parse", "HEAD")
+    selected = {name: bench for name, bench in benchmarks(args.quick).items()
+                if args.bench is None or re.search(args.bench, name)}
+    results = {}
+    for name, (bench, unit) in selected.items():
+        try:
+            samples = [bench() for _ in range(args.repeat)]
+        except Skip as e:
+            print(f"{name:<32} skipped: {e}")
+            continue
+        rate = statistics.median(samples)
+        results[name] = {"rate": rate, "unit": unit, "samples": samples}
+        print(f"{name:<32} {rate:>14,.1f} {unit}")
+
+    directory = os.path.join(RESULTS_DIR, machine())
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{commit}.json")
+    previous = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            previous = json.load(f)["results"]
+    with open(path, "w") as f:
+        json.dump({
+            "commit": commit,
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+            "date": time.time(),
+            "machine": machine(),
+            "python": platform.python_version(),
+            "results": {**previous, **results},
+        }, f, indent=2)
+        f.write("\n")
+    print(f"results in {path}")
+    return 0
+
+
+def load(commit):
+    path = os.path.join(RESULTS_DIR, machine(), f"{commit}.json")
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(args):
+    directory = os.path.join(RESULTS_DIR, machine())
+    recorded = {os.path.basename(p)[:-5] for p in glob.glob(os.path.join(directory, "*.json"))}
+    if args.base and args.head:
+        base, head = git("rev-parse", args.base), git("rev-parse", args.head)
+    else:
+        history = [c for c in git("rev-list", "HEAD").split() if c in recorded]
+        if args.base:
+            base, head = git("rev-parse", args.base), history[0] if history else None
+        elif len(history) >= 2:
+            head, base = history[0], history[1]
+        else:
+            print(f"need results for two commits in {directory}")
+            return 1
+    if base not in recorded or head not in recorded:
+        print(f"no results for {base[:10] if base not in recorded else head[:10]} in {directory}")
+        return 1
+
+    old, new = load(base), load(head)
+    print(f"{base[:10]} -> {head[:10]}, flagging rates that dropped by more than {args.factor:g}x")
+    regressions = 0
+    for name in [n for n in new if n in old]:
+        ratio = new[name]["rate"] / old[name]["rate"]
+        slower = ratio * args.factor < 1
+        faster = ratio > args.factor
+        regressions += slower
+        mark = "REGRESSION " if slower else "improvement" if faster else ""
+        print(f"{mark:<11} {name:<32} {old[name]['rate']:>14,.1f} -> {new[name]['rate']:>14,.1f} "
+              f"{new[name]['unit']:<9} {ratio:6.2f}x")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("run", help="run the benchmarks and record them for HEAD")
+    p.add_argument("-b", "--bench", help="only benchmarks matching this regex")
+    p.add_argument("--repeat", type=int, default=3, help="runs per benchmark, median kept (default 3)")
+    p.add_argument("--quick", action="store_true", help="only a few representative opcodes")
+    p = commands.add_parser("compare", help="compare the results of two commits")
+    p.add_argument("base", nargs="?")
+    p.add_argument("head", nargs="?")
+    p.add_argument("--factor", type=float, default=1.1, help="slowdown that counts as a regression (default 1.1)")
+    args = parser.parse_args()
+    return run(args) if args.command == "run" else compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
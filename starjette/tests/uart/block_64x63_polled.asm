@@ -0,0 +1,47 @@
+; 64 lines of 63 characters, polling LSR
+    jump _main
+
+#bank code
+
+_main:
+    li rx, 0
+_blk_line:
+    li ry, 0
+_blk_col:
+    push rx
+    rel ry
+    push 0x3f
+    and
+    add 0x30
+_poll_0:
+    push 0xff05
+    lb
+    push 0x20
+    and
+    beqz _poll_0
+    push 0xff00
+    sb
+    add ry, 1
+    push ry
+    push 63
+    xor
+    bnez _blk_col
+
+    push 10
+_poll_1:
+    push 0xff05
+    lb
+    push 0x20
+    and
+    beqz _poll_1
+    push 0xff00
+    sb
+    add rx, 1
+    push rx
+    push 64
+    xor
+    bnez _blk_line
+
+    ; All passed
+    push 1
+    halt
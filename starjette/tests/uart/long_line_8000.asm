@@ -0,0 +1,31 @@
+; A single 8000 character line
+    jump _main
+
+#bank code
+
+_main:
+    push 0x41           ; 'A'
+    li rx, 8000
+_long:
+    dup
+    push 0xff00
+    sb
+    add 1
+    dup
+    push 0x5b           ; 'Z' + 1
+    xor
+    bnez _long_next
+    drop
+    push 0x41
+_long_next:
+    add rx, -1
+    push rx
+    bnez _long
+    drop
+
+    push 10  ; newline
+    push 0xff00
+    sb
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,166 @@
+; 500 lines of n=%05u 0x%04x, stepping by 1237
+    jump _main
+
+#bank code
+
+_main:
+    push 0
+    li ry, 500
+_num_line:
+    push 110  ; n
+    push 0xff00
+    sb
+    push 61  ; =
+    push 0xff00
+    sb
+    dup
+    call _putdec
+    push 32  ; space
+    push 0xff00
+    sb
+    push 48  ; 0
+    push 0xff00
+    sb
+    push 120  ; x
+    push 0xff00
+    sb
+    dup
+    call _puthex
+    push 10  ; newline
+    push 0xff00
+    sb
+    add 1237
+    add ry, -1
+    push ry
+    bnez _num_line
+    drop
+
+    ; All passed
+    push 1
+    halt
+
+_putdec:             ; ( n -- )
+    push 0              ; n digit
+_dec_10000:
+    over
+    push 10000
+    ltu
+    bnez _dec_10000_done
+    swap
+    add -10000
+    swap
+    add 1
+    jump _dec_10000
+_dec_10000_done:
+    add 0x30
+    push 0xff00
+    sb
+    push 0              ; n digit
+_dec_1000:
+    over
+    push 1000
+    ltu
+    bnez _dec_1000_done
+    swap
+    add -1000
+    swap
+    add 1
+    jump _dec_1000
+_dec_1000_done:
+    add 0x30
+    push 0xff00
+    sb
+    push 0              ; n digit
+_dec_100:
+    over
+    push 100
+    ltu
+    bnez _dec_100_done
+    swap
+    add -100
+    swap
+    add 1
+    jump _dec_100
+_dec_100_done:
+    add 0x30
+    push 0xff00
+    sb
+    push 0              ; n digit
+_dec_10:
+    over
+    push 10
+    ltu
+    bnez _dec_10_done
+    swap
+    add -10
+    swap
+    add 1
+    jump _dec_10
+_dec_10_done:
+    add 0x30
+    push 0xff00
+    sb
+    add 0x30
+    push 0xff00
+    sb
+    ret ra
+
+_puthex:             ; ( n -- )
+    dup
+    push 12
+    srl
+    push 0x0f
+    and
+    dup
+    push 10
+    ltu
+    bnez _hex_12
+    add 39              ; 'a' - '0' - 10
+_hex_12:
+    add 0x30
+    push 0xff00
+    sb
+    dup
+    push 8
+    srl
+    push 0x0f
+    and
+    dup
+    push 10
+    ltu
+    bnez _hex_8
+    add 39              ; 'a' - '0' - 10
+_hex_8:
+    add 0x30
+    push 0xff00
+    sb
+    dup
+    push 4
+    srl
+    push 0x0f
+    and
+    dup
+    push 10
+    ltu
+    bnez _hex_4
+    add 39              ; 'a' - '0' - 10
+_hex_4:
+    add 0x30
+    push 0xff00
+    sb
+    dup
+    push 0
+    srl
+    push 0x0f
+    and
+    dup
+    push 10
+    ltu
+    bnez _hex_0
+    add 39              ; 'a' - '0' - 10
+_hex_0:
+    add 0x30
+    push 0xff00
+    sb
+    drop
+    ret ra
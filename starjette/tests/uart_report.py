@@ -0,0 +1,86 @@
+"""
+Check UART output against the golden files and report throughput.
+
+By default each ROM runs on the reference model (starjette_system.py). With
+--capture DIR, <name>.out files captured from another emulator are diffed
+instead and only the byte counts are checked.
+
+Usage (from starjette/): python tests/uart_report.py [--capture DIR] [manifest.json]
+The ROMs must be built first with `make uart`.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from starjette_system import System
+
+
+def first_difference(actual, expected):
+    """Offset of the first mismatching byte, or None when equal."""
+    for i, (a, b) in enumerate(zip(actual, expected)):
+        if a != b:
+            return i
+    if len(actual) != len(expected):
+        return min(len(actual), len(expected))
+    return None
+
+
+def describe_difference(actual, expected, offset):
+    line = expected.count(b"\n", 0, offset) + 1
+    return (f"first difference at byte {offset} (line {line}): "
+            f"expected {expected[offset:offset + 16]!r}, got {actual[offset:offset + 16]!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("manifest", nargs="?", default="tests/uart/manifest.json")
+    parser.add_argument("--capture", help="directory of <name>.out files from another emulator")
+    args = parser.parse_args()
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    base = os.path.dirname(args.manifest)
+
+    failures = 0
+    for test in manifest["tests"]:
+        name = os.path.splitext(test["rom"])[0]
+        with open(os.path.join(base, test["golden"]), "rb") as f:
+            expected = f.read()
+
+        if args.capture:
+            with open(os.path.join(args.capture, name + ".out"), "rb") as f:
+                actual = f.read()
+            passed = True
+            stats = ""
+        else:
+            rom = os.path.join(base, test["rom"])
+            if not os.path.exists(rom):
+                print(f"{rom}: missing, run `make uart` first")
+                failures += 1
+                continue
+            cpu = System(wordsize=manifest.get("wordsize", 16))
+            cpu.load_rom(rom)
+            start = time.perf_counter()
+            cpu.run(test["max_cycles"])
+            elapsed = time.perf_counter() - start
+            actual = bytes(cpu.uart.output)
+            passed = cpu.halted and cpu.depth == 1 and cpu.peek() == test["expect"]
+            stats = (f", {cpu.cycles} cycles, {cpu.cycles / max(len(actual), 1):.1f} cycles/byte, "
+                     f"{1000 * len(actual) / max(cpu.cycles, 1):.1f} bytes/1000 cycles, "
+                     f"{len(actual) / elapsed:,.0f} bytes/s host")
+
+        offset = first_difference(actual, expected)
+        passed = passed and offset is None and len(actual) == test["bytes"]
+        failures += not passed
+        print(f"{name}: {'ok' if passed else 'FAIL'}, {len(actual)}/{test['bytes']} bytes{stats}")
+        if offset is not None:
+            print("    " + describe_difference(actual, expected, offset))
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+; Test and instruction
+    ; Case 0: 12 and 10 -> 8
+    push 12
+    push 10
+    and
+    push 8
+    xor
+    failnez
+
+    ; Case 1: 0 and 65535 -> 0
+    push 0
+    push 3
+    shi 0x7f
+    shi 0x7f
+    and
+    push 0
+    xor
+    failnez
+
+    ; Case 2: 65535 and 65535 -> 65535
+    push 3
+    shi 0x7f
+    shi 0x7f
+    push 3
+    shi 0x7f
+    shi 0x7f
+    and
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    failnez
+
+    ; Case 3: 65280 and 4080 -> 3840
+    push 3
+    shi 0x7e
+    shi 0x00
+    push 4080
+    and
+    push 3840
+    xor
+    failnez
+
+    ; Case 4: 21845 and 43690 -> 0
+    push 21845
+    push 2
+    shi 0x55
+    shi 0x2a
+    and
+    push 0
+    xor
+    failnez
+
+    ; Case 5: 4660 and 65535 -> 4660
+    push 4660
+    push 3
+    shi 0x7f
+    shi 0x7f
+    and
+    push 4660
+    xor
+    failnez
+
+    ; Case 6: 32768 and 32768 -> 32768
+    push 2
+    shi 0x00
+    shi 0x00
+    push 2
+    shi 0x00
+    shi 0x00
+    and
+    push 2
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
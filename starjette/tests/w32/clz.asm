@@ -0,0 +1,194 @@
+; Test clz instruction
+    ; Case 0: clz 0 -> 32
+    push 0
+    clz
+    push 32
+    xor
+    failnez
+
+    ; Case 1: clz 1 -> 31
+    push 1
+    clz
+    push 31
+    xor
+    failnez
+
+    ; Case 2: clz 2 -> 30
+    push 2
+    clz
+    push 30
+    xor
+    failnez
+
+    ; Case 3: clz 4 -> 29
+    push 4
+    clz
+    push 29
+    xor
+    failnez
+
+    ; Case 4: clz 8 -> 28
+    push 8
+    clz
+    push 28
+    xor
+    failnez
+
+    ; Case 5: clz 16 -> 27
+    push 16
+    clz
+    push 27
+    xor
+    failnez
+
+    ; Case 6: clz 32 -> 26
+    push 32
+    clz
+    push 26
+    xor
+    failnez
+
+    ; Case 7: clz 64 -> 25
+    push 64
+    clz
+    push 25
+    xor
+    failnez
+
+    ; Case 8: clz 128 -> 24
+    push 128
+    clz
+    push 24
+    xor
+    failnez
+
+    ; Case 9: clz 256 -> 23
+    push 256
+    clz
+    push 23
+    xor
+    failnez
+
+    ; Case 10: clz 512 -> 22
+    push 512
+    clz
+    push 22
+    xor
+    failnez
+
+    ; Case 11: clz 1024 -> 21
+    push 1024
+    clz
+    push 21
+    xor
+    failnez
+
+    ; Case 12: clz 2048 -> 20
+    push 2048
+    clz
+    push 20
+    xor
+    failnez
+
+    ; Case 13: clz 4096 -> 19
+    push 4096
+    clz
+    push 19
+    xor
+    failnez
+
+    ; Case 14: clz 8192 -> 18
+    push 8192
+    clz
+    push 18
+    xor
+    failnez
+
+    ; Case 15: clz 16384 -> 17
+    push 16384
+    clz
+    push 17
+    xor
+    failnez
+
+    ; Case 16: clz 32768 -> 16
+    push 2
+    shi 0x00
+    shi 0x00
+    clz
+    push 16
+    xor
+    failnez
+
+    ; Case 17: clz 65535 -> 16
+    push 3
+    shi 0x7f
+    shi 0x7f
+    clz
+    push 16
+    xor
+    failnez
+
+    ; Case 18: clz 255 -> 24
+    push 255
+    clz
+    push 24
+    xor
+    failnez
+
+    ; Case 19: clz 65280 -> 16
+    push 3
+    shi 0x7e
+    shi 0x00
+    clz
+    push 16
+    xor
+    failnez
+
+    ; Case 20: clz 3840 -> 20
+    push 3840
+    clz
+    push 20
+    xor
+    failnez
+
+    ; Case 21: clz 240 -> 24
+    push 240
+    clz
+    push 24
+    xor
+    failnez
+
+    ; Case 22: clz 21845 -> 17
+    push 21845
+    clz
+    push 17
+    xor
+    failnez
+
+    ; Case 23: clz 43690 -> 16
+    push 2
+    shi 0x55
+    shi 0x2a
+    clz
+    push 16
+    xor
+    failnez
+
+    ; Case 24: clz 3 -> 30
+    push 3
+    clz
+    push 30
+    xor
+    failnez
+
+    ; Case 25: clz 32767 -> 17
+    push 32767
+    clz
+    push 17
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
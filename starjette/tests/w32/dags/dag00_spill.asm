@@ -0,0 +1,200 @@
+; Expression DAG program 0, spill scheduling
+; 4 locals, 2 memory words, 2 temporaries
+    add fp, -24
+    push 4
+    shi 0x07
+    shi 0x0e
+    shi 0x15
+    shi 0x44
+    slw 0
+    push 0
+    shi 0x54
+    shi 0x46
+    shi 0x16
+    shi 0x27
+    slw 4
+    push -2
+    shi 0x54
+    shi 0x68
+    shi 0x1f
+    shi 0x25
+    slw 8
+    push -4
+    shi 0x1c
+    shi 0x3e
+    shi 0x46
+    shi 0x1a
+    slw 12
+    push -3
+    shi 0x4c
+    shi 0x0c
+    shi 0x3d
+    shi 0x17
+    push 28672
+    sw
+    push -4
+    shi 0x26
+    shi 0x4a
+    shi 0x71
+    shi 0x17
+    push 28676
+    sw
+
+    ; local0 = node 16 (0xffffffff)
+    push -21
+    push 28672
+    lw
+    push 0
+    shi 0x61
+    shi 0x2e
+    shi 0x43
+    shi 0x20
+    llw 4
+    add
+    or
+    push 7
+    shi 0x0c
+    shi 0x42
+    shi 0x1e
+    shi 0x74
+    sub
+    dup
+    slw 16
+    add
+    llw 16
+    sub
+    dup
+    slw 20
+    llw 20
+    sra
+    slw 0
+
+    ; local3 = node 25 (0x0036)
+    push 28672
+    lw
+    llw 12
+    srl
+    slw 12
+
+    ; mem0 = node 33 (0x0000)
+    push -15
+    llw 4
+    push 28672
+    lw
+    add
+    dup
+    slw 16
+    srl
+    llw 16
+    sub
+    dup
+    slw 20
+    llw 20
+    xor
+    push 28672
+    sw
+
+    ; mem0 = node 43 (0xffffffff)
+    llw 0
+    push 2
+    shi 0x52
+    shi 0x6e
+    shi 0x26
+    shi 0x3a
+    sra
+    push 28672
+    sw
+
+    ; local2 = node 59 (0xde386f36)
+    push 0
+    shi 0x2e
+    shi 0x1c
+    shi 0x29
+    shi 0x33
+    push -19
+    sub
+    dup
+    slw 16
+    llw 16
+    sra
+    push 28672
+    lw
+    or
+    llw 16
+    mul
+    drop
+    push 28676
+    lw
+    mul
+    drop
+    slw 8
+
+    ; local1 = node 71 (0xc4d2b897)
+    push 12
+    llw 8
+    mul
+    drop
+    llw 12
+    and
+    push 28676
+    lw
+    add
+    slw 4
+
+    ; mem1 = node 86 (0x0000)
+    push -5
+    shi 0x0b
+    shi 0x2b
+    shi 0x46
+    shi 0x58
+    llw 0
+    ltu
+    llw 12
+    llw 0
+    sub
+    push 28676
+    lw
+    xor
+    and
+    push 28676
+    sw
+
+    ; Check the results
+    llw 0
+    push -1
+    xor
+    failnez
+    llw 4
+    push -4
+    shi 0x26
+    shi 0x4a
+    shi 0x71
+    shi 0x17
+    xor
+    failnez
+    llw 8
+    push -3
+    shi 0x71
+    shi 0x61
+    shi 0x5e
+    shi 0x36
+    xor
+    failnez
+    llw 12
+    push 54
+    xor
+    failnez
+    push 0x7000
+    lw
+    push -1
+    xor
+    failnez
+    push 0x7004
+    lw
+    push 0
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
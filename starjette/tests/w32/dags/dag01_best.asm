@@ -0,0 +1,205 @@
+; Expression DAG program 1, best scheduling
+; 4 locals, 3 memory words, 1 temporaries
+    add fp, -20
+    push 7
+    shi 0x59
+    shi 0x03
+    shi 0x18
+    shi 0x19
+    slw 0
+    push 5
+    shi 0x63
+    shi 0x4c
+    shi 0x36
+    shi 0x3d
+    slw 4
+    push -4
+    shi 0x78
+    shi 0x79
+    shi 0x2b
+    shi 0x2b
+    slw 8
+    push -7
+    shi 0x78
+    shi 0x40
+    shi 0x77
+    shi 0x5f
+    slw 12
+    push -4
+    shi 0x79
+    shi 0x75
+    shi 0x3d
+    shi 0x79
+    push 28672
+    sw
+    push 7
+    shi 0x68
+    shi 0x71
+    shi 0x63
+    shi 0x28
+    push 28676
+    sw
+    push 3
+    shi 0x11
+    shi 0x73
+    shi 0x40
+    shi 0x03
+    push 28680
+    sw
+
+    ; mem0 = node 15 (0x9f103bdf)
+    llw 0
+    push 28672
+    lw
+    ltu
+    dup
+    xor
+    llw 4
+    clz
+    add
+    llw 12
+    mul
+    drop
+    push 28672
+    sw
+
+    ; local0 = node 31 (0xff30ffdf)
+    llw 12
+    llw 0
+    or
+    slw 0
+
+    ; local0 = node 39 (0xfb83571c)
+    push 28672
+    lw
+    llw 4
+    add
+    slw 0
+
+    ; local1 = node 55 (0x132d3e90)
+    push 28676
+    lw
+    llw 0
+    sub
+    push 28672
+    lw
+    clz
+    dup
+    push 6
+    add
+    xor
+    dup
+    add
+    mul
+    drop
+    slw 4
+
+    ; local0 = node 70 (0x2dc03727)
+    push -9
+    push 6
+    sra
+    llw 12
+    lt
+    dup
+    over
+    llw 4
+    sra
+    add
+    swap
+    push 28680
+    lw
+    xor
+    add
+    llw 0
+    add
+    push 8
+    add
+    slw 0
+
+    ; local0 = node 89 (0x132d3e90)
+    push 28676
+    lw
+    push 25
+    push -26
+    add
+    dup
+    slw 16
+    or
+    dup
+    push -13
+    sll
+    dup
+    llw 16
+    xor
+    rot
+    rot
+    and
+    add
+    llw 4
+    and
+    slw 0
+
+    ; Check the results
+    llw 0
+    push 1
+    shi 0x19
+    shi 0x34
+    shi 0x7d
+    shi 0x10
+    xor
+    failnez
+    llw 4
+    push 1
+    shi 0x19
+    shi 0x34
+    shi 0x7d
+    shi 0x10
+    xor
+    failnez
+    llw 8
+    push -4
+    shi 0x78
+    shi 0x79
+    shi 0x2b
+    shi 0x2b
+    xor
+    failnez
+    llw 12
+    push -7
+    shi 0x78
+    shi 0x40
+    shi 0x77
+    shi 0x5f
+    xor
+    failnez
+    push 0x7000
+    lw
+    push -7
+    shi 0x78
+    shi 0x40
+    shi 0x77
+    shi 0x5f
+    xor
+    failnez
+    push 0x7004
+    lw
+    push 7
+    shi 0x68
+    shi 0x71
+    shi 0x63
+    shi 0x28
+    xor
+    failnez
+    push 0x7008
+    lw
+    push 3
+    shi 0x11
+    shi 0x73
+    shi 0x40
+    shi 0x03
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
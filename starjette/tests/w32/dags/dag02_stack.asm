@@ -0,0 +1,172 @@
+; Expression DAG program 2, stack scheduling
+; 3 locals, 1 memory words, 0 temporaries
+    add fp, -12
+    push 0
+    shi 0x6f
+    shi 0x4a
+    shi 0x53
+    shi 0x2f
+    slw 0
+    push -4
+    shi 0x53
+    shi 0x41
+    shi 0x0b
+    shi 0x4c
+    slw 4
+    push 7
+    shi 0x7f
+    shi 0x6a
+    shi 0x68
+    shi 0x59
+    slw 8
+    push -4
+    shi 0x51
+    shi 0x76
+    shi 0x7e
+    shi 0x77
+    push 28672
+    sw
+
+    ; local0 = node 17 (0x7d1f0cf8)
+    push 6
+    shi 0x01
+    shi 0x75
+    shi 0x53
+    shi 0x16
+    push -6
+    mul
+    drop
+    dup
+    over
+    sll
+    dup
+    llw 8
+    rot
+    rot
+    dup
+    add
+    dup
+    rot
+    rot
+    swap
+    or
+    push 0
+    shi 0x60
+    shi 0x60
+    shi 0x4e
+    shi 0x35
+    xor
+    rot
+    rot
+    swap
+    sub
+    swap
+    ltu
+    swap
+    add
+    dup
+    add
+    slw 0
+
+    ; local0 = node 25 (0x0001)
+    llw 4
+    dup
+    push 4
+    lt
+    dup
+    rot
+    rot
+    xor
+    swap
+    and
+    slw 0
+
+    ; mem0 = node 37 (0x07ff)
+    push -5
+    shi 0x16
+    shi 0x73
+    shi 0x5f
+    shi 0x53
+    llw 4
+    llw 8
+    push 28672
+    lw
+    and
+    clz
+    and
+    sra
+    push 15
+    sra
+    push -4
+    shi 0x70
+    shi 0x65
+    shi 0x2b
+    shi 0x55
+    srl
+    push 28672
+    sw
+
+    ; local0 = node 44 (0x0000)
+    llw 4
+    llw 0
+    llw 0
+    add
+    dup
+    sub
+    and
+    slw 0
+
+    ; local1 = node 56 (0xdef87ddd)
+    push -7
+    shi 0x75
+    shi 0x20
+    shi 0x7a
+    shi 0x51
+    llw 4
+    or
+    slw 4
+
+    ; mem0 = node 70 (0x0000)
+    push 28672
+    lw
+    llw 0
+    ltu
+    dup
+    push -17
+    rot
+    rot
+    xor
+    and
+    push 28672
+    sw
+
+    ; Check the results
+    llw 0
+    push 0
+    xor
+    failnez
+    llw 4
+    push -3
+    shi 0x77
+    shi 0x61
+    shi 0x7b
+    shi 0x5d
+    xor
+    failnez
+    llw 8
+    push 7
+    shi 0x7f
+    shi 0x6a
+    shi 0x68
+    shi 0x59
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,197 @@
+; Expression DAG program 3, spill scheduling
+; 4 locals, 1 memory words, 3 temporaries
+    add fp, -28
+    push -6
+    shi 0x1c
+    shi 0x77
+    shi 0x02
+    shi 0x47
+    slw 0
+    push -5
+    shi 0x0e
+    shi 0x6b
+    shi 0x54
+    shi 0x6d
+    slw 4
+    push -6
+    shi 0x63
+    shi 0x24
+    shi 0x33
+    shi 0x75
+    slw 8
+    push -7
+    shi 0x2d
+    shi 0x63
+    shi 0x5a
+    shi 0x28
+    slw 12
+    push 4
+    shi 0x7e
+    shi 0x7d
+    shi 0x47
+    shi 0x5c
+    push 28672
+    sw
+
+    ; local0 = node 18 (0x2188086c)
+    llw 4
+    llw 0
+    push 5
+    shi 0x3f
+    shi 0x38
+    shi 0x53
+    shi 0x4a
+    mul
+    drop
+    push 28672
+    lw
+    ltu
+    dup
+    slw 16
+    llw 0
+    sll
+    dup
+    slw 20
+    llw 16
+    add
+    dup
+    slw 24
+    sub
+    push 5
+    shi 0x5a
+    shi 0x60
+    shi 0x6b
+    shi 0x5b
+    llw 20
+    llw 24
+    sll
+    sub
+    llw 16
+    sra
+    and
+    slw 0
+
+    ; mem0 = node 24 (0x0020)
+    push 6
+    shi 0x13
+    shi 0x5e
+    shi 0x31
+    shi 0x08
+    push 28672
+    lw
+    sub
+    dup
+    slw 16
+    llw 16
+    sub
+    clz
+    dup
+    slw 20
+    llw 20
+    srl
+    push 28672
+    sw
+
+    ; local0 = node 36 (0xc10231d9)
+    llw 4
+    llw 12
+    push 2
+    shi 0x1a
+    shi 0x3c
+    shi 0x4f
+    shi 0x7c
+    sub
+    push 1
+    shi 0x3f
+    shi 0x53
+    shi 0x73
+    shi 0x41
+    and
+    sub
+    llw 0
+    add
+    slw 0
+
+    ; local3 = node 47 (0x58ad14c0)
+    push -2
+    shi 0x16
+    shi 0x3b
+    shi 0x09
+    shi 0x38
+    llw 12
+    mul
+    drop
+    slw 12
+
+    ; mem0 = node 59 (0x0000)
+    llw 0
+    push 28672
+    lw
+    add
+    dup
+    slw 16
+    llw 16
+    xor
+    push 28672
+    lw
+    push 28672
+    lw
+    llw 16
+    and
+    dup
+    slw 20
+    and
+    llw 0
+    clz
+    and
+    llw 0
+    llw 20
+    and
+    mul
+    drop
+    sub
+    push 28672
+    sw
+
+    ; Check the results
+    llw 0
+    push -4
+    shi 0x08
+    shi 0x08
+    shi 0x63
+    shi 0x59
+    xor
+    failnez
+    llw 4
+    push -5
+    shi 0x0e
+    shi 0x6b
+    shi 0x54
+    shi 0x6d
+    xor
+    failnez
+    llw 8
+    push -6
+    shi 0x63
+    shi 0x24
+    shi 0x33
+    shi 0x75
+    xor
+    failnez
+    llw 12
+    push 5
+    shi 0x45
+    shi 0x34
+    shi 0x29
+    shi 0x40
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,148 @@
+; Expression DAG program 4, best scheduling
+; 4 locals, 1 memory words, 1 temporaries
+    add fp, -20
+    push 5
+    shi 0x57
+    shi 0x79
+    shi 0x16
+    shi 0x54
+    slw 0
+    push 1
+    shi 0x3e
+    shi 0x61
+    shi 0x37
+    shi 0x61
+    slw 4
+    push -1
+    shi 0x27
+    shi 0x6a
+    shi 0x45
+    shi 0x37
+    slw 8
+    push 6
+    shi 0x7f
+    shi 0x3b
+    shi 0x0b
+    shi 0x61
+    slw 12
+    push -7
+    shi 0x1e
+    shi 0x0c
+    shi 0x0a
+    shi 0x2d
+    push 28672
+    sw
+
+    ; mem0 = node 15 (0x0000)
+    push 1
+    shi 0x6b
+    shi 0x61
+    shi 0x5d
+    shi 0x6f
+    push -8
+    lt
+    dup
+    mul
+    drop
+    push 28672
+    sw
+
+    ; mem0 = node 25 (0x0000)
+    push -5
+    shi 0x0d
+    shi 0x0e
+    shi 0x41
+    shi 0x0b
+    push 28672
+    lw
+    llw 12
+    sll
+    dup
+    push 28672
+    lw
+    or
+    add
+    ltu
+    push 28672
+    sw
+
+    ; local2 = node 34 (0x6feec5e2)
+    llw 12
+    llw 4
+    llw 4
+    add
+    push 28672
+    lw
+    lt
+    push 24
+    lt
+    add
+    slw 8
+
+    ; local3 = node 48 (0x0000)
+    push 28672
+    lw
+    llw 0
+    llw 8
+    sub
+    dup
+    slw 16
+    llw 16
+    sra
+    dup
+    llw 0
+    swap
+    sub
+    llw 12
+    push 28672
+    lw
+    sub
+    add
+    dup
+    llw 16
+    lt
+    srl
+    swap
+    sub
+    mul
+    drop
+    slw 12
+
+    ; Check the results
+    llw 0
+    push 5
+    shi 0x57
+    shi 0x79
+    shi 0x16
+    shi 0x54
+    xor
+    failnez
+    llw 4
+    push 1
+    shi 0x3e
+    shi 0x61
+    shi 0x37
+    shi 0x61
+    xor
+    failnez
+    llw 8
+    push 6
+    shi 0x7f
+    shi 0x3b
+    shi 0x0b
+    shi 0x62
+    xor
+    failnez
+    llw 12
+    push 0
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,186 @@
+; Expression DAG program 5, spill scheduling
+; 4 locals, 1 memory words, 2 temporaries
+    add fp, -24
+    push -5
+    shi 0x30
+    shi 0x32
+    shi 0x2c
+    shi 0x3f
+    slw 0
+    push -6
+    shi 0x51
+    shi 0x14
+    shi 0x3c
+    shi 0x7a
+    slw 4
+    push -7
+    shi 0x65
+    shi 0x65
+    shi 0x28
+    shi 0x03
+    slw 8
+    push -2
+    shi 0x38
+    shi 0x3a
+    shi 0x1a
+    shi 0x31
+    slw 12
+    push -6
+    shi 0x6f
+    shi 0x0f
+    shi 0x52
+    shi 0x0c
+    push 28672
+    sw
+
+    ; mem0 = node 17 (0x0000)
+    llw 8
+    llw 4
+    llw 4
+    llw 12
+    add
+    dup
+    slw 16
+    llw 16
+    sll
+    sub
+    and
+    dup
+    slw 20
+    llw 20
+    xor
+    push 28672
+    sw
+
+    ; mem0 = node 22 (0x40f5e10a)
+    push 28672
+    lw
+    clz
+    clz
+    push -5
+    shi 0x78
+    shi 0x28
+    shi 0x3e
+    shi 0x10
+    sub
+    push 28672
+    sw
+
+    ; local0 = node 28 (0xa05e1000)
+    push 28672
+    lw
+    llw 8
+    mul
+    drop
+    dup
+    slw 16
+    llw 16
+    mul
+    drop
+    push 28672
+    lw
+    sll
+    slw 0
+
+    ; local0 = node 47 (0x40f5e0fd)
+    push 28672
+    lw
+    llw 12
+    push -24
+    and
+    and
+    push -14
+    or
+    push 28672
+    lw
+    and
+    push -5
+    llw 12
+    or
+    add
+    slw 0
+
+    ; mem0 = node 56 (0x0000)
+    llw 8
+    llw 8
+    sub
+    push 28672
+    sw
+
+    ; local3 = node 72 (0xa7fb6dcc)
+    llw 0
+    llw 12
+    xor
+    slw 12
+
+    ; local3 = node 78 (0x9cb95408)
+    llw 8
+    push -5
+    push 28672
+    lw
+    add
+    dup
+    slw 16
+    sub
+    llw 16
+    and
+    slw 12
+
+    ; mem0 = node 83 (0x0001)
+    push 28672
+    lw
+    push 25
+    lt
+    dup
+    slw 16
+    llw 16
+    and
+    dup
+    slw 20
+    llw 20
+    or
+    push 28672
+    sw
+
+    ; Check the results
+    llw 0
+    push 4
+    shi 0x07
+    shi 0x57
+    shi 0x41
+    shi 0x7d
+    xor
+    failnez
+    llw 4
+    push -6
+    shi 0x51
+    shi 0x14
+    shi 0x3c
+    shi 0x7a
+    xor
+    failnez
+    llw 8
+    push -7
+    shi 0x65
+    shi 0x65
+    shi 0x28
+    shi 0x03
+    xor
+    failnez
+    llw 12
+    push -7
+    shi 0x65
+    shi 0x65
+    shi 0x28
+    shi 0x08
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 1
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,201 @@
+; Expression DAG program 6, best scheduling
+; 4 locals, 2 memory words, 0 temporaries
+    add fp, -16
+    push 5
+    shi 0x14
+    shi 0x18
+    shi 0x6f
+    shi 0x3e
+    slw 0
+    push -6
+    shi 0x40
+    shi 0x7e
+    shi 0x60
+    shi 0x40
+    slw 4
+    push 5
+    shi 0x7b
+    shi 0x0d
+    shi 0x5d
+    shi 0x30
+    slw 8
+    push -4
+    shi 0x70
+    shi 0x26
+    shi 0x09
+    shi 0x48
+    slw 12
+    push -7
+    shi 0x10
+    shi 0x36
+    shi 0x6d
+    shi 0x63
+    push 28672
+    sw
+    push -7
+    shi 0x75
+    shi 0x21
+    shi 0x07
+    shi 0x14
+    push 28676
+    sw
+
+    ; local1 = node 14 (0xdfbdcfbd)
+    push 4
+    shi 0x68
+    shi 0x57
+    shi 0x19
+    shi 0x3d
+    push 28676
+    lw
+    or
+    slw 4
+
+    ; local1 = node 26 (0x1bcff7)
+    llw 12
+    push 5
+    shi 0x13
+    shi 0x47
+    shi 0x34
+    shi 0x45
+    push 28672
+    lw
+    or
+    or
+    dup
+    over
+    srl
+    swap
+    add
+    push 3
+    shi 0x0a
+    shi 0x6d
+    shi 0x56
+    shi 0x6b
+    srl
+    slw 4
+
+    ; local1 = node 32 (0x386ff972)
+    llw 12
+    dup
+    or
+    push 6
+    shi 0x54
+    shi 0x09
+    shi 0x09
+    shi 0x21
+    add
+    llw 4
+    sub
+    slw 4
+
+    ; local1 = node 40 (0x001b)
+    push -8
+    shi 0x38
+    shi 0x02
+    shi 0x3c
+    shi 0x78
+    push 27
+    and
+    clz
+    slw 4
+
+    ; local0 = node 54 (0x7d726284)
+    push 5
+    shi 0x70
+    shi 0x60
+    shi 0x65
+    shi 0x63
+    push 0
+    lt
+    llw 0
+    add
+    llw 4
+    push 28672
+    lw
+    add
+    mul
+    drop
+    slw 0
+
+    ; local1 = node 70 (0xfffffffb)
+    push -31
+    llw 4
+    or
+    slw 4
+
+    ; local0 = node 87 (0xde1ba6dc)
+    llw 12
+    llw 0
+    llw 4
+    push 28676
+    lw
+    and
+    add
+    or
+    slw 0
+
+    ; local1 = node 97 (0xde0db6d7)
+    push -20
+    llw 12
+    push 28672
+    lw
+    or
+    add
+    slw 4
+
+    ; Check the results
+    llw 0
+    push -3
+    shi 0x70
+    shi 0x6e
+    shi 0x4d
+    shi 0x5c
+    xor
+    failnez
+    llw 4
+    push -3
+    shi 0x70
+    shi 0x36
+    shi 0x6d
+    shi 0x57
+    xor
+    failnez
+    llw 8
+    push 5
+    shi 0x7b
+    shi 0x0d
+    shi 0x5d
+    shi 0x30
+    xor
+    failnez
+    llw 12
+    push -4
+    shi 0x70
+    shi 0x26
+    shi 0x09
+    shi 0x48
+    xor
+    failnez
+    push 0x7000
+    lw
+    push -7
+    shi 0x10
+    shi 0x36
+    shi 0x6d
+    shi 0x63
+    xor
+    failnez
+    push 0x7004
+    lw
+    push -7
+    shi 0x75
+    shi 0x21
+    shi 0x07
+    shi 0x14
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
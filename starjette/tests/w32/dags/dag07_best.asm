@@ -0,0 +1,190 @@
+; Expression DAG program 7, best scheduling
+; 3 locals, 1 memory words, 0 temporaries
+    add fp, -12
+    push -1
+    shi 0x17
+    shi 0x59
+    shi 0x36
+    shi 0x32
+    slw 0
+    push 4
+    shi 0x33
+    shi 0x31
+    shi 0x7e
+    shi 0x0c
+    slw 4
+    push 7
+    shi 0x10
+    shi 0x0c
+    shi 0x4e
+    shi 0x78
+    slw 8
+    push 3
+    shi 0x69
+    shi 0x7d
+    shi 0x01
+    shi 0x77
+    push 28672
+    sw
+
+    ; mem0 = node 15 (0x0000)
+    llw 0
+    dup
+    lt
+    dup
+    add
+    dup
+    push 10
+    add
+    llw 4
+    lt
+    llw 8
+    mul
+    drop
+    push 7
+    shi 0x6b
+    shi 0x3b
+    shi 0x23
+    shi 0x38
+    ltu
+    sll
+    push 28672
+    sw
+
+    ; local1 = node 21 (0x0000)
+    llw 8
+    push 28672
+    lw
+    add
+    dup
+    sub
+    llw 0
+    sra
+    slw 4
+
+    ; local1 = node 31 (0xe5ecb664)
+    llw 0
+    dup
+    add
+    push 28672
+    lw
+    sub
+    slw 4
+
+    ; local2 = node 43 (0x0000)
+    llw 4
+    push 5
+    shi 0x41
+    shi 0x0d
+    shi 0x4b
+    shi 0x57
+    mul
+    drop
+    clz
+    dup
+    push 28672
+    lw
+    swap
+    sub
+    and
+    slw 8
+
+    ; local0 = node 58 (0x81602000)
+    llw 4
+    dup
+    push 18
+    add
+    dup
+    over
+    xor
+    push 28672
+    lw
+    sll
+    push 7
+    shi 0x0f
+    shi 0x22
+    shi 0x60
+    shi 0x06
+    add
+    push 2
+    sub
+    swap
+    sub
+    and
+    push -8
+    shi 0x6b
+    shi 0x59
+    shi 0x53
+    shi 0x30
+    and
+    slw 0
+
+    ; local2 = node 70 (0x0001)
+    push 6
+    shi 0x7e
+    shi 0x17
+    shi 0x50
+    shi 0x16
+    clz
+    slw 8
+
+    ; local1 = node 87 (0x81602000)
+    push -25
+    push 28672
+    lw
+    lt
+    dup
+    push 6
+    shi 0x5a
+    shi 0x66
+    shi 0x48
+    shi 0x7f
+    add
+    dup
+    push 28672
+    lw
+    add
+    rot
+    rot
+    mul
+    drop
+    llw 0
+    swap
+    srl
+    swap
+    sll
+    push 28672
+    lw
+    add
+    slw 4
+
+    ; Check the results
+    llw 0
+    push -8
+    shi 0x0b
+    shi 0x00
+    shi 0x40
+    shi 0x00
+    xor
+    failnez
+    llw 4
+    push -8
+    shi 0x0b
+    shi 0x00
+    shi 0x40
+    shi 0x00
+    xor
+    failnez
+    llw 8
+    push 1
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
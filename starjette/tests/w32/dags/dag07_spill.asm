@@ -0,0 +1,198 @@
+; Expression DAG program 7, spill scheduling
+; 3 locals, 1 memory words, 2 temporaries
+    add fp, -20
+    push -1
+    shi 0x17
+    shi 0x59
+    shi 0x36
+    shi 0x32
+    slw 0
+    push 4
+    shi 0x33
+    shi 0x31
+    shi 0x7e
+    shi 0x0c
+    slw 4
+    push 7
+    shi 0x10
+    shi 0x0c
+    shi 0x4e
+    shi 0x78
+    slw 8
+    push 3
+    shi 0x69
+    shi 0x7d
+    shi 0x01
+    shi 0x77
+    push 28672
+    sw
+
+    ; mem0 = node 15 (0x0000)
+    llw 0
+    llw 0
+    lt
+    dup
+    slw 12
+    llw 12
+    add
+    dup
+    slw 16
+    push 10
+    llw 16
+    add
+    llw 4
+    lt
+    llw 8
+    mul
+    drop
+    push 7
+    shi 0x6b
+    shi 0x3b
+    shi 0x23
+    shi 0x38
+    ltu
+    sll
+    push 28672
+    sw
+
+    ; local1 = node 21 (0x0000)
+    llw 8
+    push 28672
+    lw
+    add
+    dup
+    slw 12
+    llw 12
+    sub
+    llw 0
+    sra
+    slw 4
+
+    ; local1 = node 31 (0xe5ecb664)
+    llw 0
+    llw 0
+    add
+    push 28672
+    lw
+    sub
+    slw 4
+
+    ; local2 = node 43 (0x0000)
+    push 28672
+    lw
+    llw 4
+    push 5
+    shi 0x41
+    shi 0x0d
+    shi 0x4b
+    shi 0x57
+    mul
+    drop
+    clz
+    dup
+    slw 12
+    sub
+    llw 12
+    and
+    slw 8
+
+    ; local0 = node 58 (0x81602000)
+    push 7
+    shi 0x0f
+    shi 0x22
+    shi 0x60
+    shi 0x06
+    push 18
+    llw 4
+    add
+    dup
+    slw 12
+    llw 12
+    xor
+    push 28672
+    lw
+    sll
+    add
+    push 2
+    sub
+    llw 12
+    sub
+    llw 4
+    and
+    push -8
+    shi 0x6b
+    shi 0x59
+    shi 0x53
+    shi 0x30
+    and
+    slw 0
+
+    ; local2 = node 70 (0x0001)
+    push 6
+    shi 0x7e
+    shi 0x17
+    shi 0x50
+    shi 0x16
+    clz
+    slw 8
+
+    ; local1 = node 87 (0x81602000)
+    llw 0
+    push 28672
+    lw
+    push 6
+    shi 0x5a
+    shi 0x66
+    shi 0x48
+    shi 0x7f
+    push -25
+    push 28672
+    lw
+    lt
+    dup
+    slw 12
+    add
+    dup
+    slw 16
+    add
+    llw 12
+    mul
+    drop
+    srl
+    llw 16
+    sll
+    push 28672
+    lw
+    add
+    slw 4
+
+    ; Check the results
+    llw 0
+    push -8
+    shi 0x0b
+    shi 0x00
+    shi 0x40
+    shi 0x00
+    xor
+    failnez
+    llw 4
+    push -8
+    shi 0x0b
+    shi 0x00
+    shi 0x40
+    shi 0x00
+    xor
+    failnez
+    llw 8
+    push 1
+    xor
+    failnez
+    push 0x7000
+    lw
+    push 0
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,14117 @@
+; Decode sweep, kernel mode: 344 cases
+; Trap handler and macro vectors: record the cause in TRAP_VAR and continue
+    jump _main
+
+#addr 0x100
+    push 0x100
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x108
+    push 0x101
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x110
+    push 0x102
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x118
+    push 0x103
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x120
+    push 0x104
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x128
+    push 0x105
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x130
+    push 0x106
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x138
+    push 0x107
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x140
+    push 0x108
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x148
+    push 0x109
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x150
+    push 0x10a
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x158
+    push 0x10b
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x160
+    push 0x10c
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x168
+    push 0x10d
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x170
+    push 0x10e
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x178
+    push 0x10f
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x180
+    push 0x110
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x188
+    push 0x111
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x190
+    push 0x112
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x198
+    push 0x113
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1a0
+    push 0x114
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1a8
+    push 0x115
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1b0
+    push 0x116
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1b8
+    push 0x117
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1c0
+    push 0x118
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1c8
+    push 0x119
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1d0
+    push 0x11a
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1d8
+    push 0x11b
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1e0
+    push 0x11c
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1e8
+    push 0x11d
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1f0
+    push 0x11e
+    push 0x7f00
+    sw
+    rets
+
+#addr 0x1f8
+    push 0x11f
+    push 0x7f00
+    sw
+    rets
+
+#bank code
+
+_trap:
+    push ecause
+    push 0x7f00
+    sw
+    push 0x7f04
+    lw
+    bnez _finish
+    rets
+
+_finish:
+    li status, 1
+    push 0x7f04
+    lw
+    halt
+
+_fail:
+    push 0x7f08
+    lw
+    add 2
+    push 0x7f04
+    sw
+    syscall
+
+_main:
+    li evec, _trap
+    li fp, 0x7e00
+    li afp, 0x7d00
+    push 0
+    push 0x7f04
+    sw
+    li status, 5
+
+    ; case 0: halt -> ecause 0x12
+    push 0
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x00
+_d0:
+    push 32512
+    lw
+    push 18
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 1: rets
+    push 1
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    li epc, _d1
+    li estatus, 5
+    #d8 0x01
+_d1:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 2: syscall -> ecause 0x00
+    push 2
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x02
+_d2:
+    push 32512
+    lw
+    push 0
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 3: callp
+    push 3
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push _d3
+    #d8 0x03
+_d3:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push _d3 + 0
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 4: beqz
+    push 4
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 165
+    push 0
+    #d8 0x04
+_d4:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 5: bnez
+    push 5
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 165
+    push 0
+    #d8 0x05
+_d5:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 6: swap
+    push 6
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x06
+_d6:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 7: over
+    push 7
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x07
+_d7:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 5
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 8: drop
+    push 8
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x08
+_d8:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 9: dup
+    push 9
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x09
+_d9:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 5
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 10: ltu
+    push 10
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x0a
+_d10:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 11: lt
+    push 11
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x0b
+_d11:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 12: add
+    push 12
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x0c
+_d12:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4667
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 13: and
+    push 13
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x0d
+_d13:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 14: xor
+    push 14
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x0e
+_d14:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4659
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 15: fsl
+    push 15
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x0f
+_d15:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    shi 0x00
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 16: rel pc
+    push 16
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 5
+    #d8 0x10
+_d16:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push _d16 + 5
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 17: rel fp
+    push 17
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x11
+_d17:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 32263
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 18: rel rx
+    push 18
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x12
+_d18:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 32583
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 19: rel ry
+    push 19
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x13
+_d19:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 32647
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 20: pop pc
+    push 20
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push _d20
+    #d8 0x14
+_d20:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 21: pop fp
+    push 21
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x15
+_d21:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 7
+    xor
+    bnez _fail
+    li fp, 0x7e00
+
+    ; case 22: pop rx
+    push 22
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x16
+_d22:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 7
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 23: pop ry
+    push 23
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x17
+_d23:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 7
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 24: add pc
+    push 24
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0
+    #d8 0x18
+_d24:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 25: add fp
+    push 25
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x19
+_d25:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32263
+    xor
+    bnez _fail
+    li fp, 0x7e00
+
+    ; case 26: add rx
+    push 26
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x1a
+_d26:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32583
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 27: add ry
+    push 27
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x1b
+_d27:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32647
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 28: pushcsr (csr 4)
+    push 28
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4
+    #d8 0x1c
+_d28:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 29: popcsr (csr 3, written back)
+    push 29
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 3
+    pushcsr
+    push 3
+    #d8 0x1d
+_d29:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 30: lw
+    push 30
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 32640
+    #d8 0x1e
+_d30:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 4386
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 31: sw
+    push 31
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 2
+    shi 0x4b
+    shi 0x43
+    push 32640
+    #d8 0x1f
+_d31:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 2
+    shi 0x4b
+    shi 0x43
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 32: div -> macro vector 0x00
+    push 32
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 100
+    push 7
+    #d8 0x20
+_d32:
+    push 32512
+    lw
+    push 256
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 100
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 33: divu -> macro vector 0x01
+    push 33
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 100
+    push 7
+    #d8 0x21
+_d33:
+    push 32512
+    lw
+    push 257
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 100
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 34: mul
+    push 34
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x22
+_d34:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push 32620
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 35: rot
+    push 35
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x23
+_d35:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 36: srl
+    push 36
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x24
+_d36:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 36
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 37: sra
+    push 37
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x25
+_d37:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 36
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 38: sll
+    push 38
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x26
+_d38:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0
+    shi 0x24
+    shi 0x34
+    shi 0x00
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 39: or
+    push 39
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x27
+_d39:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4663
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 40: sub
+    push 40
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x28
+_d40:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4653
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 41: clz
+    push 41
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x29
+_d41:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 29
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 42: lb
+    push 42
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 32640
+    #d8 0x2a
+_d42:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 34
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 43: sb
+    push 43
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 2
+    shi 0x4b
+    shi 0x43
+    push 32640
+    #d8 0x2b
+_d43:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4547
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 44: lh
+    push 44
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 32640
+    #d8 0x2c
+_d44:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 4386
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 45: sh
+    push 45
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 2
+    shi 0x4b
+    shi 0x43
+    push 32640
+    #d8 0x2d
+_d45:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 2
+    shi 0x4b
+    shi 0x43
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 46: lnw
+    push 46
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    #d8 0x2e
+_d46:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 4386
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32644
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 47: snw
+    push 47
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 23130
+    #d8 0x2f
+_d47:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32644
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 23130
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 48: #d8 0x30 -> macro vector 0x10
+    push 48
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x30
+_d48:
+    push 32512
+    lw
+    push 272
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 49: #d8 0x31 -> macro vector 0x11
+    push 49
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x31
+_d49:
+    push 32512
+    lw
+    push 273
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 50: #d8 0x32 -> macro vector 0x12
+    push 50
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x32
+_d50:
+    push 32512
+    lw
+    push 274
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 51: #d8 0x33 -> macro vector 0x13
+    push 51
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x33
+_d51:
+    push 32512
+    lw
+    push 275
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 52: #d8 0x34 -> macro vector 0x14
+    push 52
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x34
+_d52:
+    push 32512
+    lw
+    push 276
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 53: #d8 0x35 -> macro vector 0x15
+    push 53
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x35
+_d53:
+    push 32512
+    lw
+    push 277
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 54: #d8 0x36 -> macro vector 0x16
+    push 54
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x36
+_d54:
+    push 32512
+    lw
+    push 278
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 55: #d8 0x37 -> macro vector 0x17
+    push 55
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x37
+_d55:
+    push 32512
+    lw
+    push 279
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 56: #d8 0x38 -> macro vector 0x18
+    push 56
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x38
+_d56:
+    push 32512
+    lw
+    push 280
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 57: #d8 0x39 -> macro vector 0x19
+    push 57
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x39
+_d57:
+    push 32512
+    lw
+    push 281
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 58: #d8 0x3a -> macro vector 0x1a
+    push 58
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x3a
+_d58:
+    push 32512
+    lw
+    push 282
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 59: #d8 0x3b -> macro vector 0x1b
+    push 59
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x3b
+_d59:
+    push 32512
+    lw
+    push 283
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 60: #d8 0x3c -> macro vector 0x1c
+    push 60
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x3c
+_d60:
+    push 32512
+    lw
+    push 284
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 61: #d8 0x3d -> macro vector 0x1d
+    push 61
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x3d
+_d61:
+    push 32512
+    lw
+    push 285
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 62: #d8 0x3e -> macro vector 0x1e
+    push 62
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x3e
+_d62:
+    push 32512
+    lw
+    push 286
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 63: #d8 0x3f -> macro vector 0x1f
+    push 63
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    shi 0x08
+    shi 0x21
+    push 4660
+    push 7
+    #d8 0x3f
+_d63:
+    push 32512
+    lw
+    push 287
+    xor
+    bnez _fail
+    push depth
+    push 4
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 4660
+    xor
+    bnez _fail
+    push 2
+    shi 0x08
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 64: push 0
+    push 64
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x40
+_d64:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 65: push 1
+    push 65
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x41
+_d65:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 1
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 66: push 2
+    push 66
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x42
+_d66:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 2
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 67: push 3
+    push 67
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x43
+_d67:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 3
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 68: push 4
+    push 68
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x44
+_d68:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 4
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 69: push 5
+    push 69
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x45
+_d69:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 5
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 70: push 6
+    push 70
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x46
+_d70:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 6
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 71: push 7
+    push 71
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x47
+_d71:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 72: push 8
+    push 72
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x48
+_d72:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 8
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 73: push 9
+    push 73
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x49
+_d73:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 9
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 74: push 10
+    push 74
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x4a
+_d74:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 10
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 75: push 11
+    push 75
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x4b
+_d75:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 11
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 76: push 12
+    push 76
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x4c
+_d76:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 12
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 77: push 13
+    push 77
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x4d
+_d77:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 13
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 78: push 14
+    push 78
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x4e
+_d78:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 14
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 79: push 15
+    push 79
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x4f
+_d79:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 15
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 80: push 16
+    push 80
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x50
+_d80:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 16
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 81: push 17
+    push 81
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x51
+_d81:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 82: push 18
+    push 82
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x52
+_d82:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 18
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 83: push 19
+    push 83
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x53
+_d83:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 19
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 84: push 20
+    push 84
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x54
+_d84:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 20
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 85: push 21
+    push 85
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x55
+_d85:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 21
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 86: push 22
+    push 86
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x56
+_d86:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 22
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 87: push 23
+    push 87
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x57
+_d87:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 23
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 88: push 24
+    push 88
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x58
+_d88:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 24
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 89: push 25
+    push 89
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x59
+_d89:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 25
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 90: push 26
+    push 90
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x5a
+_d90:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 26
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 91: push 27
+    push 91
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x5b
+_d91:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 27
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 92: push 28
+    push 92
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x5c
+_d92:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 28
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 93: push 29
+    push 93
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x5d
+_d93:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 29
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 94: push 30
+    push 94
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x5e
+_d94:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 30
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 95: push 31
+    push 95
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x5f
+_d95:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 31
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 96: push -32
+    push 96
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x60
+_d96:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -32
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 97: push -31
+    push 97
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x61
+_d97:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -31
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 98: push -30
+    push 98
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x62
+_d98:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -30
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 99: push -29
+    push 99
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x63
+_d99:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -29
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 100: push -28
+    push 100
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x64
+_d100:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -28
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 101: push -27
+    push 101
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x65
+_d101:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -27
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 102: push -26
+    push 102
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x66
+_d102:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -26
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 103: push -25
+    push 103
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x67
+_d103:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -25
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 104: push -24
+    push 104
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x68
+_d104:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -24
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 105: push -23
+    push 105
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x69
+_d105:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -23
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 106: push -22
+    push 106
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x6a
+_d106:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -22
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 107: push -21
+    push 107
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x6b
+_d107:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -21
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 108: push -20
+    push 108
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x6c
+_d108:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -20
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 109: push -19
+    push 109
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x6d
+_d109:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -19
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 110: push -18
+    push 110
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x6e
+_d110:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -18
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 111: push -17
+    push 111
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x6f
+_d111:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -17
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 112: push -16
+    push 112
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x70
+_d112:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -16
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 113: push -15
+    push 113
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x71
+_d113:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -15
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 114: push -14
+    push 114
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x72
+_d114:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -14
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 115: push -13
+    push 115
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x73
+_d115:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -13
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 116: push -12
+    push 116
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x74
+_d116:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -12
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 117: push -11
+    push 117
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x75
+_d117:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -11
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 118: push -10
+    push 118
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x76
+_d118:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -10
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 119: push -9
+    push 119
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x77
+_d119:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -9
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 120: push -8
+    push 120
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x78
+_d120:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -8
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 121: push -7
+    push 121
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x79
+_d121:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -7
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 122: push -6
+    push 122
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x7a
+_d122:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -6
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 123: push -5
+    push 123
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x7b
+_d123:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -5
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 124: push -4
+    push 124
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x7c
+_d124:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -4
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 125: push -3
+    push 125
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x7d
+_d125:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -3
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 126: push -2
+    push 126
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x7e
+_d126:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -2
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 127: push -1
+    push 127
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x7f
+_d127:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push -1
+    xor
+    bnez _fail
+    push 291
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 128: shi 0x00
+    push 128
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x80
+_d128:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x00
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 129: shi 0x01
+    push 129
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x81
+_d129:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x01
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 130: shi 0x02
+    push 130
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x82
+_d130:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x02
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 131: shi 0x03
+    push 131
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x83
+_d131:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x03
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 132: shi 0x04
+    push 132
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x84
+_d132:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x04
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 133: shi 0x05
+    push 133
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x85
+_d133:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x05
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 134: shi 0x06
+    push 134
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x86
+_d134:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x06
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 135: shi 0x07
+    push 135
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x87
+_d135:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x07
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 136: shi 0x08
+    push 136
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x88
+_d136:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x08
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 137: shi 0x09
+    push 137
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x89
+_d137:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x09
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 138: shi 0x0a
+    push 138
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x8a
+_d138:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x0a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 139: shi 0x0b
+    push 139
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x8b
+_d139:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x0b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 140: shi 0x0c
+    push 140
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x8c
+_d140:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x0c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 141: shi 0x0d
+    push 141
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x8d
+_d141:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x0d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 142: shi 0x0e
+    push 142
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x8e
+_d142:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x0e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 143: shi 0x0f
+    push 143
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x8f
+_d143:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x0f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 144: shi 0x10
+    push 144
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x90
+_d144:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x10
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 145: shi 0x11
+    push 145
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x91
+_d145:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x11
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 146: shi 0x12
+    push 146
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x92
+_d146:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x12
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 147: shi 0x13
+    push 147
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x93
+_d147:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x13
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 148: shi 0x14
+    push 148
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x94
+_d148:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x14
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 149: shi 0x15
+    push 149
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x95
+_d149:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x15
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 150: shi 0x16
+    push 150
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x96
+_d150:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x16
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 151: shi 0x17
+    push 151
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x97
+_d151:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 152: shi 0x18
+    push 152
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x98
+_d152:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x18
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 153: shi 0x19
+    push 153
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x99
+_d153:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x19
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 154: shi 0x1a
+    push 154
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x9a
+_d154:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x1a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 155: shi 0x1b
+    push 155
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x9b
+_d155:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x1b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 156: shi 0x1c
+    push 156
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x9c
+_d156:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x1c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 157: shi 0x1d
+    push 157
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x9d
+_d157:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x1d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 158: shi 0x1e
+    push 158
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x9e
+_d158:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x1e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 159: shi 0x1f
+    push 159
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0x9f
+_d159:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x1f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 160: shi 0x20
+    push 160
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa0
+_d160:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x20
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 161: shi 0x21
+    push 161
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa1
+_d161:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x21
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 162: shi 0x22
+    push 162
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa2
+_d162:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x22
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 163: shi 0x23
+    push 163
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa3
+_d163:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x23
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 164: shi 0x24
+    push 164
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa4
+_d164:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x24
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 165: shi 0x25
+    push 165
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa5
+_d165:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x25
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 166: shi 0x26
+    push 166
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa6
+_d166:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x26
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 167: shi 0x27
+    push 167
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa7
+_d167:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x27
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 168: shi 0x28
+    push 168
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa8
+_d168:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x28
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 169: shi 0x29
+    push 169
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xa9
+_d169:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x29
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 170: shi 0x2a
+    push 170
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xaa
+_d170:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x2a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 171: shi 0x2b
+    push 171
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xab
+_d171:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x2b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 172: shi 0x2c
+    push 172
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xac
+_d172:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x2c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 173: shi 0x2d
+    push 173
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xad
+_d173:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x2d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 174: shi 0x2e
+    push 174
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xae
+_d174:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x2e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 175: shi 0x2f
+    push 175
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xaf
+_d175:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x2f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 176: shi 0x30
+    push 176
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb0
+_d176:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x30
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 177: shi 0x31
+    push 177
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb1
+_d177:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x31
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 178: shi 0x32
+    push 178
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb2
+_d178:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x32
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 179: shi 0x33
+    push 179
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb3
+_d179:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x33
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 180: shi 0x34
+    push 180
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb4
+_d180:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x34
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 181: shi 0x35
+    push 181
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb5
+_d181:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x35
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 182: shi 0x36
+    push 182
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb6
+_d182:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x36
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 183: shi 0x37
+    push 183
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb7
+_d183:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x37
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 184: shi 0x38
+    push 184
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb8
+_d184:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x38
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 185: shi 0x39
+    push 185
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xb9
+_d185:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x39
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 186: shi 0x3a
+    push 186
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xba
+_d186:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x3a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 187: shi 0x3b
+    push 187
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xbb
+_d187:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x3b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 188: shi 0x3c
+    push 188
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xbc
+_d188:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x3c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 189: shi 0x3d
+    push 189
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xbd
+_d189:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x3d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 190: shi 0x3e
+    push 190
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xbe
+_d190:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x3e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 191: shi 0x3f
+    push 191
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xbf
+_d191:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x3f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 192: shi 0x40
+    push 192
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc0
+_d192:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x40
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 193: shi 0x41
+    push 193
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc1
+_d193:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x41
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 194: shi 0x42
+    push 194
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc2
+_d194:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x42
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 195: shi 0x43
+    push 195
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc3
+_d195:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x43
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 196: shi 0x44
+    push 196
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc4
+_d196:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x44
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 197: shi 0x45
+    push 197
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc5
+_d197:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x45
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 198: shi 0x46
+    push 198
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc6
+_d198:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x46
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 199: shi 0x47
+    push 199
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc7
+_d199:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x47
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 200: shi 0x48
+    push 200
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc8
+_d200:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x48
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 201: shi 0x49
+    push 201
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xc9
+_d201:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x49
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 202: shi 0x4a
+    push 202
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xca
+_d202:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x4a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 203: shi 0x4b
+    push 203
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xcb
+_d203:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x4b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 204: shi 0x4c
+    push 204
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xcc
+_d204:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x4c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 205: shi 0x4d
+    push 205
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xcd
+_d205:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x4d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 206: shi 0x4e
+    push 206
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xce
+_d206:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x4e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 207: shi 0x4f
+    push 207
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xcf
+_d207:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x4f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 208: shi 0x50
+    push 208
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd0
+_d208:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x50
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 209: shi 0x51
+    push 209
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd1
+_d209:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x51
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 210: shi 0x52
+    push 210
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd2
+_d210:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x52
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 211: shi 0x53
+    push 211
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd3
+_d211:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x53
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 212: shi 0x54
+    push 212
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd4
+_d212:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x54
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 213: shi 0x55
+    push 213
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd5
+_d213:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x55
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 214: shi 0x56
+    push 214
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd6
+_d214:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x56
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 215: shi 0x57
+    push 215
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd7
+_d215:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x57
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 216: shi 0x58
+    push 216
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd8
+_d216:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x58
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 217: shi 0x59
+    push 217
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xd9
+_d217:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x59
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 218: shi 0x5a
+    push 218
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xda
+_d218:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x5a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 219: shi 0x5b
+    push 219
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xdb
+_d219:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x5b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 220: shi 0x5c
+    push 220
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xdc
+_d220:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x5c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 221: shi 0x5d
+    push 221
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xdd
+_d221:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x5d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 222: shi 0x5e
+    push 222
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xde
+_d222:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x5e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 223: shi 0x5f
+    push 223
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xdf
+_d223:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x5f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 224: shi 0x60
+    push 224
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe0
+_d224:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x60
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 225: shi 0x61
+    push 225
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe1
+_d225:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x61
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 226: shi 0x62
+    push 226
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe2
+_d226:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x62
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 227: shi 0x63
+    push 227
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe3
+_d227:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x63
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 228: shi 0x64
+    push 228
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe4
+_d228:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x64
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 229: shi 0x65
+    push 229
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe5
+_d229:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x65
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 230: shi 0x66
+    push 230
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe6
+_d230:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x66
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 231: shi 0x67
+    push 231
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe7
+_d231:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x67
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 232: shi 0x68
+    push 232
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe8
+_d232:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x68
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 233: shi 0x69
+    push 233
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xe9
+_d233:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x69
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 234: shi 0x6a
+    push 234
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xea
+_d234:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x6a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 235: shi 0x6b
+    push 235
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xeb
+_d235:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x6b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 236: shi 0x6c
+    push 236
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xec
+_d236:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x6c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 237: shi 0x6d
+    push 237
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xed
+_d237:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x6d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 238: shi 0x6e
+    push 238
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xee
+_d238:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x6e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 239: shi 0x6f
+    push 239
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xef
+_d239:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x6f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 240: shi 0x70
+    push 240
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf0
+_d240:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x70
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 241: shi 0x71
+    push 241
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf1
+_d241:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x71
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 242: shi 0x72
+    push 242
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf2
+_d242:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x72
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 243: shi 0x73
+    push 243
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf3
+_d243:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x73
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 244: shi 0x74
+    push 244
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf4
+_d244:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x74
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 245: shi 0x75
+    push 245
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf5
+_d245:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x75
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 246: shi 0x76
+    push 246
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf6
+_d246:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x76
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 247: shi 0x77
+    push 247
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf7
+_d247:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x77
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 248: shi 0x78
+    push 248
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf8
+_d248:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x78
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 249: shi 0x79
+    push 249
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xf9
+_d249:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x79
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 250: shi 0x7a
+    push 250
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xfa
+_d250:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x7a
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 251: shi 0x7b
+    push 251
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xfb
+_d251:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x7b
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 252: shi 0x7c
+    push 252
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xfc
+_d252:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x7c
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 253: shi 0x7d
+    push 253
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xfd
+_d253:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x7d
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 254: shi 0x7e
+    push 254
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xfe
+_d254:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x7e
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 255: shi 0x7f
+    push 255
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 291
+    #d8 0xff
+_d255:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 2
+    shi 0x23
+    shi 0x7f
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 256: beqz (condition zero)
+    push 256
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0
+    push 0
+    #d8 0x04
+_d256:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 257: bnez (condition zero)
+    push 257
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0
+    push 0
+    #d8 0x05
+_d257:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 258: pushcsr (csr 0)
+    push 258
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0
+    #d8 0x1c
+_d258:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 5
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 259: popcsr (csr 0, written back)
+    push 259
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 0
+    pushcsr
+    push 0
+    #d8 0x1d
+_d259:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 260: pushcsr (csr 1)
+    push 260
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 1
+    #d8 0x1c
+_d260:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    drop
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 261: popcsr (csr 1, written back)
+    push 261
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 1
+    pushcsr
+    push 1
+    #d8 0x1d
+_d261:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 262: pushcsr (csr 2)
+    push 262
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    #d8 0x1c
+_d262:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    drop
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 263: popcsr (csr 2, written back)
+    push 263
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 2
+    pushcsr
+    push 2
+    #d8 0x1d
+_d263:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 264: pushcsr (csr 3)
+    push 264
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 3
+    #d8 0x1c
+_d264:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 32000
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 265: popcsr (csr 3, written back)
+    push 265
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 3
+    pushcsr
+    push 3
+    #d8 0x1d
+_d265:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 266: pushcsr (csr 4)
+    push 266
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4
+    #d8 0x1c
+_d266:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 267: popcsr (csr 4, written back)
+    push 267
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4
+    pushcsr
+    push 4
+    #d8 0x1d
+_d267:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 268: pushcsr (csr 5)
+    push 268
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 5
+    #d8 0x1c
+_d268:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    drop
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 269: popcsr (csr 5, written back)
+    push 269
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 5
+    pushcsr
+    push 5
+    #d8 0x1d
+_d269:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 270: pushcsr (csr 6)
+    push 270
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 6
+    #d8 0x1c
+_d270:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    drop
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 271: popcsr (csr 6, written back)
+    push 271
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 6
+    pushcsr
+    push 6
+    #d8 0x1d
+_d271:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 272: pushcsr (csr 7) -> ecause 0x10
+    push 272
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 7
+    #d8 0x1c
+_d272:
+    push 32512
+    lw
+    push 16
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 273: popcsr (csr 7) -> ecause 0x10
+    push 273
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 85
+    push 7
+    #d8 0x1d
+_d273:
+    push 32512
+    lw
+    push 16
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 7
+    xor
+    bnez _fail
+    push 85
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 274: pushcsr (csr 8)
+    push 274
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 8
+    #d8 0x1c
+_d274:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 275: popcsr (csr 8, written back)
+    push 275
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 8
+    pushcsr
+    push 8
+    #d8 0x1d
+_d275:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 276: pushcsr (csr 9)
+    push 276
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 9
+    #d8 0x1c
+_d276:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 277: popcsr (csr 9, written back)
+    push 277
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 9
+    pushcsr
+    push 9
+    #d8 0x1d
+_d277:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 278: pushcsr (csr 10)
+    push 278
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 10
+    #d8 0x1c
+_d278:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 279: popcsr (csr 10, written back)
+    push 279
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 10
+    pushcsr
+    push 10
+    #d8 0x1d
+_d279:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 280: pushcsr (csr 11)
+    push 280
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 11
+    #d8 0x1c
+_d280:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 281: popcsr (csr 11, written back)
+    push 281
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 11
+    pushcsr
+    push 11
+    #d8 0x1d
+_d281:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 282: pushcsr (csr 12)
+    push 282
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 12
+    #d8 0x1c
+_d282:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 283: popcsr (csr 12, written back)
+    push 283
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 12
+    pushcsr
+    push 12
+    #d8 0x1d
+_d283:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 284: pushcsr (csr 13)
+    push 284
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 13
+    #d8 0x1c
+_d284:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 285: popcsr (csr 13, written back)
+    push 285
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 13
+    pushcsr
+    push 13
+    #d8 0x1d
+_d285:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 286: pushcsr (csr 14)
+    push 286
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 14
+    #d8 0x1c
+_d286:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 287: popcsr (csr 14, written back)
+    push 287
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 14
+    pushcsr
+    push 14
+    #d8 0x1d
+_d287:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 288: pushcsr (csr 15)
+    push 288
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 15
+    #d8 0x1c
+_d288:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 0
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 289: popcsr (csr 15, written back)
+    push 289
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 15
+    pushcsr
+    push 15
+    #d8 0x1d
+_d289:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 290: pushcsr (csr 16) -> ecause 0x10
+    push 290
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 16
+    #d8 0x1c
+_d290:
+    push 32512
+    lw
+    push 16
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 16
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 291: popcsr (csr 16) -> ecause 0x10
+    push 291
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 85
+    push 16
+    #d8 0x1d
+_d291:
+    push 32512
+    lw
+    push 16
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 16
+    xor
+    bnez _fail
+    push 85
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 292: lw (unaligned) -> ecause 0x20
+    push 292
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 32641
+    #d8 0x1e
+_d292:
+    push 32512
+    lw
+    push 32
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 32641
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 293: lb (unaligned)
+    push 293
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 32641
+    #d8 0x2a
+_d293:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 294: lh (unaligned) -> ecause 0x20
+    push 294
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 32641
+    #d8 0x2c
+_d294:
+    push 32512
+    lw
+    push 32
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 32641
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 295: sw (unaligned) -> ecause 0x20
+    push 295
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 2
+    shi 0x4b
+    shi 0x43
+    push 32641
+    #d8 0x1f
+_d295:
+    push 32512
+    lw
+    push 32
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 32641
+    xor
+    bnez _fail
+    push 2
+    shi 0x4b
+    shi 0x43
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 296: sb (unaligned)
+    push 296
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 2
+    shi 0x4b
+    shi 0x43
+    push 32641
+    #d8 0x2b
+_d296:
+    push 32512
+    lw
+    push -1
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 3
+    shi 0x06
+    shi 0x22
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 297: sh (unaligned) -> ecause 0x20
+    push 297
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 2
+    shi 0x4b
+    shi 0x43
+    push 32641
+    #d8 0x2d
+_d297:
+    push 32512
+    lw
+    push 32
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 32641
+    xor
+    bnez _fail
+    push 2
+    shi 0x4b
+    shi 0x43
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 298: callp (underflow) -> ecause 0x30
+    push 298
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x03
+_d298:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 299: beqz (underflow) -> ecause 0x30
+    push 299
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x04
+_d299:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 300: bnez (underflow) -> ecause 0x30
+    push 300
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x05
+_d300:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 301: swap (underflow) -> ecause 0x30
+    push 301
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x06
+_d301:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 302: over (underflow) -> ecause 0x30
+    push 302
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x07
+_d302:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 303: drop (underflow) -> ecause 0x30
+    push 303
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x08
+_d303:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 304: dup (underflow) -> ecause 0x30
+    push 304
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x09
+_d304:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 305: ltu (underflow) -> ecause 0x30
+    push 305
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x0a
+_d305:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 306: lt (underflow) -> ecause 0x30
+    push 306
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x0b
+_d306:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 307: add (underflow) -> ecause 0x30
+    push 307
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x0c
+_d307:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 308: and (underflow) -> ecause 0x30
+    push 308
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x0d
+_d308:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 309: xor (underflow) -> ecause 0x30
+    push 309
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x0e
+_d309:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 310: fsl (underflow) -> ecause 0x30
+    push 310
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    push 17
+    #d8 0x0f
+_d310:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 311: rel pc (underflow) -> ecause 0x30
+    push 311
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x10
+_d311:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 312: rel fp (underflow) -> ecause 0x30
+    push 312
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x11
+_d312:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 313: rel rx (underflow) -> ecause 0x30
+    push 313
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x12
+_d313:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 314: rel ry (underflow) -> ecause 0x30
+    push 314
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x13
+_d314:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 315: pop pc (underflow) -> ecause 0x30
+    push 315
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x14
+_d315:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 316: pop fp (underflow) -> ecause 0x30
+    push 316
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x15
+_d316:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 317: pop rx (underflow) -> ecause 0x30
+    push 317
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x16
+_d317:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 318: pop ry (underflow) -> ecause 0x30
+    push 318
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x17
+_d318:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 319: add pc (underflow) -> ecause 0x30
+    push 319
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x18
+_d319:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 320: add fp (underflow) -> ecause 0x30
+    push 320
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x19
+_d320:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 321: add rx (underflow) -> ecause 0x30
+    push 321
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x1a
+_d321:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 322: add ry (underflow) -> ecause 0x30
+    push 322
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x1b
+_d322:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 323: pushcsr (underflow) -> ecause 0x30
+    push 323
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x1c
+_d323:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 324: popcsr (underflow) -> ecause 0x30
+    push 324
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x1d
+_d324:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 325: lw (underflow) -> ecause 0x30
+    push 325
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    #d8 0x1e
+_d325:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 326: sw (underflow) -> ecause 0x30
+    push 326
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 17
+    #d8 0x1f
+_d326:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 327: div (underflow) -> ecause 0x30
+    push 327
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x20
+_d327:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 328: divu (underflow) -> ecause 0x30
+    push 328
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x21
+_d328:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 329: mul (underflow) -> ecause 0x30
+    push 329
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x22
+_d329:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 330: rot (underflow) -> ecause 0x30
+    push 330
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    push 17
+    #d8 0x23
+_d330:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 3
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 331: srl (underflow) -> ecause 0x30
+    push 331
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x24
+_d331:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 332: sra (underflow) -> ecause 0x30
+    push 332
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x25
+_d332:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 333: sll (underflow) -> ecause 0x30
+    push 333
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x26
+_d333:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 334: or (underflow) -> ecause 0x30
+    push 334
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x27
+_d334:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 335: sub (underflow) -> ecause 0x30
+    push 335
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 17
+    #d8 0x28
+_d335:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 336: clz (underflow) -> ecause 0x30
+    push 336
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x29
+_d336:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 337: lb (underflow) -> ecause 0x30
+    push 337
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    #d8 0x2a
+_d337:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 338: sb (underflow) -> ecause 0x30
+    push 338
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 17
+    #d8 0x2b
+_d338:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 339: lh (underflow) -> ecause 0x30
+    push 339
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    #d8 0x2c
+_d339:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 340: sh (underflow) -> ecause 0x30
+    push 340
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    push 17
+    #d8 0x2d
+_d340:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 2
+    xor
+    bnez _fail
+    push 17
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 341: snw (underflow) -> ecause 0x30
+    push 341
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    push 4386
+    push 32640
+    sw
+    push 13124
+    push 32644
+    sw
+    #d8 0x2f
+_d341:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+    push 32640
+    lw
+    push 4386
+    xor
+    bnez _fail
+    push 32644
+    lw
+    push 13124
+    xor
+    bnez _fail
+
+    ; case 342: shi 0x00 (underflow) -> ecause 0x30
+    push 342
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0x80
+_d342:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; case 343: shi 0x7f (underflow) -> ecause 0x30
+    push 343
+    push 32520
+    sw
+    push -1
+    push 32512
+    sw
+    li rx, 0x7f40
+    li ry, 0x7f80
+    #d8 0xff
+_d343:
+    push 32512
+    lw
+    push 48
+    xor
+    bnez _fail
+    push depth
+    push 1
+    xor
+    bnez _fail
+    push rx
+    push 32576
+    xor
+    bnez _fail
+    push ry
+    push 32640
+    xor
+    bnez _fail
+    push fp
+    push 32256
+    xor
+    bnez _fail
+
+    ; All passed
+    push 1
+    push 0x7f04
+    sw
+    syscall
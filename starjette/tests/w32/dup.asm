@@ -0,0 +1,66 @@
+; Test dup
+    ; dup: push(tos) - duplicates top of stack
+
+    ; Test 1: Basic dup
+    push 123
+    dup
+    ; Stack: 123, 123
+    push 123
+    xor
+    failnez
+
+    ; Stack: 123
+    push 123
+    xor
+    failnez
+
+    ; Test 2: Dup zero
+    push 0
+    dup
+    push 0
+    xor
+    failnez
+    push 0
+    xor
+    failnez
+
+    ; Test 3: Dup negative
+    push -1
+    dup
+    push -1
+    xor
+    failnez
+    push -1
+    xor
+    failnez
+
+    ; Test 4: Dup large value
+    push 0x7FFF
+    dup
+    push 0x7FFF
+    xor
+    failnez
+    push 0x7FFF
+    xor
+    failnez
+
+    ; Test 5: Dup with existing stack values
+    push 0xAAAA     ; will be ros after dup
+    push 0xBBBB     ; will be nos after dup
+    dup             ; -> 0xAAAA, 0xBBBB, 0xBBBB
+    push 0xBBBB
+    xor
+    failnez
+    push 0xBBBB
+    xor
+    failnez
+    push 0xAAAA
+    xor
+    failnez
+
+    push 1
+    halt
+
+_fail:
+    push 0
+    halt
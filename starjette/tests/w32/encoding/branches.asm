@@ -0,0 +1,650 @@
+; Branch encoding boundaries: 50 branches, 10 with 1 byte offsets, 20 with 2 byte offsets, 20 with 3 byte offsets
+    jump _s0
+
+#addr 0x0040
+_t7:
+    jump _s8
+
+#addr 0x0044
+_t8:
+    push rx
+    push _r8
+    xor
+    failnez
+    jump _s9
+
+#addr 0x0052
+_t9:
+    jump _s10
+
+#addr 0x04d5
+    ; case 4: beqz forward 20000, offset 19996 (3 bytes), vector -> code bank
+_s4:
+    push 0
+    beqz _t4
+    push 0
+    halt
+
+#addr 0x04dc
+    ; case 3: call forward 4099, offset 4095 (3 bytes), vector -> code bank
+_s3:
+    call _t3
+_r3:
+    push 0
+    halt
+
+#addr 0x04e3
+_t5:
+    jump _s6
+
+#addr 0x04e7
+_t6:
+    jump _s7
+
+#addr 0x04f0
+    ; case 2: jump forward 4098, offset 4095 (2 bytes), vector -> code bank
+_s2:
+    jump _t2
+    push 0
+    halt
+
+#addr 0x04f5
+    ; case 1: bnez forward 34, offset 31 (2 bytes), vector -> code bank
+_s1:
+    push 1
+    bnez _t1
+    push 0
+    halt
+
+#addr 0x04fb
+    ; case 0: beqz forward 33, offset 31 (1 bytes), vector -> code bank
+_s0:
+    push 0
+    beqz _t0
+    push 0
+    halt
+
+#bank code
+
+#addr 0x0500
+    ; case 5: beqz backward 30, offset -32 (1 bytes), code -> vector bank
+_s5:
+    push 0
+    beqz _t5
+    push 0
+    halt
+
+#addr 0x0505
+    ; case 6: bnez backward 31, offset -34 (2 bytes), code -> vector bank
+_s6:
+    push 1
+    bnez _t6
+    push 0
+    halt
+
+#addr 0x050b
+_t18:
+    jump _s19
+
+#addr 0x0510
+_t19:
+    jump _s20
+
+#addr 0x0514
+_t20:
+    jump _s21
+
+#addr 0x0518
+_t1:
+    jump _s2
+
+#addr 0x051d
+_t0:
+    jump _s1
+
+#addr 0x0521
+_t34:
+    jump _s35
+
+#addr 0x0528
+    ; case 18: beqz backward 30, offset -32 (1 bytes), within the code bank
+_s18:
+    push 0
+    beqz _t18
+    push 0
+    halt
+
+#addr 0x052d
+    ; case 19: bnez backward 30, offset -32 (1 bytes), within the code bank
+_s19:
+    push 1
+    bnez _t19
+    push 0
+    halt
+
+#addr 0x0532
+    ; case 20: jump backward 30, offset -32 (1 bytes), within the code bank
+_s20:
+    jump _t20
+    push 0
+    halt
+
+#addr 0x0536
+_t21:
+    push rx
+    push _r21
+    xor
+    failnez
+    jump _s22
+
+#addr 0x0544
+_t22:
+    jump _s23
+
+#addr 0x054a
+_t23:
+    jump _s24
+
+#addr 0x054f
+_t24:
+    jump _s25
+
+#addr 0x0554
+    ; case 21: call backward 30, offset -32 (1 bytes), within the code bank
+_s21:
+    call _t21
+_r21:
+    push 0
+    halt
+
+#addr 0x0559
+_t35:
+    jump _s36
+
+#addr 0x055e
+_t36:
+    jump _s37
+
+#addr 0x0562
+    ; case 22: beqz backward 31, offset -34 (2 bytes), within the code bank
+_s22:
+    push 0
+    beqz _t22
+    push 0
+    halt
+
+#addr 0x0568
+    ; case 23: bnez backward 31, offset -34 (2 bytes), within the code bank
+_s23:
+    push 1
+    bnez _t23
+    push 0
+    halt
+
+#addr 0x056e
+    ; case 24: jump backward 31, offset -34 (2 bytes), within the code bank
+_s24:
+    jump _t24
+    push 0
+    halt
+
+#addr 0x0573
+_t25:
+    push rx
+    push _r25
+    xor
+    failnez
+    jump _s26
+
+#addr 0x0581
+    ; case 10: beqz forward 33, offset 31 (1 bytes), within the code bank
+_s10:
+    push 0
+    beqz _t10
+    push 0
+    halt
+
+#addr 0x0586
+    ; case 11: bnez forward 33, offset 31 (1 bytes), within the code bank
+_s11:
+    push 1
+    bnez _t11
+    push 0
+    halt
+
+#addr 0x058b
+    ; case 12: jump forward 33, offset 31 (1 bytes), within the code bank
+_s12:
+    jump _t12
+    push 0
+    halt
+
+#addr 0x0592
+    ; case 25: call backward 31, offset -34 (2 bytes), within the code bank
+_s25:
+    call _t25
+_r25:
+    push 0
+    halt
+
+#addr 0x0598
+    ; case 13: call forward 33, offset 31 (1 bytes), within the code bank
+_s13:
+    call _t13
+_r13:
+    push 0
+    halt
+
+#addr 0x059d
+_t38:
+    jump _s39
+
+#addr 0x05a3
+_t10:
+    jump _s11
+
+#addr 0x05a8
+_t11:
+    jump _s12
+
+#addr 0x05ac
+_t12:
+    jump _s13
+
+#addr 0x05b0
+    ; case 14: beqz forward 34, offset 31 (2 bytes), within the code bank
+_s14:
+    push 0
+    beqz _t14
+    push 0
+    halt
+
+#addr 0x05b9
+_t13:
+    push rx
+    push _r13
+    xor
+    failnez
+    jump _s14
+
+#addr 0x05c7
+    ; case 15: bnez forward 34, offset 31 (2 bytes), within the code bank
+_s15:
+    push 1
+    bnez _t15
+    push 0
+    halt
+
+#addr 0x05cd
+    ; case 16: jump forward 34, offset 31 (2 bytes), within the code bank
+_s16:
+    jump _t16
+    push 0
+    halt
+
+#addr 0x05d3
+_t14:
+    jump _s15
+
+#addr 0x05d7
+    ; case 17: call forward 34, offset 31 (2 bytes), within the code bank
+_s17:
+    call _t17
+_r17:
+    push 0
+    halt
+
+#addr 0x05dd
+_t39:
+    jump _s40
+
+#addr 0x05e3
+_t40:
+    jump _s41
+
+#addr 0x05ea
+_t15:
+    jump _s16
+
+#addr 0x05ef
+_t16:
+    jump _s17
+
+#addr 0x05f3
+    ; case 26: beqz forward 4098, offset 4095 (2 bytes), within the code bank
+_s26:
+    push 0
+    beqz _t26
+    push 0
+    halt
+
+#addr 0x05f9
+_t17:
+    push rx
+    push _r17
+    xor
+    failnez
+    jump _s18
+
+#addr 0x0607
+_t37:
+    push rx
+    push _r37
+    xor
+    failnez
+    jump _s38
+
+#addr 0x0615
+_t41:
+    push rx
+    push _r41
+    xor
+    failnez
+    jump _s42
+
+#addr 0x0623
+    ; case 27: bnez forward 4098, offset 4095 (2 bytes), within the code bank
+_s27:
+    push 1
+    bnez _t27
+    push 0
+    halt
+
+#addr 0x0629
+    ; case 28: jump forward 4098, offset 4095 (2 bytes), within the code bank
+_s28:
+    jump _t28
+    push 0
+    halt
+
+#addr 0x062e
+    ; case 29: call forward 4098, offset 4095 (2 bytes), within the code bank
+_s29:
+    call _t29
+_r29:
+    push 0
+    halt
+
+#addr 0x0634
+    ; case 44: jump forward 20000, offset 19996 (3 bytes), within the code bank
+_s44:
+    jump _t44
+    push 0
+    halt
+
+#addr 0x063a
+    ; case 30: beqz forward 4099, offset 4095 (3 bytes), within the code bank
+_s30:
+    push 0
+    beqz _t30
+    push 0
+    halt
+
+#addr 0x0641
+    ; case 31: bnez forward 4099, offset 4095 (3 bytes), within the code bank
+_s31:
+    push 1
+    bnez _t31
+    push 0
+    halt
+
+#addr 0x0648
+    ; case 32: jump forward 4099, offset 4095 (3 bytes), within the code bank
+_s32:
+    jump _t32
+    push 0
+    halt
+
+#addr 0x064e
+    ; case 33: call forward 4099, offset 4095 (3 bytes), within the code bank
+_s33:
+    call _t33
+_r33:
+    push 0
+    halt
+
+#addr 0x0655
+    ; case 42: beqz forward 20000, offset 19996 (3 bytes), within the code bank
+_s42:
+    push 0
+    beqz _t42
+    push 0
+    halt
+
+#addr 0x065c
+    ; case 43: bnez forward 20000, offset 19996 (3 bytes), within the code bank
+_s43:
+    push 1
+    bnez _t43
+    push 0
+    halt
+
+#addr 0x0663
+    ; case 45: call forward 20000, offset 19996 (3 bytes), within the code bank
+_s45:
+    call _t45
+_r45:
+    push 0
+    halt
+
+#addr 0x0672
+_t46:
+    jump _s47
+
+#addr 0x0679
+_t47:
+    jump _s48
+
+#addr 0x067f
+_t48:
+    jump _s49
+
+#addr 0x0685
+_t49:
+    push rx
+    push _r49
+    xor
+    failnez
+    jump _done
+
+#addr 0x0693
+_done:
+    push depth
+    push 1
+    xor
+    failnez
+    ; All passed
+    push 1
+    halt
+
+#addr 0x103d
+    ; case 7: jump backward 4093, offset -4096 (2 bytes), code -> vector bank
+_s7:
+    jump _t7
+    push 0
+    halt
+
+#addr 0x1042
+    ; case 8: call backward 4094, offset -4098 (3 bytes), code -> vector bank
+_s8:
+    call _t8
+_r8:
+    push 0
+    halt
+
+#addr 0x14df
+_t3:
+    push rx
+    push _r3
+    xor
+    failnez
+    jump _s4
+
+#addr 0x14f2
+_t2:
+    jump _s3
+
+#addr 0x151d
+    ; case 34: beqz backward 4093, offset -4096 (2 bytes), within the code bank
+_s34:
+    push 0
+    beqz _t34
+    push 0
+    halt
+
+#addr 0x1555
+    ; case 35: bnez backward 4093, offset -4096 (2 bytes), within the code bank
+_s35:
+    push 1
+    bnez _t35
+    push 0
+    halt
+
+#addr 0x155b
+    ; case 36: jump backward 4093, offset -4096 (2 bytes), within the code bank
+_s36:
+    jump _t36
+    push 0
+    halt
+
+#addr 0x159a
+    ; case 38: beqz backward 4094, offset -4098 (3 bytes), within the code bank
+_s38:
+    push 0
+    beqz _t38
+    push 0
+    halt
+
+#addr 0x15da
+    ; case 39: bnez backward 4094, offset -4098 (3 bytes), within the code bank
+_s39:
+    push 1
+    bnez _t39
+    push 0
+    halt
+
+#addr 0x15e1
+    ; case 40: jump backward 4094, offset -4098 (3 bytes), within the code bank
+_s40:
+    jump _t40
+    push 0
+    halt
+
+#addr 0x15f6
+_t26:
+    jump _s27
+
+#addr 0x1604
+    ; case 37: call backward 4093, offset -4096 (2 bytes), within the code bank
+_s37:
+    call _t37
+_r37:
+    push 0
+    halt
+
+#addr 0x1613
+    ; case 41: call backward 4094, offset -4098 (3 bytes), within the code bank
+_s41:
+    call _t41
+_r41:
+    push 0
+    halt
+
+#addr 0x1626
+_t27:
+    jump _s28
+
+#addr 0x162b
+_t28:
+    jump _s29
+
+#addr 0x1630
+_t29:
+    push rx
+    push _r29
+    xor
+    failnez
+    jump _s30
+
+#addr 0x163e
+_t30:
+    jump _s31
+
+#addr 0x1645
+_t31:
+    jump _s32
+
+#addr 0x164b
+_t32:
+    jump _s33
+
+#addr 0x1651
+_t33:
+    push rx
+    push _r33
+    xor
+    failnez
+    jump _s34
+
+#addr 0x4e71
+    ; case 9: beqz backward 20000, offset -20004 (3 bytes), code -> vector bank
+_s9:
+    push 0
+    beqz _t9
+    push 0
+    halt
+
+#addr 0x52f6
+_t4:
+    jump _s5
+
+#addr 0x5454
+_t44:
+    jump _s45
+
+#addr 0x5476
+_t42:
+    jump _s43
+
+#addr 0x547d
+_t43:
+    jump _s44
+
+#addr 0x5483
+_t45:
+    push rx
+    push _r45
+    xor
+    failnez
+    jump _s46
+
+#addr 0x5491
+    ; case 46: beqz backward 20000, offset -20004 (3 bytes), within the code bank
+_s46:
+    push 0
+    beqz _t46
+    push 0
+    halt
+
+#addr 0x5498
+    ; case 47: bnez backward 20000, offset -20004 (3 bytes), within the code bank
+_s47:
+    push 1
+    bnez _t47
+    push 0
+    halt
+
+#addr 0x549f
+    ; case 48: jump backward 20000, offset -20004 (3 bytes), within the code bank
+_s48:
+    jump _t48
+    push 0
+    halt
+
+#addr 0x54a5
+    ; case 49: call backward 20000, offset -20004 (3 bytes), within the code bank
+_s49:
+    call _t49
+_r49:
+    push 0
+    halt
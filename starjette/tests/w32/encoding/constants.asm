@@ -0,0 +1,201 @@
+; Push encoding boundaries: 18 constants checked against raw bytes
+
+    ; push 31: 1 bytes
+    push 31
+    push _k0
+    lw
+    xor
+    failnez
+
+    ; push 32: 2 bytes
+    push 32
+    push _k1
+    lw
+    xor
+    failnez
+
+    ; push -32: 1 bytes
+    push -32
+    push _k2
+    lw
+    xor
+    failnez
+
+    ; push -33: 2 bytes
+    push -33
+    push _k3
+    lw
+    xor
+    failnez
+
+    ; push 4095: 2 bytes
+    push 4095
+    push _k4
+    lw
+    xor
+    failnez
+
+    ; push 4096: 3 bytes
+    push 4096
+    push _k5
+    lw
+    xor
+    failnez
+
+    ; push -4096: 2 bytes
+    push -4096
+    push _k6
+    lw
+    xor
+    failnez
+
+    ; push -4097: 3 bytes
+    push -4097
+    push _k7
+    lw
+    xor
+    failnez
+
+    ; push 31; shi 0x7f; shi 0x7f: 3 bytes
+    push 31
+    shi 0x7f
+    shi 0x7f
+    push _k8
+    lw
+    xor
+    failnez
+
+    ; push 0; shi 0x20; shi 0x00; shi 0x00: 4 bytes
+    push 0
+    shi 0x20
+    shi 0x00
+    shi 0x00
+    push _k9
+    lw
+    xor
+    failnez
+
+    ; push -32; shi 0x00; shi 0x00: 3 bytes
+    push -32
+    shi 0x00
+    shi 0x00
+    push _k10
+    lw
+    xor
+    failnez
+
+    ; push -1; shi 0x5f; shi 0x7f; shi 0x7f: 4 bytes
+    push -1
+    shi 0x5f
+    shi 0x7f
+    shi 0x7f
+    push _k11
+    lw
+    xor
+    failnez
+
+    ; push 31; shi 0x7f; shi 0x7f; shi 0x7f: 4 bytes
+    push 31
+    shi 0x7f
+    shi 0x7f
+    shi 0x7f
+    push _k12
+    lw
+    xor
+    failnez
+
+    ; push 0; shi 0x20; shi 0x00; shi 0x00; shi 0x00: 5 bytes
+    push 0
+    shi 0x20
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push _k13
+    lw
+    xor
+    failnez
+
+    ; push -32; shi 0x00; shi 0x00; shi 0x00: 4 bytes
+    push -32
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push _k14
+    lw
+    xor
+    failnez
+
+    ; push -1; shi 0x5f; shi 0x7f; shi 0x7f; shi 0x7f: 5 bytes
+    push -1
+    shi 0x5f
+    shi 0x7f
+    shi 0x7f
+    shi 0x7f
+    push _k15
+    lw
+    xor
+    failnez
+
+    ; push 7; shi 0x7f; shi 0x7f; shi 0x7f; shi 0x7f: 5 bytes
+    push 7
+    shi 0x7f
+    shi 0x7f
+    shi 0x7f
+    shi 0x7f
+    push _k16
+    lw
+    xor
+    failnez
+
+    ; push -8; shi 0x00; shi 0x00; shi 0x00; shi 0x00: 5 bytes
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push _k17
+    lw
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
+
+#align 32
+_k0:
+    #d8 0x1f, 0x00, 0x00, 0x00
+_k1:
+    #d8 0x20, 0x00, 0x00, 0x00
+_k2:
+    #d8 0xe0, 0xff, 0xff, 0xff
+_k3:
+    #d8 0xdf, 0xff, 0xff, 0xff
+_k4:
+    #d8 0xff, 0x0f, 0x00, 0x00
+_k5:
+    #d8 0x00, 0x10, 0x00, 0x00
+_k6:
+    #d8 0x00, 0xf0, 0xff, 0xff
+_k7:
+    #d8 0xff, 0xef, 0xff, 0xff
+_k8:
+    #d8 0xff, 0xff, 0x07, 0x00
+_k9:
+    #d8 0x00, 0x00, 0x08, 0x00
+_k10:
+    #d8 0x00, 0x00, 0xf8, 0xff
+_k11:
+    #d8 0xff, 0xff, 0xf7, 0xff
+_k12:
+    #d8 0xff, 0xff, 0xff, 0x03
+_k13:
+    #d8 0x00, 0x00, 0x00, 0x04
+_k14:
+    #d8 0x00, 0x00, 0x00, 0xfc
+_k15:
+    #d8 0xff, 0xff, 0xff, 0xfb
+_k16:
+    #d8 0xff, 0xff, 0xff, 0x7f
+_k17:
+    #d8 0x00, 0x00, 0x00, 0x80
@@ -0,0 +1,271 @@
+; Test fsl instruction: upper word of {ros, nos} << (tos & 63)
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: {0xaaaaaaaa, 0x55555555} << 0
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    push 5
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    push 0
+    fsl
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    xor
+    failnez
+
+    ; Case 1: {0xaaaaaaaa, 0x55555555} << 32
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    push 5
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    push 32
+    fsl
+    push 5
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    xor
+    failnez
+
+    ; Case 2: {0x0, 0x12345678} << 4
+    push 0
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    push 4
+    fsl
+    push 1
+    xor
+    failnez
+
+    ; Case 3: {0x0, 0xff000000} << 8
+    push 0
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push 8
+    fsl
+    push 255
+    xor
+    failnez
+
+    ; Case 4: {0x80000000, 0x0} << 1
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push 0
+    push 1
+    fsl
+    push 0
+    xor
+    failnez
+
+    ; Case 5: {0x0, 0x80000000} << 1
+    push 0
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push 1
+    fsl
+    push 1
+    xor
+    failnez
+
+    ; Case 6: {0x1, 0x0} << 31
+    push 1
+    push 0
+    push 31
+    fsl
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 7: {0x0, 0x1} << 63
+    push 0
+    push 1
+    push 63
+    fsl
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 8: {0xaaaaaaaa, 0x55555555} << 64
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    push 5
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    push 64
+    fsl
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    xor
+    failnez
+
+    ; Case 9: {0xffffffff, 0xffffffff} << 4
+    push -1
+    push -1
+    push 4
+    fsl
+    push -1
+    xor
+    failnez
+
+    ; Case 10: {0xf0f0, 0xf0f0000} << 16
+    push 3
+    shi 0x61
+    shi 0x70
+    push 0
+    shi 0x78
+    shi 0x3c
+    shi 0x00
+    shi 0x00
+    push 16
+    fsl
+    push -1
+    shi 0x07
+    shi 0x40
+    shi 0x1e
+    shi 0x0f
+    xor
+    failnez
+
+    ; Case 11: {0x0, 0xffff} << 16
+    push 0
+    push 3
+    shi 0x7f
+    shi 0x7f
+    push 16
+    fsl
+    push 0
+    xor
+    failnez
+
+    ; Case 12: {0x0, 0x10000} << 36
+    push 0
+    push 65536
+    push 36
+    fsl
+    push 0
+    shi 0x40
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 13: {0x0, 0x80000000} << 28
+    push 0
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push 28
+    fsl
+    push 0
+    shi 0x40
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 14: deep stack, {0xAAAAAAAA, 0x55555555} << 0
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    push 5
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    push 0
+    fsl
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,38 @@
+; Baseline: 3000 iteration xorshift kernel with no timer
+    jump _kmain
+
+#bank code
+
+_kmain:
+    ; Compute kernel: xorshift32 from 0xace1
+    push 2
+    shi 0x59
+    shi 0x61
+    li rx, 3000
+_work:
+    dup
+    push 7
+    sll
+    xor
+    dup
+    push 9
+    srl
+    xor
+    dup
+    push 8
+    sll
+    xor
+    add rx, -1
+    push rx
+    bnez _work
+
+    push 5
+    shi 0x13
+    shi 0x7e
+    shi 0x00
+    shi 0x07
+    xor
+    failnez
+    ; All passed
+    push 1
+    halt
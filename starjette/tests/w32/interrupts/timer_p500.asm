@@ -0,0 +1,249 @@
+; Timer interrupt every 500 cycles during a 3000 iteration xorshift kernel
+    jump _kmain
+
+#bank code
+
+_kmain:
+    li evec, _irq_handler
+
+    ; First deadline one period from now
+    push 3
+    shi 0x7e
+    shi 0x50
+    lw
+    add 500
+    dup
+    push 0x7e04
+    sw
+    push 3
+    shi 0x7e
+    shi 0x48
+    sw
+    push 1
+    push 3
+    shi 0x7e
+    shi 0x40
+    sw
+
+    ; Kernel mode with interrupts enabled
+    push 3
+    pop status
+
+    ; Compute kernel: xorshift32 from 0xace1
+    push 2
+    shi 0x59
+    shi 0x61
+    li rx, 3000
+_work:
+    dup
+    push 7
+    sll
+    xor
+    dup
+    push 9
+    srl
+    xor
+    dup
+    push 8
+    sll
+    xor
+    add rx, -1
+    push rx
+    bnez _work
+
+    push 5
+    shi 0x13
+    shi 0x7e
+    shi 0x00
+    shi 0x07
+    xor
+    failnez
+
+    ; Interrupts off before checking the bookkeeping
+    push 1
+    pop status
+    push 3
+    shi 0x7e
+    shi 0x50
+    lw
+    push 0x7e08
+    sw
+
+    ; At least one interrupt was taken
+    push 0x7e00
+    lw
+    faileqz
+
+    ; Every interrupt landed in exactly one histogram bucket
+    push 0
+    push 0x7e40
+    lw
+    add
+    push 0x7e44
+    lw
+    add
+    push 0x7e48
+    lw
+    add
+    push 0x7e4c
+    lw
+    add
+    push 0x7e50
+    lw
+    add
+    push 0x7e54
+    lw
+    add
+    push 0x7e58
+    lw
+    add
+    push 0x7e5c
+    lw
+    add
+    push 0x7e60
+    lw
+    add
+    push 0x7e64
+    lw
+    add
+    push 0x7e68
+    lw
+    add
+    push 0x7e6c
+    lw
+    add
+    push 0x7e70
+    lw
+    add
+    push 0x7e74
+    lw
+    add
+    push 0x7e78
+    lw
+    add
+    push 0x7e7c
+    lw
+    add
+    push 0x7e00
+    lw
+    xor
+    failnez
+
+    ; Every interrupt moved the deadline exactly once
+    push 3
+    shi 0x7e
+    shi 0x48
+    lw
+    push 0x7e04
+    lw
+    sub
+    push 0x7e00
+    lw
+    push 500
+    mul
+    drop
+    xor
+    failnez
+
+    ; No deadline missed by a whole period when the kernel finished
+    push 0x7e08
+    lw
+    push 3
+    shi 0x7e
+    shi 0x48
+    lw
+    sub
+    push 500
+    lt
+    faileqz
+
+    ; All passed
+    push 1
+    halt
+
+_irq_handler:
+    push ecause
+    push 0x50
+    xor
+    bnez _irq_fatal
+
+    ; Ring buffer timestamp: ts[count % 64] = mtime
+    push 3
+    shi 0x7e
+    shi 0x50
+    lw
+    dup
+    push 0x7e00
+    lw
+    push 63
+    and
+    dup
+    add
+    dup
+    add
+    push 0x7e80
+    add
+    sw
+
+    ; Latency histogram bucket = min((mtime - mtimecmp) >> 2, 15)
+    push 3
+    shi 0x7e
+    shi 0x48
+    lw
+    sub
+    push 2
+    srl
+    dup
+    push 16
+    ltu
+    bnez _irq_bucket
+    drop
+    push 15
+_irq_bucket:
+    dup
+    add
+    dup
+    add
+    push 0x7e40
+    add
+    dup
+    lw
+    add 1
+    swap
+    sw
+
+    push 0x7e00
+    lw
+    add 1
+    push 0x7e00
+    sw
+
+    ; mtimecmp += 500, carrying into the next word
+    push 3
+    shi 0x7e
+    shi 0x48
+    lw
+    add 500
+    dup
+    push 3
+    shi 0x7e
+    shi 0x48
+    sw
+    push 500
+    ltu
+    push 3
+    shi 0x7e
+    shi 0x4c
+    lw
+    add
+    push 3
+    shi 0x7e
+    shi 0x4c
+    sw
+    rets
+
+_irq_fatal:
+    push ecause
+    xor -1
+    add 1
+    halt
@@ -0,0 +1,166 @@
+; Test lh and sh instructions on 32-bit words
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: store and load half 0x5678
+    push 22136
+    push fp
+    push -4
+    add
+    sh
+    push fp
+    push -4
+    add
+    lh
+    push 22136
+    xor
+    failnez
+
+    ; Case 1: negative half -1234 is sign extended
+    push -1234
+    push fp
+    push -4
+    add
+    sh
+    push fp
+    push -4
+    add
+    lh
+    push -1234
+    xor
+    failnez
+
+    ; Case 2: halves of word 0x8765abcd, low half first
+    push -8
+    shi 0x3b
+    shi 0x16
+    shi 0x57
+    shi 0x4d
+    push fp
+    push -8
+    add
+    sw
+    push fp
+    push -8
+    add
+    lh
+    push fp
+    push -6
+    add
+    lh
+    push -30875
+    xor
+    failnez
+    push -21555
+    xor
+    failnez
+
+    ; Case 3: sh replaces only the upper half of a word
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x44
+    shi 0x22
+    push fp
+    push -8
+    add
+    sw
+    push 30583
+    push fp
+    push -6
+    add
+    sh
+    push fp
+    push -8
+    add
+    lw
+    push 7
+    shi 0x3b
+    shi 0x5c
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+
+    ; Case 4: sh keeps the low 16 bits of the stored value
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    push fp
+    push -4
+    add
+    sh
+    push fp
+    push -4
+    add
+    lw
+    push 22136
+    xor
+    failnez
+
+    ; Case 5: deep stack, store half 0x5678 at fp-10
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    push 22136
+    push fp
+    push -10
+    add
+    sh
+    push fp
+    push -10
+    add
+    lh
+    push 22136
+    xor
+    failnez
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,109 @@
+; Test llw and slw instructions: fp-relative words
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: allocate 16 bytes, store at offsets 0 and 4, load them back, free the frame
+    add fp, -16
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 0
+    slw
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 4
+    slw
+    push 0
+    llw
+    push 4
+    llw
+    push 16
+    add fp
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; Case 1: deep stack, store 0xbeefcafe at fp-20
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    push -5
+    shi 0x77
+    shi 0x3f
+    shi 0x15
+    shi 0x7e
+    push -20
+    slw
+    push -20
+    llw
+    push -5
+    shi 0x77
+    shi 0x3f
+    shi 0x15
+    shi 0x7e
+    xor
+    failnez
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
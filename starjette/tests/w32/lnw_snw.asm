@@ -0,0 +1,124 @@
+; Test lnw and snw instructions: ar += 4
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: snw four words from fp-16, ar ends at fp
+    push fp
+    push -16
+    add
+    pop ar
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    snw
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    snw
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    snw
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    snw
+    push ar
+    push fp
+    xor
+    push 0
+    xor
+    failnez
+
+    ; Case 1: lnw them back from fp-16, ar ends at fp
+    push fp
+    push -16
+    add
+    pop ar
+    lnw
+    lnw
+    lnw
+    lnw
+    push ar
+    push fp
+    xor
+    push 0
+    xor
+    failnez
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; Case 2: overwrite the first two and read them back
+    push fp
+    push -16
+    add
+    pop ar
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    snw
+    push -5
+    shi 0x5d
+    shi 0x6e
+    shi 0x77
+    shi 0x3b
+    snw
+    push fp
+    push -16
+    add
+    pop ar
+    lnw
+    lnw
+    push -5
+    shi 0x5d
+    shi 0x6e
+    shi 0x77
+    shi 0x3b
+    xor
+    failnez
+    push -6
+    shi 0x55
+    shi 0x2a
+    shi 0x55
+    shi 0x2a
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
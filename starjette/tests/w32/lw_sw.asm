@@ -0,0 +1,131 @@
+; Test lw and sw instructions
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: store and load 0x12345678 at fp-4
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    push fp
+    push -4
+    add
+    sw
+    push fp
+    push -4
+    add
+    lw
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    xor
+    failnez
+
+    ; Case 1: store 0xabcdef01 at fp-8, fp-4 keeps its value
+    push -6
+    shi 0x5e
+    shi 0x37
+    shi 0x5e
+    shi 0x01
+    push fp
+    push -8
+    add
+    sw
+    push fp
+    push -8
+    add
+    lw
+    push fp
+    push -4
+    add
+    lw
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    xor
+    failnez
+    push -6
+    shi 0x5e
+    shi 0x37
+    shi 0x5e
+    shi 0x01
+    xor
+    failnez
+
+    ; Case 2: deep stack, store 0xcafef00d at fp-12
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    push -4
+    shi 0x57
+    shi 0x7b
+    shi 0x60
+    shi 0x0d
+    push fp
+    push -12
+    add
+    sw
+    push fp
+    push -12
+    add
+    lw
+    push -4
+    shi 0x57
+    shi 0x7b
+    shi 0x60
+    shi 0x0d
+    xor
+    failnez
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,241 @@
+; Test mul instruction: TOS=high word, NOS=low word
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: 0xa * 0xa
+    push 10
+    push 10
+    mul
+    push 0
+    xor
+    failnez
+    push 100
+    xor
+    failnez
+
+    ; Case 1: 0xffff * 0xffff
+    push 3
+    shi 0x7f
+    shi 0x7f
+    push 3
+    shi 0x7f
+    shi 0x7f
+    mul
+    push 0
+    xor
+    failnez
+    push -131071
+    xor
+    failnez
+
+    ; Case 2: 0x10000 * 0x10000
+    push 65536
+    push 65536
+    mul
+    push 1
+    xor
+    failnez
+    push 0
+    xor
+    failnez
+
+    ; Case 3: 0xf4240 * 0xf4240
+    push 0
+    shi 0x3d
+    shi 0x04
+    shi 0x40
+    push 0
+    shi 0x3d
+    shi 0x04
+    shi 0x40
+    mul
+    push 232
+    xor
+    failnez
+    push -3
+    shi 0x25
+    shi 0x14
+    shi 0x20
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 4: 0xbc614e * 0x0
+    push 5
+    shi 0x71
+    shi 0x42
+    shi 0x4e
+    push 0
+    mul
+    push 0
+    xor
+    failnez
+    push 0
+    xor
+    failnez
+
+    ; Case 5: 0xbc614e * 0x1
+    push 5
+    shi 0x71
+    shi 0x42
+    shi 0x4e
+    push 1
+    mul
+    push 0
+    xor
+    failnez
+    push 5
+    shi 0x71
+    shi 0x42
+    shi 0x4e
+    xor
+    failnez
+
+    ; Case 6: 0xffffffff * 0xffffffff
+    push -1
+    push -1
+    mul
+    push -2
+    xor
+    failnez
+    push 1
+    xor
+    failnez
+
+    ; Case 7: 0x80000000 * 0x2
+    push -8
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    push 2
+    mul
+    push 1
+    xor
+    failnez
+    push 0
+    xor
+    failnez
+
+    ; Case 8: 0x12345678 * 0x100
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    push 256
+    mul
+    push 18
+    xor
+    failnez
+    push 3
+    shi 0x22
+    shi 0x59
+    shi 0x70
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 9: 0xffffffff * 0x2
+    push -1
+    push 2
+    mul
+    push 1
+    xor
+    failnez
+    push -2
+    xor
+    failnez
+
+    ; Case 10: 0xdeadbeef * 0xcafebabe
+    push -3
+    shi 0x75
+    shi 0x36
+    shi 0x7d
+    shi 0x6f
+    push -4
+    shi 0x57
+    shi 0x7a
+    shi 0x75
+    shi 0x3e
+    mul
+    push -5
+    shi 0x04
+    shi 0x4a
+    shi 0x56
+    shi 0x7b
+    xor
+    failnez
+    push -8
+    shi 0x46
+    shi 0x3d
+    shi 0x36
+    shi 0x62
+    xor
+    failnez
+
+    ; Case 11: deep stack, 0x12345678 * 0x9abcdef0
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    push 1
+    shi 0x11
+    shi 0x51
+    shi 0x2c
+    shi 0x78
+    push -7
+    shi 0x55
+    shi 0x73
+    shi 0x3d
+    shi 0x70
+    mul
+    push 0
+    shi 0x58
+    shi 0x03
+    shi 0x54
+    shi 0x4e
+    xor
+    failnez
+    push 2
+    shi 0x21
+    shi 0x34
+    shi 0x41
+    shi 0x00
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,72 @@
+; Test or instruction
+    ; Case 0: 12 or 10 -> 14
+    push 12
+    push 10
+    or
+    push 14
+    xor
+    failnez
+
+    ; Case 1: 0 or 0 -> 0
+    push 0
+    push 0
+    or
+    push 0
+    xor
+    failnez
+
+    ; Case 2: 0 or 1234 -> 1234
+    push 0
+    push 1234
+    or
+    push 1234
+    xor
+    failnez
+
+    ; Case 3: 21845 or 43690 -> 65535
+    push 21845
+    push 2
+    shi 0x55
+    shi 0x2a
+    or
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    failnez
+
+    ; Case 4: 65280 or 255 -> 65535
+    push 3
+    shi 0x7e
+    shi 0x00
+    push 255
+    or
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    failnez
+
+    ; Case 5: 4660 or 0 -> 4660
+    push 4660
+    push 0
+    or
+    push 4660
+    xor
+    failnez
+
+    ; Case 6: 32768 or 1 -> 32769
+    push 2
+    shi 0x00
+    shi 0x00
+    push 1
+    or
+    push 2
+    shi 0x00
+    shi 0x01
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
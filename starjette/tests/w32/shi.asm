@@ -0,0 +1,135 @@
+; Test shi instruction: tos = (tos << 7) | imm
+; Expected values from the ISA manual at 32 bits, checked against the reference model
+
+    ; Case 0: (1 << 7) | 0
+    push 1
+    shi 0
+    push 128
+    xor
+    failnez
+
+    ; Case 1: 0 shi 0x55
+    push 0
+    shi 0x55
+    push 85
+    xor
+    failnez
+
+    ; Case 2: 0x1234 from push 0, shi 0x24, shi 0x34
+    push 0
+    shi 0x24
+    shi 0x34
+    push 4660
+    xor
+    failnez
+
+    ; Case 3: 0xabcd needs a third shi on 32 bits, push 2 stays positive
+    push 2
+    shi 0x57
+    shi 0x4D
+    push 2
+    shi 0x57
+    shi 0x4d
+    xor
+    failnez
+
+    ; Case 4: 0x12345678 from push 1 and four shi
+    push 1
+    shi 0x11
+    shi 0x45
+    shi 0x2C
+    shi 0x78
+    push 1
+    shi 0x11
+    shi 0x45
+    shi 0x2c
+    shi 0x78
+    xor
+    failnez
+
+    ; Case 5: -2 shi 0 = -256
+    push -2
+    shi 0
+    push -256
+    xor
+    failnez
+
+    ; Case 6: -1 and four shi 0x7f stays -1
+    push -1
+    shi 0x7F
+    shi 0x7F
+    shi 0x7F
+    shi 0x7F
+    push -1
+    xor
+    failnez
+
+    ; Case 7: bits shifted past bit 31 are lost
+    push 31
+    shi 0
+    shi 0
+    shi 0
+    shi 0
+    shi 0
+    push 0
+    xor
+    failnez
+
+    ; Case 8: deep stack
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    push 3
+    shi 0x7F
+    push 511
+    xor
+    failnez
+    push 4
+    shi 0x22
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    xor
+    failnez
+    push 3
+    shi 0x19
+    shi 0x4c
+    shi 0x66
+    shi 0x33
+    xor
+    failnez
+    push 2
+    shi 0x11
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    xor
+    failnez
+    push 1
+    shi 0x08
+    shi 0x44
+    shi 0x22
+    shi 0x11
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
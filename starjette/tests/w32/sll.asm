@@ -0,0 +1,74 @@
+; Test sll instruction
+    ; Case 0: 1 sll 1 -> 2
+    push 1
+    push 1
+    sll
+    push 2
+    xor
+    failnez
+
+    ; Case 1: 1 sll 4 -> 16
+    push 1
+    push 4
+    sll
+    push 16
+    xor
+    failnez
+
+    ; Case 2: 1 sll 15 -> 32768
+    push 1
+    push 15
+    sll
+    push 2
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 3: 65535 sll 1 -> 131070
+    push 3
+    shi 0x7f
+    shi 0x7f
+    push 1
+    sll
+    push 7
+    shi 0x7f
+    shi 0x7e
+    xor
+    failnez
+
+    ; Case 4: 4660 sll 0 -> 4660
+    push 4660
+    push 0
+    sll
+    push 4660
+    xor
+    failnez
+
+    ; Case 5: 4660 sll 16 -> 305397760
+    push 4660
+    push 16
+    sll
+    push 1
+    shi 0x11
+    shi 0x50
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; Case 6: 4660 sll 20 -> 591396864
+    push 4660
+    push 20
+    sll
+    push 2
+    shi 0x1a
+    shi 0x00
+    shi 0x00
+    shi 0x00
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,74 @@
+; Overlapping entry into a push/shi chain patched every iteration
+    jump _main
+
+#addr 0x0040
+    ; return with `push rx; pop pc`, the bytes after each chain
+_chain:
+    #d8 0x71, 0x80, 0x95, 0xd5, 0xc8, 0x99, 0x8a, 0x81
+    ret rx
+
+_main:
+    push 1000
+    push 0x7f00
+    sw
+    push 0x0001
+
+_loop:
+    ; last shi of the chain becomes shi (i & 0x7f)
+    push 0x7f00
+    lw
+    push 0x7f
+    and
+    add 0x80
+    push _chain + 7
+    sb
+    dup
+    push _chain + 7
+    callp
+    xor
+    dup
+    push _chain + 6
+    callp
+    xor
+    dup
+    push _chain + 5
+    callp
+    xor
+    dup
+    push _chain + 4
+    callp
+    xor
+    dup
+    push _chain + 3
+    callp
+    xor
+    dup
+    push _chain + 2
+    callp
+    xor
+    dup
+    push _chain + 1
+    callp
+    xor
+    push _chain
+    callp
+    add
+
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    push 31
+    shi 0x52
+    shi 0x40
+    shi 0x79
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,34 @@
+; Self-modifying push immediate (control: patches go to a scratch byte)
+    push 1000
+    push 0x7f00
+    sw
+    push 0x0000
+
+_loop:
+    ; push (i & 0x1f), written over the byte at _site
+    push 0x7f00
+    lw
+    push 0x1f
+    and
+    add 0x40
+    push 0x04f0
+    sb
+_site:
+    #d8 0x41
+    add
+
+    push 0x7f00
+    lw
+    add -1
+    dup
+    push 0x7f00
+    sw
+    bnez _loop
+
+    push 1000
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,39 @@
+; 64 lines of 63 characters
+    jump _main
+
+#bank code
+
+_main:
+    li rx, 0
+_blk_line:
+    li ry, 0
+_blk_col:
+    push rx
+    rel ry
+    push 0x3f
+    and
+    add 0x30
+    push 3
+    shi 0x7e
+    shi 0x00
+    sb
+    add ry, 1
+    push ry
+    push 63
+    xor
+    bnez _blk_col
+
+    push 10
+    push 3
+    shi 0x7e
+    shi 0x00
+    sb
+    add rx, 1
+    push rx
+    push 64
+    xor
+    bnez _blk_line
+
+    ; All passed
+    push 1
+    halt
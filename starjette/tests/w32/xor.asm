@@ -0,0 +1,76 @@
+; Test xor instruction
+    ; Case 0: 12 xor 10 -> 6
+    push 12
+    push 10
+    xor
+    push 6
+    xor
+    failnez
+
+    ; Case 1: 12345 xor 12345 -> 0
+    push 12345
+    push 12345
+    xor
+    push 0
+    xor
+    failnez
+
+    ; Case 2: 0 xor -1 -> -1
+    push 0
+    push -1
+    xor
+    push -1
+    xor
+    failnez
+
+    ; Case 3: 65535 xor 65535 -> 0
+    push 3
+    shi 0x7f
+    shi 0x7f
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    push 0
+    xor
+    failnez
+
+    ; Case 4: 21845 xor 43690 -> 65535
+    push 21845
+    push 2
+    shi 0x55
+    shi 0x2a
+    xor
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    failnez
+
+    ; Case 5: 65280 xor 255 -> 65535
+    push 3
+    shi 0x7e
+    shi 0x00
+    push 255
+    xor
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    failnez
+
+    ; Case 6: 4660 xor 65535 -> 60875
+    push 4660
+    push 3
+    shi 0x7f
+    shi 0x7f
+    xor
+    push 3
+    shi 0x5b
+    shi 0x4b
+    xor
+    failnez
+
+    ; All passed
+    push 1
+    halt
@@ -0,0 +1,93 @@
+"""
+Compare every built test and benchmark ROM with its 32-bit word build.
+
+`STARJETTE_WORDSIZE=32` makes the generators write the same tests under
+tests/w32/ (`make w32` generates and builds them with test_shim32.asm). Each
+ROM runs on the reference system at its own word size, and the report pairs
+tests/X.bin with tests/w32/X.bin and every suite manifest with its w32 twin:
+instructions executed, image bytes (up to the last non-zero byte) and the
+change from 16 to 32 bits, and whether each build exits with tos == 1. The
+Zig cores are 16-bit only, so the model is the only place both trees run.
+
+Arguments may be .bin files or suite manifest.json files from the 16-bit
+tree, as for pipeline_report.py.
+
+Usage (from starjette/): python tests/wordsize_report.py [--w32 DIR] [ROM or manifest ...]
+Build both trees first with `make all` and the suite targets, and `make w32`.
+"""
+
+import argparse
+import os
+import sys
+
+from pipeline_report import collect_roms
+from starjette_system import System
+
+# Every generated ROM exits with tos == 1
+EXPECT = 1
+
+
+def twin(path, w32):
+    """The tests/w32 counterpart of a tests/ path."""
+    return os.path.join(w32, os.path.relpath(path, "tests"))
+
+
+def run(path, max_cycles, wordsize):
+    """(instructions, image bytes, passed) of a ROM, or None when it was not built."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        image = len(f.read().rstrip(b"\0"))
+    cpu = System(wordsize=wordsize)
+    cpu.load_rom(path)
+    cpu.run(max_cycles)
+    return cpu.cycles, image, cpu.halted and cpu.depth == 1 and cpu.peek() == EXPECT
+
+
+def change(old, new):
+    return f"{100 * (new - old) / max(old, 1):+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("paths", nargs="*", help=".bin files or manifest.json files of the 16-bit tree")
+    parser.add_argument("--w32", default="tests/w32", help="root of the 32-bit tree")
+    args = parser.parse_args()
+
+    roms = collect_roms(args.paths)
+    paths32 = [twin(path, args.w32) for path in args.paths]
+    if not paths32:
+        paths32 = [twin(path, args.w32) for _, path, *_ in roms if path.count(os.sep) == 1]
+        paths32 += sorted({os.path.join(os.path.dirname(twin(path, args.w32)), "manifest.json")
+                           for _, path, *_ in roms if path.count(os.sep) > 1})
+    roms32 = {label: (path, max_cycles)
+              for label, path, max_cycles, _ in collect_roms([p for p in paths32 if os.path.exists(p)])}
+
+    width = max([len(label) for label, *_ in roms] + [8])
+    print(f"{'rom':<{width}} {'instrs16':>9} {'instrs32':>9} {'change':>8} "
+          f"{'bytes16':>8} {'bytes32':>8} {'change':>8}  result")
+    totals = [0, 0, 0, 0]
+    failures = skipped = 0
+    for label, path, max_cycles, _ in roms:
+        result16 = run(path, max_cycles, 16)
+        result32 = run(*roms32[label], 32) if label in roms32 else None
+        if result16 is None or result32 is None:
+            skipped += 1
+            continue
+        (instrs16, bytes16, ok16), (instrs32, bytes32, ok32) = result16, result32
+        failed = [f"w{ws}" for ws, ok in ((16, ok16), (32, ok32)) if not ok]
+        failures += bool(failed)
+        for i, value in enumerate((instrs16, instrs32, bytes16, bytes32)):
+            totals[i] += value
+        print(f"{label:<{width}} {instrs16:>9} {instrs32:>9} {change(instrs16, instrs32):>8} "
+              f"{bytes16:>8} {bytes32:>8} {change(bytes16, bytes32):>8}  "
+              + ("FAIL " + ", ".join(failed) if failed else "ok"))
+    print(f"{'total':<{width}} {totals[0]:>9} {totals[1]:>9} {change(totals[0], totals[1]):>8} "
+          f"{totals[2]:>8} {totals[3]:>8} {change(totals[2], totals[3]):>8}")
+    if skipped:
+        print(f"({skipped} ROMs without a built pair, skipped)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())